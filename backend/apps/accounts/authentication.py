@@ -0,0 +1,156 @@
+"""
+Onbellekli JWT kimlik dogrulama.
+
+Varsayilan JWTAuthentication her istekte CustomUser'i veritabanindan okur.
+CachedJWTAuthentication kullaniciyi iki katmanli onbellekten cozer:
+
+- Proses ici sozluk (LOCAL_TTL saniye) — istek basina sifir I/O.
+- Paylasilan cache (production'da Redis, SHARED_TTL saniye) — tek GET.
+
+Kayitlar kullanici id'si ile tutulur ve kullanicinin guvenlik damgasini
+(security_stamp) tasir. Damga; sifre hash'i, rol ve aktiflik durumundan
+uretilir ve StampedRefreshToken ile token'a 'stamp' claim'i olarak yazilir.
+Onbellekteki damga token'dakiyle eslesmezse kullanici veritabanindan
+yeniden okunur; guncel damga da eslesmiyorsa (sifre/rol degisti, hesap
+pasif) token reddedilir.
+
+Gecersiz kilma: CustomUser kaydedildiginde/silindiginde (sinyal) ve
+cikis yapildiginda paylasilan kayit silinir; diger proseslerin yerel
+kopyalari en fazla LOCAL_TTL saniye yasar.
+
+Sifre hash'i onbellege yazilmaz (EXCLUDED_FIELDS); cozulen kullanicida
+ertelenmis alan olarak kalir ve yalnizca gerektiginde okunur.
+
+'stamp' claim'i olmayan (eski) token'lar onbellege girmeden eski yoldan
+dogrulanir.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+STAMP_CLAIM = 'stamp'
+LOCAL_TTL = 10
+SHARED_TTL = 300
+LOCAL_MAX_ENTRIES = 5000
+# Onbellege yazilmayan alanlar; erisilirse veritabanindan ertelenmis okunur
+EXCLUDED_FIELDS = {'password'}
+
+_local = {}
+_local_lock = threading.Lock()
+
+
+def security_stamp(user) -> str:
+    """Sifre, rol veya aktiflik degisince degisen kisa damga."""
+    raw = f'{user.pk}:{user.password}:{user.role}:{user.is_active}'
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+class StampedRefreshToken(RefreshToken):
+    """Guvenlik damgasini tasiyan refresh token (access token'a kopyalanir)."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token[STAMP_CLAIM] = security_stamp(user)
+        return token
+
+
+def _cache_key(user_id):
+    return f'auth_user:{user_id}'
+
+
+def _serialize(user) -> dict:
+    fields = [f for f in user._meta.concrete_fields if f.attname not in EXCLUDED_FIELDS]
+    return {
+        'stamp': security_stamp(user),
+        'fields': [f.attname for f in fields],
+        'values': [getattr(user, f.attname) for f in fields],
+    }
+
+
+def _build(user_model, entry):
+    # Her istege ayri ornek: view'lar request.user'i degistirebilir
+    return user_model.from_db('default', entry['fields'], entry['values'])
+
+
+def _remember_local(user_id, entry):
+    with _local_lock:
+        if len(_local) >= LOCAL_MAX_ENTRIES:
+            _local.clear()
+        _local[str(user_id)] = (time.monotonic() + LOCAL_TTL, entry)
+
+
+def invalidate_user(user_id):
+    """Kullanicinin onbellek kayitlarini sil (commit sonrasi tekrar)."""
+    def _delete():
+        _local.pop(str(user_id), None)
+        try:
+            cache.delete(_cache_key(user_id))
+        except Exception:
+            logger.warning("Kullanici onbellegi silinemedi", exc_info=True)
+
+    _delete()
+    transaction.on_commit(_delete)
+
+
+def reset():
+    """Proses ici kayitlari unut (testler)."""
+    with _local_lock:
+        _local.clear()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication; kullaniciyi damga kontrollu onbellekten cozer."""
+
+    def get_user(self, validated_token):
+        stamp = validated_token.get(STAMP_CLAIM)
+        if stamp is None:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken('Token contained no recognizable user identification') from e
+
+        local = _local.get(str(user_id))
+        if local is not None and local[0] > time.monotonic() and local[1]['stamp'] == stamp:
+            return _build(self.user_model, local[1])
+
+        try:
+            entry = cache.get(_cache_key(user_id))
+        except Exception:
+            entry = None
+        if entry is None or entry['stamp'] != stamp:
+            entry = self._load(user_id)
+            if entry['stamp'] != stamp:
+                raise AuthenticationFailed('Token is no longer valid for this user.', code='token_revoked')
+
+        _remember_local(user_id, entry)
+        return _build(self.user_model, entry)
+
+    def _load(self, user_id) -> dict:
+        try:
+            user = self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed('User not found', code='user_not_found') from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+
+        entry = _serialize(user)
+        try:
+            cache.set(_cache_key(user_id), entry, SHARED_TTL)
+        except Exception:
+            logger.warning("Kullanici onbellegi yazilamadi", exc_info=True)
+        return entry
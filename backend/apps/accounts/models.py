@@ -292,17 +292,20 @@ class DoctorAuthor(TimeStampedModel):
     def __str__(self):
         return f"{self.doctor.user.get_full_name()} - {self.get_primary_specialty_display()}"
 
+    @staticmethod
+    def level_for(total_articles):
+        if total_articles >= 50:
+            return 4
+        if total_articles >= 25:
+            return 3
+        if total_articles >= 10:
+            return 2
+        if total_articles >= 5:
+            return 1
+        return 0
+
     def update_level(self):
-        if self.total_articles >= 50:
-            self.author_level = 4
-        elif self.total_articles >= 25:
-            self.author_level = 3
-        elif self.total_articles >= 10:
-            self.author_level = 2
-        elif self.total_articles >= 5:
-            self.author_level = 1
-        else:
-            self.author_level = 0
+        self.author_level = self.level_for(self.total_articles)
         self.save(update_fields=['author_level'])
 
     @property
@@ -1,6 +1,6 @@
 import logging
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.contrib.auth.signals import user_login_failed
 from django.dispatch import receiver
 from .models import CustomUser, PatientProfile, DoctorProfile
@@ -19,6 +19,13 @@ def create_user_profile(sender, instance, created, **kwargs):
             DoctorProfile.objects.create(user=instance, approval_status=approval)
 
 
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_cached_user(sender, instance, **kwargs):
+    from .authentication import invalidate_user
+    invalidate_user(instance.pk)
+
+
 @receiver(user_login_failed)
 def log_failed_login(sender, credentials, request=None, **kwargs):
     if request is None:
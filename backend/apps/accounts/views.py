@@ -13,6 +13,7 @@ from django.core.mail import send_mail
 from django.db.models import Q
 from django.utils import timezone
 from django.utils.html import strip_tags
+from .authentication import StampedRefreshToken, invalidate_user
 from .models import CustomUser, PatientProfile, DoctorProfile, RelativeInvitation
 from .permissions import IsDoctor, IsAdminUser
 from .serializers import (
@@ -61,7 +62,7 @@ class RegisterView(generics.CreateAPIView):
             )
 
         # Non-doctor: return tokens as before
-        refresh = RefreshToken.for_user(user)
+        refresh = StampedRefreshToken.for_user(user)
         return Response(
             {
                 'user': UserSerializer(user).data,
@@ -90,7 +91,7 @@ class LoginView(generics.GenericAPIView):
         user = serializer.validated_data['user']
         user.last_active = timezone.now()
         user.save(update_fields=['last_active'])
-        refresh = RefreshToken.for_user(user)
+        refresh = StampedRefreshToken.for_user(user)
         return Response(
             {
                 'user': UserSerializer(user).data,
@@ -113,6 +114,7 @@ class LogoutView(generics.GenericAPIView):
                 token.blacklist()
         except Exception:
             pass
+        invalidate_user(request.user.pk)
         return Response(status=status.HTTP_205_RESET_CONTENT)
 
 
@@ -125,7 +127,15 @@ class ChangePasswordView(generics.GenericAPIView):
         serializer.is_valid(raise_exception=True)
         request.user.set_password(serializer.validated_data['new_password'])
         request.user.save()
-        return Response({'detail': 'Password updated successfully.'})
+        # Damga degisti; eski token'lar gecersiz, istemciye yeni cift verilir
+        refresh = StampedRefreshToken.for_user(request.user)
+        return Response({
+            'detail': 'Password updated successfully.',
+            'tokens': {
+                'refresh': str(refresh),
+                'access': str(refresh.access_token),
+            },
+        })
 
 
 class UserProfileView(generics.RetrieveUpdateAPIView):
@@ -329,7 +339,7 @@ class RegisterRelativeView(APIView):
         user = serializer.save()
 
         # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = StampedRefreshToken.for_user(user)
 
         return Response({
             'user': UserSerializer(user).data,
@@ -0,0 +1,79 @@
+"""
+Mesaj kutusu (inbox) yardimcilari.
+
+Mesaj eklenirken son mesaj ozeti ve karsi tarafin okunmamis sayaci ayni
+transaction icinde tek UPDATE ile F() kullanilarak guncellenir; liste
+endpoint'leri bu denormalize alanlari okur, satir basina sorgu yapmaz.
+"""
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ChatMessage, ChatSession, Conversation, DirectMessage
+
+PREVIEW_LENGTH = 100
+
+# Okuyan taraf -> sifirlanacak sayac; gonderen taraf -> artirilacak sayac
+UNREAD_FIELD = {
+    'patient': 'patient_unread_count',
+    'doctor': 'doctor_unread_count',
+}
+
+
+def _recipient_side(conversation, sender):
+    return 'patient' if sender.pk == conversation.doctor_id else 'doctor'
+
+
+def record_direct_message(conversation, sender, content):
+    """Doktor-hasta mesajini kaydet; ozet ve karsi taraf sayaci atomik guncellenir."""
+    unread_field = UNREAD_FIELD[_recipient_side(conversation, sender)]
+
+    with transaction.atomic():
+        msg = DirectMessage.objects.create(
+            conversation=conversation,
+            sender=sender,
+            content=content,
+        )
+        Conversation.objects.filter(pk=conversation.pk).update(
+            last_message_at=msg.created_at,
+            last_message_preview=content[:PREVIEW_LENGTH],
+            last_message_sender_name=sender.get_full_name(),
+            updated_at=timezone.now(),
+            **{unread_field: F(unread_field) + 1},
+        )
+
+    conversation.refresh_from_db(fields=[
+        'last_message_at', 'last_message_preview', 'last_message_sender_name',
+        'patient_unread_count', 'doctor_unread_count',
+    ])
+    return msg
+
+
+def mark_conversation_read(conversation, reader, side):
+    """Karsi tarafin mesajlarini okundu isaretle ve okuyanin sayacini sifirla."""
+    with transaction.atomic():
+        DirectMessage.objects.filter(
+            conversation=conversation,
+            is_read=False,
+        ).exclude(sender=reader).update(is_read=True, read_at=timezone.now())
+        Conversation.objects.filter(pk=conversation.pk).update(**{UNREAD_FIELD[side]: 0})
+    setattr(conversation, UNREAD_FIELD[side], 0)
+
+
+def record_chat_message(session, role, content, **fields):
+    """AI sohbet mesajini kaydet; mesaj sayisi ve son mesaj ozeti F() ile guncellenir."""
+    with transaction.atomic():
+        msg = ChatMessage.objects.create(
+            session=session,
+            role=role,
+            content=content,
+            **fields,
+        )
+        ChatSession.objects.filter(pk=session.pk).update(
+            message_count=F('message_count') + 1,
+            last_message_at=msg.created_at,
+            last_message_role=role,
+            last_message_preview=content[:PREVIEW_LENGTH],
+        )
+    return msg
@@ -0,0 +1,67 @@
+# Generated by Django 5.1.5 on 2026-10-19 18:09
+
+from django.db import migrations, models
+
+
+def backfill_last_message(apps, schema_editor):
+    """Mevcut konusma ve oturumlar icin son mesaj ozetini doldur."""
+    ChatSession = apps.get_model('chat', 'ChatSession')
+    ChatMessage = apps.get_model('chat', 'ChatMessage')
+    Conversation = apps.get_model('chat', 'Conversation')
+    DirectMessage = apps.get_model('chat', 'DirectMessage')
+
+    for session in ChatSession.objects.iterator(chunk_size=500):
+        msg = ChatMessage.objects.filter(session=session).order_by('-created_at').first()
+        if msg:
+            ChatSession.objects.filter(pk=session.pk).update(
+                last_message_at=msg.created_at,
+                last_message_role=msg.role,
+                last_message_preview=msg.content[:100],
+            )
+
+    for conversation in Conversation.objects.iterator(chunk_size=500):
+        msg = DirectMessage.objects.filter(
+            conversation=conversation,
+        ).select_related('sender').order_by('-created_at').first()
+        if msg:
+            sender_name = f'{msg.sender.first_name} {msg.sender.last_name}'.strip()
+            Conversation.objects.filter(pk=conversation.pk).update(
+                last_message_preview=msg.content[:100],
+                last_message_sender_name=sender_name,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatsession',
+            name='last_message_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='chatsession',
+            name='last_message_preview',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='chatsession',
+            name='last_message_role',
+            field=models.CharField(blank=True, default='', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message_preview',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message_sender_name',
+            field=models.CharField(blank=True, default='', max_length=200),
+        ),
+        migrations.RunPython(backfill_last_message, migrations.RunPython.noop),
+    ]
@@ -25,6 +25,10 @@ class ChatSession(TimeStampedModel):
     title = models.CharField(max_length=200, blank=True, default='')
     is_active = models.BooleanField(default=True)
     message_count = models.PositiveIntegerField(default=0)
+    # Denormalize son mesaj ozeti (liste sorgusunda satir basina sorgu olmasin)
+    last_message_at = models.DateTimeField(null=True, blank=True)
+    last_message_role = models.CharField(max_length=10, blank=True, default='')
+    last_message_preview = models.CharField(max_length=100, blank=True, default='')
 
     class Meta:
         ordering = ['-created_at']
@@ -88,6 +92,9 @@ class Conversation(TimeStampedModel):
     )
     subject = models.CharField(max_length=300, blank=True, default='')
     last_message_at = models.DateTimeField(null=True, blank=True)
+    # Denormalize son mesaj ozeti (inbox listesi tek sorguda yuklenir)
+    last_message_preview = models.CharField(max_length=100, blank=True, default='')
+    last_message_sender_name = models.CharField(max_length=200, blank=True, default='')
     patient_unread_count = models.PositiveIntegerField(default=0)
     doctor_unread_count = models.PositiveIntegerField(default=0)
 
@@ -26,12 +26,12 @@ class ChatSessionSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'title', 'message_count', 'is_active', 'created_at']
 
     def get_last_message(self, obj):
-        msg = obj.messages.order_by('-created_at').first()
-        if msg:
+        # Denormalize ozet: satir basina mesaj sorgusu yok
+        if obj.last_message_at:
             return {
-                'role': msg.role,
-                'content': msg.content[:100],
-                'created_at': msg.created_at.isoformat(),
+                'role': obj.last_message_role,
+                'content': obj.last_message_preview,
+                'created_at': obj.last_message_at.isoformat(),
             }
         return None
 
@@ -99,12 +99,12 @@ class ConversationListSerializer(serializers.ModelSerializer):
         return obj.patient.get_full_name()
 
     def get_last_message(self, obj):
-        msg = obj.messages.order_by('-created_at').first()
-        if msg:
+        # Denormalize ozet: satir basina mesaj sorgusu yok
+        if obj.last_message_at and obj.last_message_preview:
             return {
-                'sender_name': msg.sender.get_full_name(),
-                'content': msg.content[:100],
-                'created_at': msg.created_at.isoformat(),
+                'sender_name': obj.last_message_sender_name,
+                'content': obj.last_message_preview,
+                'created_at': obj.last_message_at.isoformat(),
             }
         return None
 
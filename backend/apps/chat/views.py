@@ -2,25 +2,35 @@ import logging
 import time
 
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db.models import Count, Q, Sum
 from django.utils import timezone
 from rest_framework import viewsets, permissions, status, generics
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 
 from apps.accounts.permissions import IsPatient, IsDoctor
-from .models import ChatSession, ChatMessage, Conversation, DirectMessage
+from .models import ChatSession, ChatMessage, Conversation
 from .serializers import (
     ChatSessionSerializer, ChatSessionDetailSerializer, ChatMessageSerializer,
     AskQuestionSerializer, ConversationListSerializer, ConversationDetailSerializer,
     DirectMessageSerializer, SendMessageSerializer, StartConversationSerializer,
     DoctorListForChatSerializer,
 )
+from .inbox import record_chat_message, record_direct_message, mark_conversation_read
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
 
+class InboxCursorPagination(CursorPagination):
+    """Konusma listesi icin keyset sayfalama (OFFSET ve COUNT(*) yok)."""
+    page_size = 30
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+    ordering = ('-last_message_at', '-id')
+
+
 # ─────────────────────────────────────────────
 # Feature A: AI Chat
 # ─────────────────────────────────────────────
@@ -75,11 +85,7 @@ class ChatSessionViewSet(viewsets.ModelViewSet):
             )
 
         # Kullanici mesajini kaydet
-        user_msg = ChatMessage.objects.create(
-            session=session,
-            role='user',
-            content=question,
-        )
+        user_msg = record_chat_message(session, 'user', question)
 
         # Ilk mesajsa oturum basligini ayarla
         if not session.title:
@@ -100,13 +106,13 @@ class ChatSessionViewSet(viewsets.ModelViewSet):
             start_time = time.time()
 
             # Onceki mesajlardan context olustur (son 6 mesaj)
-            recent_msgs = ChatMessage.objects.filter(
+            recent_msgs = list(ChatMessage.objects.filter(
                 session=session,
-            ).order_by('-created_at')[:6]
+            ).order_by('-created_at')[:6])
             history_context = ''
-            if recent_msgs.count() > 1:
+            if len(recent_msgs) > 1:
                 history_parts = []
-                for msg in reversed(list(recent_msgs)):
+                for msg in reversed(recent_msgs):
                     if msg.id != user_msg.id:
                         role_label = 'Hasta' if msg.role == 'user' else 'Asistan'
                         history_parts.append(f"{role_label}: {msg.content[:200]}")
@@ -141,10 +147,8 @@ class ChatSessionViewSet(viewsets.ModelViewSet):
                 if disclaimer and disclaimer not in answer:
                     answer = f"{answer}\n\n---\n{disclaimer}"
 
-                assistant_msg = ChatMessage.objects.create(
-                    session=session,
-                    role='assistant',
-                    content=answer,
+                assistant_msg = record_chat_message(
+                    session, 'assistant', answer,
                     sources=sources,
                     confidence=confidence,
                     tokens_used=result.tokens_used,
@@ -157,27 +161,20 @@ class ChatSessionViewSet(viewsets.ModelViewSet):
                     if language == 'tr'
                     else 'An error occurred while generating your answer. Please try again.'
                 )
-                assistant_msg = ChatMessage.objects.create(
-                    session=session,
-                    role='assistant',
-                    content=error_answer,
+                assistant_msg = record_chat_message(
+                    session, 'assistant', error_answer,
                     confidence='low',
                     duration_ms=duration_ms,
                 )
 
         except Exception as e:
             logger.error(f"AI Chat error: {e}")
-            assistant_msg = ChatMessage.objects.create(
-                session=session,
-                role='assistant',
-                content='Teknik bir sorun olustu. Lutfen daha sonra tekrar deneyin.',
+            assistant_msg = record_chat_message(
+                session, 'assistant',
+                'Teknik bir sorun olustu. Lutfen daha sonra tekrar deneyin.',
                 confidence='low',
             )
 
-        # Mesaj sayisini guncelle
-        session.message_count = session.messages.count()
-        session.save(update_fields=['message_count'])
-
         return Response({
             'user_message': ChatMessageSerializer(user_msg).data,
             'assistant_message': ChatMessageSerializer(assistant_msg).data,
@@ -255,10 +252,14 @@ class ConversationViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated, IsPatient]
     http_method_names = ['get', 'post']
 
+    pagination_class = InboxCursorPagination
+
     def get_queryset(self):
         return Conversation.objects.filter(
             patient=self.request.user,
-        ).select_related('doctor').exclude(status='archived')
+        ).select_related(
+            'doctor__doctor_profile', 'patient',
+        ).exclude(status='archived')
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -297,14 +298,8 @@ class ConversationViewSet(viewsets.ModelViewSet):
             doctor=doctor,
             subject=subject,
             last_message_at=timezone.now(),
-            doctor_unread_count=1,
-        )
-
-        DirectMessage.objects.create(
-            conversation=conversation,
-            sender=request.user,
-            content=initial_message,
         )
+        record_direct_message(conversation, request.user, initial_message)
 
         # Doktora bildirim gonder
         _notify_new_message(doctor, request.user, conversation)
@@ -328,16 +323,10 @@ class ConversationViewSet(viewsets.ModelViewSet):
         serializer = SendMessageSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        msg = DirectMessage.objects.create(
-            conversation=conversation,
-            sender=request.user,
-            content=serializer.validated_data['content'],
+        msg = record_direct_message(
+            conversation, request.user, serializer.validated_data['content'],
         )
 
-        conversation.last_message_at = timezone.now()
-        conversation.doctor_unread_count += 1
-        conversation.save(update_fields=['last_message_at', 'doctor_unread_count'])
-
         _notify_new_message(conversation.doctor, request.user, conversation)
 
         return Response(DirectMessageSerializer(msg).data, status=status.HTTP_201_CREATED)
@@ -354,14 +343,7 @@ class ConversationViewSet(viewsets.ModelViewSet):
     def mark_read(self, request, pk=None):
         """Okunmamis mesajlari okundu isaretle."""
         conversation = self.get_object()
-
-        DirectMessage.objects.filter(
-            conversation=conversation,
-            is_read=False,
-        ).exclude(sender=request.user).update(is_read=True, read_at=timezone.now())
-
-        conversation.patient_unread_count = 0
-        conversation.save(update_fields=['patient_unread_count'])
+        mark_conversation_read(conversation, request.user, 'patient')
 
         return Response({'status': 'ok'})
 
@@ -375,10 +357,14 @@ class DoctorConversationViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated, IsDoctor]
     http_method_names = ['get', 'post']
 
+    pagination_class = InboxCursorPagination
+
     def get_queryset(self):
         return Conversation.objects.filter(
             doctor=self.request.user,
-        ).select_related('patient').exclude(status='archived')
+        ).select_related(
+            'doctor__doctor_profile', 'patient',
+        ).exclude(status='archived')
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -399,16 +385,10 @@ class DoctorConversationViewSet(viewsets.ModelViewSet):
         serializer = SendMessageSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        msg = DirectMessage.objects.create(
-            conversation=conversation,
-            sender=request.user,
-            content=serializer.validated_data['content'],
+        msg = record_direct_message(
+            conversation, request.user, serializer.validated_data['content'],
         )
 
-        conversation.last_message_at = timezone.now()
-        conversation.patient_unread_count += 1
-        conversation.save(update_fields=['last_message_at', 'patient_unread_count'])
-
         _notify_new_message(conversation.patient, request.user, conversation)
 
         return Response(DirectMessageSerializer(msg).data, status=status.HTTP_201_CREATED)
@@ -425,14 +405,7 @@ class DoctorConversationViewSet(viewsets.ModelViewSet):
     def mark_read(self, request, pk=None):
         """Okunmamis mesajlari okundu isaretle."""
         conversation = self.get_object()
-
-        DirectMessage.objects.filter(
-            conversation=conversation,
-            is_read=False,
-        ).exclude(sender=request.user).update(is_read=True, read_at=timezone.now())
-
-        conversation.doctor_unread_count = 0
-        conversation.save(update_fields=['doctor_unread_count'])
+        mark_conversation_read(conversation, request.user, 'doctor')
 
         return Response({'status': 'ok'})
 
@@ -442,16 +415,15 @@ class DoctorConversationStatsView(generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated, IsDoctor]
 
     def get(self, request):
-        conversations = Conversation.objects.filter(doctor=request.user)
-        active = conversations.filter(status='active').count()
-        total_unread = sum(
-            c.doctor_unread_count
-            for c in conversations.filter(status='active')
+        stats = Conversation.objects.filter(doctor=request.user).aggregate(
+            active=Count('id', filter=Q(status='active')),
+            total_unread=Sum('doctor_unread_count', filter=Q(status='active')),
+            total=Count('id'),
         )
         return Response({
-            'active_conversations': active,
-            'total_unread': total_unread,
-            'total_conversations': conversations.count(),
+            'active_conversations': stats['active'],
+            'total_unread': stats['total_unread'] or 0,
+            'total_conversations': stats['total'],
         })
 
 
@@ -2,7 +2,8 @@ from django.contrib import admin
 from .models import (
     AuditLog, ConsentRecord, AgentTask,
     SiteConfig, FeatureFlag, Announcement, HomepageHero, SocialLink,
-    MarketingCampaign, BrokenLink, BrokenLinkScan,
+    MarketingCampaign, BrokenLink, BrokenLinkScan, LinkCheckCache, GeneratedReport,
+    HealthAuditResult, TranslationMemory,
 )
 
 
@@ -41,8 +42,9 @@ class SiteConfigAdmin(admin.ModelAdmin):
 
 @admin.register(FeatureFlag)
 class FeatureFlagAdmin(admin.ModelAdmin):
-    list_display = ['key', 'label', 'is_enabled']
-    list_editable = ['is_enabled']
+    list_display = ['key', 'label', 'is_enabled', 'is_public']
+    list_editable = ['is_enabled', 'is_public']
+    list_filter = ['is_public']
 
 
 @admin.register(Announcement)
@@ -93,6 +95,38 @@ class BrokenLinkScanAdmin(admin.ModelAdmin):
     ordering = ('-created_at',)
 
 
+@admin.register(LinkCheckCache)
+class LinkCheckCacheAdmin(admin.ModelAdmin):
+    list_display = ['url', 'is_broken', 'http_status', 'checked_at']
+    list_filter = ['is_broken']
+    search_fields = ['url']
+
+
+@admin.register(GeneratedReport)
+class GeneratedReportAdmin(admin.ModelAdmin):
+    list_display = ['user', 'report_type', 'start_date', 'end_date', 'status', 'size_bytes', 'completed_at']
+    list_filter = ['report_type', 'status']
+    search_fields = ['user__email']
+    readonly_fields = ['data_version', 'file', 'size_bytes', 'error_message', 'completed_at', 'created_at']
+
+
+@admin.register(HealthAuditResult)
+class HealthAuditResultAdmin(admin.ModelAdmin):
+    list_display = ['created_at', 'status', 'is_full', 'issue_count', 'warning_count', 'duration_ms']
+    list_filter = ['status', 'is_full']
+    readonly_fields = ['status', 'is_full', 'scopes_checked', 'issue_count', 'warning_count',
+                       'results', 'versions', 'duration_ms', 'created_at']
+    ordering = ('-created_at',)
+
+
+@admin.register(TranslationMemory)
+class TranslationMemoryAdmin(admin.ModelAdmin):
+    list_display = ['source_text', 'source_lang', 'target_lang', 'provider', 'hit_count', 'last_used_at']
+    list_filter = ['source_lang', 'target_lang', 'provider']
+    search_fields = ['source_text', 'target_text']
+    readonly_fields = ['source_hash', 'hit_count', 'last_used_at', 'created_at']
+
+
 @admin.register(MarketingCampaign)
 class MarketingCampaignAdmin(admin.ModelAdmin):
     list_display = ['title', 'theme', 'status', 'week_start', 'total_tokens', 'created_by', 'created_at']
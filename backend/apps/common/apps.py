@@ -5,3 +5,6 @@ class CommonConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.common'
     label = 'common'
+
+    def ready(self):
+        import apps.common.signals  # noqa: F401
@@ -0,0 +1,189 @@
+"""
+Atomik, idempotent gunluk sayac artirimi.
+
+(user, date) basina tek satir tutan "sayac" tipindeki gunluk loglar
+(ornegin WaterIntakeLog.glasses) icin:
+
+- increment_daily_counter: tek sorguluk upsert
+  `INSERT ... ON CONFLICT (user, date) DO UPDATE SET col = col + n RETURNING *`.
+  Ardisik hizli dokunuslar birbirinin artirimini ezmez.
+- run_idempotent: Istemcinin gonderdigi Idempotency-Key ile islem en fazla
+  bir kez uygulanir; tekrar gonderimde ilk yanit aynen doner.
+- DailyCounterMixin: ViewSet'lere `increment_counter(request)` ekler.
+
+Kullanım:
+    class WaterIntakeLogViewSet(DailyCounterMixin, viewsets.ModelViewSet):
+        counter_field = 'glasses'
+
+        @action(detail=False, methods=['post'])
+        def add_glass(self, request):
+            return self.increment_counter(request)
+"""
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 100
+MAX_INCREMENT = 20
+
+# ON CONFLICT ... RETURNING destekleyen backend'ler
+_UPSERT_VENDORS = ('postgresql', 'sqlite')
+
+
+def _upsert_sql(model, field_name, obj, user_field, date_field):
+    """Sayac satiri icin tek ifadelik upsert SQL'i ve parametreleri."""
+    qn = connection.ops.quote_name
+    opts = model._meta
+    table = qn(opts.db_table)
+
+    columns, params = [], []
+    for field in opts.concrete_fields:
+        if field.primary_key and field.auto_created:
+            continue
+        columns.append(qn(field.column))
+        params.append(field.get_db_prep_save(field.pre_save(obj, add=True), connection))
+
+    counter = qn(opts.get_field(field_name).column)
+    assignments = [f'{counter} = {table}.{counter} + EXCLUDED.{counter}']
+    assignments += [
+        f'{qn(field.column)} = EXCLUDED.{qn(field.column)}'
+        for field in opts.concrete_fields if getattr(field, 'auto_now', False)
+    ]
+    conflict = ', '.join(
+        qn(opts.get_field(name).column) for name in (user_field, date_field)
+    )
+    sql = (
+        f'INSERT INTO {table} ({", ".join(columns)}) '
+        f'VALUES ({", ".join(["%s"] * len(columns))}) '
+        f'ON CONFLICT ({conflict}) DO UPDATE SET {", ".join(assignments)} '
+        f'RETURNING {", ".join(qn(field.column) for field in opts.concrete_fields)}'
+    )
+    return sql, params
+
+
+def _from_row(model, row):
+    """Ham RETURNING satirini backend donusturuculerinden gecirip model instance'ina cevir."""
+    fields = model._meta.concrete_fields
+    values = []
+    for field, value in zip(fields, row):
+        expression = field.get_col(model._meta.db_table)
+        for converter in connection.ops.get_db_converters(expression) + field.get_db_converters(connection):
+            value = converter(value, expression, connection)
+        values.append(value)
+    return model.from_db(connection.alias, [field.attname for field in fields], values)
+
+
+def increment_daily_counter(model, field_name, user, day=None, amount=1, defaults=None,
+                            user_field='user', date_field='date'):
+    """
+    (user, day) satirindaki sayaci `amount` kadar artir, guncel satiri dondur.
+
+    Satir yoksa `defaults` ile olusturulur ve sayac `amount` olur.
+    Model (user_field, date_field) uzerinde unique olmalidir.
+    """
+    day = day or timezone.localdate()
+    values = {**(defaults or {}), user_field: user, date_field: day}
+
+    if connection.vendor in _UPSERT_VENDORS:
+        obj = model(**values, **{field_name: amount})
+        sql, params = _upsert_sql(model, field_name, obj, user_field, date_field)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+        return _from_row(model, row)
+
+    # Diger backend'ler: kosullu UPDATE, yoksa olustur (yaris durumunda tekrar UPDATE)
+    lookup = {user_field: user, date_field: day}
+    with transaction.atomic():
+        if not model.objects.filter(**lookup).update(**{field_name: F(field_name) + amount}):
+            try:
+                with transaction.atomic():
+                    return model.objects.create(**values, **{field_name: amount})
+            except IntegrityError:
+                model.objects.filter(**lookup).update(**{field_name: F(field_name) + amount})
+        return model.objects.get(**lookup)
+
+
+def run_idempotent(user, key, scope, operation):
+    """
+    operation() sonucunu (JSON uyumlu dict) dondur; ayni anahtar daha once
+    kullanildiysa islemi tekrar etmeden ilk yaniti dondur.
+
+    Donus: (data, replayed). Islem ve anahtar kaydi ayni transaction'dadir:
+    es zamanli iki istekte anahtar eklemesi unique ihlaline dusen taraf
+    kendi artirimini geri alir ve kaydedilmis yaniti doner.
+    """
+    from apps.common.models import IdempotencyKey
+
+    if not key:
+        return operation(), False
+
+    try:
+        with transaction.atomic():
+            data = operation()
+            IdempotencyKey.objects.create(user=user, key=key, scope=scope, response=data)
+        return data, False
+    except IntegrityError:
+        stored = IdempotencyKey.objects.filter(user=user, key=key).first()
+        if stored is None:
+            raise
+        if stored.scope != scope:
+            raise ValidationError({'idempotency_key': 'Bu anahtar baska bir islem icin kullanildi.'})
+        return stored.response, True
+
+
+def get_idempotency_key(request):
+    """Header veya govdeden idempotency anahtarini al ve dogrula."""
+    key = request.headers.get(IDEMPOTENCY_HEADER) or request.data.get('idempotency_key') or ''
+    key = str(key).strip()
+    if len(key) > MAX_KEY_LENGTH:
+        raise ValidationError({'idempotency_key': f'En fazla {MAX_KEY_LENGTH} karakter olabilir.'})
+    return key
+
+
+class DailyCounterMixin:
+    """
+    Gunluk sayac loglari icin atomik + idempotent artirim.
+
+    counter_field: artirilacak alan. Model get_serializer_class() ile
+    serializer'dan, satir varsayilanlari counter_defaults ile verilir.
+    Govde: {"amount": 3} (coklu dokunus tek istekte), varsayilan 1.
+    """
+    counter_field = None
+    counter_defaults = {}
+    counter_max_increment = MAX_INCREMENT
+
+    def get_counter_amount(self, request):
+        raw = request.data.get('amount', 1)
+        try:
+            amount = int(raw)
+        except (TypeError, ValueError):
+            raise ValidationError({'amount': 'Tam sayi olmali.'})
+        if not 1 <= amount <= self.counter_max_increment:
+            raise ValidationError({'amount': f'1 ile {self.counter_max_increment} arasinda olmali.'})
+        return amount
+
+    def increment_counter(self, request, day=None):
+        serializer_class = self.get_serializer_class()
+        model = serializer_class.Meta.model
+        amount = self.get_counter_amount(request)
+        key = get_idempotency_key(request)
+        scope = f'{model._meta.label_lower}.{self.counter_field}'
+
+        def operation():
+            log = increment_daily_counter(
+                model, self.counter_field, request.user, day=day,
+                amount=amount, defaults=self.counter_defaults,
+            )
+            return serializer_class(log, context=self.get_serializer_context()).data
+
+        data, replayed = run_idempotent(request.user, key, scope, operation)
+        response = Response(data, status=status.HTTP_200_OK)
+        if replayed:
+            response['Idempotent-Replayed'] = 'true'
+        return response
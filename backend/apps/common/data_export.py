@@ -0,0 +1,385 @@
+"""
+Hasta verisi disa aktarimi: tum modullerden tek zip arsivi.
+
+Hekim talepleri ve KVKK ilgili kisi basvurulari icin hastanin migren,
+epilepsi, semptom/ilac takibi, demans, Parkinson, wellness, gorev ve
+sohbet kayitlari tek arsivde verilir:
+
+- Her kaynak tablo `.iterator(chunk_size=EXPORT_CHUNK_SIZE)` ile okunur
+  (PostgreSQL'de sunucu tarafli cursor); satirlar NDJSON veya CSV olarak
+  zip uyesine yazilir ve sikistirilmis baytlar uretildikce stream edilir.
+  Bellek kullanimi gecmisin uzunlugundan bagimsizdir.
+- Arsivin sonunda manifest.json: uye basina satir sayisi.
+- Talep eden hastanin kendisi degilse (hekim) kapsam daraltilir: chatbot
+  oturumlari arsive girmez, dogrudan mesajlar yalnizca talep eden hekimle
+  olan konusmalardan alinir (ExportSource.own_only / requester_lookup).
+- Buyuk aktarimlar (?async=1 veya ASYNC_EXPORT_MIN_ROWS ustu) Celery'de
+  DataExport kaydina yazilir; istemci 202 yanitindaki status_url'i sorgular.
+  Ayni hasta + format + talep eden icin bekleyen/hazir arsiv varsa yenisi
+  olusturulmaz, o dondurulur.
+- Hazir arsivler EXPORT_RETENTION_HOURS sonra indirilemez; gecelik
+  purge_data_exports gorevi kayitlari dosyalariyla siler.
+
+Kullanım:
+    return data_export.export_response(request, patient)
+"""
+
+import csv
+import io
+import json
+import logging
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.files import File
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CHUNK_SIZE = 2000
+# Toplam satir sayisi bunu asarsa arsiv arka planda uretilir
+ASYNC_EXPORT_MIN_ROWS = 50000
+EXPORT_FORMATS = ('ndjson', 'csv')
+EXPORT_RETENTION_HOURS = 72
+
+
+@dataclass(frozen=True)
+class ExportSource:
+    """
+    Arsive giren tablo: model etiketi ve hastaya giden lookup.
+
+    own_only: yalnizca hastanin kendi talebinde arsive girer.
+    requester_lookup: baskasi talep ettiginde satirlar bu lookup ile talep
+    edene daraltilir.
+    """
+    model: str
+    patient_lookup: str = 'patient'
+    own_only: bool = False
+    requester_lookup: str = ''
+
+    def applies(self, patient, requested_by=None) -> bool:
+        return not self.own_only or _is_own(patient, requested_by)
+
+    def queryset(self, patient, requested_by=None):
+        model = apps.get_model(self.model)
+        queryset = model.objects.filter(**{self.patient_lookup: patient})
+        if self.requester_lookup and not _is_own(patient, requested_by):
+            queryset = queryset.filter(**{self.requester_lookup: requested_by})
+        return queryset.order_by('pk')
+
+    def member_name(self, export_format):
+        app_label, model_name = self.model.split('.')
+        return f'{app_label}/{model_name}.{export_format}'
+
+
+EXPORT_SOURCES = (
+    ExportSource('migraine.MigraineAttack'),
+    ExportSource('epilepsy.SeizureEvent'),
+    ExportSource('tracking.SymptomEntry'),
+    ExportSource('tracking.Medication'),
+    ExportSource('tracking.MedicationLog'),
+    ExportSource('tracking.ReminderConfig'),
+    ExportSource('dementia.ExerciseSession'),
+    ExportSource('dementia.DailyAssessment'),
+    ExportSource('dementia.CognitiveScore'),
+    ExportSource('dementia.CognitiveScreening'),
+    ExportSource('dementia.CaregiverNote'),
+    ExportSource('parkinson.ParkinsonSymptomEntry'),
+    ExportSource('parkinson.ParkinsonMedication'),
+    ExportSource('parkinson.ParkinsonMedicationLog', 'medication__patient'),
+    ExportSource('parkinson.HoehnYahrAssessment'),
+    ExportSource('parkinson.SchwabEnglandAssessment'),
+    ExportSource('parkinson.NMSQuestAssessment'),
+    ExportSource('parkinson.NoseraMotorAssessment'),
+    ExportSource('parkinson.NoseraDailyLivingAssessment'),
+    ExportSource('parkinson.ParkinsonVisit'),
+    ExportSource('wellness.ExerciseSession', 'user'),
+    ExportSource('wellness.SleepLog', 'user'),
+    ExportSource('wellness.MenstrualLog', 'user'),
+    ExportSource('wellness.WaterIntakeLog', 'user'),
+    ExportSource('wellness.WeatherSensitivityProfile', 'user'),
+    ExportSource('patients.PatientModule'),
+    ExportSource('patients.TaskCompletion'),
+    ExportSource('chat.ChatSession', own_only=True),
+    ExportSource('chat.ChatMessage', 'session__patient', own_only=True),
+    ExportSource('chat.DirectMessage', 'conversation__patient', requester_lookup='conversation__doctor'),
+)
+
+
+def _is_own(patient, requested_by) -> bool:
+    """Talep hastanin kendisinden mi (None: hasta/sistem talebi)."""
+    return requested_by is None or requested_by.pk == patient.pk
+
+
+def export_sources(patient, requested_by=None, sources=EXPORT_SOURCES) -> list:
+    """Talep edene gore arsive girecek kaynaklar."""
+    return [source for source in sources if source.applies(patient, requested_by)]
+
+
+class _ZipSink(io.RawIOBase):
+    """ZipFile'in yazdigi baytlari biriktiren, seek desteklemeyen hedef."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def pop(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _ndjson_chunks(rows):
+    batch = []
+    for row in rows:
+        batch.append(json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False))
+        if len(batch) >= EXPORT_CHUNK_SIZE:
+            yield ('\n'.join(batch) + '\n').encode()
+            batch = []
+    if batch:
+        yield ('\n'.join(batch) + '\n').encode()
+
+
+def _csv_value(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=DjangoJSONEncoder, ensure_ascii=False)
+    return value
+
+
+def _csv_chunks(rows, fieldnames):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fieldnames)
+    count = 0
+    for row in rows:
+        writer.writerow([_csv_value(row[name]) for name in fieldnames])
+        count += 1
+        if count % EXPORT_CHUNK_SIZE == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _counting(rows, counter):
+    for row in rows:
+        counter[0] += 1
+        yield row
+
+
+def iter_archive(patient, export_format='ndjson', requested_by=None, sources=EXPORT_SOURCES):
+    """Zip arsivinin baytlarini parca parca uret (sabit bellek)."""
+    sink = _ZipSink()
+    manifest = {
+        'patient_id': patient.pk,
+        'requested_by_id': requested_by.pk if requested_by is not None else patient.pk,
+        'format': export_format,
+        'generated_at': timezone.now().isoformat(),
+        'members': [],
+    }
+
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for source in export_sources(patient, requested_by, sources):
+            queryset = source.queryset(patient, requested_by)
+            fieldnames = [field.attname for field in queryset.model._meta.concrete_fields]
+            counter = [0]
+            rows = _counting(queryset.values(*fieldnames).iterator(chunk_size=EXPORT_CHUNK_SIZE), counter)
+            chunks = _ndjson_chunks(rows) if export_format == 'ndjson' else _csv_chunks(rows, fieldnames)
+
+            name = source.member_name(export_format)
+            with archive.open(name, 'w', force_zip64=True) as member:
+                for chunk in chunks:
+                    member.write(chunk)
+                    data = sink.pop()
+                    if data:
+                        yield data
+            manifest['members'].append({'name': name, 'model': source.model, 'rows': counter[0]})
+            yield sink.pop()
+
+        manifest['total_rows'] = sum(member['rows'] for member in manifest['members'])
+        archive.writestr('manifest.json', json.dumps(manifest, cls=DjangoJSONEncoder, indent=2))
+    yield sink.pop()
+
+
+def archive_filename(patient, export_format):
+    return f'hasta_verisi_{patient.pk}_{timezone.localdate():%Y%m%d}_{export_format}.zip'
+
+
+def streaming_response(patient, export_format='ndjson', requested_by=None):
+    response = StreamingHttpResponse(
+        (chunk for chunk in iter_archive(patient, export_format, requested_by) if chunk),
+        content_type='application/zip',
+    )
+    response['Content-Disposition'] = f'attachment; filename="{archive_filename(patient, export_format)}"'
+    return response
+
+
+def estimated_rows(patient, requested_by=None, sources=EXPORT_SOURCES) -> int:
+    return sum(
+        source.queryset(patient, requested_by).count()
+        for source in export_sources(patient, requested_by, sources)
+    )
+
+
+# ------------------------------------------------------------
+# Arka plan (Celery) varyanti
+# ------------------------------------------------------------
+
+def claim_export(export) -> bool:
+    """Uretimi tek bir worker'a ver (pending/failed -> running kosullu UPDATE)."""
+    from apps.common.models import DataExport
+
+    claimed = DataExport.objects.filter(
+        id=export.id, status__in=('pending', 'failed'),
+    ).update(status='running', error_message='', updated_at=timezone.now())
+    if claimed:
+        export.status = 'running'
+    return bool(claimed)
+
+
+def render_export(export):
+    """Arsivi gecici dosyaya stream edip storage'a yaz."""
+    try:
+        with tempfile.TemporaryFile() as tmp:
+            for chunk in iter_archive(export.patient, export.export_format, export.requested_by):
+                tmp.write(chunk)
+            size = tmp.tell()
+            tmp.seek(0)
+            with zipfile.ZipFile(tmp) as archive:
+                manifest = json.loads(archive.read('manifest.json'))
+            tmp.seek(0)
+            export.file.save(
+                f'{export.patient_id}/{export.id}.zip', File(tmp), save=False,
+            )
+        export.size_bytes = size
+        export.row_count = manifest['total_rows']
+        export.status = 'ready'
+        export.completed_at = timezone.now()
+        export.expires_at = export.completed_at + timedelta(hours=EXPORT_RETENTION_HOURS)
+        export.save(update_fields=[
+            'file', 'size_bytes', 'row_count', 'status', 'completed_at', 'expires_at', 'updated_at',
+        ])
+    except Exception as e:
+        logger.exception(f"Veri disa aktarimi uretilemedi: {export.id}")
+        export.status = 'failed'
+        export.error_message = str(e)
+        export.save(update_fields=['status', 'error_message', 'updated_at'])
+        raise
+    return export
+
+
+def export_status_data(export) -> dict:
+    base = f'/api/v1/kvkk/exports/{export.id}/'
+    return {
+        'id': str(export.id),
+        'patient_id': export.patient_id,
+        'format': export.export_format,
+        'status': export.status,
+        'size_bytes': export.size_bytes,
+        'row_count': export.row_count,
+        'error_message': export.error_message,
+        'expires_at': export.expires_at,
+        'status_url': base,
+        'download_url': f'{base}download/',
+    }
+
+
+def is_expired(export) -> bool:
+    return export.expires_at is not None and export.expires_at <= timezone.now()
+
+
+def active_export(patient, export_format, requested_by):
+    """Yeniden kullanilabilecek bekleyen, uretilen veya suresi dolmamis hazir arsiv."""
+    from django.db.models import Q
+    from apps.common.models import DataExport
+
+    return DataExport.objects.filter(
+        Q(status__in=('pending', 'running')) | Q(status='ready', expires_at__gt=timezone.now()),
+        patient=patient, export_format=export_format, requested_by=requested_by,
+    ).order_by('-created_at').first()
+
+
+def delete_exports(queryset) -> int:
+    """Disa aktarim kayitlarini arsiv dosyalariyla birlikte sil."""
+    count = 0
+    for export in queryset:
+        if export.file:
+            export.file.delete(save=False)
+        export.delete()
+        count += 1
+    return count
+
+
+def purge_expired_exports(now=None) -> int:
+    """Suresi dolan hazir arsivleri ve saklama suresini asan yarim kalmis kayitlari sil."""
+    from django.db.models import Q
+    from apps.common.models import DataExport
+
+    now = now or timezone.now()
+    stale = now - timedelta(hours=EXPORT_RETENTION_HOURS)
+    return delete_exports(DataExport.objects.filter(
+        Q(expires_at__lte=now) | Q(expires_at__isnull=True, updated_at__lt=stale)
+    ))
+
+
+def file_response(export):
+    response = FileResponse(
+        export.file.storage.open(export.file.name, 'rb'), content_type='application/zip',
+    )
+    response['Content-Length'] = str(export.size_bytes or export.file.size)
+    response['Content-Disposition'] = (
+        f'attachment; filename="{archive_filename(export.patient, export.export_format)}"'
+    )
+    return response
+
+
+def export_response(request, patient):
+    """
+    Disa aktarim endpoint'leri icin ortak yanit: kucuk arsivler dogrudan
+    stream edilir, buyukler (veya ?async=1) Celery'ye gider ve 202 doner.
+    """
+    from apps.common.models import DataExport
+    from apps.common.tasks import generate_data_export
+
+    export_format = request.query_params.get('export_format', 'ndjson')
+    if export_format not in EXPORT_FORMATS:
+        return Response(
+            {'detail': f"Gecersiz format. Secenekler: {', '.join(EXPORT_FORMATS)}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    wants_async = (
+        request.query_params.get('async') in ('1', 'true')
+        or estimated_rows(patient, request.user) > ASYNC_EXPORT_MIN_ROWS
+    )
+    if not wants_async:
+        return streaming_response(patient, export_format, request.user)
+
+    with transaction.atomic():
+        # Ayni hasta icin es zamanli talepler tek kayit uretsin
+        type(patient).objects.select_for_update().filter(pk=patient.pk).first()
+        export = active_export(patient, export_format, request.user)
+        if export is None:
+            export = DataExport.objects.create(
+                patient=patient, requested_by=request.user, export_format=export_format,
+            )
+            transaction.on_commit(lambda: generate_data_export.delay(str(export.id)))
+
+    code = status.HTTP_200_OK if export.status == 'ready' else status.HTTP_202_ACCEPTED
+    return Response(export_status_data(export), status=code)
@@ -0,0 +1,490 @@
+"""
+Platform saglik alt sistemi.
+
+Probe'lar (izleme sik sorgulayabilir, tarama yok):
+- liveness: I/O yok; proses ayakta mi.
+- readiness: veritabani (SELECT 1), cache (production'da Redis) gidis-donus,
+  Celery kuyruk derinligi ve beat'teki her periyodik gorevin son calisma
+  yasi (django_celery_beat PeriodicTask.last_run_at, tek sorgu). DB veya
+  cache yoksa 503; kuyruk birikmesi / geciken beat 'degraded' olarak raporlanir.
+  Sonuc READINESS_TTL saniye cache'lenir (her probe broker'a baglanmaz);
+  ayrinti (kuyruk/gorev adlari, hata metinleri) yalnizca admin'e gosterilir.
+
+Icerik tutarlilik denetimi (artimli):
+- Denetim kapsamlara ayrilir (modules, news, articles). Kapsamin
+  modellerine yazildiginda/silindiginde sinyaller kapsamin cache'teki
+  degisiklik surumunu yeniler (mark_changed).
+- Her calisma yalnizca surumu son sonuctan beri degisen kapsamlari yeniden
+  denetler; digerlerinin sonucu onceki HealthAuditResult'tan tasinir.
+  Sonuclar zaman serisi olarak saklanir; hicbir kapsam degismediyse yeni
+  satir yazilmaz (onceki sonuc gecerlidir). RESULT_RETENTION_DAYS'ten eski
+  satirlari gecelik purge_health_audits gorevi siler.
+- Tam calisma (full=True, gunde bir) tum kapsamlari ve canli endpoint
+  kontrollerini calistirir; sinyalsiz yazimlari (queryset.update) yakalar.
+
+Kullanım:
+    health.readiness()                        # {'status': ..., 'checks': {...}}
+    health.cached_readiness()                 # ayni, READINESS_TTL saniye cache'li
+    health.run_consistency_audit(full=False)  # HealthAuditResult
+"""
+
+import json
+import logging
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+PROBE_CACHE_KEY = 'health:probe'
+READINESS_CACHE_KEY = 'health:readiness'
+READINESS_TTL = 10
+VERSION_KEY = 'health:scope_version:{scope}'
+# Bu kadar bekleyen mesaj kuyrugu 'degraded' yapar
+QUEUE_DEPTH_WARN = 500
+# Beat gorevinin planlanan zamanindan bu kadar gecikmesine izin verilir (saniye)
+BEAT_GRACE_SECONDS = 15 * 60
+RESULT_RETENTION_DAYS = 30
+
+EXPECTED_MODULES = ['migraine', 'epilepsy', 'dementia', 'parkinson']
+# Frontend modul sayfalarinin bekledigi egitim kategorileri
+MODULE_EDUCATION_CATEGORIES = {
+    'migraine': ['basics', 'treatment'],
+    'epilepsy': ['basics'],
+    'dementia': ['basics', 'exercises'],
+    'parkinson': ['basics', 'treatment', 'exercises'],
+}
+
+# Kapsam -> degisikligi izlenen modeller (signals.py)
+SCOPE_MODELS = {
+    'modules': ('patients.DiseaseModule', 'content.EducationItem', 'content.ContentCategory'),
+    'news': ('content.NewsArticle', 'content.NewsArticle_related_diseases'),
+    'articles': ('content.Article',),
+}
+
+
+# ------------------------------------------------------------
+# Probe'lar
+# ------------------------------------------------------------
+
+def _timed(fn):
+    start = time.monotonic()
+    try:
+        result = fn() or {}
+        result.setdefault('ok', True)
+    except Exception as e:
+        result = {'ok': False, 'error': str(e)[:200]}
+    result['response_ms'] = round((time.monotonic() - start) * 1000, 1)
+    return result
+
+
+def check_database():
+    def probe():
+        with connection.cursor() as c:
+            c.execute("SELECT 1")
+    return _timed(probe)
+
+
+def check_cache():
+    def probe():
+        token = uuid.uuid4().hex
+        cache.set(PROBE_CACHE_KEY, token, 30)
+        return {'ok': cache.get(PROBE_CACHE_KEY) == token}
+    return _timed(probe)
+
+
+def _queue_names(app):
+    names = {app.conf.task_default_queue or 'celery'}
+    routes = app.conf.task_routes
+    if isinstance(routes, dict):
+        names.update(route['queue'] for route in routes.values() if isinstance(route, dict) and route.get('queue'))
+    return sorted(names)
+
+
+def check_queue():
+    """Broker'daki bekleyen mesaj sayisi (kuyruk basina)."""
+    from config.celery import app
+
+    if app.conf.task_always_eager:
+        return {'ok': True, 'skipped': 'eager'}
+
+    def probe():
+        with app.connection_for_read() as conn:
+            conn.ensure_connection(max_retries=1)
+            depth = {
+                name: conn.default_channel.queue_declare(queue=name, passive=True).message_count
+                for name in _queue_names(app)
+            }
+        return {'ok': max(depth.values(), default=0) <= QUEUE_DEPTH_WARN, 'depth': depth}
+    return _timed(probe)
+
+
+def check_beat(now=None):
+    """Beat programindaki her gorevin son calisma yasi ve gecikme durumu."""
+    from django_celery_beat.models import PeriodicTask
+    from config.celery import app
+
+    now = now or timezone.now()
+    schedule = app.conf.beat_schedule or {}
+
+    def probe():
+        last_runs = dict(
+            PeriodicTask.objects.filter(name__in=list(schedule), enabled=True)
+            .values_list('name', 'last_run_at')
+        )
+        tasks, overdue = {}, []
+        for name, entry in schedule.items():
+            last_run = last_runs.get(name)
+            info = {'task': entry['task'], 'last_run_at': last_run.isoformat() if last_run else None}
+            if last_run:
+                info['age_seconds'] = int((now - last_run).total_seconds())
+                remaining = entry['schedule'].remaining_estimate(last_run).total_seconds()
+                info['overdue'] = remaining < -BEAT_GRACE_SECONDS
+                if info['overdue']:
+                    overdue.append(name)
+            tasks[name] = info
+        return {'ok': not overdue, 'overdue': overdue, 'tasks': tasks}
+    return _timed(probe)
+
+
+def readiness() -> dict:
+    checks = {
+        'database': check_database(),
+        'cache': check_cache(),
+        'queue': check_queue(),
+        'beat': check_beat(),
+    }
+    if not (checks['database']['ok'] and checks['cache']['ok']):
+        status = 'down'
+    elif all(check['ok'] for check in checks.values()):
+        status = 'ok'
+    else:
+        status = 'degraded'
+    return {'status': status, 'checks': checks}
+
+
+def cached_readiness() -> dict:
+    """readiness() sonucunu kisa sure paylas; cache yoksa her seferinde hesapla."""
+    try:
+        data = cache.get(READINESS_CACHE_KEY)
+    except Exception:
+        data = None
+    if data is None:
+        data = readiness()
+        try:
+            cache.set(READINESS_CACHE_KEY, data, READINESS_TTL)
+        except Exception:
+            pass
+    return data
+
+
+# ------------------------------------------------------------
+# Degisiklik izleme
+# ------------------------------------------------------------
+
+def mark_changed(scope):
+    """Kapsamin degisiklik surumunu commit sonrasi yenile."""
+    def _bump():
+        try:
+            cache.set(VERSION_KEY.format(scope=scope), uuid.uuid4().hex, None)
+        except Exception:
+            logger.warning("Saglik kapsam surumu yazilamadi", exc_info=True)
+
+    transaction.on_commit(_bump)
+
+
+def scope_versions() -> dict:
+    """Kapsamlarin guncel surumleri; cache'te olmayan (silinmis) surum yenilenir."""
+    keys = {scope: VERSION_KEY.format(scope=scope) for scope in SCOPE_MODELS}
+    try:
+        stored = cache.get_many(list(keys.values()))
+    except Exception:
+        stored = {}
+    versions = {}
+    for scope, key in keys.items():
+        version = stored.get(key)
+        if version is None:
+            # Surum bilinmiyorsa kapsam degismis sayilir
+            version = uuid.uuid4().hex
+            try:
+                cache.set(key, version, None)
+            except Exception:
+                pass
+        versions[scope] = version
+    return versions
+
+
+# ------------------------------------------------------------
+# Tutarlilik kontrolleri (kapsam basina)
+# ------------------------------------------------------------
+
+def _result():
+    return {'issues': [], 'warnings': [], 'stats': {}}
+
+
+def check_modules() -> dict:
+    from apps.content.models import EducationItem
+    from apps.patients.models import DiseaseModule
+
+    result = _result()
+    active = set(DiseaseModule.objects.filter(is_active=True).values_list('slug', flat=True))
+    for slug in EXPECTED_MODULES:
+        if slug not in active:
+            result['issues'].append(f'❌ DiseaseModule "{slug}" aktif değil veya mevcut değil')
+    result['stats']['disease_modules'] = len(active)
+
+    published = EducationItem.objects.filter(is_published=True, disease_module__slug__in=EXPECTED_MODULES)
+    counts = dict(
+        published.filter(disease_module__is_active=True)
+        .values_list('disease_module__slug').annotate(n=Count('id')).order_by()
+    )
+    for slug in EXPECTED_MODULES:
+        if slug not in active:
+            continue
+        count = counts.get(slug, 0)
+        result['stats'][f'education_{slug}'] = count
+        if count == 0:
+            result['issues'].append(f'❌ {slug.title()} modülünde hiç eğitim içeriği yok')
+        elif count < 3:
+            result['warnings'].append(
+                f'⚠️ {slug.title()} modülünde sadece {count} eğitim içeriği var (min 3 önerilir)'
+            )
+
+    categories = {}
+    for slug, category in published.values_list('disease_module__slug', 'category__slug').distinct():
+        categories.setdefault(slug, set()).add(category)
+    for slug, expected in MODULE_EDUCATION_CATEGORIES.items():
+        missing = sorted(set(expected) - categories.get(slug, set()))
+        if missing:
+            result['warnings'].append(f'⚠️ {slug.title()} eğitiminde eksik kategori: {", ".join(missing)}')
+    return result
+
+
+def check_news() -> dict:
+    from apps.content.models import NewsArticle
+
+    result = _result()
+    published = NewsArticle.objects.filter(status='published')
+    agg = published.aggregate(
+        total=Count('id'),
+        no_image=Count('id', filter=Q(featured_image='')),
+        no_slug=Count('id', filter=Q(slug='')),
+    )
+    result['stats']['news_total'] = agg['total']
+    if agg['total'] == 0:
+        result['issues'].append('❌ Hiç yayınlanmış haber yok')
+
+    per_disease = dict(
+        published.filter(related_diseases__slug__in=EXPECTED_MODULES)
+        .values_list('related_diseases__slug').annotate(n=Count('id')).order_by()
+    )
+    for slug in EXPECTED_MODULES:
+        result['stats'][f'news_{slug}'] = per_disease.get(slug, 0)
+        if not per_disease.get(slug):
+            result['warnings'].append(f'⚠️ {slug.title()} ile ilgili hiç haber yok')
+
+    if agg['no_image']:
+        result['warnings'].append(f'⚠️ {agg["no_image"]} haberde görsel eksik')
+    if agg['no_slug']:
+        result['issues'].append(f'❌ {agg["no_slug"]} haberde slug eksik (detay sayfası açılmaz)')
+
+    duplicates = published.values('slug').annotate(cnt=Count('id')).filter(cnt__gt=1).order_by()
+    for row in duplicates:
+        result['issues'].append(f'❌ Duplike haber slug: "{row["slug"]}" ({row["cnt"]} adet)')
+    return result
+
+
+def check_articles() -> dict:
+    from apps.content.models import Article
+
+    result = _result()
+    agg = Article.objects.filter(status='published').aggregate(
+        total=Count('id'), no_slug=Count('id', filter=Q(slug='')),
+    )
+    result['stats']['articles_total'] = agg['total']
+    if agg['total'] == 0:
+        result['warnings'].append('⚠️ Hiç yayınlanmış blog makalesi yok')
+    if agg['no_slug']:
+        result['issues'].append(f'❌ {agg["no_slug"]} makalede slug eksik')
+    return result
+
+
+PUBLIC_ENDPOINTS = [
+    ('/api/v1/content/public-news/', 'Haberler API'),
+    ('/api/v1/content/public-education/', 'Eğitim API'),
+    ('/api/v1/content/articles/', 'Makaleler API'),
+    ('/api/v1/health/', 'Health Check API'),
+    ('/api/v1/modules/', 'Modüller API'),
+]
+AUTH_ENDPOINTS = [
+    ('/api/v1/content/education/', 'Eğitim (Auth) API'),
+    ('/api/v1/doctor/dashboard/stats/', 'Doktor Dashboard API'),
+]
+
+
+def check_endpoints() -> dict:
+    """Canli endpoint kontrolleri (yalnizca tam calismada)."""
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.test import Client
+
+    result = _result()
+    server_name = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+    client = Client(SERVER_NAME=server_name)
+    for endpoint, label in PUBLIC_ENDPOINTS:
+        try:
+            response = client.get(endpoint, follow=True)
+            if response.status_code >= 400:
+                result['issues'].append(f'❌ {label} ({endpoint}) → HTTP {response.status_code}')
+            else:
+                result['stats'][f'api_{label}'] = f'OK ({response.status_code})'
+        except Exception as e:
+            result['issues'].append(f'❌ {label} ({endpoint}) → Hata: {str(e)[:100]}')
+
+    admin_user = get_user_model().objects.filter(is_superuser=True).first()
+    if admin_user is None:
+        return result
+
+    from rest_framework_simplejwt.tokens import AccessToken
+    auth_header = {'HTTP_AUTHORIZATION': f'Bearer {AccessToken.for_user(admin_user)}'}
+    for endpoint, label in AUTH_ENDPOINTS:
+        try:
+            response = client.get(endpoint, follow=True, **auth_header)
+            if response.status_code >= 400:
+                result['warnings'].append(f'⚠️ {label} ({endpoint}) → HTTP {response.status_code}')
+        except Exception as e:
+            result['warnings'].append(f'⚠️ {label} ({endpoint}) → Hata: {str(e)[:100]}')
+
+    try:
+        response = client.get('/api/v1/content/education/?disease_module=parkinson', follow=True, **auth_header)
+        if response.status_code == 200:
+            data = json.loads(response.content)
+            items = data if isinstance(data, list) else data.get('results', [])
+            if not items:
+                result['issues'].append('❌ Parkinson eğitim API\'si veri döndürmüyor (0 item)')
+            else:
+                result['stats']['parkinson_edu_api'] = f'{len(items)} item'
+        else:
+            result['issues'].append(f'❌ Parkinson eğitim API → HTTP {response.status_code}')
+    except Exception as e:
+        result['issues'].append(f'❌ Parkinson eğitim API → Hata: {str(e)[:100]}')
+    return result
+
+
+SCOPE_CHECKS = {
+    'modules': check_modules,
+    'news': check_news,
+    'articles': check_articles,
+}
+
+
+# ------------------------------------------------------------
+# Denetim
+# ------------------------------------------------------------
+
+def _flatten(results, key):
+    return [message for scope in results.values() for message in scope[key]]
+
+
+def run_consistency_audit(full=False):
+    """
+    Degisen kapsamlari denetle ve sonucu zaman serisine yaz. Artimli
+    calismada degisen kapsam yoksa satir yazilmaz, onceki sonuc doner.
+    """
+    from apps.common.models import HealthAuditResult
+
+    start = time.monotonic()
+    previous = HealthAuditResult.objects.first()
+    # Surumler denetimden once okunur: denetim sirasindaki yazim bir sonraki calismada yakalanir
+    versions = scope_versions()
+    prev_results = previous.results if previous else {}
+    prev_versions = previous.versions if previous else {}
+
+    results, checked = {}, []
+    for scope, check in SCOPE_CHECKS.items():
+        if full or scope not in prev_results or prev_versions.get(scope) != versions[scope]:
+            results[scope] = check()
+            checked.append(scope)
+        else:
+            results[scope] = prev_results[scope]
+
+    if full:
+        results['endpoints'] = check_endpoints()
+        checked.append('endpoints')
+    elif 'endpoints' in prev_results:
+        results['endpoints'] = prev_results['endpoints']
+
+    if not checked:
+        return previous
+
+    issues, warnings = _flatten(results, 'issues'), _flatten(results, 'warnings')
+    return HealthAuditResult.objects.create(
+        status='fail' if issues else 'warn' if warnings else 'ok',
+        is_full=full,
+        scopes_checked=checked,
+        issue_count=len(issues),
+        warning_count=len(warnings),
+        results=results,
+        versions=versions,
+        duration_ms=int((time.monotonic() - start) * 1000),
+    )
+
+
+def has_new_findings(result, previous) -> bool:
+    """Onceki calismada olmayan sorun/uyari var mi?"""
+    if previous is None:
+        return bool(result.issue_count or result.warning_count)
+    before = set(_flatten(previous.results, 'issues') + _flatten(previous.results, 'warnings'))
+    after = set(_flatten(result.results, 'issues') + _flatten(result.results, 'warnings'))
+    return bool(after - before)
+
+
+def format_report(result) -> str:
+    issues, warnings = _flatten(result.results, 'issues'), _flatten(result.results, 'warnings')
+    stats = {k: v for scope in result.results.values() for k, v in scope['stats'].items()}
+    now = timezone.localtime(result.created_at).strftime('%Y-%m-%d %H:%M')
+
+    lines = [f'📊 Backend-Frontend Uyum Raporu ({now})', '', '📈 İstatistikler:']
+    lines += [f'  • {key}: {val}' for key, val in stats.items()]
+    lines.append('')
+    if issues:
+        lines.append(f'🚨 KRİTİK SORUNLAR ({len(issues)}):')
+        lines += [f'  {issue}' for issue in issues]
+        lines.append('')
+    if warnings:
+        lines.append(f'⚠️ UYARILAR ({len(warnings)}):')
+        lines += [f'  {warn}' for warn in warnings]
+        lines.append('')
+    if not issues and not warnings:
+        lines.append('✅ Tüm kontroller başarılı! Backend-frontend uyumu sorunsuz.')
+    return '\n'.join(lines)
+
+
+def purge_audit_results(now=None) -> int:
+    """RESULT_RETENTION_DAYS'ten eski denetim satirlarini sil (son satir korunur)."""
+    from apps.common.models import HealthAuditResult
+
+    cutoff = (now or timezone.now()) - timedelta(days=RESULT_RETENTION_DAYS)
+    latest = HealthAuditResult.objects.first()
+    queryset = HealthAuditResult.objects.filter(created_at__lt=cutoff)
+    if latest is not None:
+        # Artimli denetim onceki sonuca dayanir; en son satir silinmez
+        queryset = queryset.exclude(pk=latest.pk)
+    deleted, _ = queryset.delete()
+    return deleted
+
+
+def series(limit=96) -> list:
+    """Son denetimler (yeniden eskiye) — izleme grafikleri icin."""
+    from apps.common.models import HealthAuditResult
+
+    return list(
+        HealthAuditResult.objects.values(
+            'created_at', 'status', 'is_full', 'issue_count', 'warning_count', 'scopes_checked', 'duration_ms',
+        )[:limit]
+    )
@@ -0,0 +1,216 @@
+"""
+Eszamanli link kontrol motoru.
+
+- Sinirli thread havuzu (max_workers) ile paralel kontrol
+- Host basina eszamanlilik siniri (semaphore) ve nezaket gecikmesi
+- Thread basina requests.Session (baglanti havuzu)
+- LinkCheckCache: TTL icindeki sonuclar tekrar kontrol edilmez; suresi
+  dolanlar ETag / Last-Modified ile kosullu istek (304) atar
+"""
+
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from urllib.parse import urlparse
+
+import requests
+from django.utils import timezone
+
+# HTTP timeout
+REQUEST_TIMEOUT = 10
+USER_AGENT = 'Norosera-LinkChecker/1.0 (+https://norosera.com)'
+
+MAX_WORKERS = 16
+PER_HOST_CONCURRENCY = 2
+HOST_DELAY_SECONDS = 0.5
+
+# Saglam linkler seyrek, kirik linkler daha sik tekrar kontrol edilir
+OK_TTL = timedelta(days=7)
+BROKEN_TTL = timedelta(days=1)
+
+CACHE_BATCH_SIZE = 500
+
+
+@dataclass
+class LinkResult:
+    url: str
+    is_broken: bool
+    http_status: int | None
+    error_message: str = ''
+    etag: str = ''
+    last_modified: str = ''
+    from_cache: bool = False
+
+
+def url_hash(url):
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+def probe_url(url, session=None, cached=None):
+    """
+    URL'yi HEAD (gerekirse GET) ile kontrol et.
+    cached verilirse If-None-Match / If-Modified-Since ile kosullu istek atar.
+    """
+    http = session or requests
+    headers = {'User-Agent': USER_AGENT}
+    if cached is not None and not cached.is_broken:
+        if cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+
+    try:
+        # Once HEAD dene (daha hizli)
+        resp = http.head(url, timeout=REQUEST_TIMEOUT, allow_redirects=True, headers=headers)
+
+        # Bazi siteler HEAD'i reddeder, GET ile tekrar dene
+        if resp.status_code in (403, 405, 406):
+            resp = http.get(
+                url,
+                timeout=REQUEST_TIMEOUT,
+                allow_redirects=True,
+                headers=headers,
+                stream=True,  # Body'yi indirme
+            )
+            resp.close()
+
+        if resp.status_code == 304 and cached is not None:
+            return LinkResult(
+                url, False, cached.http_status,
+                etag=resp.headers.get('ETag', cached.etag),
+                last_modified=resp.headers.get('Last-Modified', cached.last_modified),
+            )
+
+        etag = resp.headers.get('ETag', '')[:300]
+        last_modified = resp.headers.get('Last-Modified', '')[:100]
+        if resp.status_code >= 400:
+            return LinkResult(url, True, resp.status_code, f'HTTP {resp.status_code}')
+        return LinkResult(url, False, resp.status_code, etag=etag, last_modified=last_modified)
+
+    except requests.exceptions.Timeout:
+        return LinkResult(url, True, None, 'Timeout')
+    except requests.exceptions.SSLError:
+        return LinkResult(url, True, None, 'SSL Error')
+    except requests.exceptions.ConnectionError:
+        return LinkResult(url, True, None, 'Connection Error')
+    except requests.exceptions.TooManyRedirects:
+        return LinkResult(url, True, None, 'Too Many Redirects')
+    except Exception as e:
+        return LinkResult(url, True, None, str(e)[:200])
+
+
+class HostThrottle:
+    """Host basina eszamanlilik siniri ve istekler arasi minimum bekleme."""
+
+    def __init__(self, per_host=PER_HOST_CONCURRENCY, delay=HOST_DELAY_SECONDS):
+        self.per_host = per_host
+        self.delay = delay
+        self._guard = threading.Lock()
+        self._semaphores = {}
+        self._next_slot = defaultdict(float)
+
+    def _semaphore(self, host):
+        with self._guard:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self._semaphores[host]
+
+    def run(self, host, fn):
+        semaphore = self._semaphore(host)
+        with semaphore:
+            # Baslangic zamanlarini host bazinda delay araliklarla sirala
+            with self._guard:
+                now = time.monotonic()
+                start = max(now, self._next_slot[host])
+                self._next_slot[host] = start + self.delay
+            wait = start - now
+            if wait > 0:
+                time.sleep(wait)
+            return fn()
+
+
+class LinkScanner:
+    """URL listesini cache + sinirli paralellikle kontrol eder."""
+
+    def __init__(self, max_workers=MAX_WORKERS, per_host=PER_HOST_CONCURRENCY,
+                 host_delay=HOST_DELAY_SECONDS):
+        self.max_workers = max_workers
+        self.throttle = HostThrottle(per_host=per_host, delay=host_delay)
+        self._local = threading.local()
+
+    def _session(self):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def _check(self, url, cached):
+        host = urlparse(url).hostname or ''
+        return self.throttle.run(host, lambda: probe_url(url, self._session(), cached))
+
+    def check_many(self, urls, max_network_checks=None, now=None):
+        """
+        URL'leri kontrol et, {url: LinkResult} dondur.
+
+        TTL icindeki cache kayitlari agi kullanmaz. max_network_checks
+        asilirsa kalan URL'ler bu taramada atlanir (sonucta yer almaz).
+        """
+        from apps.common.models import LinkCheckCache
+
+        now = now or timezone.now()
+        hashes = {url_hash(url): url for url in urls}
+        cached = {
+            row.url: row
+            for row in LinkCheckCache.objects.filter(url_hash__in=list(hashes))
+        }
+
+        results = {}
+        to_check = []
+        for url in urls:
+            row = cached.get(url)
+            ttl = BROKEN_TTL if row is not None and row.is_broken else OK_TTL
+            if row is not None and row.checked_at + ttl > now:
+                results[url] = LinkResult(
+                    url, row.is_broken, row.http_status, row.error_message,
+                    row.etag, row.last_modified, from_cache=True,
+                )
+            else:
+                to_check.append(url)
+
+        if max_network_checks is not None:
+            to_check = to_check[:max_network_checks]
+
+        if to_check:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for result in pool.map(lambda u: self._check(u, cached.get(u)), to_check):
+                    results[result.url] = result
+            self._store([results[url] for url in to_check], now)
+
+        return results
+
+    @staticmethod
+    def _store(results, now):
+        from apps.common.models import LinkCheckCache
+
+        LinkCheckCache.objects.bulk_create(
+            [
+                LinkCheckCache(
+                    url_hash=url_hash(r.url), url=r.url, is_broken=r.is_broken,
+                    http_status=r.http_status, error_message=r.error_message[:500],
+                    etag=r.etag, last_modified=r.last_modified, checked_at=now,
+                )
+                for r in results
+            ],
+            batch_size=CACHE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['url_hash'],
+            update_fields=[
+                'is_broken', 'http_status', 'error_message', 'etag',
+                'last_modified', 'checked_at',
+            ],
+        )
@@ -108,14 +108,14 @@ class Command(BaseCommand):
         # FeatureFlags
         # ==================
         flags = [
-            {'key': 'migraine_module', 'label': 'Migren Modulu', 'is_enabled': True, 'description': 'Migren takip modulu'},
-            {'key': 'epilepsy_module', 'label': 'Epilepsi Modulu', 'is_enabled': True, 'description': 'Epilepsi takip modulu'},
-            {'key': 'dementia_module', 'label': 'Demans Modulu', 'is_enabled': True, 'description': 'Demans takip modulu'},
-            {'key': 'wellness_module', 'label': 'Wellness Modulu', 'is_enabled': True, 'description': 'Saglik ve wellness takibi'},
-            {'key': 'store_module', 'label': 'Magaza Modulu', 'is_enabled': False, 'description': 'Urun magazasi'},
-            {'key': 'payment_module', 'label': 'Odeme Modulu', 'is_enabled': False, 'description': 'Odeme sistemi'},
+            {'key': 'migraine_module', 'label': 'Migren Modulu', 'is_enabled': True, 'is_public': True, 'description': 'Migren takip modulu'},
+            {'key': 'epilepsy_module', 'label': 'Epilepsi Modulu', 'is_enabled': True, 'is_public': True, 'description': 'Epilepsi takip modulu'},
+            {'key': 'dementia_module', 'label': 'Demans Modulu', 'is_enabled': True, 'is_public': True, 'description': 'Demans takip modulu'},
+            {'key': 'wellness_module', 'label': 'Wellness Modulu', 'is_enabled': True, 'is_public': True, 'description': 'Saglik ve wellness takibi'},
+            {'key': 'store_module', 'label': 'Magaza Modulu', 'is_enabled': False, 'is_public': True, 'description': 'Urun magazasi'},
+            {'key': 'payment_module', 'label': 'Odeme Modulu', 'is_enabled': False, 'is_public': True, 'description': 'Odeme sistemi'},
             {'key': 'ai_content_pipeline', 'label': 'AI Icerik Pipeline', 'is_enabled': True, 'description': 'Yapay zeka icerik uretimi'},
-            {'key': 'gamification', 'label': 'Gamification', 'is_enabled': True, 'description': 'Oyunlastirma sistemi'},
+            {'key': 'gamification', 'label': 'Gamification', 'is_enabled': True, 'is_public': True, 'description': 'Oyunlastirma sistemi'},
             {'key': 'agent_marketing_content', 'label': 'Marketing Icerik Agent', 'is_enabled': True, 'description': 'Sosyal medya post uretimi'},
             {'key': 'agent_visual_brief', 'label': 'Gorsel Brief Agent', 'is_enabled': True, 'description': 'Tasarim brief uretimi'},
             {'key': 'agent_scheduling', 'label': 'Zamanlama Agent', 'is_enabled': True, 'description': 'Haftalik yayin plani'},
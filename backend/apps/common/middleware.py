@@ -32,6 +32,9 @@ AUDITED_METHODS = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']
 MAX_FAILED_LOGINS = 5
 LOCKOUT_DURATION = 900  # 15 dakika (saniye)
 
+# Son aktivite yazim araligi (saniye)
+LAST_ACTIVE_INTERVAL = 300
+
 
 def get_client_ip(request):
     x_forwarded = request.META.get('HTTP_X_FORWARDED_FOR')
@@ -187,11 +190,11 @@ class LastActiveMiddleware:
         response = self.get_response(request)
 
         if hasattr(request, 'user') and request.user.is_authenticated:
-            now = timezone.now()
             user = request.user
-            # Her istekte değil, en az 5 dakikada bir güncelle
-            if not user.last_active or (now - user.last_active).total_seconds() > 300:
+            # Her istekte değil, en az 5 dakikada bir güncelle. request.user
+            # onbellekten gelebilir (last_active eski olabilir): aralik cache'te tutulur.
+            if cache.add(f'last_active:{user.pk}', True, LAST_ACTIVE_INTERVAL):
                 from django.contrib.auth import get_user_model
-                get_user_model().objects.filter(pk=user.pk).update(last_active=now)
+                get_user_model().objects.filter(pk=user.pk).update(last_active=timezone.now())
 
         return response
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.5 on 2026-10-19 18:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0008_add_broken_link_models'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LinkCheckCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url_hash', models.CharField(help_text='URL SHA-256', max_length=64, unique=True)),
+                ('url', models.URLField(max_length=2000)),
+                ('is_broken', models.BooleanField(default=False)),
+                ('http_status', models.IntegerField(blank=True, null=True)),
+                ('error_message', models.CharField(blank=True, default='', max_length=500)),
+                ('etag', models.CharField(blank=True, default='', max_length=300)),
+                ('last_modified', models.CharField(blank=True, default='', max_length=100)),
+                ('checked_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Link Kontrol Onbellegi',
+                'verbose_name_plural': 'Link Kontrol Onbellegi',
+                'indexes': [models.Index(fields=['checked_at'], name='common_link_checked_3b8d42_idx')],
+            },
+        ),
+    ]
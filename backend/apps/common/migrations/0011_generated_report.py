@@ -0,0 +1,42 @@
+# Generated by Django 5.1.5 on 2026-10-19 18:37
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0010_idempotency_key'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeneratedReport',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('report_type', models.CharField(max_length=30)),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('data_version', models.CharField(help_text='Kaynak verinin parmak izi', max_length=64)),
+                ('status', models.CharField(choices=[('pending', 'Bekliyor'), ('running', 'Uretiliyor'), ('ready', 'Hazir'), ('failed', 'Basarisiz')], default='pending', max_length=10)),
+                ('file', models.FileField(blank=True, upload_to='reports/')),
+                ('size_bytes', models.PositiveIntegerField(default=0)),
+                ('error_message', models.TextField(blank=True, default='')),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('notify_on_ready', models.BooleanField(default=False)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='generated_reports', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Uretilmis Rapor',
+                'verbose_name_plural': 'Uretilmis Raporlar',
+                'ordering': ['-created_at'],
+                'unique_together': {('user', 'report_type', 'start_date', 'end_date', 'data_version')},
+            },
+        ),
+    ]
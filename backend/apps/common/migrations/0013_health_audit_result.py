@@ -0,0 +1,36 @@
+# Generated by Django 5.1.5 on 2026-10-19 19:17
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0012_data_export'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HealthAuditResult',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('status', models.CharField(choices=[('ok', 'Sorunsuz'), ('warn', 'Uyari'), ('fail', 'Sorunlu')], default='ok', max_length=10)),
+                ('is_full', models.BooleanField(default=False)),
+                ('scopes_checked', models.JSONField(blank=True, default=list)),
+                ('issue_count', models.PositiveIntegerField(default=0)),
+                ('warning_count', models.PositiveIntegerField(default=0)),
+                ('results', models.JSONField(blank=True, default=dict)),
+                ('versions', models.JSONField(blank=True, default=dict)),
+                ('duration_ms', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Saglik Denetimi',
+                'verbose_name_plural': 'Saglik Denetimleri',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['-created_at'], name='common_heal_created_4e5add_idx')],
+            },
+        ),
+    ]
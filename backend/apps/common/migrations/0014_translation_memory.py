@@ -0,0 +1,33 @@
+# Generated by Django 5.1.5 on 2026-10-19 19:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0013_health_audit_result'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationMemory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_hash', models.CharField(help_text='SHA-256(dil cifti + normalize kaynak metin)', max_length=64, unique=True)),
+                ('source_lang', models.CharField(default='tr', max_length=5)),
+                ('target_lang', models.CharField(default='en', max_length=5)),
+                ('source_text', models.TextField()),
+                ('target_text', models.TextField()),
+                ('provider', models.CharField(blank=True, default='', max_length=20)),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('last_used_at', models.DateTimeField(auto_now_add=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Ceviri Bellegi',
+                'verbose_name_plural': 'Ceviri Bellegi',
+                'indexes': [models.Index(fields=['last_used_at'], name='common_tran_last_us_21815f_idx')],
+            },
+        ),
+    ]
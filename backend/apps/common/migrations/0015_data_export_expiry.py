@@ -0,0 +1,28 @@
+# Generated by Django 5.1.5 on 2026-10-19 19:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0014_translation_memory'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dataexport',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='dataexport',
+            index=models.Index(fields=['patient', 'export_format', 'status'], name='common_data_patient_7af4e5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dataexport',
+            index=models.Index(fields=['expires_at'], name='common_data_expires_3d08ce_idx'),
+        ),
+    ]
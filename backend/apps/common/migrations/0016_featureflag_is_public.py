@@ -0,0 +1,31 @@
+# Generated by Django 5.1.5 on 2026-10-19 19:45
+
+from django.db import migrations, models
+
+# Frontend'in useFeatureFlag ile okudugu site modulu flag'leri
+PUBLIC_FLAG_KEYS = [
+    'migraine_module', 'epilepsy_module', 'dementia_module', 'wellness_module',
+    'store_module', 'payment_module', 'gamification',
+]
+
+
+def mark_public_flags(apps, schema_editor):
+    """Mevcut site modulu flag'lerini public isaretle; ajan flag'leri kapali kalir."""
+    FeatureFlag = apps.get_model('common', 'FeatureFlag')
+    FeatureFlag.objects.filter(key__in=PUBLIC_FLAG_KEYS).update(is_public=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0015_data_export_expiry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='featureflag',
+            name='is_public',
+            field=models.BooleanField(default=False, help_text="True ise anonim public API'de listelenir (ajan/ic flag'ler icin False)"),
+        ),
+        migrations.RunPython(mark_public_flags, migrations.RunPython.noop),
+    ]
@@ -112,6 +112,10 @@ class FeatureFlag(TimeStampedModel):
     key = models.SlugField(max_length=100, unique=True)
     label = models.CharField(max_length=200, help_text='Ozellik ismi')
     is_enabled = models.BooleanField(default=False)
+    is_public = models.BooleanField(
+        default=False,
+        help_text='True ise anonim public API\'de listelenir (ajan/ic flag\'ler icin False)',
+    )
     description = models.TextField(blank=True, default='')
     enabled_for_roles = models.JSONField(
         default=list, blank=True,
@@ -382,6 +386,197 @@ class BrokenLinkScan(TimeStampedModel):
         return f"Tarama {self.created_at:%Y-%m-%d %H:%M} - {self.broken_links_found} kirik link"
 
 
+class LinkCheckCache(models.Model):
+    """URL bazli son kontrol sonucu. Taramalar arasi TTL ve kosullu istek icin."""
+
+    url_hash = models.CharField(max_length=64, unique=True, help_text='URL SHA-256')
+    url = models.URLField(max_length=2000)
+    is_broken = models.BooleanField(default=False)
+    http_status = models.IntegerField(null=True, blank=True)
+    error_message = models.CharField(max_length=500, blank=True, default='')
+    etag = models.CharField(max_length=300, blank=True, default='')
+    last_modified = models.CharField(max_length=100, blank=True, default='')
+    checked_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = 'Link Kontrol Onbellegi'
+        verbose_name_plural = 'Link Kontrol Onbellegi'
+        indexes = [
+            models.Index(fields=['checked_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.url[:80]} ({self.http_status or 'N/A'})"
+
+
+class IdempotencyKey(models.Model):
+    """Istemci tarafindan gonderilen idempotency anahtari ve ilk yanit (tekrar gonderimde aynen doner)."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='idempotency_keys',
+    )
+    key = models.CharField(max_length=100)
+    scope = models.CharField(max_length=50, help_text='Endpoint/islem adi')
+    response = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        unique_together = ['user', 'key']
+        verbose_name = 'Idempotency Anahtari'
+        verbose_name_plural = 'Idempotency Anahtarlari'
+
+    def __str__(self):
+        return f"{self.scope}:{self.key}"
+
+
+class GeneratedReport(TimeStampedModel):
+    """Uretilmis PDF rapor artefakti: (hasta, tur, tarih araligi, veri surumu) basina tek dosya."""
+
+    STATUS_CHOICES = [
+        ('pending', 'Bekliyor'),
+        ('running', 'Uretiliyor'),
+        ('ready', 'Hazir'),
+        ('failed', 'Basarisiz'),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='generated_reports',
+    )
+    report_type = models.CharField(max_length=30)
+    start_date = models.DateField()
+    end_date = models.DateField()
+    data_version = models.CharField(max_length=64, help_text='Kaynak verinin parmak izi')
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    file = models.FileField(upload_to='reports/', blank=True)
+    size_bytes = models.PositiveIntegerField(default=0)
+    error_message = models.TextField(blank=True, default='')
+    completed_at = models.DateTimeField(null=True, blank=True)
+    notify_on_ready = models.BooleanField(default=False)
+
+    class Meta:
+        ordering = ['-created_at']
+        unique_together = ['user', 'report_type', 'start_date', 'end_date', 'data_version']
+        verbose_name = 'Uretilmis Rapor'
+        verbose_name_plural = 'Uretilmis Raporlar'
+
+    def __str__(self):
+        return f"{self.report_type} {self.start_date}..{self.end_date} ({self.status})"
+
+
+class DataExport(TimeStampedModel):
+    """Hastanin tum modullerdeki verisinin zip arsivi (arka planda uretilen disa aktarim)."""
+
+    STATUS_CHOICES = [
+        ('pending', 'Bekliyor'),
+        ('running', 'Uretiliyor'),
+        ('ready', 'Hazir'),
+        ('failed', 'Basarisiz'),
+    ]
+    FORMAT_CHOICES = [
+        ('ndjson', 'NDJSON'),
+        ('csv', 'CSV'),
+    ]
+
+    patient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='data_exports',
+    )
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='requested_data_exports',
+    )
+    export_format = models.CharField(max_length=10, choices=FORMAT_CHOICES, default='ndjson')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    file = models.FileField(upload_to='exports/', blank=True)
+    size_bytes = models.PositiveBigIntegerField(default=0)
+    row_count = models.PositiveIntegerField(default=0)
+    error_message = models.TextField(blank=True, default='')
+    completed_at = models.DateTimeField(null=True, blank=True)
+    # Hazir arsiv bu zamandan sonra indirilemez ve purge_data_exports ile silinir
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['patient', 'export_format', 'status']),
+            models.Index(fields=['expires_at']),
+        ]
+        verbose_name = 'Veri Disa Aktarimi'
+        verbose_name_plural = 'Veri Disa Aktarimlari'
+
+    def __str__(self):
+        return f"{self.patient} {self.export_format} ({self.status})"
+
+
+class HealthAuditResult(TimeStampedModel):
+    """Icerik tutarlilik denetiminin bir calismasi (zaman serisi)."""
+
+    STATUS_CHOICES = [
+        ('ok', 'Sorunsuz'),
+        ('warn', 'Uyari'),
+        ('fail', 'Sorunlu'),
+    ]
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='ok')
+    is_full = models.BooleanField(default=False)
+    # Bu calismada yeniden denetlenen kapsamlar (digerleri onceki sonuctan)
+    scopes_checked = models.JSONField(default=list, blank=True)
+    issue_count = models.PositiveIntegerField(default=0)
+    warning_count = models.PositiveIntegerField(default=0)
+    # kapsam -> {'issues': [...], 'warnings': [...], 'stats': {...}}
+    results = models.JSONField(default=dict, blank=True)
+    # kapsam -> degisiklik surumu (bir sonraki artimli calisma icin)
+    versions = models.JSONField(default=dict, blank=True)
+    duration_ms = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+        ]
+        verbose_name = 'Saglik Denetimi'
+        verbose_name_plural = 'Saglik Denetimleri'
+
+    def __str__(self):
+        return f"{self.created_at:%Y-%m-%d %H:%M} {self.status} ({self.issue_count}/{self.warning_count})"
+
+
+class TranslationMemory(models.Model):
+    """Paragraf bazli ceviri bellegi. Degismeyen segmentler LLM'e tekrar gitmez."""
+
+    source_hash = models.CharField(
+        max_length=64, unique=True,
+        help_text='SHA-256(dil cifti + normalize kaynak metin)',
+    )
+    source_lang = models.CharField(max_length=5, default='tr')
+    target_lang = models.CharField(max_length=5, default='en')
+    source_text = models.TextField()
+    target_text = models.TextField()
+    provider = models.CharField(max_length=20, blank=True, default='')
+    hit_count = models.PositiveIntegerField(default=0)
+    last_used_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Ceviri Bellegi'
+        verbose_name_plural = 'Ceviri Bellegi'
+        indexes = [
+            models.Index(fields=['last_used_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.source_lang}->{self.target_lang}: {self.source_text[:60]}"
+
+
 class MarketingCampaign(TimeStampedModel):
     """Haftalik marketing icerik paketi."""
 
@@ -0,0 +1,77 @@
+"""
+Hasta kapsamli liste endpoint'leri icin sayfalama ve alan projeksiyonu.
+
+- KeysetPagination: (zaman damgasi, id) uzerinde cursor sayfalama.
+  OFFSET taramasi ve COUNT(*) yoktur; derin sayfalar ilk sayfa kadar
+  ucuzdur. Siralama view'in `cursor_ordering` niteligiyle belirlenir
+  (varsayilan: -created_at, -id) ve (sahip, -zaman) bilesik indeksleriyle
+  desteklenir. Varsayilan sayfa 20, ust sinir 100 (?page_size=).
+- OptionalKeysetPagination: ?cursor= veya ?page_size= gelmedikce sayfalama
+  yapmaz (tum listeyi bekleyen mevcut istemciler icin).
+- FieldProjectionMixin: ?fields=id,title gibi seyrek alan kumeleri; GET
+  yanitlarinda yalnizca istenen alanlar serialize edilir.
+
+Kullanım:
+    class SeizureEventViewSet(FieldProjectionMixin, viewsets.ModelViewSet):
+        pagination_class = KeysetPagination
+        cursor_ordering = ('-seizure_datetime', '-id')
+"""
+
+from rest_framework import serializers
+from rest_framework.pagination import CursorPagination
+
+FIELDS_QUERY_PARAM = 'fields'
+
+
+class KeysetPagination(CursorPagination):
+    """Zaman damgasi + id uzerinde keyset sayfalama (COUNT(*) yok)."""
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+    ordering = ('-created_at', '-id')
+
+    def get_ordering(self, request, queryset, view):
+        return tuple(getattr(view, 'cursor_ordering', None) or self.ordering)
+
+
+class OptionalKeysetPagination(KeysetPagination):
+    """Yalnizca istemci cursor/page_size gonderdiginde sayfala."""
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+def requested_fields(request):
+    """?fields= parametresindeki alan adlari (yoksa None)."""
+    raw = request.query_params.get(FIELDS_QUERY_PARAM)
+    if not raw:
+        return None
+    return {name.strip() for name in raw.split(',') if name.strip()}
+
+
+def project_fields(serializer, fields):
+    """Serializer'dan istenmeyen alanlari cikar; bilinmeyen alan 400 doner."""
+    target = serializer.child if isinstance(serializer, serializers.ListSerializer) else serializer
+    unknown = fields - set(target.fields)
+    if unknown:
+        raise serializers.ValidationError({
+            FIELDS_QUERY_PARAM: f"Gecersiz alan(lar): {', '.join(sorted(unknown))}",
+        })
+    for name in list(target.fields):
+        if name not in fields:
+            target.fields.pop(name)
+    return serializer
+
+
+class FieldProjectionMixin:
+    """GET yanitlarinda ?fields= ile seyrek alan kumesi."""
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields = requested_fields(self.request) if self.request.method == 'GET' else None
+        if fields:
+            project_fields(serializer, fields)
+        return serializer
@@ -0,0 +1,300 @@
+"""
+PDF rapor servisi: uretim, onbellek ve indirme.
+
+Raporlar (hasta, tur, tarih araligi, veri surumu) anahtariyla GeneratedReport
+olarak media storage'da saklanir. Veri surumu, raporun okudugu kaynak
+tablolarin aralik icindeki kayit sayisi + son updated_at degerinden uretilen
+parmak izidir: veri degismedikce ayni aralik icin PDF tekrar uretilmez,
+kayit eklenir/duzenlenir/silinirse yeni surum uretilir ve eskisi silinir.
+
+- Kisa araliklar istek icinde uretilir (bir kez), uzun araliklar veya
+  ?async=1 istekleri Celery'ye gider; istemci 202 yanitindaki status_url'i
+  sorgular, hazir olunca bildirim de gonderilir.
+- Indirmeler Range (206) ve ETag/If-None-Match (304) destekli stream edilir.
+- Paylasim (dementia.sharing) ayni artefaktlari report_bytes ile kullanir.
+
+Kullanım:
+    return report_service.report_response(request, 'migraine', request.user, start, end)
+"""
+
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.db.models import Count, Max
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from rest_framework import status
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+# Sablon/generator degisince artirin: tum onbellek gecersiz olur
+REPORT_FORMAT_VERSION = 1
+# Bu kadar gunden uzun araliklar arka planda uretilir
+SYNC_REPORT_MAX_DAYS = 92
+REPORT_CACHE_DAYS = 30
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+@dataclass(frozen=True)
+class ReportSource:
+    """Raporun okudugu tablo: model etiketi, hasta alani, tarih lookup'i (None: aralik disi)."""
+    model: str
+    user_field: str
+    date_lookup: str | None
+
+
+@dataclass(frozen=True)
+class ReportType:
+    generator: str
+    sources: tuple
+    filename: str
+
+
+REPORT_TYPES = {
+    'migraine': ReportType(
+        generator='apps.migraine.reports.MigraineReportGenerator',
+        sources=(
+            ReportSource('migraine.MigraineAttack', 'patient', 'start_datetime__date'),
+        ),
+        filename='migraine_report_{start:%Y%m%d}_{end:%Y%m%d}.pdf',
+    ),
+    'dementia': ReportType(
+        generator='apps.dementia.reports.DementiaReportGenerator',
+        sources=(
+            ReportSource('dementia.ExerciseSession', 'patient', 'started_at__date'),
+            ReportSource('dementia.DailyAssessment', 'patient', 'assessment_date'),
+            ReportSource('dementia.CognitiveScore', 'patient', 'score_date'),
+            ReportSource('dementia.CaregiverNote', 'patient', 'created_at__date'),
+            ReportSource('dementia.CognitiveScreening', 'patient', None),
+        ),
+        filename='bilissel_rapor_{last_name}_{start}_{end}.pdf',
+    ),
+}
+
+
+def data_version(user, report_type, start_date, end_date) -> str:
+    """Kaynak verinin parmak izi (kaynak basina tek aggregate sorgu)."""
+    parts = [REPORT_FORMAT_VERSION, user.first_name, user.last_name]
+    for source in REPORT_TYPES[report_type].sources:
+        qs = apps.get_model(source.model).objects.filter(**{source.user_field: user})
+        if source.date_lookup:
+            qs = qs.filter(**{
+                f'{source.date_lookup}__gte': start_date,
+                f'{source.date_lookup}__lte': end_date,
+            })
+        agg = qs.aggregate(n=Count('pk'), last=Max('updated_at'))
+        parts.append((source.model, agg['n'], agg['last'].isoformat() if agg['last'] else ''))
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def report_filename(report) -> str:
+    return REPORT_TYPES[report.report_type].filename.format(
+        start=report.start_date, end=report.end_date, last_name=report.user.last_name,
+    )
+
+
+def request_report(user, report_type, start_date, end_date):
+    """Guncel veri surumune ait rapor kaydini getir veya 'pending' olarak olustur."""
+    from apps.common.models import GeneratedReport
+
+    version = data_version(user, report_type, start_date, end_date)
+    report, _ = GeneratedReport.objects.get_or_create(
+        user=user, report_type=report_type,
+        start_date=start_date, end_date=end_date, data_version=version,
+    )
+    if report.status == 'ready' and not (report.file and report.file.storage.exists(report.file.name)):
+        # Dosya storage'dan silinmis: yeniden uret
+        GeneratedReport.objects.filter(id=report.id).update(status='pending')
+        report.status = 'pending'
+    return report
+
+
+def claim_report(report) -> bool:
+    """Uretimi tek bir worker'a ver (pending/failed -> running kosullu UPDATE)."""
+    from apps.common.models import GeneratedReport
+
+    claimed = GeneratedReport.objects.filter(
+        id=report.id, status__in=('pending', 'failed'),
+    ).update(status='running', error_message='', updated_at=timezone.now())
+    if claimed:
+        report.status = 'running'
+    return bool(claimed)
+
+
+def render_report(report):
+    """Talep edilmis raporu uret, storage'a yaz, eski surumleri temizle."""
+    from apps.common.models import GeneratedReport
+
+    spec = REPORT_TYPES[report.report_type]
+    try:
+        generator = import_string(spec.generator)(
+            user=report.user, start_date=report.start_date, end_date=report.end_date,
+        )
+        output = generator.generate()
+        content = output.getvalue() if hasattr(output, 'getvalue') else output
+
+        report.file.save(
+            f'{report.report_type}/{report.user_id}/{report.id}.pdf',
+            ContentFile(content), save=False,
+        )
+        report.size_bytes = len(content)
+        report.status = 'ready'
+        report.completed_at = timezone.now()
+        report.save(update_fields=['file', 'size_bytes', 'status', 'completed_at', 'updated_at'])
+    except Exception as e:
+        logger.exception(f"Rapor uretilemedi: {report.id}")
+        report.status = 'failed'
+        report.error_message = str(e)
+        report.save(update_fields=['status', 'error_message', 'updated_at'])
+        raise
+
+    superseded = GeneratedReport.objects.filter(
+        user_id=report.user_id, report_type=report.report_type,
+        start_date=report.start_date, end_date=report.end_date,
+    ).exclude(id=report.id)
+    delete_reports(superseded)
+    return report
+
+
+def delete_reports(queryset) -> int:
+    """Rapor kayitlarini dosyalariyla birlikte sil."""
+    count = 0
+    for report in queryset:
+        if report.file:
+            report.file.delete(save=False)
+        report.delete()
+        count += 1
+    return count
+
+
+def report_bytes(user, report_type, start_date, end_date) -> bytes:
+    """Raporun PDF icerigi; onbellekte yoksa istek icinde uretilir (paylasim icin)."""
+    report = request_report(user, report_type, start_date, end_date)
+    if report.status != 'ready':
+        if claim_report(report):
+            render_report(report)
+        else:
+            # Baska bir worker uretiyor: beklemeden dogrudan uret (saklamadan)
+            generator = import_string(REPORT_TYPES[report_type].generator)(
+                user=user, start_date=start_date, end_date=end_date,
+            )
+            output = generator.generate()
+            return output.getvalue() if hasattr(output, 'getvalue') else output
+    with _open(report) as f:
+        return f.read()
+
+
+def report_status_data(report) -> dict:
+    base = f'/api/v1/reports/{report.id}/'
+    return {
+        'id': str(report.id),
+        'report_type': report.report_type,
+        'start_date': report.start_date.isoformat(),
+        'end_date': report.end_date.isoformat(),
+        'status': report.status,
+        'size_bytes': report.size_bytes,
+        'error_message': report.error_message,
+        'status_url': base,
+        'download_url': f'{base}download/',
+    }
+
+
+def _open(report):
+    # FieldFile kaydetme sonrasi tuketilmis icerigi tutabilir: dogrudan storage'dan ac
+    return report.file.storage.open(report.file.name, 'rb')
+
+
+def _iter_file(report, start, length):
+    with _open(report) as f:
+        f.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(STREAM_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def file_response(request, report, filename=None):
+    """Hazir raporu stream et: ETag/If-None-Match, tekli Range (206/416)."""
+    etag = f'"{report.data_version}"'
+    if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+        return HttpResponseNotModified(headers={'ETag': etag})
+
+    size = report.size_bytes or report.file.size
+    disposition = f'attachment; filename="{filename or report_filename(report)}"'
+    match = _RANGE_RE.match(request.META.get('HTTP_RANGE', '').strip())
+
+    if match and any(match.groups()):
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        else:
+            # bytes=-N: son N bayt
+            start, end = max(size - int(last), 0), size - 1
+        if start >= size or start > end:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+        response = StreamingHttpResponse(
+            _iter_file(report, start, end - start + 1),
+            status=206, content_type='application/pdf',
+        )
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(end - start + 1)
+    else:
+        response = FileResponse(_open(report), content_type='application/pdf')
+        response['Content-Length'] = str(size)
+
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Content-Disposition'] = disposition
+    return response
+
+
+def report_response(request, report_type, user, start_date=None, end_date=None, filename=None):
+    """
+    Rapor endpoint'leri icin ortak yanit: hazirsa dosya, kisa aralikta istek
+    icinde uretip dosya, aksi halde Celery'ye gonderip 202 + durum bilgisi.
+    """
+    from apps.common.tasks import generate_report
+
+    end_date = end_date or timezone.localdate()
+    start_date = start_date or (end_date - timedelta(days=30))
+    if start_date > end_date:
+        return Response(
+            {'detail': 'Baslangic tarihi bitis tarihinden sonra olamaz.'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    report = request_report(user, report_type, start_date, end_date)
+    if report.status == 'ready':
+        return file_response(request, report, filename)
+
+    wants_async = (
+        request.query_params.get('async') in ('1', 'true')
+        or (end_date - start_date).days > SYNC_REPORT_MAX_DAYS
+    )
+    if not wants_async and claim_report(report):
+        render_report(report)
+        return file_response(request, report, filename)
+
+    if not report.notify_on_ready:
+        report.notify_on_ready = True
+        report.save(update_fields=['notify_on_ready'])
+    if report.status in ('pending', 'failed'):
+        generate_report.delay(str(report.id))
+        report.refresh_from_db()
+    return Response(report_status_data(report), status=status.HTTP_202_ACCEPTED)
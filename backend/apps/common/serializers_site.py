@@ -29,7 +29,7 @@ class FeatureFlagSerializer(serializers.ModelSerializer):
     class Meta:
         model = FeatureFlag
         fields = [
-            'id', 'key', 'label', 'is_enabled',
+            'id', 'key', 'label', 'is_enabled', 'is_public',
             'description', 'enabled_for_roles',
             'created_at', 'updated_at',
         ]
@@ -0,0 +1,41 @@
+"""
+Common app signals.
+
+Site yapilandirma tablolarina (flag, config, duyuru, hero, sosyal link)
+yazildiginda/silindiginde proses ici site goruntusunu gecersiz kilar.
+Icerik tablolarina yazildiginda saglik denetiminin ilgili kapsamini
+degismis olarak isaretler.
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.common import health, site_snapshot
+
+
+@receiver(post_save, sender='common.SiteConfig')
+@receiver(post_save, sender='common.FeatureFlag')
+@receiver(post_save, sender='common.Announcement')
+@receiver(post_save, sender='common.HomepageHero')
+@receiver(post_save, sender='common.SocialLink')
+@receiver(post_delete, sender='common.SiteConfig')
+@receiver(post_delete, sender='common.FeatureFlag')
+@receiver(post_delete, sender='common.Announcement')
+@receiver(post_delete, sender='common.HomepageHero')
+@receiver(post_delete, sender='common.SocialLink')
+def invalidate_site_snapshot(sender, **kwargs):
+    site_snapshot.invalidate()
+
+
+def _connect_health_scopes():
+    for scope, models in health.SCOPE_MODELS.items():
+        def mark(sender, scope=scope, **kwargs):
+            health.mark_changed(scope)
+
+        # Ara (through) tablolar icin yalnizca m2m_changed tetiklenir
+        for model in models:
+            for name, signal in (('save', post_save), ('delete', post_delete), ('m2m', m2m_changed)):
+                signal.connect(mark, sender=model, weak=False, dispatch_uid=f'health:{scope}:{model}:{name}')
+
+
+_connect_health_scopes()
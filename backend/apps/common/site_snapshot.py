@@ -0,0 +1,242 @@
+"""
+Proses ici, surumlu site yapilandirma goruntusu.
+
+FeatureFlag, SiteConfig, Announcement, HomepageHero ve SocialLink tablolari
+tek seferde okunup her worker prosesinde degismez bir SiteSnapshot olarak
+tutulur. SiteConfig degerleri yuklenirken tipine cevrilir; flag kontrolleri
+ve public site endpoint'leri sorgu atmadan sozluk okumasina doner.
+
+Gecersiz kilma:
+- Bu tablolara yazildiginda (admin viewset'leri, Django admin, seed komutu)
+  sinyaller yerel goruntuyu hemen dusurur ve commit sonrasi paylasilan
+  cache'teki (production'da Redis) surum anahtarini yeniler.
+- Diger prosesler surum anahtarini en fazla VERSION_CHECK_INTERVAL
+  saniyede bir okur (tek cache GET); surum degismisse goruntuyu yeniden
+  yukler. Cache erisilemezse goruntu SNAPSHOT_MAX_AGE sonunda yenilenir.
+
+Not: Goruntudeki JSON degerleri paylasilir; get_config kopya dondurur.
+
+Kullanım:
+    if site_snapshot.is_feature_enabled('gamification'):
+        ...
+    topics = site_snapshot.get_config('auto_content_topics', default=[])
+"""
+
+import copy
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'site_snapshot:version'
+# Paylasilan surum anahtari en fazla bu siklikta kontrol edilir (saniye)
+VERSION_CHECK_INTERVAL = 2.0
+# Surum anahtarina ulasilamasa bile goruntu bu sureden eski tutulmaz
+SNAPSHOT_MAX_AGE = 300.0
+
+@dataclass(frozen=True)
+class FlagState:
+    key: str
+    label: str
+    is_enabled: bool
+    enabled_for_roles: tuple
+    is_public: bool = False
+
+    def is_enabled_for(self, user=None):
+        """FeatureFlag.is_enabled_for ile ayni kurallar."""
+        if not self.is_enabled:
+            return False
+        if not self.enabled_for_roles:
+            return True
+        if user and hasattr(user, 'role'):
+            return user.role in self.enabled_for_roles
+        return False
+
+
+@dataclass(frozen=True)
+class SiteSnapshot:
+    version: str
+    loaded_at: float
+    flags: dict            # key -> FlagState
+    config: dict           # key -> tipine cevrilmis deger
+    public_config: list    # SiteConfigPublicSerializer ciktisi
+    announcements: tuple   # (starts_at, expires_at, serilestirilmis veri)
+    hero: dict | None
+    social_links: list
+
+    def active_announcements(self, now=None) -> list:
+        """Aktif duyurulardan su an tarih araliginda olanlar (oncelik sirasinda)."""
+        now = now or timezone.now()
+        return [
+            data for starts_at, expires_at, data in self.announcements
+            if (starts_at is None or starts_at <= now)
+            and (expires_at is None or expires_at >= now)
+        ]
+
+    def public_flags(self) -> list:
+        """Yalnizca is_public isaretli flag'ler (ajan/ic flag'ler anonim listelenmez)."""
+        return [
+            {'key': flag.key, 'label': flag.label, 'is_enabled': flag.is_enabled}
+            for flag in self.flags.values()
+            if flag.is_public
+        ]
+
+    def bootstrap(self, now=None) -> dict:
+        """Public site acilisinda gereken tum yapilandirma tek yanitta."""
+        return {
+            'version': self.version,
+            'config': self.public_config,
+            'feature_flags': self.public_flags(),
+            'announcements': self.active_announcements(now),
+            'hero': self.hero,
+            'social_links': self.social_links,
+        }
+
+
+class _State:
+    """Proses geneli (thread'ler arasi paylasilan) goruntu durumu."""
+
+    def __init__(self):
+        self.snapshot = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+
+_state = _State()
+
+
+def _typed_value(config):
+    try:
+        return config.get_typed_value()
+    except (TypeError, ValueError):
+        logger.warning(f"SiteConfig degeri cevrilemedi, ham deger kullaniliyor: {config.key}")
+        return config.value
+
+
+def _load(version) -> SiteSnapshot:
+    """Tum yapilandirma tablolarini oku ve goruntuyu olustur."""
+    from apps.common.models import Announcement, FeatureFlag, HomepageHero, SiteConfig, SocialLink
+    from apps.common.serializers_site import (
+        AnnouncementSerializer, HomepageHeroSerializer, SocialLinkSerializer,
+    )
+
+    config, public_config = {}, []
+    for item in SiteConfig.objects.all():
+        value = _typed_value(item)
+        config[item.key] = value
+        if item.is_public:
+            public_config.append({
+                'key': item.key, 'value': item.value,
+                'value_type': item.value_type, 'typed_value': value,
+            })
+
+    flags = {
+        flag.key: FlagState(
+            key=flag.key, label=flag.label, is_enabled=flag.is_enabled,
+            enabled_for_roles=tuple(flag.enabled_for_roles or ()),
+            is_public=flag.is_public,
+        )
+        for flag in FeatureFlag.objects.all()
+    }
+
+    announcements = tuple(
+        (item.starts_at, item.expires_at, AnnouncementSerializer(item).data)
+        for item in Announcement.objects.filter(is_active=True)
+    )
+    hero = HomepageHero.objects.filter(is_active=True).first()
+    social_links = SocialLinkSerializer(SocialLink.objects.filter(is_active=True), many=True).data
+
+    return SiteSnapshot(
+        version=version,
+        loaded_at=time.monotonic(),
+        flags=flags,
+        config=config,
+        public_config=public_config,
+        announcements=announcements,
+        hero=HomepageHeroSerializer(hero).data if hero else None,
+        social_links=list(social_links),
+    )
+
+
+def _shared_version():
+    """Paylasilan surum anahtari; yoksa olustur. Cache hatasinda None."""
+    try:
+        version = cache.get(VERSION_KEY)
+        if version is None:
+            cache.add(VERSION_KEY, uuid.uuid4().hex, None)
+            version = cache.get(VERSION_KEY)
+        return version
+    except Exception:
+        logger.warning("Site goruntusu surum anahtari okunamadi", exc_info=True)
+        return None
+
+
+def get_snapshot() -> SiteSnapshot:
+    """Gecerli goruntu; surum degismisse veya suresi dolmussa yeniden yukle."""
+    snapshot = _state.snapshot
+    now = time.monotonic()
+    if snapshot is not None and now - _state.checked_at < VERSION_CHECK_INTERVAL:
+        return snapshot
+
+    version = _shared_version()
+    fresh = snapshot is not None and now - snapshot.loaded_at < SNAPSHOT_MAX_AGE
+    if fresh and version in (None, snapshot.version):
+        _state.checked_at = now
+        return snapshot
+
+    with _state.lock:
+        # Ayni anda bekleyen thread'ler tek yukleme yapsin
+        current = _state.snapshot
+        if current is not None and current is not snapshot and current.version == version:
+            return current
+        snapshot = _load(version or uuid.uuid4().hex)
+        _state.snapshot = snapshot
+        _state.checked_at = time.monotonic()
+    return snapshot
+
+
+def _publish_new_version():
+    _state.snapshot = None
+    try:
+        cache.set(VERSION_KEY, uuid.uuid4().hex, None)
+    except Exception:
+        logger.warning("Site goruntusu surum anahtari yazilamadi", exc_info=True)
+
+
+def invalidate():
+    """Yerel goruntuyu dusur; commit sonrasi tum proseslere yeni surum duyur."""
+    _state.snapshot = None
+    transaction.on_commit(_publish_new_version)
+
+
+def reset():
+    """Yerel goruntuyu unut (testler)."""
+    _state.snapshot = None
+    _state.checked_at = 0.0
+
+
+def is_feature_enabled(key, default=False) -> bool:
+    """Flag acik mi (rol kisiti dikkate alinmaz). Tanimsiz flag: default."""
+    flag = get_snapshot().flags.get(key)
+    return flag.is_enabled if flag is not None else default
+
+
+def is_feature_enabled_for(key, user=None, default=False) -> bool:
+    """Flag kullanicinin rolu icin acik mi (FeatureFlag.is_enabled_for kurallari)."""
+    flag = get_snapshot().flags.get(key)
+    return flag.is_enabled_for(user) if flag is not None else default
+
+
+def get_config(key, default=None):
+    """SiteConfig degerini tipine cevrilmis olarak dondur."""
+    value = get_snapshot().config.get(key, default)
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
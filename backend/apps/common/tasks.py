@@ -6,8 +6,9 @@ kirik olanlari tespit eder ve mumkunse otomatik tamir eder.
 
 Akis:
 1. HTML iceriklerden ve URL alanlarindan linkleri cikar
-2. Her linki HTTP HEAD ile kontrol et
-3. Kirik linkleri BrokenLink modeline kaydet
+   (incremental modda sadece son taramadan beri degisen icerikler)
+2. Linkleri LinkScanner ile paralel kontrol et (host basina sinir, TTL cache)
+3. Kirik linkleri BrokenLink modeline toplu kaydet
 4. Dahili linkler icin otomatik tamir dene (slug eslestirme)
 5. Tarama sonuclarini BrokenLinkScan'e kaydet
 """
@@ -17,12 +18,12 @@ import time
 import logging
 from urllib.parse import urlparse
 
-import requests
 from celery import shared_task
-from django.db import models
 from django.utils import timezone
 from django.db.models import Q
 
+from apps.common.link_scanner import LinkScanner, probe_url
+
 logger = logging.getLogger(__name__)
 
 # Link cikarma regex - HTML href ve src
@@ -39,12 +40,10 @@ SKIP_DOMAINS = ('localhost', '127.0.0.1', '0.0.0.0')
 # Dahili domain
 INTERNAL_DOMAINS = ('norosera.com', 'www.norosera.com')
 
-# HTTP timeout
-REQUEST_TIMEOUT = 10
-# Max links per scan to avoid overwhelming
+# Tarama basina en fazla ag kontrolu (cache isabetleri sayilmaz)
 MAX_LINKS_PER_SCAN = 500
 
-USER_AGENT = 'Norosera-LinkChecker/1.0 (+https://norosera.com)'
+BULK_BATCH_SIZE = 500
 
 
 def extract_links_from_html(html_content):
@@ -93,40 +92,8 @@ def check_url(url):
     URL'nin erisilebilirligini kontrol et.
     Returns: (is_broken, http_status, error_message)
     """
-    try:
-        # Once HEAD dene (daha hizli)
-        resp = requests.head(
-            url,
-            timeout=REQUEST_TIMEOUT,
-            allow_redirects=True,
-            headers={'User-Agent': USER_AGENT},
-        )
-
-        # Bazi siteler HEAD'i reddeder, GET ile tekrar dene
-        if resp.status_code in (403, 405, 406):
-            resp = requests.get(
-                url,
-                timeout=REQUEST_TIMEOUT,
-                allow_redirects=True,
-                headers={'User-Agent': USER_AGENT},
-                stream=True,  # Body'yi indirme
-            )
-            resp.close()
-
-        if resp.status_code >= 400:
-            return True, resp.status_code, f'HTTP {resp.status_code}'
-        return False, resp.status_code, ''
-
-    except requests.exceptions.Timeout:
-        return True, None, 'Timeout'
-    except requests.exceptions.ConnectionError:
-        return True, None, 'Connection Error'
-    except requests.exceptions.TooManyRedirects:
-        return True, None, 'Too Many Redirects'
-    except requests.exceptions.SSLError:
-        return True, None, 'SSL Error'
-    except Exception as e:
-        return True, None, str(e)[:200]
+    result = probe_url(url)
+    return result.is_broken, result.http_status, result.error_message
 
 
 def try_auto_fix_internal(broken_url):
@@ -144,36 +111,32 @@ def try_auto_fix_internal(broken_url):
         return None
 
     # Blog yazisi slug'i kontrol et
-    article = Article.objects.filter(
-        Q(slug_tr=slug) | Q(slug_en=slug),
-        status='published',
-    ).first()
+    article = Article.objects.filter(slug=slug, status='published').first()
     if article:
-        return f'/blog/{article.slug_tr}'
+        return f'/blog/{article.slug}'
 
     # Haber slug'i
-    news = NewsArticle.objects.filter(
-        Q(slug_tr=slug) | Q(slug_en=slug),
-        status='published',
-    ).first()
+    news = NewsArticle.objects.filter(slug=slug, status='published').first()
     if news:
-        return f'/news/{news.slug_tr}'
+        return f'/news/{news.slug}'
 
     return None
 
 
-def collect_content_links():
+def collect_content_links(since=None):
     """
     Tum iceriklerden link topla.
+    since verilirse sadece o zamandan sonra guncellenen icerikler taranir.
     Returns: list of (url, source_type, source_id, source_title, source_field, language)
     """
     from apps.content.models import Article, NewsArticle, EducationItem
     from apps.common.models import Announcement, SocialLink
 
+    changed = Q(updated_at__gte=since) if since else Q()
     all_links = []
 
     # 1. Articles (published)
-    for article in Article.objects.filter(status='published').only(
+    for article in Article.objects.filter(changed, status='published').only(
         'id', 'title_tr', 'body_tr', 'body_en'
     ):
         for field_name, lang in [('body_tr', 'tr'), ('body_en', 'en')]:
@@ -182,7 +145,7 @@ def collect_content_links():
                 all_links.append((url, 'article', article.id, article.title_tr, field_name, lang))
 
     # 2. News Articles (published)
-    for news in NewsArticle.objects.filter(status='published').only(
+    for news in NewsArticle.objects.filter(changed, status='published').only(
         'id', 'title_tr', 'body_tr', 'body_en', 'source_urls'
     ):
         for field_name, lang in [('body_tr', 'tr'), ('body_en', 'en')]:
@@ -197,7 +160,7 @@ def collect_content_links():
                     all_links.append((url, 'news', news.id, news.title_tr, 'source_urls', ''))
 
     # 3. Education Items
-    for edu in EducationItem.objects.filter(is_active=True).only(
+    for edu in EducationItem.objects.filter(changed, is_published=True).only(
         'id', 'title_tr', 'body_tr', 'body_en', 'video_url'
     ):
         for field_name, lang in [('body_tr', 'tr'), ('body_en', 'en')]:
@@ -209,12 +172,12 @@ def collect_content_links():
             all_links.append((edu.video_url, 'education', edu.id, edu.title_tr, 'video_url', ''))
 
     # 4. Announcements
-    for ann in Announcement.objects.filter(is_active=True).only('id', 'title_tr', 'link_url'):
+    for ann in Announcement.objects.filter(changed, is_active=True).only('id', 'title_tr', 'link_url'):
         if ann.link_url:
             all_links.append((ann.link_url, 'announcement', ann.id, ann.title_tr, 'link_url', ''))
 
     # 5. Social Links
-    for sl in SocialLink.objects.filter(is_active=True).only('id', 'platform', 'url'):
+    for sl in SocialLink.objects.filter(changed, is_active=True).only('id', 'platform', 'url'):
         all_links.append((sl.url, 'social_link', sl.id, sl.get_platform_display(), 'url', ''))
 
     return all_links
@@ -274,103 +237,143 @@ def apply_fix_to_content(source_type, source_id, source_field, broken_url, new_u
     return False
 
 
+def _normalize_links(all_links):
+    """Linkleri normalize edip unique URL -> kaynak listesi haritasina indir."""
+    unique_urls = {}
+    for url, src_type, src_id, src_title, src_field, lang in all_links:
+        # URL normalize
+        if url.startswith('//'):
+            url = 'https:' + url
+        elif url.startswith('/'):
+            url = 'https://norosera.com' + url
+
+        parsed = urlparse(url)
+        if not parsed.scheme or parsed.hostname in SKIP_DOMAINS:
+            continue
+
+        unique_urls.setdefault(url, []).append((src_type, src_id, src_title, src_field, lang))
+    return unique_urls
+
+
+def _record_results(unique_urls, results):
+    """
+    Kontrol sonuclarini toplu yaz.
+    Returns: (broken_found, auto_fixed)
+    """
+    from apps.common.models import BrokenLink
+
+    now = timezone.now()
+    ok_urls = [url for url, r in results.items() if not r.is_broken]
+    broken = {url: r for url, r in results.items() if r.is_broken}
+
+    # Onceden kirik kayitli ama artik erisilebilir linkler: otomatik tamamla
+    for start in range(0, len(ok_urls), BULK_BATCH_SIZE):
+        BrokenLink.objects.filter(
+            broken_url__in=ok_urls[start:start + BULK_BATCH_SIZE],
+            status='detected',
+        ).update(status='auto_fixed', fix_notes='Link tekrar erisilebilir', fixed_at=now)
+
+    if not broken:
+        return 0, 0
+
+    existing = {}
+    broken_list = list(broken)
+    for start in range(0, len(broken_list), BULK_BATCH_SIZE):
+        for obj in BrokenLink.objects.filter(broken_url__in=broken_list[start:start + BULK_BATCH_SIZE]):
+            existing[(obj.broken_url, obj.source_type, obj.source_id, obj.source_field)] = obj
+
+    to_create = []
+    to_update = {}
+    to_fix = []
+    for url, result in broken.items():
+        link_type = classify_link(url)
+
+        # Dahili link icin otomatik tamir dene
+        suggested = try_auto_fix_internal(url) if link_type == 'internal' else None
+
+        for src_type, src_id, src_title, src_field, lang in unique_urls[url]:
+            obj = existing.get((url, src_type, src_id, src_field))
+            if obj is None:
+                obj = BrokenLink(
+                    broken_url=url, source_type=src_type, source_id=src_id,
+                    source_field=src_field, check_count=1,
+                )
+                to_create.append(obj)
+                # Ayni kaynakta ayni URL tekrar gelirse yeniden olusturma
+                existing[(url, src_type, src_id, src_field)] = obj
+            elif not obj._state.adding and obj.pk not in to_update:
+                obj.check_count += 1
+                to_update[obj.pk] = obj
+
+            obj.http_status = result.http_status
+            obj.error_message = result.error_message
+            obj.link_type = link_type
+            obj.source_title = src_title
+            obj.source_language = lang
+            obj.last_checked = now
+
+            if suggested and obj.status == 'detected':
+                to_fix.append((obj, suggested))
+
+    BrokenLink.objects.bulk_create(to_create, batch_size=BULK_BATCH_SIZE)
+    BrokenLink.objects.bulk_update(
+        list(to_update.values()),
+        ['http_status', 'error_message', 'link_type', 'source_title',
+         'source_language', 'check_count', 'last_checked'],
+        batch_size=BULK_BATCH_SIZE,
+    )
+
+    # Otomatik tamir icerik yazar, kayit bazinda uygulanir (nadir)
+    auto_fixed = 0
+    for obj, suggested in to_fix:
+        success = apply_fix_to_content(
+            obj.source_type, obj.source_id, obj.source_field, obj.broken_url, suggested,
+        )
+        if success:
+            obj.status = 'auto_fixed'
+            obj.suggested_url = suggested
+            obj.fix_notes = f'Dahili link otomatik tamir edildi: {suggested}'
+            obj.fixed_at = now
+            obj.save(update_fields=['status', 'suggested_url', 'fix_notes', 'fixed_at'])
+            auto_fixed += 1
+        elif not obj.suggested_url:
+            obj.suggested_url = suggested
+            obj.save(update_fields=['suggested_url'])
+
+    return len(to_create), auto_fixed
+
+
 @shared_task(name='apps.common.tasks.scan_broken_links')
-def scan_broken_links():
+def scan_broken_links(incremental=False):
     """
     Ana tarama gorevi. Tum iceriklerdeki linkleri kontrol eder.
-    Haftalik Celery Beat ile calisir.
+    Haftalik Celery Beat ile tam tarama, gunluk incremental tarama calisir.
     """
-    from apps.common.models import BrokenLink, BrokenLinkScan
+    from apps.common.models import BrokenLinkScan
 
     start_time = time.time()
+
+    since = None
+    if incremental:
+        last_scan = BrokenLinkScan.objects.filter(status='completed').order_by('-created_at').first()
+        since = last_scan.created_at if last_scan else None
+
     scan = BrokenLinkScan.objects.create(status='running')
 
     try:
-        all_links = collect_content_links()
+        all_links = collect_content_links(since=since)
         logger.info(f"Link taramasi basladi: {len(all_links)} link bulundu")
 
         # Unique URL'lere indir (ayni URL birden fazla yerde olabilir)
-        unique_urls = {}
-        for url, src_type, src_id, src_title, src_field, lang in all_links:
-            # URL normalize
-            if url.startswith('//'):
-                url = 'https:' + url
-            elif url.startswith('/'):
-                url = 'https://norosera.com' + url
-
-            parsed = urlparse(url)
-            if not parsed.scheme or parsed.hostname in SKIP_DOMAINS:
-                continue
-
-            if url not in unique_urls:
-                unique_urls[url] = []
-            unique_urls[url].append((src_type, src_id, src_title, src_field, lang))
-
-        total_checked = 0
-        broken_found = 0
-        auto_fixed = 0
-
-        # Mevcut kirik linkleri "detected" durumunda birak
-        # Sadece yeni kirik linkler ekle
-
-        for url, sources in unique_urls.items():
-            if total_checked >= MAX_LINKS_PER_SCAN:
-                break
-
-            is_broken, http_status, error_msg = check_url(url)
-            total_checked += 1
-
-            if not is_broken:
-                # Eger onceden kirik olarak kayitliysa, otomatik tamamla
-                BrokenLink.objects.filter(
-                    broken_url=url,
-                    status='detected',
-                ).update(status='auto_fixed', fix_notes='Link tekrar erisilebilir', fixed_at=timezone.now())
-                continue
-
-            link_type = classify_link(url)
-
-            # Dahili link icin otomatik tamir dene
-            suggested = None
-            if link_type == 'internal':
-                suggested = try_auto_fix_internal(url)
-
-            for src_type, src_id, src_title, src_field, lang in sources:
-                obj, created = BrokenLink.objects.update_or_create(
-                    broken_url=url,
-                    source_type=src_type,
-                    source_id=src_id,
-                    source_field=src_field,
-                    defaults={
-                        'http_status': http_status,
-                        'error_message': error_msg,
-                        'link_type': link_type,
-                        'source_title': src_title,
-                        'source_language': lang,
-                        'check_count': 1 if created else models.F('check_count') + 1,
-                    },
-                )
+        unique_urls = _normalize_links(all_links)
+
+        results = LinkScanner().check_many(
+            list(unique_urls), max_network_checks=MAX_LINKS_PER_SCAN,
+        )
+        total_checked = len(results)
+        cache_hits = sum(1 for r in results.values() if r.from_cache)
 
-                if created:
-                    broken_found += 1
-
-                # Otomatik tamir uygula
-                if suggested and obj.status == 'detected':
-                    success = apply_fix_to_content(src_type, src_id, src_field, url, suggested)
-                    if success:
-                        obj.status = 'auto_fixed'
-                        obj.suggested_url = suggested
-                        obj.fix_notes = f'Dahili link otomatik tamir edildi: {suggested}'
-                        obj.fixed_at = timezone.now()
-                        obj.save(update_fields=['status', 'suggested_url', 'fix_notes', 'fixed_at'])
-                        auto_fixed += 1
-                    elif not obj.suggested_url:
-                        obj.suggested_url = suggested
-                        obj.save(update_fields=['suggested_url'])
-
-            # Rate limiting - sunuculari baskiya sokmamak icin
-            if total_checked % 10 == 0:
-                time.sleep(0.5)
+        broken_found, auto_fixed = _record_results(unique_urls, results)
 
         duration = int(time.time() - start_time)
         scan.status = 'completed'
@@ -381,13 +384,17 @@ def scan_broken_links():
         scan.details = {
             'total_content_links': len(all_links),
             'unique_urls': len(unique_urls),
+            'cache_hits': cache_hits,
+            'network_checks': total_checked - cache_hits,
+            'incremental': bool(incremental),
+            'since': since.isoformat() if since else None,
         }
         scan.save()
 
         logger.info(
-            f"Link taramasi tamamlandi: {total_checked} kontrol, "
-            f"{broken_found} kirik, {auto_fixed} otomatik tamir, "
-            f"{duration}s sure"
+            f"Link taramasi tamamlandi: {total_checked} kontrol "
+            f"({cache_hits} cache), {broken_found} kirik, "
+            f"{auto_fixed} otomatik tamir, {duration}s sure"
         )
 
         return {
@@ -448,235 +455,168 @@ def fix_broken_link(broken_link_id, new_url, user_id=None):
 # ═══════════════════════════════════════════════════════════════════
 
 @shared_task(name='apps.common.tasks.backend_frontend_health_check')
-def backend_frontend_health_check():
+def backend_frontend_health_check(full=False):
     """
-    Backend verileri ile frontend sayfaları arasındaki uyumu kontrol eder.
-    Her gün çalışır ve uyumsuzlukları admin'e bildirim olarak gönderir.
-
-    Kontroller:
-    - Hastalık modüllerinin eğitim içerikleri var mı
-    - Haber sayısı ve erişilebilirliği
-    - Blog/makale erişilebilirliği
-    - API endpoint'lerinin yanıt durumu
-    - Veri tutarsızlıkları
+    Backend verileri ile frontend sayfalari arasindaki uyumu kontrol eder
+    (apps.common.health). Artimli calismada yalnizca son denetimden beri
+    degisen kapsamlar denetlenir; tam calisma (gunde bir) canli endpoint
+    kontrollerini de yapar. Yeni bir sorun/uyari ciktiginda veya tam
+    calismada sorun varsa admin'e bildirim gonderilir.
     """
     from django.contrib.auth import get_user_model
-    from django.test import RequestFactory
-    from django.utils import timezone
-    from rest_framework.test import APIRequestFactory
-    from apps.patients.models import DiseaseModule
-    from apps.content.models import Article, EducationItem, NewsArticle
+    from apps.common import health
+    from apps.common.models import HealthAuditResult
     from apps.notifications.models import Notification
 
-    User = get_user_model()
-    issues = []
-    warnings = []
-    stats = {}
-
-    logger.info('🔍 Backend-Frontend uyum kontrolü başlatılıyor...')
-
-    # ─── 1. Hastalık Modülleri Kontrolü ───
-    expected_modules = ['migraine', 'epilepsy', 'dementia', 'parkinson']
-    existing_modules = set(DiseaseModule.objects.filter(is_active=True).values_list('slug', flat=True))
-
-    for mod_slug in expected_modules:
-        if mod_slug not in existing_modules:
-            issues.append(f'❌ DiseaseModule "{mod_slug}" aktif değil veya mevcut değil')
-
-    stats['disease_modules'] = len(existing_modules)
-
-    # ─── 2. Her Modül İçin Eğitim İçeriği Kontrolü ───
-    for mod_slug in expected_modules:
-        try:
-            module = DiseaseModule.objects.get(slug=mod_slug, is_active=True)
-            edu_count = EducationItem.objects.filter(
-                disease_module=module,
-                is_published=True
-            ).count()
-            stats[f'education_{mod_slug}'] = edu_count
-
-            if edu_count == 0:
-                issues.append(f'❌ {mod_slug.title()} modülünde hiç eğitim içeriği yok')
-            elif edu_count < 3:
-                warnings.append(f'⚠️ {mod_slug.title()} modülünde sadece {edu_count} eğitim içeriği var (min 3 önerilir)')
-        except DiseaseModule.DoesNotExist:
-            pass  # Zaten yukarıda raporlandı
-
-    # ─── 3. Haber Kontrolü ───
-    news_total = NewsArticle.objects.filter(status='published').count()
-    stats['news_total'] = news_total
-    if news_total == 0:
-        issues.append('❌ Hiç yayınlanmış haber yok')
-
-    # Hastalık bazlı haber dağılımı
-    for mod_slug in expected_modules:
-        news_count = NewsArticle.objects.filter(
-            status='published',
-            related_diseases__slug=mod_slug
-        ).count()
-        stats[f'news_{mod_slug}'] = news_count
-        if news_count == 0:
-            warnings.append(f'⚠️ {mod_slug.title()} ile ilgili hiç haber yok')
-
-    # Görselsiz haberler
-    news_no_image = NewsArticle.objects.filter(
-        status='published',
-        featured_image=''
-    ).count()
-    if news_no_image > 0:
-        warnings.append(f'⚠️ {news_no_image} haberde görsel eksik')
-
-    # ─── 4. Blog/Makale Kontrolü ───
-    articles_total = Article.objects.filter(status='published').count()
-    stats['articles_total'] = articles_total
-    if articles_total == 0:
-        warnings.append('⚠️ Hiç yayınlanmış blog makalesi yok')
-
-    # ─── 5. API Endpoint Erişim Kontrolü ───
-    public_endpoints = [
-        ('/api/v1/content/public-news/', 'Haberler API'),
-        ('/api/v1/content/public-education/', 'Eğitim API'),
-        ('/api/v1/content/articles/', 'Makaleler API'),
-        ('/api/v1/health/', 'Health Check API'),
-        ('/api/v1/modules/', 'Modüller API'),
-    ]
-
-    from django.test import Client
-    from django.conf import settings
-    server_name = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
-    client = Client(SERVER_NAME=server_name)
-    for endpoint, label in public_endpoints:
-        try:
-            response = client.get(endpoint, follow=True)
-            if response.status_code >= 400:
-                issues.append(f'❌ {label} ({endpoint}) → HTTP {response.status_code}')
-            else:
-                stats[f'api_{label}'] = f'OK ({response.status_code})'
-        except Exception as e:
-            issues.append(f'❌ {label} ({endpoint}) → Hata: {str(e)[:100]}')
-
-    # Auth gerektiren endpoint'leri admin ile test et
-    admin_user = User.objects.filter(is_superuser=True).first()
-    if admin_user:
-        from rest_framework_simplejwt.tokens import AccessToken
-        token = str(AccessToken.for_user(admin_user))
-        auth_header = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
-
-        auth_endpoints = [
-            ('/api/v1/content/education/', 'Eğitim (Auth) API'),
-            ('/api/v1/doctor/dashboard/stats/', 'Doktor Dashboard API'),
-        ]
-        for endpoint, label in auth_endpoints:
-            try:
-                response = client.get(endpoint, follow=True, **auth_header)
-                if response.status_code >= 400:
-                    warnings.append(f'⚠️ {label} ({endpoint}) → HTTP {response.status_code}')
-            except Exception as e:
-                warnings.append(f'⚠️ {label} ({endpoint}) → Hata: {str(e)[:100]}')
-
-        # Parkinson eğitim API'si özel kontrol
-        try:
-            response = client.get('/api/v1/content/education/?disease_module=parkinson', follow=True, **auth_header)
-            if response.status_code == 200:
-                import json
-                data = json.loads(response.content)
-                items = data if isinstance(data, list) else data.get('results', [])
-                if len(items) == 0:
-                    issues.append('❌ Parkinson eğitim API\'si veri döndürmüyor (0 item)')
-                else:
-                    stats['parkinson_edu_api'] = f'{len(items)} item'
-            else:
-                issues.append(f'❌ Parkinson eğitim API → HTTP {response.status_code}')
-        except Exception as e:
-            issues.append(f'❌ Parkinson eğitim API → Hata: {str(e)[:100]}')
-
-    # ─── 6. Veri Tutarsızlığı Kontrolü ───
-    # Yayınlanmış ama slug'ı olmayan içerikler
-    no_slug_news = NewsArticle.objects.filter(status='published', slug='').count()
-    if no_slug_news > 0:
-        issues.append(f'❌ {no_slug_news} haberde slug eksik (detay sayfası açılmaz)')
-
-    no_slug_articles = Article.objects.filter(status='published', slug='').count()
-    if no_slug_articles > 0:
-        issues.append(f'❌ {no_slug_articles} makalede slug eksik')
-
-    # Duplike slug kontrolü
-    from django.db.models import Count
-    dup_news = NewsArticle.objects.filter(status='published').values('slug').annotate(
-        cnt=Count('id')
-    ).filter(cnt__gt=1)
-    if dup_news.exists():
-        for d in dup_news:
-            issues.append(f'❌ Duplike haber slug: "{d["slug"]}" ({d["cnt"]} adet)')
-
-    # ─── 7. Frontend Sayfa-Backend Veri Eşleşmesi ───
-    # Her modül için frontend sayfasının beklediği verileri kontrol et
-    module_education_mapping = {
-        'migraine': {'min_items': 2, 'expected_categories': ['basics', 'treatment']},
-        'epilepsy': {'min_items': 2, 'expected_categories': ['basics']},
-        'dementia': {'min_items': 2, 'expected_categories': ['basics', 'exercises']},
-        'parkinson': {'min_items': 3, 'expected_categories': ['basics', 'treatment', 'exercises']},
+    previous = HealthAuditResult.objects.first()
+    result = health.run_consistency_audit(full=full)
+    if previous is not None and result.pk == previous.pk:
+        logger.info("Uyum denetimi: degisen kapsam yok, yeni sonuc yazilmadi")
+        return {
+            'issues': result.issue_count,
+            'warnings': result.warning_count,
+            'checked': [],
+        }
+    report = health.format_report(result)
+    logger.info(report)
+
+    has_findings = result.issue_count or result.warning_count
+    if has_findings and (full or health.has_new_findings(result, previous)):
+        Notification.objects.bulk_create([
+            Notification(
+                recipient=admin,
+                notification_type='system',
+                title_tr=f'Sistem Uyum Raporu: {result.issue_count} sorun, {result.warning_count} uyarı',
+                title_en=f'System Health Report: {result.issue_count} issues, {result.warning_count} warnings',
+                message_tr=report,
+                message_en=report,
+            )
+            for admin in get_user_model().objects.filter(is_superuser=True)
+        ])
+
+    return {
+        'issues': result.issue_count,
+        'warnings': result.warning_count,
+        'checked': result.scopes_checked,
+        'stats': {k: v for scope in result.results.values() for k, v in scope['stats'].items()},
+        'report': report,
     }
 
-    for mod_slug, expected in module_education_mapping.items():
-        items = EducationItem.objects.filter(
-            disease_module__slug=mod_slug,
-            is_published=True
+
+# ═══════════════════════════════════════════════════════════════════
+# Idempotency anahtari temizligi
+# ═══════════════════════════════════════════════════════════════════
+
+IDEMPOTENCY_KEY_TTL_HOURS = 48
+
+
+@shared_task(name='apps.common.tasks.purge_idempotency_keys')
+def purge_idempotency_keys():
+    """Istemci tekrar denemesi suresini asan idempotency anahtarlarini sil."""
+    from datetime import timedelta
+    from apps.common.models import IdempotencyKey
+
+    cutoff = timezone.now() - timedelta(hours=IDEMPOTENCY_KEY_TTL_HOURS)
+    deleted, _ = IdempotencyKey.objects.filter(created_at__lt=cutoff).delete()
+    logger.info(f"Idempotency anahtari temizligi: {deleted} kayit silindi")
+    return {'deleted': deleted}
+
+
+# ═══════════════════════════════════════════════════════════════════
+# PDF rapor uretimi (apps.common.report_service)
+# ═══════════════════════════════════════════════════════════════════
+
+@shared_task(name='apps.common.tasks.generate_report')
+def generate_report(report_id):
+    """Bekleyen raporu uret; istenmisse hazir oldugunda hastaya bildirim gonder."""
+    from apps.common import report_service
+    from apps.common.models import GeneratedReport
+    from apps.notifications.models import Notification
+
+    report = GeneratedReport.objects.select_related('user').filter(id=report_id).first()
+    if report is None or not report_service.claim_report(report):
+        return {'success': False, 'message': 'Rapor bulunamadi veya zaten uretiliyor'}
+
+    try:
+        report_service.render_report(report)
+    except Exception as e:
+        return {'success': False, 'message': str(e)}
+
+    if report.notify_on_ready:
+        Notification.objects.create(
+            recipient=report.user,
+            notification_type='info',
+            title_tr='Raporunuz hazir',
+            title_en='Your report is ready',
+            message_tr=f'{report.start_date:%d.%m.%Y} - {report.end_date:%d.%m.%Y} donemi raporu indirilebilir.',
+            message_en=f'The report for {report.start_date} - {report.end_date} is ready to download.',
+            action_url=report_service.report_status_data(report)['download_url'],
+            metadata={'report_id': str(report.id), 'report_type': report.report_type},
         )
-        actual_categories = set(items.values_list('category__slug', flat=True))
-        missing = set(expected['expected_categories']) - actual_categories
-        if missing:
-            warnings.append(
-                f'⚠️ {mod_slug.title()} eğitiminde eksik kategori: {", ".join(missing)}'
-            )
+    return {'success': True, 'size_bytes': report.size_bytes}
 
-    # ─── Rapor Oluştur ───
-    now = timezone.now().strftime('%Y-%m-%d %H:%M')
-    total_issues = len(issues)
-    total_warnings = len(warnings)
 
-    report_lines = [f'📊 Backend-Frontend Uyum Raporu ({now})', '']
+@shared_task(name='apps.common.tasks.purge_health_audits')
+def purge_health_audits():
+    """RESULT_RETENTION_DAYS'ten eski uyum denetimi sonuclarini sil."""
+    from apps.common import health
 
-    # Stats
-    report_lines.append('📈 İstatistikler:')
-    for key, val in stats.items():
-        report_lines.append(f'  • {key}: {val}')
-    report_lines.append('')
+    deleted = health.purge_audit_results()
+    logger.info(f"Uyum denetimi temizligi: {deleted} sonuc silindi")
+    return {'deleted': deleted}
 
-    if issues:
-        report_lines.append(f'🚨 KRİTİK SORUNLAR ({total_issues}):')
-        for issue in issues:
-            report_lines.append(f'  {issue}')
-        report_lines.append('')
 
-    if warnings:
-        report_lines.append(f'⚠️ UYARILAR ({total_warnings}):')
-        for warn in warnings:
-            report_lines.append(f'  {warn}')
-        report_lines.append('')
+@shared_task(name='apps.common.tasks.purge_generated_reports')
+def purge_generated_reports():
+    """REPORT_CACHE_DAYS'ten eski rapor artefaktlarini dosyalariyla sil."""
+    from datetime import timedelta
+    from apps.common import report_service
+    from apps.common.models import GeneratedReport
 
-    if not issues and not warnings:
-        report_lines.append('✅ Tüm kontroller başarılı! Backend-frontend uyumu sorunsuz.')
+    cutoff = timezone.now() - timedelta(days=report_service.REPORT_CACHE_DAYS)
+    deleted = report_service.delete_reports(GeneratedReport.objects.filter(updated_at__lt=cutoff))
+    logger.info(f"Rapor onbellek temizligi: {deleted} rapor silindi")
+    return {'deleted': deleted}
 
-    report = '\n'.join(report_lines)
-    logger.info(report)
 
-    # Admin'e bildirim gönder (sorun varsa)
-    if issues or warnings:
-        admins = User.objects.filter(is_superuser=True)
-        for admin in admins:
-            Notification.objects.create(
-                recipient=admin,
-                notification_type='system',
-                title_tr=f'Sistem Uyum Raporu: {total_issues} sorun, {total_warnings} uyarı',
-                title_en=f'System Health Report: {total_issues} issues, {total_warnings} warnings',
-                message_tr=report,
-                message_en=report,
-            )
+# ═══════════════════════════════════════════════════════════════════
+# Hasta verisi disa aktarimi (apps.common.data_export)
+# ═══════════════════════════════════════════════════════════════════
 
-    return {
-        'issues': total_issues,
-        'warnings': total_warnings,
-        'stats': stats,
-        'report': report,
-    }
+@shared_task(name='apps.common.tasks.generate_data_export')
+def generate_data_export(export_id):
+    """Buyuk hasta arsivini arka planda uret; hazir oldugunda talep edene bildir."""
+    from apps.common import data_export
+    from apps.common.models import DataExport
+    from apps.notifications.models import Notification
+
+    export = DataExport.objects.select_related('patient', 'requested_by').filter(id=export_id).first()
+    if export is None or not data_export.claim_export(export):
+        return {'success': False, 'message': 'Disa aktarim bulunamadi veya zaten uretiliyor'}
+
+    try:
+        data_export.render_export(export)
+    except Exception as e:
+        return {'success': False, 'message': str(e)}
+
+    Notification.objects.create(
+        recipient=export.requested_by or export.patient,
+        notification_type='info',
+        title_tr='Veri arsivi hazir',
+        title_en='Data export is ready',
+        message_tr=f'{export.row_count} kayit iceren arsiv indirilebilir.',
+        message_en=f'The archive with {export.row_count} records is ready to download.',
+        action_url=data_export.export_status_data(export)['download_url'],
+        metadata={'export_id': str(export.id), 'patient_id': export.patient_id},
+    )
+    return {'success': True, 'size_bytes': export.size_bytes, 'row_count': export.row_count}
+
+
+@shared_task(name='apps.common.tasks.purge_data_exports')
+def purge_data_exports():
+    """Suresi dolan hasta veri arsivlerini dosyalariyla sil (KVKK saklama suresi)."""
+    from apps.common import data_export
+
+    deleted = data_export.purge_expired_exports()
+    logger.info(f"Veri disa aktarim temizligi: {deleted} arsiv silindi")
+    return {'deleted': deleted}
@@ -1,8 +1,11 @@
 from django.urls import path
-from . import views
+from . import views, views_exports
 
 urlpatterns = [
     path('contact/', views.ContactView.as_view(), name='contact'),
     path('consent/', views.ConsentListView.as_view(), name='consent-list'),
     path('consent/grant/', views.GrantConsentView.as_view(), name='consent-grant'),
+    path('export/', views_exports.PatientDataExportView.as_view(), name='data-export'),
+    path('exports/<uuid:pk>/', views_exports.DataExportStatusView.as_view(), name='data-export-status'),
+    path('exports/<uuid:pk>/download/', views_exports.DataExportDownloadView.as_view(), name='data-export-download'),
 ]
@@ -0,0 +1,7 @@
+from django.urls import path
+from . import views_reports
+
+urlpatterns = [
+    path('<uuid:pk>/', views_reports.GeneratedReportStatusView.as_view(), name='report-status'),
+    path('<uuid:pk>/download/', views_reports.GeneratedReportDownloadView.as_view(), name='report-download'),
+]
@@ -17,6 +17,7 @@ urlpatterns = [
     path('hero/active/', views_site.ActiveHeroView.as_view(), name='hero-active'),
     path('social-links/', views_site.PublicSocialLinksView.as_view(), name='social-links-public'),
     path('feature-flags/', views_site.PublicFeatureFlagsView.as_view(), name='feature-flags-public'),
+    path('bootstrap/', views_site.SiteBootstrapView.as_view(), name='site-bootstrap'),
 
     # Admin endpoints
     path('admin/', include(admin_router.urls)),
@@ -0,0 +1,54 @@
+"""
+Hasta verisi disa aktarim endpoint'leri (KVKK ilgili kisi basvurusu).
+GET /api/v1/kvkk/export/?export_format=ndjson|csv   — Zip arsivi (stream) veya 202 + durum
+GET /api/v1/kvkk/exports/<id>/                      — Arka plan uretim durumu (polling)
+GET /api/v1/kvkk/exports/<id>/download/             — Hazir arsiv
+"""
+
+from django.db.models import Q
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from . import data_export
+from .models import DataExport
+
+
+def _visible_exports(user):
+    # Hasta kendi arsivlerini, hekim talep ettigi arsivleri gorur
+    return DataExport.objects.select_related('patient').filter(Q(patient=user) | Q(requested_by=user))
+
+
+class PatientDataExportView(APIView):
+    """Hastanin tum modul verisini zip arsivi olarak ver."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return data_export.export_response(request, request.user)
+
+
+class DataExportStatusView(APIView):
+    """Disa aktarim uretim durumu."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        export = get_object_or_404(_visible_exports(request.user), pk=pk)
+        return Response(data_export.export_status_data(export))
+
+
+class DataExportDownloadView(APIView):
+    """Hazir arsivi indir; hazir degilse 202 + durum."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        export = get_object_or_404(_visible_exports(request.user), pk=pk)
+        if export.status != 'ready':
+            return Response(data_export.export_status_data(export), status=status.HTTP_202_ACCEPTED)
+        if data_export.is_expired(export):
+            return Response(
+                {'detail': 'Arsivin suresi doldu, yeni bir disa aktarim talep edin.'},
+                status=status.HTTP_410_GONE,
+            )
+        return data_export.file_response(export)
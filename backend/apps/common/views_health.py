@@ -1,7 +1,11 @@
 """
-Health check endpoint.
+Health check endpoint'leri.
 Deployment, monitoring ve uptime kontrolleri icin.
-GET /api/v1/health/
+GET /api/v1/health/              — DB kontrolu (geriye uyumlu)
+GET /api/v1/health/live/         — Liveness (I/O yok)
+GET /api/v1/health/ready/        — Readiness: DB, cache, kuyruk derinligi, beat yaslari
+                                   (anonim: yalnizca status; ayrinti admin'e)
+GET /api/v1/health/consistency/  — Icerik tutarlilik denetimi zaman serisi (admin)
 """
 
 import time
@@ -10,6 +14,10 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 
+from apps.accounts.permissions import IsAdminUser
+from . import health
+from .models import HealthAuditResult
+
 
 class HealthCheckView(APIView):
     """Sistem sagligi kontrol endpoint'i."""
@@ -35,3 +43,49 @@ class HealthCheckView(APIView):
             'database': {'ok': db_ok, 'response_ms': db_ms},
             'version': '1.0.0',
         }, status=status_code)
+
+
+class LivenessView(APIView):
+    """Proses ayakta mi (I/O yok)."""
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    throttle_classes = []
+
+    def get(self, request):
+        return Response({'status': 'ok'})
+
+
+class ReadinessView(APIView):
+    """Bagimliliklar hazir mi; DB veya cache yoksa 503. Kontrol ayrintisi yalnizca admin'e."""
+    permission_classes = [AllowAny]
+    throttle_classes = []
+
+    def get(self, request):
+        data = health.cached_readiness()
+        status_code = 503 if data['status'] == 'down' else 200
+        if not IsAdminUser().has_permission(request, self):
+            data = {'status': data['status']}
+        return Response(data, status=status_code)
+
+
+class ConsistencyAuditView(APIView):
+    """Son tutarlilik denetimi ve zaman serisi."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        try:
+            limit = min(int(request.query_params.get('limit', 96)), 1000)
+        except ValueError:
+            limit = 96
+        latest = HealthAuditResult.objects.first()
+        return Response({
+            'latest': {
+                'created_at': latest.created_at,
+                'status': latest.status,
+                'is_full': latest.is_full,
+                'issue_count': latest.issue_count,
+                'warning_count': latest.warning_count,
+                'results': latest.results,
+            } if latest else None,
+            'series': health.series(limit),
+        })
@@ -0,0 +1,34 @@
+"""
+Uretilmis PDF raporlarin durum ve indirme endpoint'leri.
+GET /api/v1/reports/<id>/           — Uretim durumu (polling)
+GET /api/v1/reports/<id>/download/  — PDF (Range destekli)
+"""
+
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from . import report_service
+from .models import GeneratedReport
+
+
+class GeneratedReportStatusView(APIView):
+    """Rapor uretim durumu."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        report = get_object_or_404(GeneratedReport, pk=pk, user=request.user)
+        return Response(report_service.report_status_data(report))
+
+
+class GeneratedReportDownloadView(APIView):
+    """Hazir raporu indir; hazir degilse 202 + durum."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        report = get_object_or_404(GeneratedReport.objects.select_related('user'), pk=pk, user=request.user)
+        if report.status != 'ready':
+            return Response(report_service.report_status_data(report), status=status.HTTP_202_ACCEPTED)
+        return report_service.file_response(request, report)
@@ -1,14 +1,15 @@
 from django.utils import timezone
-from rest_framework import generics, viewsets, status
+from rest_framework import viewsets
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from apps.accounts.permissions import IsAdminUser
+from . import site_snapshot
 from .models import SiteConfig, FeatureFlag, Announcement, HomepageHero, SocialLink
 from .serializers_site import (
-    SiteConfigSerializer, SiteConfigPublicSerializer,
-    FeatureFlagSerializer, FeatureFlagPublicSerializer,
+    SiteConfigSerializer, FeatureFlagSerializer,
     AnnouncementSerializer, HomepageHeroSerializer, SocialLinkSerializer,
 )
 
@@ -17,63 +18,68 @@ from .serializers_site import (
 # PUBLIC ENDPOINTS
 # ============================
 
-class PublicSiteConfigView(generics.ListAPIView):
-    """is_public=True olan SiteConfig degerlerini dondurur."""
-    serializer_class = SiteConfigPublicSerializer
+class PublicSiteView(APIView):
+    """Public site endpoint'leri icin ortak taban: veri proses ici goruntuden okunur."""
     permission_classes = [AllowAny]
     authentication_classes = []
-    pagination_class = None
 
-    def get_queryset(self):
-        return SiteConfig.objects.filter(is_public=True)
+    def get_payload(self, request, snapshot):
+        raise NotImplementedError
+
+    def get(self, request):
+        return Response(self.get_payload(request, site_snapshot.get_snapshot()))
+
+
+def _hero_payload(request, hero):
+    """Hero verisinde gorsel yolunu istek uzerinden mutlak URL'e cevir."""
+    if hero and hero.get('background_image'):
+        hero = {**hero, 'background_image': request.build_absolute_uri(hero['background_image'])}
+    return hero
+
+
+class PublicSiteConfigView(PublicSiteView):
+    """is_public=True olan SiteConfig degerlerini dondurur."""
+
+    def get_payload(self, request, snapshot):
+        return snapshot.public_config
 
 
-class ActiveAnnouncementsView(generics.ListAPIView):
+class ActiveAnnouncementsView(PublicSiteView):
     """Aktif ve tarih araliginda olan duyurulari dondurur."""
-    serializer_class = AnnouncementSerializer
-    permission_classes = [AllowAny]
-    authentication_classes = []
-    pagination_class = None
 
-    def get_queryset(self):
-        now = timezone.now()
-        qs = Announcement.objects.filter(is_active=True)
-        qs = qs.exclude(starts_at__gt=now)
-        qs = qs.exclude(expires_at__lt=now)
-        return qs
+    def get_payload(self, request, snapshot):
+        return snapshot.active_announcements()
 
 
-class ActiveHeroView(generics.ListAPIView):
+class ActiveHeroView(PublicSiteView):
     """Aktif hero section verisini dondurur."""
-    serializer_class = HomepageHeroSerializer
-    permission_classes = [AllowAny]
-    authentication_classes = []
-    pagination_class = None
 
-    def get_queryset(self):
-        return HomepageHero.objects.filter(is_active=True)[:1]
+    def get_payload(self, request, snapshot):
+        hero = _hero_payload(request, snapshot.hero)
+        return [hero] if hero else []
 
 
-class PublicSocialLinksView(generics.ListAPIView):
+class PublicSocialLinksView(PublicSiteView):
     """Aktif sosyal medya linklerini dondurur."""
-    serializer_class = SocialLinkSerializer
-    permission_classes = [AllowAny]
-    authentication_classes = []
-    pagination_class = None
 
-    def get_queryset(self):
-        return SocialLink.objects.filter(is_active=True)
+    def get_payload(self, request, snapshot):
+        return snapshot.social_links
 
 
-class PublicFeatureFlagsView(generics.ListAPIView):
-    """Public feature flag durumlarini dondurur."""
-    serializer_class = FeatureFlagPublicSerializer
-    permission_classes = [AllowAny]
-    authentication_classes = []
-    pagination_class = None
+class PublicFeatureFlagsView(PublicSiteView):
+    """Feature flag durumlarini dondurur (key, label, is_enabled)."""
+
+    def get_payload(self, request, snapshot):
+        return snapshot.public_flags()
+
+
+class SiteBootstrapView(PublicSiteView):
+    """Config, flag, duyuru, hero ve sosyal linkler tek yanitta (sayfa acilisi)."""
 
-    def get_queryset(self):
-        return FeatureFlag.objects.filter(is_public=True)
+    def get_payload(self, request, snapshot):
+        payload = snapshot.bootstrap()
+        payload['hero'] = _hero_payload(request, payload['hero'])
+        return payload
 
 
 # ============================
@@ -5,3 +5,6 @@ class ContentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.content'
     label = 'content'
+
+    def ready(self):
+        import apps.content.signals  # noqa: F401
@@ -0,0 +1,151 @@
+"""
+Gunluk mikro-egitim (drip) motoru.
+
+Her hastalik modulu icin:
+- Kayitli hastalarin siradaki karti, tamamlanan kart sayisi ve bildirim
+  tercihi tek sorguda (correlated subquery) hesaplanir.
+- Bugun gonderilmis drip bildirimleri tek sorguyla okunur, kume farki ile elenir.
+- Bildirimler bulk_create ile tek seferde yazilir.
+- Hastalar patient_id % shard_count ile parcalanip paralel islenebilir.
+"""
+
+import logging
+
+from django.db.models import Count, Exists, F, OuterRef, Subquery
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DRIP_METADATA_KEY = 'drip_education_item'
+BULK_BATCH_SIZE = 500
+
+
+def _module_copy(module):
+    """Bildirim basliklari; migren icin mevcut metinler korunur."""
+    if module.slug == 'migraine':
+        return {
+            'title_tr': 'Gunun Migren Bilgisi',
+            'title_en': "Today's Migraine Tip",
+            'set_tr': 'Migren egitim setinizde',
+            'set_en': 'your migraine education set',
+        }
+    return {
+        'title_tr': f'Gunun {module.name_tr} Bilgisi',
+        'title_en': f"Today's {module.name_en} Tip",
+        'set_tr': f'{module.name_tr} egitim setinizde',
+        'set_en': f'your {module.name_en.lower()} education set',
+    }
+
+
+def _enrollment_rows(module, shard, shard_count):
+    """Kayitli hastalar + siradaki kart + tamamlanan sayisi + tercih (tek sorgu)."""
+    from apps.content.models import EducationItem, EducationProgress
+    from apps.notifications.models import NotificationPreference
+    from apps.patients.models import PatientModule
+
+    published = EducationItem.objects.filter(disease_module=module, is_published=True)
+    completed = EducationProgress.objects.filter(
+        patient_id=OuterRef(OuterRef('patient_id')),
+        education_item_id=OuterRef('pk'),
+        completed_at__isnull=False,
+    )
+    next_item = (
+        published
+        .annotate(is_completed=Exists(completed))
+        .filter(is_completed=False)
+        .order_by('order')
+        .values('id')[:1]
+    )
+    completed_count = (
+        EducationProgress.objects.filter(
+            patient_id=OuterRef('patient_id'),
+            completed_at__isnull=False,
+            education_item__disease_module=module,
+            education_item__is_published=True,
+        )
+        .order_by()
+        .values('patient_id')
+        .annotate(n=Count('id'))
+        .values('n')
+    )
+    opted_out = NotificationPreference.objects.filter(
+        user_id=OuterRef('patient_id'), email_education=False,
+    )
+
+    rows = PatientModule.objects.filter(disease_module=module, is_active=True)
+    if shard_count > 1:
+        rows = rows.annotate(shard=F('patient_id') % shard_count).filter(shard=shard)
+
+    return rows.annotate(
+        next_item_id=Subquery(next_item),
+        completed_count=Subquery(completed_count),
+        opted_out=Exists(opted_out),
+    ).values_list('patient_id', 'next_item_id', 'completed_count', 'opted_out')
+
+
+def run_module_drip(module, shard=0, shard_count=1, now=None):
+    """Tek modul (ve shard) icin gunun drip bildirimlerini olustur."""
+    from apps.content.models import EducationItem
+    from apps.notifications.models import Notification
+
+    now = now or timezone.now()
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    items = {
+        item.id: item
+        for item in EducationItem.objects.filter(
+            disease_module=module, is_published=True,
+        ).only('id', 'slug', 'order', 'title_tr', 'title_en')
+    }
+    total_cards = len(items)
+
+    candidates = []
+    skipped = 0
+    for patient_id, next_item_id, completed_count, opted_out in _enrollment_rows(
+        module, shard, shard_count,
+    ):
+        if opted_out or next_item_id is None:
+            skipped += 1
+            continue
+        candidates.append((patient_id, next_item_id, completed_count or 0))
+
+    if not candidates:
+        return {'sent': 0, 'skipped': skipped}
+
+    already_sent = {
+        (recipient_id, item_id)
+        for recipient_id, item_id in Notification.objects.filter(
+            recipient_id__in=[c[0] for c in candidates],
+            notification_type='info',
+            created_at__gte=today_start,
+            metadata__has_key=DRIP_METADATA_KEY,
+        ).values_list('recipient_id', f'metadata__{DRIP_METADATA_KEY}')
+    }
+
+    copy = _module_copy(module)
+    notifications = []
+    for patient_id, next_item_id, completed_count in candidates:
+        if (patient_id, str(next_item_id)) in already_sent:
+            skipped += 1
+            continue
+
+        item = items[next_item_id]
+        position = f"({completed_count + 1}/{total_cards})"
+        notifications.append(Notification(
+            recipient_id=patient_id,
+            notification_type='info',
+            title_tr=f"{copy['title_tr']}: {item.title_tr}",
+            title_en=f"{copy['title_en']}: {item.title_en}",
+            message_tr=f"{copy['set_tr']} yeni bir kart sizi bekliyor! {position}",
+            message_en=f"A new card is waiting in {copy['set_en']}! {position}",
+            action_url=f'/patient/{module.slug}/education',
+            metadata={
+                DRIP_METADATA_KEY: str(item.id),
+                'education_slug': item.slug,
+                'card_number': item.order,
+                'total_cards': total_cards,
+            },
+        ))
+
+    Notification.objects.bulk_create(notifications, batch_size=BULK_BATCH_SIZE)
+    return {'sent': len(notifications), 'skipped': skipped}
@@ -0,0 +1,80 @@
+"""
+Quiz puanlama hizini olc (derlenmis cevap anahtari ile bellekte puanlama).
+
+Kullanım: python3 manage.py benchmark_quiz_grading [--quiz <slug>] [--questions 20] [--attempts 100000]
+"""
+
+import random
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Quiz puanlama throughput benchmark (deneme/saniye)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--quiz', type=str, default='',
+            help='Gercek quiz slug (bos ise sentetik quiz kullanilir)',
+        )
+        parser.add_argument(
+            '--questions', type=int, default=20,
+            help='Sentetik quiz soru sayisi (varsayılan: 20)',
+        )
+        parser.add_argument(
+            '--attempts', type=int, default=100000,
+            help='Puanlanacak deneme sayisi (varsayılan: 100000)',
+        )
+
+    def handle(self, *args, **options):
+        from django.db import connection, reset_queries
+        from apps.content.models import EducationQuiz
+        from apps.content.quiz_grading import AnswerKey, get_answer_key, grade_answers
+
+        if options['quiz']:
+            try:
+                quiz = EducationQuiz.objects.get(slug=options['quiz'])
+            except EducationQuiz.DoesNotExist:
+                raise CommandError(f"Quiz bulunamadi: {options['quiz']}")
+            key = get_answer_key(quiz)
+        else:
+            key = AnswerKey(
+                quiz_id=str(uuid.uuid4()),
+                version=1,
+                passing_score_percent=60,
+                questions={
+                    str(uuid.uuid4()): (4, frozenset([random.randrange(4)]))
+                    for _ in range(options['questions'])
+                },
+            )
+
+        if not key.total:
+            raise CommandError('Quiz sorusu yok.')
+
+        question_ids = list(key.questions)
+        attempts = [
+            [
+                {'question_id': q_id, 'selected_option_index': random.randrange(4)}
+                for q_id in question_ids
+            ]
+            for _ in range(min(options['attempts'], 1000))
+        ]
+        total_attempts = options['attempts']
+
+        reset_queries()
+        queries_before = len(connection.queries)
+        started = time.perf_counter()
+        passed = 0
+        for i in range(total_attempts):
+            if grade_answers(key, attempts[i % len(attempts)]).passed:
+                passed += 1
+        elapsed = time.perf_counter() - started
+        queries = len(connection.queries) - queries_before
+
+        rate = total_attempts / elapsed if elapsed else float('inf')
+        self.stdout.write(self.style.SUCCESS(
+            f'{total_attempts} deneme / {key.total} soru: {elapsed:.3f} sn, '
+            f'{rate:,.0f} deneme/sn, {passed} gecti, {queries} sorgu'
+        ))
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.5 on 2026-10-19 18:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0005_add_featured_image_url'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='educationquiz',
+            name='content_version',
+            field=models.PositiveIntegerField(default=1, editable=False, help_text='Quiz veya soru degistikce artar; cevap anahtari cache anahtarinda kullanilir'),
+        ),
+    ]
@@ -185,6 +185,10 @@ class EducationQuiz(TimeStampedModel):
     points_reward = models.PositiveIntegerField(default=10)
     is_published = models.BooleanField(default=False)
     order = models.PositiveIntegerField(default=0)
+    content_version = models.PositiveIntegerField(
+        default=1, editable=False,
+        help_text='Quiz veya soru degistikce artar; cevap anahtari cache anahtarinda kullanilir',
+    )
 
     class Meta:
         ordering = ['disease_module', 'order']
@@ -0,0 +1,132 @@
+"""
+Quiz puanlama: derlenmis cevap anahtari cache'i ve tek gecisli puanlama.
+
+Cevap anahtari (soru id -> secenek sayisi, dogru secenek indeksleri) quiz
+basina bir kez derlenir ve (quiz id, content_version) ile anahtarlanir.
+Once proses ici sozlukte, sonra Django cache'inde (Redis) aranir; soru
+duzenlenince content_version arttigi icin eski anahtar kendiliginden
+kullanilmaz. Cache isabetinde puanlama ek sorgu yapmadan bellekte yapilir.
+"""
+
+from dataclasses import dataclass, field
+
+from django.core.cache import cache
+
+ANSWER_KEY_CACHE_TIMEOUT = 60 * 60 * 24
+
+# quiz_id -> AnswerKey (proses ici, en guncel versiyon)
+_local_keys = {}
+
+
+@dataclass(frozen=True)
+class AnswerKey:
+    """Bir quiz versiyonunun derlenmis cevap anahtari."""
+    quiz_id: str
+    version: int
+    passing_score_percent: int
+    # question_id -> (secenek sayisi, dogru secenek indeksleri)
+    questions: dict = field(default_factory=dict)
+
+    @property
+    def total(self):
+        return len(self.questions)
+
+
+@dataclass(frozen=True)
+class GradeResult:
+    score: int
+    total_questions: int
+    passed: bool
+    answers: list
+
+    @property
+    def is_perfect(self):
+        return self.total_questions > 0 and self.score == self.total_questions
+
+
+def _cache_key(quiz_id, version):
+    return f'quiz_answer_key:{quiz_id}:v{version}'
+
+
+def compile_answer_key(quiz):
+    """Quiz sorularindan cevap anahtarini derle (tek sorgu)."""
+    from .models import QuizQuestion
+
+    rows = QuizQuestion.objects.filter(quiz_id=quiz.pk).values_list('id', 'options')
+    questions = {}
+    for question_id, options in rows:
+        options = options or []
+        correct = frozenset(
+            i for i, opt in enumerate(options)
+            if isinstance(opt, dict) and opt.get('is_correct', False)
+        )
+        questions[str(question_id)] = (len(options), correct)
+
+    return AnswerKey(
+        quiz_id=str(quiz.pk),
+        version=quiz.content_version,
+        passing_score_percent=quiz.passing_score_percent,
+        questions=questions,
+    )
+
+
+def get_answer_key(quiz):
+    """Quiz'in guncel versiyonu icin cevap anahtarini dondur."""
+    quiz_id = str(quiz.pk)
+    key = _local_keys.get(quiz_id)
+    if key is not None and key.version == quiz.content_version:
+        return key
+
+    cache_key = _cache_key(quiz_id, quiz.content_version)
+    key = cache.get(cache_key)
+    if key is None:
+        key = compile_answer_key(quiz)
+        cache.set(cache_key, key, ANSWER_KEY_CACHE_TIMEOUT)
+
+    _local_keys[quiz_id] = key
+    return key
+
+
+def grade_answers(answer_key, answers):
+    """
+    Cevaplari tek geciste puanla (saf fonksiyon, sorgu yok).
+
+    answers: [{question_id, selected_option_index}]
+    """
+    questions = answer_key.questions
+    correct_count = 0
+    evaluated = []
+    seen = set()
+
+    for answer in answers:
+        q_id = str(answer.get('question_id', ''))
+        selected_idx = answer.get('selected_option_index', -1)
+        entry = questions.get(q_id)
+        is_correct = False
+
+        # Ayni soruya tekrar gelen cevaplar puana eklenmez
+        if entry is not None and q_id not in seen and isinstance(selected_idx, int):
+            seen.add(q_id)
+            option_count, correct = entry
+            is_correct = 0 <= selected_idx < option_count and selected_idx in correct
+
+        if is_correct:
+            correct_count += 1
+
+        evaluated.append({
+            'question_id': q_id,
+            'selected_option_index': selected_idx,
+            'is_correct': is_correct,
+        })
+
+    total = answer_key.total
+    passed = (
+        (correct_count / total * 100) >= answer_key.passing_score_percent
+        if total > 0 else False
+    )
+    return GradeResult(
+        score=correct_count,
+        total_questions=total,
+        passed=passed,
+        answers=evaluated,
+    )
@@ -444,7 +444,8 @@ class EducationQuizSerializer(serializers.ModelSerializer):
         return None
 
     def get_question_count(self, obj):
-        return obj.questions.count()
+        # prefetch_related('questions') ile ek sorgu yapmaz
+        return len(obj.questions.all())
 
     def get_best_attempt(self, obj):
         request = self.context.get('request')
@@ -496,7 +497,8 @@ class EducationQuizListSerializer(serializers.ModelSerializer):
         return None
 
     def get_question_count(self, obj):
-        return obj.questions.count()
+        # prefetch_related('questions') ile ek sorgu yapmaz
+        return len(obj.questions.all())
 
     def get_best_attempt(self, obj):
         request = self.context.get('request')
@@ -521,3 +523,10 @@ class QuizAttemptSerializer(serializers.ModelSerializer):
             'answers', 'duration_seconds', 'created_at', 'completed_at',
         ]
         read_only_fields = ['created_at', 'passed', 'score', 'total_questions']
+
+
+class BulkQuizAttemptItemSerializer(serializers.Serializer):
+    """Toplu deneme gonderiminde tek bir denemenin dogrulanmasi (quiz view'da cozulur)."""
+    answers = serializers.ListField(child=serializers.DictField(), required=False, default=list)
+    duration_seconds = serializers.IntegerField(required=False, allow_null=True, min_value=0)
+    completed_at = serializers.DateTimeField(required=False, allow_null=True)
@@ -0,0 +1,39 @@
+"""
+Content app signals.
+
+Quiz veya sorulari degistiginde content_version artirilir; derlenmis cevap
+anahtari ve quiz detay cache'i bu versiyonla anahtarlandigi icin kendiliginden
+gecersiz olur.
+"""
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+
+@receiver(pre_save, sender='content.EducationQuiz')
+def bump_quiz_version(sender, instance, **kwargs):
+    """
+    Mevcut quiz kaydedilirken (esik puan, baslik vb.) versiyonu artir.
+    Bellekteki deger eski olabilir (arada soru degismis olabilir); artis
+    veritabaninda F() ile yapilir, post_save'de guncel deger geri okunur.
+    """
+    if not instance._state.adding:
+        instance.content_version = F('content_version') + 1
+
+
+@receiver(post_save, sender='content.EducationQuiz')
+def refresh_quiz_version(sender, instance, created, **kwargs):
+    """F() ifadesini kayittan sonra gercek versiyon degeriyle degistir."""
+    if not created and not isinstance(instance.content_version, int):
+        instance.refresh_from_db(fields=['content_version'])
+
+
+@receiver(post_save, sender='content.QuizQuestion')
+@receiver(post_delete, sender='content.QuizQuestion')
+def bump_quiz_version_on_question_change(sender, instance, **kwargs):
+    """Soru eklenince/degisince/silinince quiz versiyonunu artir."""
+    from apps.content.models import EducationQuiz
+    EducationQuiz.objects.filter(pk=instance.quiz_id).update(
+        content_version=F('content_version') + 1
+    )
@@ -22,20 +22,19 @@ def auto_generate_weekly_content():
     SiteConfig'den topic listesini alir (key: 'auto_content_topics'),
     her topic icin 'full_content_v5' pipeline'ini tetikler.
     """
-    from apps.common.models import SiteConfig
+    from apps.common import site_snapshot
     from services.orchestrator import orchestrator
 
     try:
-        config = SiteConfig.objects.filter(key='auto_content_topics').first()
+        topics = site_snapshot.get_config('auto_content_topics')
     except Exception as e:
         logger.error(f"SiteConfig sorgulanamadi: {e}")
         return {'success': False, 'error': str(e)}
 
-    if not config:
+    if topics is None:
         logger.info("auto_content_topics SiteConfig bulunamadi, atlanıyor")
         return {'success': False, 'error': 'auto_content_topics not configured'}
 
-    topics = config.get_typed_value()
     if not isinstance(topics, list) or not topics:
         logger.warning("auto_content_topics bos veya liste degil")
         return {'success': False, 'error': 'topics is empty or not a list'}
@@ -269,104 +268,59 @@ def send_weekly_content_report():
 
 
 @shared_task(name='apps.content.tasks.send_daily_education_drip')
-def send_daily_education_drip():
+def send_daily_education_drip(shard_count=None):
     """
     Gunluk mikro-egitim bildirimi.
 
-    Migren modulune kayitli her hasta icin, henuz tamamlanmamis
-    siradaki egitim kartini bildirim olarak gonderir.
+    Yayinlanmis egitim karti olan her hastalik modulunde, kayitli her hasta
+    icin henuz tamamlanmamis siradaki karti bildirim olarak gonderir.
     Her gun 1 kart, 20-25 gunde set tamamlanir.
-    """
-    from apps.content.models import EducationItem, EducationProgress
-    from apps.patients.models import PatientModule
-    from apps.notifications.models import Notification, NotificationPreference
-    from apps.accounts.models import CustomUser
 
-    # Migren modulune kayitli aktif hastalar
-    migraine_enrollments = PatientModule.objects.filter(
-        disease_module__slug='migraine',
-        is_active=True,
-    ).select_related('patient')
+    shard_count > 1 ise her modul/shard cifti ayri gorev olarak kuyruga alinir.
+    """
+    from django.conf import settings
+    from django.db.models import Exists, OuterRef
+    from apps.content.drip import run_module_drip
+    from apps.content.models import EducationItem
+    from apps.patients.models import DiseaseModule
+
+    if shard_count is None:
+        shard_count = getattr(settings, 'EDUCATION_DRIP_SHARDS', 1)
+
+    modules = DiseaseModule.objects.filter(Exists(
+        EducationItem.objects.filter(disease_module=OuterRef('pk'), is_published=True)
+    ))
+
+    if shard_count > 1:
+        queued = 0
+        for module in modules:
+            for shard in range(shard_count):
+                send_education_drip_shard.delay(str(module.id), shard, shard_count)
+                queued += 1
+        logger.info(f"Daily education drip: queued {queued} shard tasks")
+        return {'queued': queued}
 
     sent = 0
     skipped = 0
-
-    for enrollment in migraine_enrollments:
-        patient = enrollment.patient
-
-        # Egitim bildirimi tercihini kontrol et
-        try:
-            prefs = NotificationPreference.objects.get(user=patient)
-            if not prefs.email_education:
-                skipped += 1
-                continue
-        except NotificationPreference.DoesNotExist:
-            pass  # Tercih yoksa gonder
-
-        # Tamamlanmis kartlarin ID'lerini al
-        completed_ids = set(
-            EducationProgress.objects.filter(
-                patient=patient,
-                completed_at__isnull=False,
-            ).values_list('education_item_id', flat=True)
-        )
-
-        # Siradaki tamamlanmamis karti bul (order'a gore)
-        next_item = (
-            EducationItem.objects.filter(
-                disease_module__slug='migraine',
-                is_published=True,
-            )
-            .exclude(id__in=completed_ids)
-            .order_by('order')
-            .first()
-        )
-
-        if not next_item:
-            skipped += 1
-            continue
-
-        # Bugun zaten bildirim gonderdik mi kontrol et
-        today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        already_sent = Notification.objects.filter(
-            recipient=patient,
-            notification_type='info',
-            metadata__drip_education_item=str(next_item.id),
-            created_at__gte=today_start,
-        ).exists()
-
-        if already_sent:
-            skipped += 1
-            continue
-
-        # Bildirim olustur
-        card_number = next_item.order
-        total_cards = EducationItem.objects.filter(
-            disease_module__slug='migraine', is_published=True,
-        ).count()
-
-        Notification.objects.create(
-            recipient=patient,
-            notification_type='info',
-            title_tr=f"Gunun Migren Bilgisi: {next_item.title_tr}",
-            title_en=f"Today's Migraine Tip: {next_item.title_en}",
-            message_tr=(
-                f"Migren egitim setinizde yeni bir kart sizi bekliyor! "
-                f"({completed_ids.__len__() + 1}/{total_cards})"
-            ),
-            message_en=(
-                f"A new card is waiting in your migraine education set! "
-                f"({len(completed_ids) + 1}/{total_cards})"
-            ),
-            action_url='/patient/migraine/education',
-            metadata={
-                'drip_education_item': str(next_item.id),
-                'education_slug': next_item.slug,
-                'card_number': card_number,
-                'total_cards': total_cards,
-            },
-        )
-        sent += 1
+    for module in modules:
+        result = run_module_drip(module)
+        sent += result['sent']
+        skipped += result['skipped']
 
     logger.info(f"Daily education drip: sent={sent}, skipped={skipped}")
     return {'sent': sent, 'skipped': skipped}
+
+
+@shared_task(name='apps.content.tasks.send_education_drip_shard')
+def send_education_drip_shard(module_id, shard, shard_count):
+    """Tek modul/shard icin drip bildirimleri (paralel isciler icin)."""
+    from apps.content.drip import run_module_drip
+    from apps.patients.models import DiseaseModule
+
+    module = DiseaseModule.objects.get(id=module_id)
+    result = run_module_drip(module, shard=shard, shard_count=shard_count)
+    logger.info(
+        f"Education drip {module.slug} shard {shard}/{shard_count}: "
+        f"sent={result['sent']}, skipped={result['skipped']}"
+    )
+    return result
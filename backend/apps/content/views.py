@@ -1,4 +1,8 @@
-from django.db import models
+import uuid
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import prefetch_related_objects
 from drf_spectacular.utils import extend_schema_view, extend_schema
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
@@ -9,6 +13,8 @@ from django_filters.rest_framework import DjangoFilterBackend
 
 from apps.accounts.permissions import IsPatient
 from apps.accounts.models import DoctorAuthor
+from apps.common.pagination import FieldProjectionMixin, KeysetPagination, OptionalKeysetPagination
+from apps.gamification.engine import emit_event
 from .models import (
     ContentCategory, Article, NewsArticle, EducationItem, EducationProgress,
     EducationQuiz, QuizAttempt,
@@ -25,7 +31,12 @@ from .serializers import (
     NewsArticleListSerializer,
     NewsArticleDetailSerializer,
     PublicDoctorAuthorSerializer,
+    BulkQuizAttemptItemSerializer,
 )
+from .quiz_grading import get_answer_key, grade_answers
+
+QUIZ_DETAIL_CACHE_TIMEOUT = 60 * 60
+MAX_BULK_QUIZ_ATTEMPTS = 50
 
 
 class ContentCategoryViewSet(viewsets.ReadOnlyModelViewSet):
@@ -36,9 +47,11 @@ class ContentCategoryViewSet(viewsets.ReadOnlyModelViewSet):
     lookup_field = 'slug'
 
 
-class ArticleViewSet(viewsets.ReadOnlyModelViewSet):
+class ArticleViewSet(FieldProjectionMixin, viewsets.ReadOnlyModelViewSet):
     permission_classes = [permissions.AllowAny]
-    pagination_class = None
+    # Varsayilan tum liste; ?cursor= / ?page_size= ile keyset sayfalama
+    pagination_class = OptionalKeysetPagination
+    cursor_ordering = ('-published_at', '-id')
     lookup_field = 'slug'
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['category', 'is_featured']
@@ -101,24 +114,21 @@ class EducationProgressViewSet(viewsets.ModelViewSet):
         progress.completed_at = timezone.now()
         progress.save()
 
-        # Gamification: puan + streak
-        try:
-            from apps.gamification.models import UserPoints, UserStreak
-            points_obj, _ = UserPoints.objects.get_or_create(user=request.user)
-            points_obj.add_points(5, f'Egitim tamamlandi: {progress.education_item.title_tr[:50]}')
-            streak, _ = UserStreak.objects.get_or_create(
-                user=request.user, streak_type='education',
-            )
-            streak.update_streak(timezone.now().date())
-        except Exception:
-            pass  # Gamification hatasi egitimi engellemez
+        # Gamification: olay kuyruga yazilir, puan + streak Celery'de islenir
+        emit_event(
+            request.user, 'education_completed',
+            reason=f'Egitim tamamlandi: {progress.education_item.title_tr[:50]}',
+            education_item_id=str(progress.education_item_id),
+        )
 
         return Response(EducationProgressSerializer(progress).data)
 
 
-class NewsArticleViewSet(viewsets.ReadOnlyModelViewSet):
+class NewsArticleViewSet(FieldProjectionMixin, viewsets.ReadOnlyModelViewSet):
     """Public haber listesi ve detayi."""
     permission_classes = [permissions.AllowAny]
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-published_at', '-id')
     lookup_field = 'slug'
 
     def get_queryset(self):
@@ -232,7 +242,9 @@ class EducationQuizViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         qs = EducationQuiz.objects.filter(
             is_published=True
-        ).prefetch_related('questions').select_related('disease_module', 'category')
+        ).select_related('disease_module', 'category')
+        if self.action != 'retrieve':
+            qs = qs.prefetch_related('questions')
 
         disease_module = self.request.query_params.get('disease_module')
         if disease_module:
@@ -244,6 +256,25 @@ class EducationQuizViewSet(viewsets.ReadOnlyModelViewSet):
             return EducationQuizSerializer
         return EducationQuizListSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        quiz = self.get_object()
+        serializer = self.get_serializer(quiz)
+
+        # Sorular dahil quiz govdesi (content_version, dil, staff) ile cache'lenir;
+        # sadece kullaniciya ozel best_attempt her istekte hesaplanir.
+        lang = request.headers.get('Accept-Language', 'tr')[:2]
+        cache_key = (
+            f'quiz_detail:{quiz.id}:v{quiz.content_version}:{lang}:{int(request.user.is_staff)}'
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            prefetch_related_objects([quiz], 'questions')
+            data = dict(serializer.data)
+            data.pop('best_attempt', None)
+            cache.set(cache_key, data, QUIZ_DETAIL_CACHE_TIMEOUT)
+
+        return Response({**data, 'best_attempt': serializer.get_best_attempt(quiz)})
+
 
 class QuizAttemptViewSet(viewsets.ModelViewSet):
     """Hasta quiz denemeleri."""
@@ -260,56 +291,101 @@ class QuizAttemptViewSet(viewsets.ModelViewSet):
         quiz = serializer.validated_data['quiz']
         answers = serializer.validated_data.get('answers', [])
 
-        # Skor hesapla: soru seceneklerinden dogru cevabi bul
-        questions_map = {str(q.id): q for q in quiz.questions.all()}
-        correct_count = 0
-        evaluated_answers = []
-
-        for answer in answers:
-            q_id = str(answer.get('question_id', ''))
-            selected_idx = answer.get('selected_option_index', -1)
-            question = questions_map.get(q_id)
-            is_correct = False
-
-            if question and question.options and 0 <= selected_idx < len(question.options):
-                is_correct = question.options[selected_idx].get('is_correct', False)
-
-            if is_correct:
-                correct_count += 1
-
-            evaluated_answers.append({
-                'question_id': q_id,
-                'selected_option_index': selected_idx,
-                'is_correct': is_correct,
-            })
-
-        total = quiz.questions.count()
-        pass_threshold = quiz.passing_score_percent
-        passed = (correct_count / total * 100) >= pass_threshold if total > 0 else False
+        # Skor: derlenmis cevap anahtari ile bellekte tek gecis
+        result = grade_answers(get_answer_key(quiz), answers)
 
         attempt = serializer.save(
             patient=self.request.user,
-            score=correct_count,
-            total_questions=total,
-            passed=passed,
-            answers=evaluated_answers,
+            score=result.score,
+            total_questions=result.total_questions,
+            passed=result.passed,
+            answers=result.answers,
             completed_at=timezone.now(),
         )
+        self._emit_quiz_passed(quiz, attempt, result)
+
+    def _emit_quiz_passed(self, quiz, attempt, result):
+        # Gamification: olay kuyruga yazilir, puan + streak Celery'de islenir
+        if result.passed:
+            reward = quiz.points_reward
+            # Tam puan bonusu
+            if result.is_perfect:
+                reward += 5
+            emit_event(
+                self.request.user, 'quiz_passed',
+                points=reward,
+                reason=f'Quiz gecildi: {quiz.title_tr[:50]}',
+                quiz_id=str(quiz.id),
+                attempt_id=str(attempt.id),
+            )
 
-        # Gamification: puan + streak
-        if passed:
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        Cevrimdisi istemcilerin biriktirdigi denemeleri toplu gonder.
+
+        Body: {"attempts": [{quiz, answers, duration_seconds, completed_at}, ...]}
+        """
+        items = request.data.get('attempts') if isinstance(request.data, dict) else request.data
+        if not isinstance(items, list) or not items:
+            return Response(
+                {'detail': 'attempts listesi gerekli.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > MAX_BULK_QUIZ_ATTEMPTS:
+            return Response(
+                {'detail': f'En fazla {MAX_BULK_QUIZ_ATTEMPTS} deneme gonderilebilir.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Quizler tek sorguda yuklenir (serializer her satir icin ayri sorgu atmasin)
+        quiz_ids = set()
+        for item in items:
             try:
-                from apps.gamification.models import UserPoints, UserStreak
-                points_obj, _ = UserPoints.objects.get_or_create(user=self.request.user)
-                reward = quiz.points_reward
-                # Tam puan bonusu
-                if correct_count == total:
-                    reward += 5
-                points_obj.add_points(reward, f'Quiz gecildi: {quiz.title_tr[:50]}')
-
-                streak, _ = UserStreak.objects.get_or_create(
-                    user=self.request.user, streak_type='education',
-                )
-                streak.update_streak(timezone.now().date())
-            except Exception:
+                quiz_ids.add(uuid.UUID(str(item.get('quiz'))))
+            except (AttributeError, ValueError):
                 pass
+        quizzes = {
+            str(q.id): q for q in EducationQuiz.objects.filter(id__in=quiz_ids)
+        }
+
+        errors = []
+        attempts = []
+        results = []
+        now = timezone.now()
+        for index, item in enumerate(items):
+            quiz = quizzes.get(str(item.get('quiz', ''))) if isinstance(item, dict) else None
+            if quiz is None:
+                errors.append({'index': index, 'quiz': ['Quiz bulunamadi.']})
+                continue
+            serializer = BulkQuizAttemptItemSerializer(data=item)
+            if not serializer.is_valid():
+                errors.append({'index': index, **serializer.errors})
+                continue
+
+            data = serializer.validated_data
+            result = grade_answers(get_answer_key(quiz), data.get('answers', []))
+            attempts.append(QuizAttempt(
+                patient=request.user,
+                quiz=quiz,
+                score=result.score,
+                total_questions=result.total_questions,
+                passed=result.passed,
+                answers=result.answers,
+                duration_seconds=data.get('duration_seconds'),
+                completed_at=data.get('completed_at') or now,
+            ))
+            results.append(result)
+
+        if errors:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            QuizAttempt.objects.bulk_create(attempts)
+            for attempt, result in zip(attempts, results):
+                self._emit_quiz_passed(attempt.quiz, attempt, result)
+
+        return Response(
+            QuizAttemptSerializer(attempts, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
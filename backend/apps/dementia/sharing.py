@@ -108,20 +108,14 @@ def share_report_via_email(patient, recipient, start_date, end_date, ip_address=
     Returns:
         dict with success status and message
     """
-    from apps.dementia.reports import DementiaReportGenerator
+    from apps.common.report_service import report_bytes
 
     if not recipient.email:
         return {'success': False, 'error': 'Alicinin email adresi tanimli degil.'}
 
     try:
-        # Generate PDF report
-        generator = DementiaReportGenerator(
-            user=patient,
-            start_date=start_date,
-            end_date=end_date,
-        )
-        buffer = generator.generate()
-        pdf_content = buffer.getvalue()
+        # PDF raporu (ayni donem ve veri icin onbellekteki artefakt)
+        pdf_content = report_bytes(patient, 'dementia', start_date, end_date)
 
         # Build email
         patient_name = patient.get_full_name() or patient.email
@@ -185,7 +179,7 @@ def share_report_via_telegram(patient, recipient, start_date, end_date, ip_addre
     Returns:
         dict with success status and message
     """
-    from apps.dementia.reports import DementiaReportGenerator
+    from apps.common.report_service import report_bytes
 
     bot_token = getattr(settings, 'TELEGRAM_BOT_TOKEN', '')
     if not bot_token:
@@ -195,14 +189,8 @@ def share_report_via_telegram(patient, recipient, start_date, end_date, ip_addre
         return {'success': False, 'error': 'Alicinin Telegram chat ID\'si tanimli degil.'}
 
     try:
-        # Generate PDF report
-        generator = DementiaReportGenerator(
-            user=patient,
-            start_date=start_date,
-            end_date=end_date,
-        )
-        buffer = generator.generate()
-        pdf_content = buffer.getvalue()
+        # PDF raporu (ayni donem ve veri icin onbellekteki artefakt)
+        pdf_content = report_bytes(patient, 'dementia', start_date, end_date)
 
         patient_name = patient.get_full_name() or patient.email
         filename = f"bilissel_rapor_{patient.last_name}_{start_date}_{end_date}.pdf"
@@ -2,7 +2,6 @@ from datetime import date, datetime, timedelta
 from decimal import Decimal
 from django.db import models
 from django.db.models import Avg, Count, Sum, Q
-from django.http import HttpResponse
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema_view, extend_schema
 from rest_framework import viewsets, permissions, status
@@ -11,6 +10,7 @@ from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
 from apps.accounts.permissions import IsPatient, IsCaregiver, IsRelative, IsPatientOrCaregiver
+from apps.common import report_service
 from .models import (
     CognitiveExercise,
     ExerciseSession,
@@ -197,9 +197,7 @@ class ExerciseSessionViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def report(self, request):
-        """Generate PDF report for the patient's cognitive data."""
-        from .reports import DementiaReportGenerator
-
+        """PDF report for the patient's cognitive data (cached per date range and data version)."""
         start_str = request.query_params.get('start_date')
         end_str = request.query_params.get('end_date')
 
@@ -212,17 +210,7 @@ class ExerciseSessionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        generator = DementiaReportGenerator(
-            user=request.user,
-            start_date=start_date,
-            end_date=end_date,
-        )
-        buffer = generator.generate()
-
-        response = HttpResponse(buffer.getvalue(), content_type='application/pdf')
-        filename = f"bilissel_rapor_{request.user.last_name}_{date.today().strftime('%Y%m%d')}.pdf"
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        return response
+        return report_service.report_response(request, 'dementia', request.user, start_date, end_date)
 
 
 class DailyAssessmentViewSet(viewsets.ModelViewSet):
@@ -0,0 +1,209 @@
+"""
+Editor toplu durum gecisleri (kume bazli).
+
+Satir satir save() + bildirim yerine:
+
+1. Secilen satirlar tek sorguda kilitlenerek okunur; tek kayitlik gecis
+   view'lariyla ayni durum makinesi tum kume icin dogrulanir. Bulunamayan
+   ve gecersiz durumdaki kayitlar 'failed' olarak raporlanir.
+2. Gecerli kayitlar tek UPDATE ile hedef duruma alinir (yayin tarihi
+   bos olanlara Coalesce ile atanir).
+3. Bildirimler editorler bir kez cozulerek tek bulk_create ile yazilir;
+   emailler commit sonrasi tek Celery gorevine verilir.
+4. Yayin sayisi degisen yazarlarin istatistikleri tek gruplu sorgu +
+   bulk_update ile yeniden hesaplanir (sayim tanimi
+   pipeline_jobs.update_author_stats ile aynidir).
+
+Gecis tablolari (ARTICLE_TRANSITIONS, NEWS_TRANSITIONS) tek kayitlik editor
+view'lari tarafindan da kullanilir; iki yol ayni durum makinesini paylasir.
+
+Kullanım:
+    results = bulk_transition(ARTICLE, ids, 'publish', request.user, feedback)
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.db.models import DateTimeField, F, Func, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+STATUS_MAP = {
+    'approve': 'approved',
+    'reject': 'revision',
+    'publish': 'published',
+    'archive': 'archived',
+    'revert_to_draft': 'draft',
+}
+
+
+# Editor gecisleri: durum -> izinli action'lar
+ARTICLE_TRANSITIONS = {
+    'draft': ['publish', 'archive'],
+    'published': ['archive'],
+    'archived': ['revert_to_draft'],
+}
+
+NEWS_TRANSITIONS = {
+    'review': ['approve', 'reject'],
+    'approved': ['publish'],
+    'published': ['archive'],
+    'archived': ['revert_to_draft'],
+    # Editor draft'tan da direkt yayinlayabilir
+    'draft': ['approve', 'publish', 'archive'],
+    'revision': ['approve', 'reject'],
+}
+
+
+@dataclass(frozen=True)
+class BulkTarget:
+    """Toplu gecis yapilabilen icerik tipi."""
+    content_type: str      # notify_transitions_bulk icin: 'article' | 'news'
+    model: str
+    author_path: str       # select_related yolu
+    transitions: dict      # durum -> izinli action'lar
+    label: str
+
+
+ARTICLE = BulkTarget(
+    content_type='article',
+    model='content.Article',
+    author_path='author',
+    transitions=ARTICLE_TRANSITIONS,
+    label='makale',
+)
+
+NEWS = BulkTarget(
+    content_type='news',
+    model='content.NewsArticle',
+    author_path='author__doctor__user',
+    transitions=NEWS_TRANSITIONS,
+    label='haber',
+)
+
+
+def split_ids(ids):
+    """Id listesini tekillestir: (gecerli UUID'ler, gecersiz girdiler), sira korunur."""
+    valid, invalid = [], []
+    for pk in ids:
+        try:
+            pk = str(uuid.UUID(str(pk)))
+        except ValueError:
+            bucket, pk = invalid, str(pk)
+        else:
+            bucket = valid
+        if pk not in bucket:
+            bucket.append(pk)
+    return valid, invalid
+
+
+def bulk_transition(target, ids, action, changed_by, feedback='') -> dict:
+    """
+    Secilen iceriklere action'i uygula.
+
+    Donus: {'success': [{id, title, new_status}], 'failed': [{id, error}]}
+    """
+    from django.apps import apps
+    from apps.notifications.content_notifications import notify_transitions_bulk
+
+    model = apps.get_model(target.model)
+    new_status = STATUS_MAP[action]
+    allowed_from = [state for state, actions in target.transitions.items() if action in actions]
+    ids, invalid_ids = split_ids(ids)
+    results = {'success': [], 'failed': [{'id': pk, 'error': 'Gecersiz id.'} for pk in invalid_ids]}
+
+    with transaction.atomic():
+        rows = {
+            str(obj.pk): obj
+            for obj in model.objects.select_for_update(of=('self',))
+            .select_related(target.author_path)
+            .filter(pk__in=ids)
+        }
+
+        valid = []
+        for pk in ids:
+            obj = rows.get(pk)
+            if obj is None:
+                results['failed'].append({'id': pk, 'error': f'{target.label.capitalize()} bulunamadi.'})
+            elif obj.status not in allowed_from:
+                results['failed'].append({
+                    'id': pk,
+                    'error': f"'{obj.status}' durumundaki {target.label} icin '{action}' gecersiz.",
+                })
+            else:
+                valid.append(obj)
+
+        if not valid:
+            return results
+
+        now = timezone.now()
+        values = {'status': new_status, 'updated_at': now}
+        if new_status == 'published':
+            values['published_at'] = Coalesce(F('published_at'), Value(now, output_field=DateTimeField()))
+        if target is NEWS and action in ('approve', 'reject'):
+            values['reviewed_by'] = changed_by
+        model.objects.filter(pk__in=[obj.pk for obj in valid], status__in=allowed_from).update(**values)
+
+        items = [(obj, obj.status) for obj in valid]
+        for obj in valid:
+            obj.status = new_status
+            results['success'].append({'id': str(obj.pk), 'title': obj.title_tr, 'new_status': new_status})
+
+        notify_transitions_bulk(target.content_type, items, new_status, changed_by=changed_by, feedback=feedback)
+
+        # Yayin sayisi yalnizca yayina alinan veya yayindan cikan iceriklerde degisir
+        if new_status == 'published' or any(old == 'published' for _, old in items):
+            update_author_stats(target, valid)
+
+    return results
+
+
+def _count_subquery(queryset):
+    """Iliskili satir sayisini tek deger donduren alt sorgu."""
+    return Coalesce(
+        Subquery(
+            queryset.order_by().annotate(n=Func(F('pk'), function='COUNT')).values('n')[:1],
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def update_author_stats(target, objects) -> int:
+    """
+    Etkilenen yazarlarin total_articles / author_level degerlerini toplu guncelle.
+    Sayim pipeline_jobs.update_author_stats ile aynidir: yazarin kullanicisina
+    ait (author) yayinlanmis makaleler + yazarin yayinlanmis haberleri.
+    """
+    from apps.accounts.models import DoctorAuthor
+    from apps.content.models import Article, NewsArticle
+
+    if target is ARTICLE:
+        authors = DoctorAuthor.objects.filter(
+            doctor__user_id__in={obj.author_id for obj in objects if obj.author_id}
+        )
+    else:
+        authors = DoctorAuthor.objects.filter(id__in={obj.author_id for obj in objects if obj.author_id})
+
+    authors = authors.annotate(
+        article_count=_count_subquery(Article.objects.filter(
+            author_id=OuterRef('doctor__user_id'), status='published',
+        )),
+        news_count=_count_subquery(NewsArticle.objects.filter(author_id=OuterRef('pk'), status='published')),
+    ).only('id', 'total_articles', 'author_level')
+
+    changed = []
+    for author in authors:
+        total = author.article_count + author.news_count
+        level = DoctorAuthor.level_for(total)
+        if (author.total_articles, author.author_level) != (total, level):
+            author.total_articles = total
+            author.author_level = level
+            changed.append(author)
+    if changed:
+        DoctorAuthor.objects.bulk_update(changed, ['total_articles', 'author_level'])
+    return len(changed)
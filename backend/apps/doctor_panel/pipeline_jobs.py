@@ -0,0 +1,299 @@
+"""
+Yazar paneli icin asenkron pipeline isleri.
+
+Cok ajanli LLM zincirleri istek icinde (gunicorn worker'ini dakikalarca
+bloklayarak) calismaz:
+
+1. submit_job  — Is kaydi olusturur ve Celery'ye gonderir; view 202 + job id doner.
+2. run_job     — Celery worker'inda zinciri calistirir, sonucu is tipine gore
+   uygular (review: ArticleReview + yayin karari, run: cikti saklanir) ve
+   yazara bildirim gonderir.
+3. job_status_data — Istemcinin sorguladigi ilerleme: adim bazinda durum,
+   baslangic/bitis zamani ve token kullanimi.
+
+Is kaydi, orkestratorun pipeline seviyesindeki AgentTask'idir (agent_name=
+'orchestrator', input_data['job_kind'] dolu); adimlar onun subtask'laridir,
+ayri bir tablo gerekmez. FeatureFlag bypass'i BaseAgent'i sinif seviyesinde
+degistirmek yerine flag_overrides ile yalnizca bu calistirmaya uygulanir.
+Yazar basina es zamanli aktif is sayisi MAX_ACTIVE_JOBS_PER_AUTHOR ile sinirlidir.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+JOB_AGENT_NAME = 'orchestrator'
+MAX_ACTIVE_JOBS_PER_AUTHOR = 2
+ACTIVE_STATUSES = ('pending', 'running')
+# Worker coktugu icin takili kalan isler bu sureden sonra limite sayilmaz
+STALE_JOB_AFTER = timedelta(hours=1)
+QUALITY_PASS_SCORE = 60
+RECENT_JOBS_LIMIT = 20
+
+JOB_REVIEW = 'review'
+JOB_RUN = 'run'
+JOB_TASK_TYPES = {
+    JOB_REVIEW: 'review_article',
+    JOB_RUN: 'full_pipeline',
+}
+REVIEW_PIPELINE = 'doctor_article_review'
+
+
+class JobLimitExceeded(Exception):
+    """Yazarin aktif is limiti dolu."""
+
+
+class JobAlreadyRunning(Exception):
+    """Makale icin aktif bir is zaten var (job: o is)."""
+
+    def __init__(self, job):
+        super().__init__('Bu makale icin calisan bir pipeline isi var.')
+        self.job = job
+
+
+def job_queryset(user):
+    """Kullanicinin pipeline isleri (orkestrator alt gorevleri haric)."""
+    from apps.common.models import AgentTask
+
+    return AgentTask.objects.filter(
+        agent_name=JOB_AGENT_NAME,
+        created_by=user,
+        parent_task__isnull=True,
+        input_data__has_key='job_kind',
+    )
+
+
+def active_jobs(user):
+    return job_queryset(user).filter(
+        status__in=ACTIVE_STATUSES,
+        created_at__gte=timezone.now() - STALE_JOB_AFTER,
+    )
+
+
+def article_input(article) -> dict:
+    return {
+        'title_tr': article.title_tr,
+        'body_tr': article.body_tr,
+        'excerpt_tr': article.excerpt_tr,
+        'seo_title_tr': article.seo_title_tr,
+        'seo_description_tr': article.seo_description_tr,
+        'article_id': str(article.id),
+    }
+
+
+def submit_job(user, kind, pipeline_name, article):
+    """
+    Is kaydini olustur ve commit sonrasi Celery'ye gonder.
+
+    Ayni yazarin es zamanli istekleri kullanici satiri kilidiyle siraya
+    girer; makale icin aktif is varsa JobAlreadyRunning, limit dolu ise
+    JobLimitExceeded (ikisi de kilit altinda kontrol edilir).
+    """
+    from apps.accounts.models import CustomUser
+    from apps.common.models import AgentTask
+    from services.orchestrator import PIPELINES
+
+    from .tasks import run_pipeline_job
+
+    with transaction.atomic():
+        CustomUser.objects.select_for_update().filter(pk=user.pk).first()
+        running = active_jobs(user).filter(article_id=article.id).first()
+        if running is not None:
+            raise JobAlreadyRunning(running)
+        if active_jobs(user).count() >= MAX_ACTIVE_JOBS_PER_AUTHOR:
+            raise JobLimitExceeded(
+                f'Ayni anda en fazla {MAX_ACTIVE_JOBS_PER_AUTHOR} pipeline isi calisabilir.'
+            )
+        job = AgentTask.objects.create(
+            agent_name=JOB_AGENT_NAME,
+            task_type=JOB_TASK_TYPES[kind],
+            status='pending',
+            created_by=user,
+            article_id=article.id,
+            input_data={
+                'pipeline': pipeline_name,
+                'job_kind': kind,
+                'steps': PIPELINES.get(pipeline_name, {}).get('steps', []),
+            },
+        )
+        transaction.on_commit(lambda: run_pipeline_job.delay(str(job.id)))
+    return job
+
+
+def run_job(job_id):
+    """Isi tek worker'a ver, zinciri calistir, sonucu uygula. Isi dondurur."""
+    from apps.common.models import AgentTask
+    from apps.content.models import Article
+    from apps.notifications.content_notifications import notify_pipeline_result
+    from services.base_agent import ALL_FLAGS
+    from services.orchestrator import orchestrator
+    import services.agents  # noqa: F401
+
+    # pending -> running kosullu UPDATE: ayni is iki kez calismaz
+    if not AgentTask.objects.filter(id=job_id, status='pending').update(status='running'):
+        return None
+
+    job = AgentTask.objects.select_related('created_by').get(id=job_id)
+    user = job.created_by
+    pipeline_name = job.input_data['pipeline']
+    article = Article.objects.filter(id=job.article_id).first()
+    if article is None:
+        job.mark_failed('Makale bulunamadi.')
+        return job
+
+    try:
+        result = orchestrator.run_chain(
+            pipeline_name,
+            input_data=article_input(article),
+            triggered_by=user,
+            parent_task=job,
+            flag_overrides={ALL_FLAGS: True},
+        )
+        if job.input_data['job_kind'] == JOB_REVIEW:
+            outcome = apply_review_result(article, result, user)
+        else:
+            outcome = {
+                'success': result.success,
+                'steps_completed': result.steps_completed,
+                'steps_failed': result.steps_failed,
+                'duration_ms': result.total_duration_ms,
+                'data': {
+                    k: v for k, v in result.final_data.items()
+                    if not k.startswith('__')
+                },
+            }
+    except Exception as e:
+        logger.exception(f"Pipeline isi basarisiz: job={job_id}")
+        job.mark_failed(str(e))
+        notify_pipeline_result(article, pipeline_name, False, user=user)
+        return job
+
+    job.output_data = {**job.output_data, 'result': outcome}
+    job.tokens_used = sum(step.tokens_used for step in result.step_results)
+    job.save(update_fields=['output_data', 'tokens_used', 'updated_at'])
+    notify_pipeline_result(
+        article, pipeline_name, result.success, score=outcome.get('overall_score'), user=user,
+    )
+    return job
+
+
+def apply_review_result(article, result, user) -> dict:
+    """Review zinciri ciktisini kaydet; kalite esigini gecen taslagi yayinla."""
+    from apps.content.models import ArticleReview
+    from apps.notifications.content_notifications import notify_article_transition
+
+    data = result.final_data
+    overall_score = data.get('overall_score', 0)
+    if isinstance(overall_score, str):
+        try:
+            overall_score = int(overall_score)
+        except (ValueError, TypeError):
+            overall_score = 0
+    passed = overall_score >= QUALITY_PASS_SCORE
+
+    ArticleReview.objects.create(
+        article=article,
+        review_type='agent',
+        medical_accuracy_score=data.get('medical_accuracy_score', 0),
+        language_quality_score=data.get('language_quality_score', 0),
+        seo_score=data.get('seo_score', 0),
+        style_compliance_score=data.get('style_compliance_score', 0),
+        ethics_score=data.get('ethics_score', 0),
+        overall_score=overall_score,
+        decision='publish' if passed else 'revise',
+        feedback=data.get('feedback', ''),
+        detailed_analysis=data,
+    )
+
+    # SEO alanlarini guncelle (pipeline'dan gelen, bos olanlar)
+    update_fields = []
+    for field in ['seo_title_tr', 'seo_title_en', 'seo_description_tr', 'seo_description_en']:
+        val = data.get(field)
+        if val and not getattr(article, field):
+            setattr(article, field, val)
+            update_fields.append(field)
+
+    # Inceleme surerken yazar makaleyi baska duruma almissa dokunma
+    published = passed and article.status == 'draft'
+    if published:
+        article.status = 'published'
+        if not article.published_at:
+            article.published_at = timezone.now()
+        update_fields += ['status', 'published_at']
+    if update_fields:
+        article.save(update_fields=update_fields + ['updated_at'])
+
+    if published:
+        update_author_stats(user)
+        notify_article_transition(article, 'draft', 'published', changed_by=user)
+
+    return {
+        'success': result.success,
+        'overall_score': overall_score,
+        'quality_passed': passed,
+        'published': published,
+        'status': article.status,
+        'steps_completed': result.steps_completed,
+        'feedback': data.get('feedback', ''),
+    }
+
+
+def update_author_stats(user):
+    """Yazarin yayinlanmis makale/haber sayisini guncelle."""
+    from apps.content.models import Article, NewsArticle
+
+    try:
+        author = user.doctor_profile.author_profile
+        author.total_articles = (
+            Article.objects.filter(author=user, status='published').count()
+            + NewsArticle.objects.filter(author=author, status='published').count()
+        )
+        author.save(update_fields=['total_articles'])
+        author.update_level()
+    except Exception as e:
+        logger.warning(f"Yazar istatistik guncelleme hatasi: {e}")
+
+
+def job_status_data(job) -> dict:
+    """Is durumu ve adim bazinda ilerleme (subtask'lardan)."""
+    finished = job.status not in ACTIVE_STATUSES
+    subtasks = {
+        task.agent_name: task
+        for task in job.subtasks.order_by('created_at').only(
+            'agent_name', 'status', 'tokens_used', 'duration_ms',
+            'created_at', 'completed_at', 'error_message', 'parent_task_id',
+        )
+    }
+
+    steps = []
+    for name in job.input_data.get('steps', []):
+        task = subtasks.get(name)
+        steps.append({
+            'name': name,
+            'status': task.status if task else ('skipped' if finished else 'pending'),
+            'started_at': task.created_at if task else None,
+            'finished_at': task.completed_at if task else None,
+            'duration_ms': task.duration_ms if task else 0,
+            'tokens_used': task.tokens_used if task else 0,
+            'error': task.error_message if task else '',
+        })
+
+    return {
+        'id': str(job.id),
+        'kind': job.input_data.get('job_kind'),
+        'pipeline': job.input_data.get('pipeline'),
+        'article_id': str(job.article_id) if job.article_id else None,
+        'status': job.status,
+        'steps': steps,
+        'steps_finished': sum(1 for step in steps if step['finished_at']),
+        'tokens_used': job.tokens_used or sum(step['tokens_used'] for step in steps),
+        'result': job.output_data.get('result'),
+        'error': job.error_message,
+        'created_at': job.created_at,
+        'completed_at': job.completed_at,
+        'status_url': f'/api/v1/doctor/author/pipeline-jobs/{job.id}/',
+    }
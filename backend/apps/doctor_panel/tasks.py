@@ -105,3 +105,15 @@ def run_marketing_pipeline(self, campaign_id: str):
         campaign.status = 'review'
 
     campaign.save()
+
+
+@shared_task(name='apps.doctor_panel.tasks.run_pipeline_job')
+def run_pipeline_job(job_id: str):
+    """Yazar paneli pipeline isini calistir (pipeline_jobs.run_job)."""
+    from apps.doctor_panel.pipeline_jobs import run_job
+
+    job = run_job(job_id)
+    if job is None:
+        logger.info(f"Pipeline isi zaten alinmis veya yok: {job_id}")
+        return None
+    return {'job_id': str(job.id), 'status': job.status}
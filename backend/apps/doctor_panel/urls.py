@@ -8,6 +8,8 @@ from .views_author import (
     AuthorArticleDetailView,
     AuthorArticleTransitionView,
     AuthorArticleRunPipelineView,
+    AuthorPipelineJobListView,
+    AuthorPipelineJobDetailView,
     AuthorNewsListCreateView,
     AuthorNewsDetailView,
     AuthorNewsTransitionView,
@@ -77,6 +79,10 @@ urlpatterns = [
     path('author/articles/<uuid:pk>/transition/', AuthorArticleTransitionView.as_view(), name='author-article-transition'),
     path('author/articles/<uuid:pk>/run-pipeline/', AuthorArticleRunPipelineView.as_view(), name='author-article-pipeline'),
 
+    # Pipeline isleri (asenkron, polling)
+    path('author/pipeline-jobs/', AuthorPipelineJobListView.as_view(), name='author-pipeline-jobs'),
+    path('author/pipeline-jobs/<uuid:pk>/', AuthorPipelineJobDetailView.as_view(), name='author-pipeline-job-detail'),
+
     # Haber (NewsArticle) CRUD + workflow
     path('author/news/', AuthorNewsListCreateView.as_view(), name='author-news'),
     path('author/news/<uuid:pk>/', AuthorNewsDetailView.as_view(), name='author-news-detail'),
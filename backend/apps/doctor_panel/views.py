@@ -196,6 +196,13 @@ class DoctorPatientViewSet(viewsets.ReadOnlyModelViewSet):
             status=status.HTTP_201_CREATED,
         )
 
+    @action(detail=True, methods=['get'])
+    def export(self, request, pk=None):
+        """Hastanin tum modul verisi (zip; buyuk arsivler arka planda)."""
+        from apps.common import data_export
+
+        return data_export.export_response(request, self.get_object())
+
 
 class AlertListView(generics.ListAPIView):
     """Tüm uyarı bayrakları."""
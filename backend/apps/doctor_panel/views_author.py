@@ -15,7 +15,11 @@ MAKALE (Article) YÖNETİMİ
   PATCH  /api/v1/doctor/author/articles/<id>/     → Makale duzenle
   DELETE /api/v1/doctor/author/articles/<id>/     → Makale sil (sadece draft)
   POST   /api/v1/doctor/author/articles/<id>/transition/  → Durum gecisi
-  POST   /api/v1/doctor/author/articles/<id>/run-pipeline/ → Pipeline calistir
+  POST   /api/v1/doctor/author/articles/<id>/run-pipeline/ → Pipeline isi baslat (202)
+
+PIPELINE İŞLERİ
+  GET    /api/v1/doctor/author/pipeline-jobs/        → Son pipeline islerim
+  GET    /api/v1/doctor/author/pipeline-jobs/<id>/   → Is durumu + adim ilerlemesi
 
 HABER (NewsArticle) YÖNETİMİ
   GET    /api/v1/doctor/author/news/              → Haberlerimi listele
@@ -54,6 +58,18 @@ from .serializers_author import (
     ArticleStatusTransitionSerializer,
     NewsStatusTransitionSerializer,
 )
+from .pipeline_jobs import (
+    JOB_REVIEW,
+    JOB_RUN,
+    RECENT_JOBS_LIMIT,
+    REVIEW_PIPELINE,
+    JobAlreadyRunning,
+    JobLimitExceeded,
+    job_queryset,
+    job_status_data,
+    submit_job,
+    update_author_stats,
+)
 from apps.notifications.content_notifications import (
     notify_article_transition,
     notify_news_transition,
@@ -232,16 +248,10 @@ class AuthorArticleTransitionView(views.APIView):
 
         new_status = allowed[action]
 
-        # submit_for_review icin pipeline calistir
+        # submit_for_review: review pipeline'i arka planda calisir, kalite
+        # esigini gecerse is makaleyi yayinlar (pipeline_jobs.apply_review_result)
         if action == 'submit_for_review':
-            pipeline_result = self._run_review_pipeline(article, request.user)
-            if pipeline_result and not pipeline_result.get('quality_passed', True):
-                # Kalite kontrolunden gecemedi — draft olarak kalir
-                return Response({
-                    'detail': 'Makale kalite kontrolunden gecemedigi icin taslak olarak kaldi.',
-                    'pipeline_result': pipeline_result,
-                    'status': article.status,
-                })
+            return _submit_job_response(request.user, JOB_REVIEW, REVIEW_PIPELINE, article)
 
         # Durum guncelle
         article.status = new_status
@@ -267,86 +277,9 @@ class AuthorArticleTransitionView(views.APIView):
             'article_id': str(article.id),
         })
 
-    def _run_review_pipeline(self, article, user):
-        """Makaleyi review pipeline'indan gecir."""
-        try:
-            from services.base_agent import BaseAgent
-            from services.orchestrator import orchestrator
-            import services.agents  # noqa: F401
-
-            original_is_enabled = BaseAgent.is_enabled
-            BaseAgent.is_enabled = lambda self: True
-
-            try:
-                result = orchestrator.run_chain(
-                    'doctor_article_review',
-                    input_data={
-                        'title_tr': article.title_tr,
-                        'body_tr': article.body_tr,
-                        'excerpt_tr': article.excerpt_tr,
-                        'article_id': str(article.id),
-                    },
-                    triggered_by=user,
-                )
-
-                # Review kaydini olustur
-                overall_score = result.final_data.get('overall_score', 0)
-                if isinstance(overall_score, str):
-                    try:
-                        overall_score = int(overall_score)
-                    except (ValueError, TypeError):
-                        overall_score = 0
-
-                ArticleReview.objects.create(
-                    article=article,
-                    review_type='agent',
-                    medical_accuracy_score=result.final_data.get('medical_accuracy_score', 0),
-                    language_quality_score=result.final_data.get('language_quality_score', 0),
-                    seo_score=result.final_data.get('seo_score', 0),
-                    style_compliance_score=result.final_data.get('style_compliance_score', 0),
-                    ethics_score=result.final_data.get('ethics_score', 0),
-                    overall_score=overall_score,
-                    decision='publish' if overall_score >= 60 else 'revise',
-                    feedback=result.final_data.get('feedback', ''),
-                    detailed_analysis=result.final_data,
-                )
-
-                # SEO alanlarini guncelle (pipeline'dan gelen)
-                seo_fields_updated = False
-                for field in ['seo_title_tr', 'seo_title_en', 'seo_description_tr', 'seo_description_en']:
-                    val = result.final_data.get(field)
-                    if val and not getattr(article, field):
-                        setattr(article, field, val)
-                        seo_fields_updated = True
-                if seo_fields_updated:
-                    article.save()
-
-                return {
-                    'success': result.success,
-                    'overall_score': overall_score,
-                    'quality_passed': overall_score >= 60,
-                    'steps_completed': result.steps_completed,
-                    'feedback': result.final_data.get('feedback', ''),
-                }
-            finally:
-                BaseAgent.is_enabled = original_is_enabled
-
-        except Exception as e:
-            logger.error(f"Review pipeline hatasi: {e}")
-            return None
-
     def _update_author_stats(self, user):
         """Yazarin makale sayisini guncelle."""
-        try:
-            author = user.doctor_profile.author_profile
-            author.total_articles = (
-                Article.objects.filter(author=user, status='published').count()
-                + NewsArticle.objects.filter(author=author, status='published').count()
-            )
-            author.save(update_fields=['total_articles'])
-            author.update_level()
-        except Exception as e:
-            logger.warning(f"Yazar istatistik guncelleme hatasi: {e}")
+        update_author_stats(user)
 
 
 class AuthorArticleRunPipelineView(views.APIView):
@@ -379,48 +312,53 @@ class AuthorArticleRunPipelineView(views.APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            from services.base_agent import BaseAgent
-            from services.orchestrator import orchestrator
-            import services.agents  # noqa: F401
+        return _submit_job_response(request.user, JOB_RUN, pipeline_name, article)
 
-            original_is_enabled = BaseAgent.is_enabled
-            BaseAgent.is_enabled = lambda self: True
 
-            try:
-                result = orchestrator.run_chain(
-                    pipeline_name,
-                    input_data={
-                        'title_tr': article.title_tr,
-                        'body_tr': article.body_tr,
-                        'excerpt_tr': article.excerpt_tr,
-                        'seo_title_tr': article.seo_title_tr,
-                        'seo_description_tr': article.seo_description_tr,
-                        'article_id': str(article.id),
-                    },
-                    triggered_by=request.user,
-                )
+def _submit_job_response(user, kind, pipeline_name, article):
+    """Pipeline isini kuyruga al: 202 + is durumu, makalede is varsa 409, limit doluysa 429."""
+    try:
+        job = submit_job(user, kind, pipeline_name, article)
+    except JobAlreadyRunning as e:
+        return Response(
+            {'detail': str(e), 'job': job_status_data(e.job)},
+            status=status.HTTP_409_CONFLICT,
+        )
+    except JobLimitExceeded as e:
+        return Response({'detail': str(e)}, status=status.HTTP_429_TOO_MANY_REQUESTS)
+
+    return Response(
+        {
+            'detail': 'Pipeline isi kuyruga alindi.',
+            'status': article.status,
+            'article_id': str(article.id),
+            'job': job_status_data(job),
+        },
+        status=status.HTTP_202_ACCEPTED,
+    )
 
-                return Response({
-                    'success': result.success,
-                    'pipeline': pipeline_name,
-                    'steps_completed': result.steps_completed,
-                    'steps_failed': result.steps_failed,
-                    'duration_ms': result.total_duration_ms,
-                    'data': {
-                        k: v for k, v in result.final_data.items()
-                        if not k.startswith('__')
-                    },
-                })
-            finally:
-                BaseAgent.is_enabled = original_is_enabled
-
-        except Exception as e:
-            logger.error(f"Pipeline hatasi: {e}")
+
+class AuthorPipelineJobListView(views.APIView):
+    """Yazarin son pipeline isleri."""
+    permission_classes = [IsAuthenticated, IsDoctor]
+
+    def get(self, request):
+        jobs = job_queryset(request.user).order_by('-created_at')[:RECENT_JOBS_LIMIT]
+        return Response([job_status_data(job) for job in jobs])
+
+
+class AuthorPipelineJobDetailView(views.APIView):
+    """Pipeline isi durumu ve adim bazinda ilerleme (polling)."""
+    permission_classes = [IsAuthenticated, IsDoctor]
+
+    def get(self, request, pk):
+        job = job_queryset(request.user).filter(pk=pk).first()
+        if job is None:
             return Response(
-                {'detail': f'Pipeline hatasi: {str(e)}'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {'detail': 'Pipeline isi bulunamadi.'},
+                status=status.HTTP_404_NOT_FOUND,
             )
+        return Response(job_status_data(job))
 
 
 # ═══════════════════════════════════════════════
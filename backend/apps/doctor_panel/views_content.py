@@ -33,71 +33,65 @@ class GenerateContentView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # FeatureFlag bypass - ajanları doğrudan çalıştır
-        from services.base_agent import BaseAgent
-        original_is_enabled = BaseAgent.is_enabled
-        BaseAgent.is_enabled = lambda self: True
-
-        try:
-            from services.orchestrator import orchestrator
-            import services.agents  # noqa: F401
-
-            is_news = content_type == 'news'
-
+        from services.base_agent import ALL_FLAGS
+        from services.orchestrator import orchestrator
+        import services.agents  # noqa: F401
+
+        is_news = content_type == 'news'
+
+        if is_news:
+            # Haber üretimi: news_agent → seo_agent → legal_agent
+            steps = ['news_agent', 'seo_agent', 'legal_agent']
+            pipeline_name = 'news_pipeline'
+        else:
+            steps = ['content_agent', 'seo_agent', 'legal_agent']
+            pipeline_name = 'publish_article'
+
+        result = orchestrator.run_chain(
+            pipeline_name,
+            input_data={
+                'topic': topic,
+                'module': module,
+                'audience': audience,
+                'content_type': content_type,
+                'content_length': content_length,
+                'tone': tone,
+                'type': 'general',  # news_agent type parameter
+            },
+            steps=steps,
+            triggered_by=request.user,
+            # FeatureFlag bypass - ajanlari dogrudan calistir (yalnizca bu calistirma)
+            flag_overrides={ALL_FLAGS: True},
+        )
+
+        if result.success:
             if is_news:
-                # Haber üretimi: news_agent → seo_agent → legal_agent
-                steps = ['news_agent', 'seo_agent', 'legal_agent']
-                pipeline_name = 'news_pipeline'
+                saved = self._save_as_news_draft(result.final_data, request.user, module)
             else:
-                steps = ['content_agent', 'seo_agent', 'legal_agent']
-                pipeline_name = 'publish_article'
-
-            result = orchestrator.run_chain(
-                pipeline_name,
-                input_data={
-                    'topic': topic,
-                    'module': module,
-                    'audience': audience,
-                    'content_type': content_type,
-                    'content_length': content_length,
-                    'tone': tone,
-                    'type': 'general',  # news_agent type parameter
-                },
-                steps=steps,
-                triggered_by=request.user,
-            )
+                saved = self._save_as_draft(result.final_data, request.user)
 
-            if result.success:
-                if is_news:
-                    saved = self._save_as_news_draft(result.final_data, request.user, module)
-                else:
-                    saved = self._save_as_draft(result.final_data, request.user)
-
-                return Response({
-                    'success': True,
-                    'article_id': str(saved.id) if saved else None,
-                    'title': result.final_data.get('title_tr', ''),
-                    'body_tr': result.final_data.get('body_tr', ''),
-                    'excerpt_tr': result.final_data.get('excerpt_tr', ''),
-                    'seo_title': result.final_data.get('seo_title_tr', ''),
-                    'legal_approved': result.final_data.get('legal_approved', False),
-                    'legal_score': result.final_data.get('legal_score', 0),
-                    'legal_issues': result.final_data.get('legal_issues', []),
-                    'keywords': result.final_data.get('keywords_tr', []),
-                    'steps_completed': result.steps_completed,
-                    'duration_ms': result.total_duration_ms,
-                    'content_type': 'news' if is_news else 'article',
-                })
-            else:
-                return Response({
-                    'success': False,
-                    'error': result.error,
-                    'steps_completed': result.steps_completed,
-                    'steps_failed': result.steps_failed,
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        finally:
-            BaseAgent.is_enabled = original_is_enabled
+            return Response({
+                'success': True,
+                'article_id': str(saved.id) if saved else None,
+                'title': result.final_data.get('title_tr', ''),
+                'body_tr': result.final_data.get('body_tr', ''),
+                'excerpt_tr': result.final_data.get('excerpt_tr', ''),
+                'seo_title': result.final_data.get('seo_title_tr', ''),
+                'legal_approved': result.final_data.get('legal_approved', False),
+                'legal_score': result.final_data.get('legal_score', 0),
+                'legal_issues': result.final_data.get('legal_issues', []),
+                'keywords': result.final_data.get('keywords_tr', []),
+                'steps_completed': result.steps_completed,
+                'duration_ms': result.total_duration_ms,
+                'content_type': 'news' if is_news else 'article',
+            })
+        else:
+            return Response({
+                'success': False,
+                'error': result.error,
+                'steps_completed': result.steps_completed,
+                'steps_failed': result.steps_failed,
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     def _save_as_draft(self, data, author):
         """Pipeline sonucunu Article modeline draft olarak kaydet."""
@@ -41,10 +41,6 @@ class DevOpsGenerateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        from services.base_agent import BaseAgent
-        original_is_enabled = BaseAgent.is_enabled
-        BaseAgent.is_enabled = lambda self: True
-
         try:
             from services.agents.devops_agent import DevOpsAgent
             agent = DevOpsAgent()
@@ -68,8 +64,6 @@ class DevOpsGenerateView(APIView):
                 {'error': str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
-        finally:
-            BaseAgent.is_enabled = original_is_enabled
 
 
 class DevOpsReviewView(APIView):
@@ -87,10 +81,6 @@ class DevOpsReviewView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        from services.base_agent import BaseAgent
-        original_is_enabled = BaseAgent.is_enabled
-        BaseAgent.is_enabled = lambda self: True
-
         try:
             from services.agents.devops_agent import DevOpsAgent
             agent = DevOpsAgent()
@@ -112,5 +102,3 @@ class DevOpsReviewView(APIView):
                 {'error': str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
-        finally:
-            BaseAgent.is_enabled = original_is_enabled
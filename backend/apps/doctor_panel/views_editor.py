@@ -37,6 +37,8 @@ from django.utils import timezone
 from django.db.models import Q, Count
 
 from apps.accounts.models import DoctorAuthor
+from apps.doctor_panel import bulk_transitions
+from apps.doctor_panel.pipeline_jobs import update_author_stats
 from apps.content.models import Article, NewsArticle, ArticleReview
 from .serializers_author import (
     DoctorAuthorListSerializer,
@@ -281,11 +283,7 @@ class EditorArticleTransitionView(views.APIView):
     """
     permission_classes = [IsAuthenticated, IsEditorOrAdmin]
 
-    TRANSITIONS = {
-        'draft': ['publish', 'archive'],
-        'published': ['archive'],
-        'archived': ['revert_to_draft'],
-    }
+    TRANSITIONS = bulk_transitions.ARTICLE_TRANSITIONS
 
     STATUS_MAP = {
         'publish': 'published',
@@ -344,17 +342,7 @@ class EditorArticleTransitionView(views.APIView):
         })
 
     def _update_author_stats(self, user):
-        try:
-            author = user.doctor_profile.author_profile
-            article_count = Article.objects.filter(
-                Q(author=user) | Q(doctor_author=author), status='published'
-            ).distinct().count()
-            news_count = NewsArticle.objects.filter(author=author, status='published').count()
-            author.total_articles = article_count + news_count
-            author.save(update_fields=['total_articles'])
-            author.update_level()
-        except Exception:
-            pass
+        update_author_stats(user)
 
 
 # ═══════════════════════════════════════════════
@@ -462,15 +450,7 @@ class EditorNewsTransitionView(views.APIView):
     """
     permission_classes = [IsAuthenticated, IsEditorOrAdmin]
 
-    TRANSITIONS = {
-        'review': ['approve', 'reject'],
-        'approved': ['publish'],
-        'published': ['archive'],
-        'archived': ['revert_to_draft'],
-        # Editor draft'tan da direkt yayinlayabilir
-        'draft': ['approve', 'publish', 'archive'],
-        'revision': ['approve', 'reject'],
-    }
+    TRANSITIONS = bulk_transitions.NEWS_TRANSITIONS
 
     STATUS_MAP = {
         'approve': 'approved',
@@ -536,19 +516,7 @@ class EditorNewsTransitionView(views.APIView):
         })
 
     def _update_news_author_stats(self, author):
-        try:
-            author.total_articles = (
-                Article.objects.filter(
-                    author=author.doctor.user, status='published'
-                ).count()
-                + NewsArticle.objects.filter(
-                    author=author, status='published'
-                ).count()
-            )
-            author.save(update_fields=['total_articles'])
-            author.update_level()
-        except Exception:
-            pass
+        update_author_stats(author.doctor.user)
 
 
 # ═══════════════════════════════════════════════
@@ -644,83 +612,49 @@ class EditorAuthorVerifyView(views.APIView):
 # 5. TOPLU ISLEMLER (Bulk Operations)
 # ===============================================
 
-class EditorBulkArticleTransitionView(views.APIView):
-    """Toplu makale durum gecisi. POST {"ids":["uuid1","uuid2"],"action":"publish","feedback":""}"""
+class _BulkTransitionView(views.APIView):
+    """
+    Toplu durum gecisi ortak govdesi: silme veya bulk_transitions motoru.
+    Gecersiz durumdaki kayitlar tek kayitlik gecis kurallarina gore 'failed' doner.
+    """
     permission_classes = [IsAuthenticated, IsEditorOrAdmin]
-    STATUS_MAP = {'approve': 'approved', 'reject': 'revision', 'publish': 'published', 'archive': 'archived', 'revert_to_draft': 'draft'}
+    target = None
+    model = None
 
     def post(self, request):
         ids = request.data.get('ids', [])
         action = request.data.get('action', '')
         feedback = request.data.get('feedback', '')
+        label = self.target.label
         if not ids or not action:
             return Response({'detail': 'ids ve action zorunlu.'}, status=status.HTTP_400_BAD_REQUEST)
 
         # Kalici silme
         if action == 'delete':
-            articles = Article.objects.filter(id__in=ids)
-            count = articles.count()
-            articles.delete()
-            logger.info(f"[EDITOR BULK] Articles deleted: {count}, by={request.user.email}")
-            return Response({'detail': f'{count} makale silindi.', 'results': {'deleted': count}})
+            rows = self.model.objects.filter(id__in=bulk_transitions.split_ids(ids)[0])
+            count = rows.count()
+            rows.delete()
+            logger.info(f"[EDITOR BULK] {self.model.__name__} deleted: {count}, by={request.user.email}")
+            return Response({'detail': f'{count} {label} silindi.', 'results': {'deleted': count}})
 
-        if action not in self.STATUS_MAP:
+        if action not in bulk_transitions.STATUS_MAP:
             return Response({'detail': f'Gecersiz action: {action}'}, status=status.HTTP_400_BAD_REQUEST)
-        new_status = self.STATUS_MAP[action]
-        articles = Article.objects.filter(id__in=ids)
-        results = {'success': [], 'failed': []}
-        for article in articles:
-            old = article.status
-            try:
-                article.status = new_status
-                if new_status == 'published' and not article.published_at:
-                    article.published_at = timezone.now()
-                article.save()
-                from apps.notifications.content_notifications import notify_article_transition
-                notify_article_transition(article, old, new_status, changed_by=request.user, feedback=feedback)
-                results['success'].append({'id': str(article.id), 'title': article.title_tr, 'new_status': new_status})
-            except Exception as e:
-                results['failed'].append({'id': str(article.id), 'error': str(e)})
-        logger.info(f"[EDITOR BULK] Articles: {len(results['success'])} ok, {len(results['failed'])} fail, action={action}")
-        return Response({'detail': f"{len(results['success'])} makale guncellendi.", 'results': results})
-
-
-class EditorBulkNewsTransitionView(views.APIView):
-    """Toplu haber durum gecisi. POST {"ids":["uuid1","uuid2"],"action":"approve","feedback":""}"""
-    permission_classes = [IsAuthenticated, IsEditorOrAdmin]
-    STATUS_MAP = {'approve': 'approved', 'reject': 'revision', 'publish': 'published', 'archive': 'archived', 'revert_to_draft': 'draft'}
 
-    def post(self, request):
-        ids = request.data.get('ids', [])
-        action = request.data.get('action', '')
-        feedback = request.data.get('feedback', '')
-        if not ids or not action:
-            return Response({'detail': 'ids ve action zorunlu.'}, status=status.HTTP_400_BAD_REQUEST)
+        results = bulk_transitions.bulk_transition(self.target, ids, action, request.user, feedback)
+        logger.info(
+            f"[EDITOR BULK] {self.model.__name__}: {len(results['success'])} ok, "
+            f"{len(results['failed'])} fail, action={action}, by={request.user.email}"
+        )
+        return Response({'detail': f"{len(results['success'])} {label} guncellendi.", 'results': results})
 
-        # Kalici silme
-        if action == 'delete':
-            news_list = NewsArticle.objects.filter(id__in=ids)
-            count = news_list.count()
-            news_list.delete()
-            logger.info(f"[EDITOR BULK] News deleted: {count}, by={request.user.email}")
-            return Response({'detail': f'{count} haber silindi.', 'results': {'deleted': count}})
 
-        if action not in self.STATUS_MAP:
-            return Response({'detail': f'Gecersiz action: {action}'}, status=status.HTTP_400_BAD_REQUEST)
-        new_status = self.STATUS_MAP[action]
-        news_list = NewsArticle.objects.filter(id__in=ids)
-        results = {'success': [], 'failed': []}
-        for news in news_list:
-            old = news.status
-            try:
-                news.status = new_status
-                if new_status == 'published' and not news.published_at:
-                    news.published_at = timezone.now()
-                news.save()
-                from apps.notifications.content_notifications import notify_news_transition
-                notify_news_transition(news, old, new_status, changed_by=request.user, feedback=feedback)
-                results['success'].append({'id': str(news.id), 'title': news.title_tr, 'new_status': new_status})
-            except Exception as e:
-                results['failed'].append({'id': str(news.id), 'error': str(e)})
-        logger.info(f"[EDITOR BULK] News: {len(results['success'])} ok, {len(results['failed'])} fail, action={action}")
-        return Response({'detail': f"{len(results['success'])} haber guncellendi.", 'results': results})
+class EditorBulkArticleTransitionView(_BulkTransitionView):
+    """Toplu makale durum gecisi. POST {"ids":["uuid1","uuid2"],"action":"publish","feedback":""}"""
+    target = bulk_transitions.ARTICLE
+    model = Article
+
+
+class EditorBulkNewsTransitionView(_BulkTransitionView):
+    """Toplu haber durum gecisi. POST {"ids":["uuid1","uuid2"],"action":"approve","feedback":""}"""
+    target = bulk_transitions.NEWS
+    model = NewsArticle
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import SeizureEvent, EpilepsyTrigger
+from .models import SeizureEvent, EpilepsyTrigger, SeizureMonthlySummary
 
 
 @admin.register(SeizureEvent)
@@ -15,3 +15,11 @@ class EpilepsyTriggerAdmin(admin.ModelAdmin):
     list_display = ('name_tr', 'name_en', 'category', 'is_predefined')
     list_filter = ('category', 'is_predefined')
     search_fields = ('name_tr', 'name_en')
+
+
+@admin.register(SeizureMonthlySummary)
+class SeizureMonthlySummaryAdmin(admin.ModelAdmin):
+    list_display = ('patient', 'month', 'seizure_count', 'consciousness_loss_count', 'updated_at')
+    search_fields = ('patient__email',)
+    date_hierarchy = 'month'
+    readonly_fields = ('updated_at',)
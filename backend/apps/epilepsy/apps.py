@@ -5,3 +5,6 @@ class EpilepsyConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.epilepsy'
     label = 'epilepsy'
+
+    def ready(self):
+        import apps.epilepsy.signals  # noqa: F401
@@ -0,0 +1,17 @@
+"""Aylik nobet ozetlerini (SeizureMonthlySummary) mevcut kayitlardan onar/olustur."""
+from django.core.management.base import BaseCommand
+
+from apps.epilepsy.rollups import reconcile_summaries
+
+
+class Command(BaseCommand):
+    help = 'Aylik nobet ozetlerini ham SeizureEvent kayitlariyla karsilastirip onarir.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--patient', type=int, help='Yalnizca bu hasta id')
+
+    def handle(self, *args, **options):
+        result = reconcile_summaries(options['patient'])
+        self.stdout.write(self.style.SUCCESS(
+            f"{result['updated']} aylik ozet yazildi, {result['deleted']} fazla ozet silindi."
+        ))
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.5 on 2026-10-19 19:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('epilepsy', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeizureMonthlySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='Ayin ilk gunu')),
+                ('seizure_count', models.PositiveIntegerField(default=0)),
+                ('intensity_sum', models.PositiveIntegerField(default=0)),
+                ('duration_sum', models.PositiveBigIntegerField(default=0)),
+                ('duration_count', models.PositiveIntegerField(default=0)),
+                ('consciousness_loss_count', models.PositiveIntegerField(default=0)),
+                ('type_counts', models.JSONField(blank=True, default=dict)),
+                ('trigger_counts', models.JSONField(blank=True, default=dict)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('patient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seizure_monthly_summaries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['month'],
+                'constraints': [models.UniqueConstraint(fields=('patient', 'month'), name='uniq_seizure_monthly_summary')],
+            },
+        ),
+    ]
@@ -68,3 +68,33 @@ class SeizureEvent(TimeStampedModel):
 
     def __str__(self):
         return f"{self.patient} - {self.get_seizure_type_display()} ({self.seizure_datetime})"
+
+
+class SeizureMonthlySummary(models.Model):
+    """Hasta + ay basina nobet ozeti (istatistik, grafik ve tetikleyici analizi buradan okunur)."""
+
+    patient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='seizure_monthly_summaries',
+    )
+    month = models.DateField(help_text='Ayin ilk gunu')
+    seizure_count = models.PositiveIntegerField(default=0)
+    intensity_sum = models.PositiveIntegerField(default=0)
+    duration_sum = models.PositiveBigIntegerField(default=0)
+    # Suresi girilmis nobet sayisi (ortalama sure paydasi)
+    duration_count = models.PositiveIntegerField(default=0)
+    consciousness_loss_count = models.PositiveIntegerField(default=0)
+    # Nobet tipi -> sayi, tetikleyici id -> sayi
+    type_counts = models.JSONField(default=dict, blank=True)
+    trigger_counts = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['month']
+        constraints = [
+            models.UniqueConstraint(fields=['patient', 'month'], name='uniq_seizure_monthly_summary'),
+        ]
+
+    def __str__(self):
+        return f"{self.patient} - {self.month:%Y-%m} ({self.seizure_count} nobet)"
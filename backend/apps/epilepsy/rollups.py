@@ -0,0 +1,215 @@
+"""
+Epilepsi nobet ozetleri (aylik rollup).
+
+SeizureMonthlySummary, hasta + ay basina nobet sayisi, siddet/sure
+toplamlari, bilinc kaybi sayisi ile nobet tipi ve tetikleyici sayaclarini
+tutar. Ortalamalar toplamlardan hesaplandigi icin aylar birlestirilince de
+kesindir.
+
+- Nobet yazildiginda/silindiginde veya tetikleyicileri degistiginde
+  yalnizca ilgili ay yeniden hesaplanir (signals).
+- stats, chart ve tetikleyici analizi ham SeizureEvent satirlarini okumaz.
+- queryset.update() gibi sinyalsiz yazimlarin yarattigi sapmayi gecelik
+  reconcile_summaries gorevi onarir.
+
+Kullanım:
+    summaries = SeizureMonthlySummary.objects.filter(patient=user)
+    data = rollups.stats_from_summaries(summaries, date.today())
+"""
+
+from collections import Counter
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import Count, DateField, Q, Sum
+from django.db.models.functions import Coalesce, TruncMonth
+
+from .models import EpilepsyTrigger, SeizureEvent, SeizureMonthlySummary
+
+SUMMARY_FIELDS = [
+    'seizure_count', 'intensity_sum', 'duration_sum', 'duration_count',
+    'consciousness_loss_count', 'type_counts', 'trigger_counts',
+]
+TOP_TRIGGERS = 5
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def next_month(value: date) -> date:
+    return (value.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _month(path):
+    return TruncMonth(path, output_field=DateField())
+
+
+def compute_summaries(events) -> dict:
+    """Verilen nobetlerden {(patient_id, ay): alanlar} (uc gruplu sorgu)."""
+    events = events.order_by()
+    rows = (
+        events.annotate(month=_month('seizure_datetime'))
+        .values('patient_id', 'month')
+        .annotate(
+            seizure_count=Count('id'),
+            intensity_sum=Coalesce(Sum('intensity'), 0),
+            duration_sum=Coalesce(Sum('duration_seconds'), 0),
+            duration_count=Count('duration_seconds'),
+            consciousness_loss_count=Count('id', filter=Q(loss_of_consciousness=True)),
+        )
+    )
+    summaries = {
+        (row.pop('patient_id'), row.pop('month')): {**row, 'type_counts': {}, 'trigger_counts': {}}
+        for row in rows
+    }
+
+    types = (
+        events.annotate(month=_month('seizure_datetime'))
+        .values_list('patient_id', 'month', 'seizure_type')
+        .annotate(n=Count('id'))
+    )
+    for patient_id, month, seizure_type, n in types:
+        summaries[(patient_id, month)]['type_counts'][seizure_type] = n
+
+    through = SeizureEvent.triggers_identified.through
+    triggers = (
+        through.objects.filter(seizureevent__in=events.values('pk'))
+        .annotate(month=_month('seizureevent__seizure_datetime'))
+        .values_list('seizureevent__patient_id', 'month', 'epilepsytrigger_id')
+        .annotate(n=Count('id'))
+        .order_by()
+    )
+    for patient_id, month, trigger_id, n in triggers:
+        summaries[(patient_id, month)]['trigger_counts'][str(trigger_id)] = n
+    return summaries
+
+
+def _upsert(summaries):
+    objs = [
+        SeizureMonthlySummary(patient_id=patient_id, month=month, **values)
+        for (patient_id, month), values in summaries.items()
+    ]
+    SeizureMonthlySummary.objects.bulk_create(
+        objs,
+        update_conflicts=True,
+        unique_fields=['patient', 'month'],
+        update_fields=SUMMARY_FIELDS + ['updated_at'],
+    )
+
+
+def refresh_month(patient_id, month):
+    """Bir ayin ozetini yeniden hesapla; ayda nobet kalmadiysa ozeti sil."""
+    month = month_start(month)
+    events = SeizureEvent.objects.filter(
+        patient_id=patient_id,
+        seizure_datetime__date__gte=month,
+        seizure_datetime__date__lt=next_month(month),
+    )
+    summaries = compute_summaries(events)
+    if not summaries:
+        SeizureMonthlySummary.objects.filter(patient_id=patient_id, month=month).delete()
+        return None
+    _upsert(summaries)
+    return summaries[(patient_id, month)]
+
+
+def reconcile_summaries(patient_id=None) -> dict:
+    """
+    Ozetleri ham nobetlerle karsilastir; eksik/yanlis aylari yaz, fazlalari sil.
+    Donus: {'updated': n, 'deleted': n}
+    """
+    events = SeizureEvent.objects.all()
+    stored = SeizureMonthlySummary.objects.all()
+    if patient_id is not None:
+        events = events.filter(patient_id=patient_id)
+        stored = stored.filter(patient_id=patient_id)
+
+    expected = compute_summaries(events)
+    current = {
+        (row['patient_id'], row['month']): row
+        for row in stored.values('id', 'patient_id', 'month', *SUMMARY_FIELDS)
+    }
+
+    drifted = {
+        key: values for key, values in expected.items()
+        if key not in current or any(current[key][f] != values[f] for f in SUMMARY_FIELDS)
+    }
+    stale_ids = [row['id'] for key, row in current.items() if key not in expected]
+
+    with transaction.atomic():
+        if drifted:
+            _upsert(drifted)
+        if stale_ids:
+            SeizureMonthlySummary.objects.filter(id__in=stale_ids).delete()
+    return {'updated': len(drifted), 'deleted': len(stale_ids)}
+
+
+# ------------------------------------------------------------
+# Okuma
+# ------------------------------------------------------------
+
+def trigger_totals(summaries) -> Counter:
+    totals = Counter()
+    for summary in summaries:
+        totals.update(summary.trigger_counts)
+    return totals
+
+
+def ranked_triggers(summaries, limit=None) -> list:
+    """Tetikleyiciler ve nobet sayilari, coktan aza (tek sorgu)."""
+    totals = trigger_totals(summaries)
+    triggers = EpilepsyTrigger.objects.in_bulk(list(totals))
+    ranked = sorted(
+        ((trigger, totals[str(pk)]) for pk, trigger in triggers.items()),
+        key=lambda item: (-item[1], item[0].name_tr),
+    )
+    return ranked[:limit] if limit else ranked
+
+
+def stats_from_summaries(summaries, today) -> dict:
+    summaries = list(summaries)
+    this_month = month_start(today)
+    last_month = month_start(this_month - timedelta(days=1))
+    by_month = {s.month: s.seizure_count for s in summaries}
+
+    total = sum(s.seizure_count for s in summaries)
+    intensity_sum = sum(s.intensity_sum for s in summaries)
+    duration_sum = sum(s.duration_sum for s in summaries)
+    duration_count = sum(s.duration_count for s in summaries)
+    with_loss = sum(s.consciousness_loss_count for s in summaries)
+
+    types = Counter()
+    for summary in summaries:
+        types.update(summary.type_counts)
+
+    return {
+        'total_seizures': total,
+        'avg_intensity': round(intensity_sum / total, 1) if total else 0,
+        'avg_duration': round(duration_sum / duration_count, 0) if duration_count else 0,
+        'seizures_this_month': by_month.get(this_month, 0),
+        'seizures_last_month': by_month.get(last_month, 0),
+        'most_common_triggers': [
+            {'name': trigger.name_tr, 'count': count}
+            for trigger, count in ranked_triggers(summaries, TOP_TRIGGERS)
+        ],
+        'most_common_type': types.most_common(1)[0][0] if types else '',
+        'consciousness_loss_percentage': round(with_loss / total * 100, 1) if total else 0,
+    }
+
+
+def monthly_chart(summaries, start, today) -> list:
+    """start'in ayindan bugune her ay icin sayi ve ortalama siddet."""
+    by_month = {s.month: s for s in summaries}
+    data = []
+    current = month_start(start)
+    while current <= today:
+        summary = by_month.get(current)
+        count = summary.seizure_count if summary else 0
+        data.append({
+            'month': current.strftime('%Y-%m'),
+            'count': count,
+            'avg_intensity': round(summary.intensity_sum / count, 1) if count else 0,
+        })
+        current = next_month(current)
+    return data
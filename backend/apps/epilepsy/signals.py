@@ -0,0 +1,66 @@
+"""
+Epilepsy app signals.
+
+Nobet yazildiginda/silindiginde veya tetikleyicileri degistiginde
+hastanin o aya ait SeizureMonthlySummary satirini yeniden hesaplar. Nobet
+tarihi baska aya tasindiysa eski ay da yenilenir. Silinen tetikleyici,
+kullanildigi aylarin tetikleyici sayaclarindan duser.
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import SeizureEvent
+
+
+def _month(value):
+    return timezone.localdate(value).replace(day=1)
+
+
+def _refresh(keys):
+    from apps.epilepsy.rollups import refresh_month
+
+    for patient_id, month in set(keys):
+        refresh_month(patient_id, month)
+
+
+@receiver(pre_save, sender=SeizureEvent)
+def remember_previous_month(sender, instance, **kwargs):
+    if instance._state.adding:
+        return
+    previous = sender.objects.filter(pk=instance.pk).values_list('seizure_datetime', flat=True).first()
+    instance._previous_month = _month(previous) if previous else None
+
+
+@receiver(post_save, sender=SeizureEvent)
+@receiver(post_delete, sender=SeizureEvent)
+def refresh_monthly_summary(sender, instance, **kwargs):
+    keys = [(instance.patient_id, _month(instance.seizure_datetime))]
+    previous = getattr(instance, '_previous_month', None)
+    if previous:
+        keys.append((instance.patient_id, previous))
+    _refresh(keys)
+
+
+@receiver(m2m_changed, sender=SeizureEvent.triggers_identified.through)
+def refresh_trigger_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        _refresh([(instance.patient_id, _month(instance.seizure_datetime))])
+    elif pk_set:
+        # trigger.seizure_events.add(...): etkilenen nobetlerin aylari
+        events = SeizureEvent.objects.filter(pk__in=pk_set).values_list('patient_id', 'seizure_datetime')
+        _refresh((patient_id, _month(value)) for patient_id, value in events)
+
+
+@receiver(pre_delete, sender='epilepsy.EpilepsyTrigger')
+def remember_trigger_months(sender, instance, **kwargs):
+    events = instance.seizure_events.values_list('patient_id', 'seizure_datetime')
+    instance._affected_months = [(patient_id, _month(value)) for patient_id, value in events]
+
+
+@receiver(post_delete, sender='epilepsy.EpilepsyTrigger')
+def refresh_deleted_trigger_months(sender, instance, **kwargs):
+    _refresh(getattr(instance, '_affected_months', []))
@@ -0,0 +1,15 @@
+import logging
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name='apps.epilepsy.tasks.reconcile_seizure_summaries')
+def reconcile_seizure_summaries():
+    """Aylik nobet ozetlerini ham kayitlarla karsilastir ve sapmalari onar."""
+    from apps.epilepsy.rollups import reconcile_summaries
+
+    result = reconcile_summaries()
+    if result['updated'] or result['deleted']:
+        logger.warning(f"Nobet ozeti sapmasi onarildi: {result}")
+    return result
@@ -3,11 +3,13 @@ from drf_spectacular.utils import extend_schema_view, extend_schema
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Avg, Count, Q
+from django.db.models import Q
 from django_filters.rest_framework import DjangoFilterBackend
 
 from apps.accounts.permissions import IsPatient
-from .models import SeizureEvent, EpilepsyTrigger
+from apps.common.pagination import FieldProjectionMixin, KeysetPagination
+from . import rollups
+from .models import SeizureEvent, EpilepsyTrigger, SeizureMonthlySummary
 from .serializers import (
     SeizureEventSerializer,
     SeizureEventListSerializer,
@@ -16,9 +18,11 @@ from .serializers import (
 )
 
 
-class SeizureEventViewSet(viewsets.ModelViewSet):
+class SeizureEventViewSet(FieldProjectionMixin, viewsets.ModelViewSet):
     """Seizure event diary."""
     permission_classes = [permissions.IsAuthenticated, IsPatient]
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-seizure_datetime', '-id')
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['seizure_type']
 
@@ -42,86 +46,23 @@ class SeizureEventViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def stats(self, request):
-        """Get seizure statistics."""
-        qs = SeizureEvent.objects.filter(patient=request.user)
-        today = date.today()
-        month_start = today.replace(day=1)
-        last_month_start = (month_start - timedelta(days=1)).replace(day=1)
-
-        total = qs.count()
-        aggregates = qs.aggregate(
-            avg_intensity=Avg('intensity'),
-            avg_duration=Avg('duration_seconds'),
-        )
-
-        seizures_this_month = qs.filter(seizure_datetime__date__gte=month_start).count()
-        seizures_last_month = qs.filter(
-            seizure_datetime__date__gte=last_month_start,
-            seizure_datetime__date__lt=month_start,
-        ).count()
-
-        triggers = (
-            EpilepsyTrigger.objects
-            .filter(seizure_events__patient=request.user)
-            .annotate(count=Count('seizure_events'))
-            .order_by('-count')[:5]
-        )
-        most_common_triggers = [
-            {'name': t.name_tr, 'count': t.count} for t in triggers
-        ]
-
-        seizure_type = (
-            qs.values('seizure_type')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-            .first()
-        )
-        most_common_type = seizure_type['seizure_type'] if seizure_type else ''
-
-        with_loss = qs.filter(loss_of_consciousness=True).count()
-        consciousness_pct = (with_loss / total * 100) if total > 0 else 0
-
-        data = {
-            'total_seizures': total,
-            'avg_intensity': round(aggregates['avg_intensity'] or 0, 1),
-            'avg_duration': round(aggregates['avg_duration'] or 0, 0),
-            'seizures_this_month': seizures_this_month,
-            'seizures_last_month': seizures_last_month,
-            'most_common_triggers': most_common_triggers,
-            'most_common_type': most_common_type,
-            'consciousness_loss_percentage': round(consciousness_pct, 1),
-        }
+        """Get seizure statistics (aylik ozetlerden)."""
+        summaries = SeizureMonthlySummary.objects.filter(patient=request.user)
+        data = rollups.stats_from_summaries(summaries, date.today())
         serializer = SeizureStatsSerializer(data)
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
     def chart(self, request):
-        """Monthly seizure frequency for charting."""
+        """Monthly seizure frequency for charting (aylik ozetlerden)."""
         months = int(request.query_params.get('months', 6))
         today = date.today()
         start = today - timedelta(days=months * 30)
 
-        qs = self.get_queryset().filter(seizure_datetime__date__gte=start)
-        data = []
-        current = start.replace(day=1)
-        while current <= today:
-            next_month = (current.replace(day=28) + timedelta(days=4)).replace(day=1)
-            count = qs.filter(
-                seizure_datetime__date__gte=current,
-                seizure_datetime__date__lt=next_month,
-            ).count()
-            avg_int = qs.filter(
-                seizure_datetime__date__gte=current,
-                seizure_datetime__date__lt=next_month,
-            ).aggregate(avg=Avg('intensity'))['avg']
-            data.append({
-                'month': current.strftime('%Y-%m'),
-                'count': count,
-                'avg_intensity': round(avg_int or 0, 1),
-            })
-            current = next_month
-
-        return Response(data)
+        summaries = SeizureMonthlySummary.objects.filter(
+            patient=request.user, month__gte=rollups.month_start(start),
+        )
+        return Response(rollups.monthly_chart(summaries, start, today))
 
 
 class EpilepsyTriggerViewSet(viewsets.ModelViewSet):
@@ -141,21 +82,16 @@ class EpilepsyTriggerViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def analysis(self, request):
-        """Analyze trigger frequency from patient's seizures."""
-        triggers = (
-            EpilepsyTrigger.objects
-            .filter(seizure_events__patient=request.user)
-            .annotate(seizure_count=Count('seizure_events'))
-            .order_by('-seizure_count')
-        )
+        """Analyze trigger frequency from patient's seizures (aylik ozetlerden)."""
+        summaries = SeizureMonthlySummary.objects.filter(patient=request.user).only('trigger_counts')
         data = [
             {
                 'id': str(t.id),
                 'name_tr': t.name_tr,
                 'name_en': t.name_en,
                 'category': t.category,
-                'seizure_count': t.seizure_count,
+                'seizure_count': count,
             }
-            for t in triggers
+            for t, count in rollups.ranked_triggers(summaries)
         ]
         return Response(data)
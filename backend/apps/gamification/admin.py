@@ -1,7 +1,8 @@
 from django.contrib import admin
 from .models import (
     Badge, UserBadge, UserStreak, UserPoints,
-    PointHistory, Achievement, UserAchievement
+    PointHistory, Achievement, UserAchievement,
+    GamificationEvent, UserGamificationSummary,
 )
 
 
@@ -56,3 +57,17 @@ class UserAchievementAdmin(admin.ModelAdmin):
     list_display = ['user', 'achievement', 'current_progress', 'is_completed', 'period_start']
     list_filter = ['is_completed', 'period_start']
     search_fields = ['user__email', 'achievement__name_tr']
+
+
+@admin.register(GamificationEvent)
+class GamificationEventAdmin(admin.ModelAdmin):
+    list_display = ['user', 'event_type', 'points', 'occurred_at', 'processed_at']
+    list_filter = ['event_type', 'processed_at']
+    search_fields = ['user__email', 'reason']
+    date_hierarchy = 'occurred_at'
+
+
+@admin.register(UserGamificationSummary)
+class UserGamificationSummaryAdmin(admin.ModelAdmin):
+    list_display = ['user', 'total_badges', 'completed_achievements', 'updated_at']
+    search_fields = ['user__email']
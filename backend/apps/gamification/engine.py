@@ -0,0 +1,366 @@
+"""
+Gamification kural motoru.
+
+Istek yolunda sadece GamificationEvent kuyruga yazilir (tek INSERT). Puan,
+seri, basarim ve rozet degerlendirmesi Celery'de toplu (batch) olarak yapilir;
+sonunda kullanicinin denormalize ozet satiri (UserGamificationSummary)
+yeniden olusturulur ve ozet endpoint'i tek okuma ile cevap verir.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Olay tipi -> deklaratif kurallar
+#   points: olay puan belirtmezse verilecek varsayilan puan
+#   streak_type: guncellenecek UserStreak tipi
+#   achievement_targets: ilerletilecek Achievement.target_type degerleri
+#   badge_requirements: yeniden degerlendirilecek Badge.requirement_type degerleri
+EVENT_RULES = {
+    'education_completed': {
+        'points': 5,
+        'streak_type': 'education',
+        'achievement_targets': ['any_log'],
+        'badge_requirements': [],
+    },
+    'quiz_passed': {
+        'points': 0,
+        'streak_type': 'education',
+        'achievement_targets': ['any_log'],
+        'badge_requirements': [],
+    },
+    'diary_logged': {
+        'points': 0,
+        'streak_type': 'migraine_diary',
+        'achievement_targets': ['any_log', 'daily_logs'],
+        'badge_requirements': ['total_attacks_logged'],
+    },
+    'exercise_done': {
+        'points': 0,
+        'streak_type': 'exercise',
+        'achievement_targets': ['any_log', 'total_exercise_sessions'],
+        'badge_requirements': ['breathing_sessions', 'relaxation_sessions'],
+    },
+}
+
+# Her puan/seri degisiminde tekrar bakilan rozet kriterleri
+ALWAYS_EVALUATED_REQUIREMENTS = ['level', 'streak_days']
+
+RECENT_BADGES_LIMIT = 5
+MAX_EVENT_ATTEMPTS = 5
+ACTIVE_ACHIEVEMENTS_LIMIT = 5
+
+
+def _count_attacks(user_id):
+    from apps.migraine.models import MigraineAttack
+    return MigraineAttack.objects.filter(patient_id=user_id).count()
+
+
+def _count_breathing_sessions(user_id):
+    from apps.wellness.models import ExerciseSession
+    return ExerciseSession.objects.filter(
+        user_id=user_id, breathing_exercise__isnull=False,
+    ).count()
+
+
+def _count_relaxation_sessions(user_id):
+    from apps.wellness.models import ExerciseSession
+    return ExerciseSession.objects.filter(
+        user_id=user_id, relaxation_exercise__isnull=False,
+    ).count()
+
+
+# Badge.requirement_type -> kullanicinin mevcut degerini donduren fonksiyon.
+# 'level' ve 'streak_days' bellekteki durumdan hesaplanir.
+BADGE_METRICS = {
+    'total_attacks_logged': _count_attacks,
+    'breathing_sessions': _count_breathing_sessions,
+    'relaxation_sessions': _count_relaxation_sessions,
+}
+
+
+def emit_event(user, event_type, points=None, reason='', **payload):
+    """
+    Domain olayini kuyruga yaz; degerlendirme commit sonrasi Celery'de yapilir.
+
+    Istek yolunda tek INSERT yapilir, gamification hatasi asil islemi engellemez.
+    """
+    from .models import GamificationEvent
+
+    if event_type not in EVENT_RULES:
+        raise ValueError(f'Bilinmeyen gamification olayi: {event_type}')
+    if points is None:
+        points = EVENT_RULES[event_type]['points']
+
+    event = GamificationEvent.objects.create(
+        user=user,
+        event_type=event_type,
+        points=points,
+        reason=reason[:200],
+        payload=payload,
+    )
+    transaction.on_commit(_schedule_processing)
+    return event
+
+
+def _schedule_processing():
+    from .tasks import process_gamification_events
+    try:
+        process_gamification_events.delay()
+    except Exception as e:
+        # Broker erisilemezse beat'teki periyodik calisma kuyrugu bosaltir
+        logger.warning(f'Gamification processing could not be queued: {e}')
+
+
+def process_pending_events(batch_size=500):
+    """
+    Islenmemis olaylari kullanici bazinda gruplayip toplu degerlendir.
+
+    Yalnizca basariyla uygulanan kullanicilarin olaylari islendi isaretlenir.
+    Hata veren kullanicinin olaylari bekler; attempts artar ve
+    MAX_EVENT_ATTEMPTS'ten sonra tekrar denenmez (last_error'da kalir).
+    """
+    from django.db.models import F
+    from .models import GamificationEvent
+
+    with transaction.atomic():
+        events = list(
+            GamificationEvent.objects
+            .select_for_update(skip_locked=True)
+            .filter(processed_at__isnull=True, attempts__lt=MAX_EVENT_ATTEMPTS)
+            .order_by('occurred_at')[:batch_size]
+        )
+        if not events:
+            return {'processed': 0, 'users': 0, 'failed': 0}
+
+        by_user = defaultdict(list)
+        for event in events:
+            by_user[event.user_id].append(event)
+
+        done, failed = [], 0
+        for user_id, user_events in by_user.items():
+            ids = [e.id for e in user_events]
+            try:
+                with transaction.atomic():
+                    _apply_user_events(user_id, user_events)
+            except Exception as e:
+                logger.exception(f'Gamification events failed for user {user_id}')
+                failed += len(ids)
+                GamificationEvent.objects.filter(id__in=ids).update(
+                    attempts=F('attempts') + 1, last_error=str(e)[:1000],
+                )
+            else:
+                done += ids
+
+        if done:
+            GamificationEvent.objects.filter(id__in=done).update(processed_at=timezone.now())
+
+    return {'processed': len(done), 'users': len(by_user), 'failed': failed}
+
+
+def _period_start(period, day):
+    if period == 'daily':
+        return day
+    if period == 'weekly':
+        return day - timedelta(days=day.weekday())
+    if period == 'monthly':
+        return day.replace(day=1)
+    return None  # one_time
+
+
+def _apply_user_events(user_id, events):
+    """Tek kullanicinin olay grubunu kurallara gore uygula."""
+    from .models import (
+        UserPoints, PointHistory, UserStreak,
+        Achievement, UserAchievement, Badge, UserBadge,
+    )
+
+    awards = [(e.points, e.reason) for e in events if e.points]
+
+    # --- Seriler ---
+    streak_dates = defaultdict(set)
+    for e in events:
+        streak_type = EVENT_RULES[e.event_type]['streak_type']
+        if streak_type:
+            streak_dates[streak_type].add(timezone.localdate(e.occurred_at))
+
+    streaks = {}
+    for streak_type, days in streak_dates.items():
+        streak, _ = UserStreak.objects.get_or_create(user_id=user_id, streak_type=streak_type)
+        for day in sorted(days):
+            streak.update_streak(day)
+        streaks[streak_type] = streak
+
+    # --- Basarimlar ---
+    target_counts = defaultdict(lambda: defaultdict(int))  # target -> day -> adet
+    for e in events:
+        day = timezone.localdate(e.occurred_at)
+        for target in EVENT_RULES[e.event_type]['achievement_targets']:
+            target_counts[target][day] += 1
+
+    if target_counts:
+        achievements = Achievement.objects.filter(
+            is_active=True, target_type__in=list(target_counts),
+        )
+        for achievement in achievements:
+            per_period = defaultdict(int)
+            for day, count in target_counts[achievement.target_type].items():
+                per_period[_period_start(achievement.period, day)] += count
+
+            for period_start, count in per_period.items():
+                if period_start is None:
+                    user_achievement = UserAchievement.objects.filter(
+                        user_id=user_id, achievement=achievement,
+                    ).first() or UserAchievement(
+                        user_id=user_id, achievement=achievement,
+                        period_start=timezone.localdate(),
+                    )
+                else:
+                    user_achievement, _ = UserAchievement.objects.get_or_create(
+                        user_id=user_id, achievement=achievement,
+                        period_start=period_start,
+                    )
+                if user_achievement.is_completed:
+                    continue
+                user_achievement.current_progress += count
+                if user_achievement.current_progress >= achievement.target_value:
+                    user_achievement.is_completed = True
+                    user_achievement.completed_at = timezone.now()
+                    if achievement.points_reward:
+                        awards.append((
+                            achievement.points_reward,
+                            f'Basarim tamamlandi: {achievement.name_tr[:50]}',
+                        ))
+                user_achievement.save()
+
+    # --- Rozetler ---
+    points_obj, _ = UserPoints.objects.get_or_create(user_id=user_id)
+    gained = sum(p for p, _ in awards)
+    projected_level = ((points_obj.total_points + gained) // 100) + 1
+
+    requirements = set(ALWAYS_EVALUATED_REQUIREMENTS)
+    for e in events:
+        requirements.update(EVENT_RULES[e.event_type]['badge_requirements'])
+
+    candidates = Badge.objects.filter(
+        is_active=True, requirement_type__in=requirements,
+    ).exclude(userbadge__user_id=user_id)
+
+    metric_cache = {}
+    new_badges = []
+    for badge in candidates:
+        req = badge.requirement_type
+        if req not in metric_cache:
+            if req == 'level':
+                metric_cache[req] = projected_level
+            elif req == 'streak_days':
+                metric_cache[req] = max(
+                    [s.current_streak for s in streaks.values()], default=0,
+                )
+            elif req in BADGE_METRICS:
+                metric_cache[req] = BADGE_METRICS[req](user_id)
+            else:
+                metric_cache[req] = None
+        if metric_cache[req] is not None and metric_cache[req] >= badge.requirement_value:
+            new_badges.append(UserBadge(user_id=user_id, badge=badge))
+            if badge.points_reward:
+                awards.append((badge.points_reward, f'Rozet kazanildi: {badge.name_tr[:50]}'))
+    if new_badges:
+        UserBadge.objects.bulk_create(new_badges, ignore_conflicts=True)
+
+    # --- Puanlar (tek UPDATE + toplu gecmis) ---
+    if awards:
+        running = points_obj.total_points
+        history = []
+        for points, reason in awards:
+            running += points
+            history.append(PointHistory(
+                user_id=user_id, points=points, reason=reason, total_after=running,
+            ))
+        gained = running - points_obj.total_points
+        points_obj.total_points = running
+        points_obj.points_this_week += gained
+        points_obj.points_this_month += gained
+        points_obj.level = (running // 100) + 1
+        points_obj.save()
+        PointHistory.objects.bulk_create(history)
+
+    rebuild_summary(user_id)
+
+
+def rebuild_summary(user_id):
+    """Kullanicinin denormalize gamification ozetini yeniden olustur."""
+    from .models import (
+        UserPoints, UserStreak, UserBadge, UserAchievement, UserGamificationSummary,
+    )
+    from .serializers import (
+        UserPointsSerializer, UserStreakSerializer,
+        UserBadgeSerializer, UserAchievementSerializer,
+    )
+
+    points, _ = UserPoints.objects.get_or_create(user_id=user_id)
+    streaks = UserStreak.objects.filter(user_id=user_id)
+    recent_badges = UserBadge.objects.filter(
+        user_id=user_id
+    ).select_related('badge').order_by('-earned_at')[:RECENT_BADGES_LIMIT]
+    active_achievements = UserAchievement.objects.filter(
+        user_id=user_id, is_completed=False,
+    ).select_related('achievement')[:ACTIVE_ACHIEVEMENTS_LIMIT]
+
+    summary, _ = UserGamificationSummary.objects.update_or_create(
+        user_id=user_id,
+        defaults={
+            'points': UserPointsSerializer(points).data,
+            'streaks': UserStreakSerializer(streaks, many=True).data,
+            'recent_badges': UserBadgeSerializer(recent_badges, many=True).data,
+            'active_achievements': UserAchievementSerializer(
+                active_achievements, many=True
+            ).data,
+            'total_badges': UserBadge.objects.filter(user_id=user_id).count(),
+            'completed_achievements': UserAchievement.objects.filter(
+                user_id=user_id, is_completed=True,
+            ).count(),
+        },
+    )
+    return summary
+
+
+def _localize(item, lang):
+    """Saklanan TR metinlerini istek diline gore sec."""
+    suffix = 'en' if lang == 'en' else 'tr'
+    return {
+        **item,
+        'name': item.get(f'name_{suffix}', item.get('name')),
+        'description': item.get(f'description_{suffix}', item.get('description')),
+    }
+
+
+def summary_payload(summary, lang='tr'):
+    """Ozet satirini GamificationSummaryViewSet cevap formatina cevir."""
+    today = date.today().isoformat()
+    streaks = [
+        {**s, 'is_active_today': s.get('last_activity_date') == today}
+        for s in summary.streaks
+    ]
+    return {
+        'points': summary.points,
+        'streaks': streaks,
+        'recent_badges': [
+            {**ub, 'badge': _localize(ub['badge'], lang)}
+            for ub in summary.recent_badges
+        ],
+        'active_achievements': [
+            {**ua, 'achievement': _localize(ua['achievement'], lang)}
+            for ua in summary.active_achievements
+        ],
+        'stats': {
+            'total_badges': summary.total_badges,
+            'active_streaks': sum(1 for s in streaks if s['is_active_today']),
+            'completed_achievements': summary.completed_achievements,
+        },
+    }
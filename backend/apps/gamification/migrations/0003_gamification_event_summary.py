@@ -0,0 +1,48 @@
+# Generated by Django 5.1.5 on 2026-10-19 18:04
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamification', '0002_alter_badge_category_alter_userstreak_streak_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserGamificationSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('points', models.JSONField(default=dict)),
+                ('streaks', models.JSONField(default=list)),
+                ('recent_badges', models.JSONField(default=list)),
+                ('active_achievements', models.JSONField(default=list)),
+                ('total_badges', models.PositiveIntegerField(default=0)),
+                ('completed_achievements', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='gamification_summary', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='GamificationEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(choices=[('education_completed', 'Eğitim Tamamlandı'), ('quiz_passed', 'Quiz Geçildi'), ('diary_logged', 'Günlük Kaydı'), ('exercise_done', 'Egzersiz Yapıldı')], max_length=30)),
+                ('points', models.PositiveIntegerField(default=0)),
+                ('reason', models.CharField(blank=True, max_length=200)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('occurred_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['occurred_at'],
+                'indexes': [models.Index(fields=['processed_at', 'occurred_at'], name='gamificatio_process_d68522_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.5 on 2026-10-19 19:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamification', '0003_gamification_event_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamificationevent',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='gamificationevent',
+            name='last_error',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
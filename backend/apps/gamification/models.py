@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 
 class Badge(models.Model):
@@ -207,3 +208,54 @@ class UserAchievement(models.Model):
 
     class Meta:
         ordering = ['-updated_at']
+
+
+class GamificationEvent(models.Model):
+    """Kural motoru için domain olay kuyruğu (istek yolunda sadece INSERT)"""
+    EVENT_TYPE_CHOICES = [
+        ('education_completed', 'Eğitim Tamamlandı'),
+        ('quiz_passed', 'Quiz Geçildi'),
+        ('diary_logged', 'Günlük Kaydı'),
+        ('exercise_done', 'Egzersiz Yapıldı'),
+    ]
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    event_type = models.CharField(max_length=30, choices=EVENT_TYPE_CHOICES)
+
+    points = models.PositiveIntegerField(default=0)
+    reason = models.CharField(max_length=200, blank=True)
+    payload = models.JSONField(default=dict, blank=True)
+
+    occurred_at = models.DateTimeField(default=timezone.now)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    # Basarisiz uygulama denemeleri; MAX_EVENT_ATTEMPTS'e ulasan olay
+    # islenmemis kalir ve last_error ile incelenir
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+
+    class Meta:
+        ordering = ['occurred_at']
+        indexes = [
+            models.Index(fields=['processed_at', 'occurred_at']),
+        ]
+
+    def __str__(self):
+        return f'{self.user_id} - {self.event_type}'
+
+
+class UserGamificationSummary(models.Model):
+    """Özet endpoint'i için denormalize kullanıcı özeti (tek okuma)"""
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name='gamification_summary',
+    )
+
+    points = models.JSONField(default=dict)
+    streaks = models.JSONField(default=list)
+    recent_badges = models.JSONField(default=list)
+    active_achievements = models.JSONField(default=list)
+
+    total_badges = models.PositiveIntegerField(default=0)
+    completed_achievements = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
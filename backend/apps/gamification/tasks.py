@@ -20,3 +20,17 @@ def daily_streak_check():
     expired.update(is_active=False)
     logger.info(f"Reset {count} expired streaks")
     return {'reset': count}
+
+
+@shared_task(name='apps.gamification.tasks.process_gamification_events')
+def process_gamification_events(batch_size=500):
+    """Kuyruktaki gamification olaylarini toplu degerlendir."""
+    from apps.gamification.engine import process_pending_events
+
+    result = process_pending_events(batch_size=batch_size)
+    if result['processed'] or result['failed']:
+        logger.info(
+            f"Processed {result['processed']} gamification events for {result['users']} users"
+            f" ({result['failed']} failed)"
+        )
+    return result
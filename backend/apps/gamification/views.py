@@ -8,8 +8,9 @@ from datetime import timedelta, date
 
 from .models import (
     Badge, UserBadge, UserStreak, UserPoints,
-    PointHistory, Achievement, UserAchievement
+    PointHistory, Achievement, UserAchievement, UserGamificationSummary
 )
+from .engine import rebuild_summary, summary_payload
 from .serializers import (
     BadgeSerializer, UserBadgeSerializer, UserStreakSerializer,
     UserPointsSerializer, PointHistorySerializer,
@@ -143,37 +144,10 @@ class GamificationSummaryViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
 
     def list(self, request):
-        """Tam özet"""
-        user = request.user
+        """Tam özet - kural motorunun tuttugu denormalize satirdan tek okuma"""
+        summary = UserGamificationSummary.objects.filter(user=request.user).first()
+        if summary is None:
+            summary = rebuild_summary(request.user.id)
 
-        # Puanlar
-        points, _ = UserPoints.objects.get_or_create(user=user)
-
-        # Seriler
-        streaks = UserStreak.objects.filter(user=user)
-
-        # Son kazanılan rozetler
-        recent_badges = UserBadge.objects.filter(user=user).order_by('-earned_at')[:5]
-
-        # Aktif başarımlar
-        active_achievements = UserAchievement.objects.filter(
-            user=user, is_completed=False
-        ).select_related('achievement')[:5]
-
-        summary = {
-            'points': UserPointsSerializer(points).data,
-            'streaks': UserStreakSerializer(streaks, many=True).data,
-            'recent_badges': UserBadgeSerializer(recent_badges, many=True, context={'request': request}).data,
-            'active_achievements': UserAchievementSerializer(
-                active_achievements, many=True, context={'request': request}
-            ).data,
-            'stats': {
-                'total_badges': UserBadge.objects.filter(user=user).count(),
-                'active_streaks': streaks.filter(last_activity_date=date.today()).count(),
-                'completed_achievements': UserAchievement.objects.filter(
-                    user=user, is_completed=True
-                ).count(),
-            }
-        }
-
-        return Response(summary)
+        lang = getattr(request, 'LANGUAGE_CODE', 'tr')
+        return Response(summary_payload(summary, lang))
@@ -4,11 +4,11 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.db.models import Avg, Count, Q
-from django.utils import timezone
-from django.http import HttpResponse
 from django_filters.rest_framework import DjangoFilterBackend
 
 from apps.accounts.permissions import IsPatient
+from apps.common import report_service
+from apps.gamification.engine import emit_event
 from .models import MigraineAttack, MigraineTrigger
 from .serializers import (
     MigraineAttackSerializer,
@@ -16,7 +16,6 @@ from .serializers import (
     MigraineTriggerSerializer,
     MigraineStatsSerializer,
 )
-from .reports import MigraineReportGenerator
 
 
 class MigraineAttackViewSet(viewsets.ModelViewSet):
@@ -41,7 +40,12 @@ class MigraineAttackViewSet(viewsets.ModelViewSet):
         return qs.prefetch_related('triggers_identified')
 
     def perform_create(self, serializer):
-        serializer.save(patient=self.request.user)
+        attack = serializer.save(patient=self.request.user)
+        emit_event(
+            self.request.user, 'diary_logged',
+            reason='Migren gunlugu kaydi',
+            attack_id=str(attack.id),
+        )
 
     @action(detail=False, methods=['get'])
     def stats(self, request):
@@ -132,28 +136,19 @@ class MigraineAttackViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def report(self, request):
-        """Generate PDF report for doctor visits."""
-        start_date = request.query_params.get('start_date')
-        end_date = request.query_params.get('end_date')
-
-        if start_date:
-            start_date = date.fromisoformat(start_date)
-        if end_date:
-            end_date = date.fromisoformat(end_date)
-
-        generator = MigraineReportGenerator(
-            user=request.user,
-            start_date=start_date,
-            end_date=end_date
-        )
-
-        pdf_content = generator.generate()
-
-        response = HttpResponse(pdf_content, content_type='application/pdf')
-        filename = f'migraine_report_{timezone.now().strftime("%Y%m%d")}.pdf'
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-
-        return response
+        """PDF report for doctor visits (cached per date range and data version)."""
+        try:
+            start_date = date.fromisoformat(request.query_params['start_date']) \
+                if request.query_params.get('start_date') else None
+            end_date = date.fromisoformat(request.query_params['end_date']) \
+                if request.query_params.get('end_date') else None
+        except ValueError:
+            return Response(
+                {'detail': 'Gecersiz tarih formati. YYYY-MM-DD kullanin.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return report_service.report_response(request, 'migraine', request.user, start_date, end_date)
 
 
 class MigraineTriggerViewSet(viewsets.ModelViewSet):
@@ -3,12 +3,15 @@ Icerik yayin akisi bildirim servisi.
 Durum gecislerinde otomatik bildirim gonderir.
 """
 import logging
+from django.db import transaction
 from django.db.models import Q
 from apps.notifications.models import Notification
 from apps.accounts.models import CustomUser, DoctorAuthor
 
 logger = logging.getLogger(__name__)
 
+BULK_BATCH_SIZE = 500
+
 TEMPLATES = {
     'article_submitted': {
         'title_tr': 'Makaleniz incelemeye gonderildi',
@@ -104,21 +107,29 @@ TEMPLATES = {
 }
 
 
-def _create_notification(recipient, template_key, context, action_url='', metadata=None):
+def _build_notification(recipient, template_key, context, action_url='', metadata=None):
+    """Sablondan kaydedilmemis Notification olustur."""
     template = TEMPLATES.get(template_key)
     if not template:
         return None
+    return Notification(
+        recipient=recipient,
+        notification_type=template['type'],
+        title_tr=template['title_tr'].format(**context),
+        title_en=template['title_en'].format(**context),
+        message_tr=template['message_tr'].format(**context),
+        message_en=template['message_en'].format(**context),
+        action_url=action_url,
+        metadata=metadata or {},
+    )
+
+
+def _create_notification(recipient, template_key, context, action_url='', metadata=None):
     try:
-        notification = Notification.objects.create(
-            recipient=recipient,
-            notification_type=template['type'],
-            title_tr=template['title_tr'].format(**context),
-            title_en=template['title_en'].format(**context),
-            message_tr=template['message_tr'].format(**context),
-            message_en=template['message_en'].format(**context),
-            action_url=action_url,
-            metadata=metadata or {},
-        )
+        notification = _build_notification(recipient, template_key, context, action_url, metadata)
+        if notification is None:
+            return None
+        notification.save()
         # Email gonder
         try:
             from apps.notifications.email_service import send_notification_email
@@ -142,55 +153,114 @@ def _get_editors():
     return editors
 
 
-def notify_article_transition(article, old_status, new_status, changed_by=None, feedback=''):
+def _cached_editors():
+    """Editor listesini ilk ihtiyacta bir kez cozen fonksiyon (toplu gecisler icin)."""
+    cache = []
+
+    def editors():
+        if not cache:
+            cache.append(_get_editors())
+        return cache[0]
+    return editors
+
+
+def _article_transition_messages(article, old_status, new_status, changed_by=None, feedback='',
+                                 editors=_get_editors):
+    """Makale gecisi icin gonderilecek bildirimler: (alici, sablon, ctx, url, meta)."""
     title = article.title_tr or article.title_en or 'Basliksiz'
     author_user = article.author
     ctx = {'title': title, 'feedback': feedback or '-', 'author_name': changed_by.get_full_name() if changed_by else ''}
     url = '/doctor/author'
     meta = {'article_id': str(article.id), 'old_status': old_status, 'new_status': new_status, 'content_type': 'article'}
+    messages = []
 
     if author_user and changed_by != author_user:
-        if new_status == 'published':
-            _create_notification(author_user, 'article_published', ctx, url, meta)
-        elif new_status == 'archived':
-            _create_notification(author_user, 'article_archived', ctx, url, meta)
-        elif new_status == 'approved':
-            _create_notification(author_user, 'article_approved', ctx, url, meta)
-        elif new_status == 'revision':
-            _create_notification(author_user, 'article_rejected', ctx, url, meta)
+        key = {
+            'published': 'article_published',
+            'archived': 'article_archived',
+            'approved': 'article_approved',
+            'revision': 'article_rejected',
+        }.get(new_status)
+        if key:
+            messages.append((author_user, key, ctx, url, meta))
 
     if old_status == 'draft' and new_status in ('review', 'published') and changed_by == author_user:
-        _create_notification(author_user, 'article_submitted', ctx, url, meta)
-        ctx['author_name'] = author_user.get_full_name() if author_user else 'Bilinmeyen'
-        for editor in _get_editors():
+        messages.append((author_user, 'article_submitted', ctx, url, meta))
+        editor_ctx = {**ctx, 'author_name': author_user.get_full_name() if author_user else 'Bilinmeyen'}
+        for editor in editors():
             if editor != author_user:
-                _create_notification(editor, 'editor_new_submission', ctx, '/doctor/editor/review-queue/', meta)
+                messages.append((editor, 'editor_new_submission', editor_ctx, '/doctor/editor/review-queue/', meta))
+    return messages
 
 
-def notify_news_transition(news_article, old_status, new_status, changed_by=None, feedback='', auto_published=False):
+def _news_transition_messages(news_article, old_status, new_status, changed_by=None, feedback='',
+                              auto_published=False, editors=_get_editors):
+    """Haber gecisi icin gonderilecek bildirimler: (alici, sablon, ctx, url, meta)."""
     title = news_article.title_tr or news_article.title_en or 'Basliksiz'
     author_user = news_article.author.doctor.user if news_article.author else None
     ctx = {'title': title, 'feedback': feedback or '-', 'author_name': changed_by.get_full_name() if changed_by else ''}
     url = '/doctor/author'
     meta = {'news_id': str(news_article.id), 'old_status': old_status, 'new_status': new_status, 'content_type': 'news'}
+    messages = []
 
     if author_user:
         if auto_published:
-            _create_notification(author_user, 'news_auto_published', ctx, url, meta)
-        elif new_status == 'published' and changed_by != author_user:
-            _create_notification(author_user, 'news_published', ctx, url, meta)
-        elif new_status == 'approved' and changed_by != author_user:
-            _create_notification(author_user, 'news_approved', ctx, url, meta)
-        elif new_status == 'revision' and changed_by != author_user:
-            _create_notification(author_user, 'news_rejected', ctx, url, meta)
+            messages.append((author_user, 'news_auto_published', ctx, url, meta))
+        elif changed_by != author_user:
+            key = {
+                'published': 'news_published',
+                'approved': 'news_approved',
+                'revision': 'news_rejected',
+            }.get(new_status)
+            if key:
+                messages.append((author_user, key, ctx, url, meta))
 
     if old_status in ('draft', 'revision') and new_status == 'review':
         if author_user:
-            _create_notification(author_user, 'news_submitted', ctx, url, meta)
-        ctx['author_name'] = author_user.get_full_name() if author_user else 'Bilinmeyen'
-        for editor in _get_editors():
+            messages.append((author_user, 'news_submitted', ctx, url, meta))
+        editor_ctx = {**ctx, 'author_name': author_user.get_full_name() if author_user else 'Bilinmeyen'}
+        for editor in editors():
             if editor != author_user:
-                _create_notification(editor, 'editor_new_submission', ctx, '/doctor/editor/review-queue/', meta)
+                messages.append((editor, 'editor_new_submission', editor_ctx, '/doctor/editor/review-queue/', meta))
+    return messages
+
+
+def notify_article_transition(article, old_status, new_status, changed_by=None, feedback=''):
+    for message in _article_transition_messages(article, old_status, new_status, changed_by, feedback):
+        _create_notification(*message)
+
+
+def notify_news_transition(news_article, old_status, new_status, changed_by=None, feedback='', auto_published=False):
+    for message in _news_transition_messages(
+        news_article, old_status, new_status, changed_by, feedback, auto_published,
+    ):
+        _create_notification(*message)
+
+
+def notify_transitions_bulk(content_type, items, new_status, changed_by=None, feedback=''):
+    """
+    Toplu gecis bildirimleri: editorler bir kez cozulur, bildirimler tek
+    bulk_create ile yazilir, emailler commit sonrasi tek Celery gorevine verilir.
+
+    content_type: 'article' | 'news'. items: [(icerik, eski_durum), ...]
+    """
+    from apps.notifications.tasks import send_notification_emails
+
+    build_messages = _article_transition_messages if content_type == 'article' else _news_transition_messages
+    editors = _cached_editors()
+    notifications = []
+    for obj, old_status in items:
+        for message in build_messages(obj, old_status, new_status, changed_by, feedback, editors=editors):
+            notification = _build_notification(*message)
+            if notification is not None:
+                notifications.append(notification)
+
+    if not notifications:
+        return 0
+    created = Notification.objects.bulk_create(notifications, batch_size=BULK_BATCH_SIZE)
+    ids = [str(n.id) for n in created]
+    transaction.on_commit(lambda: send_notification_emails.delay(ids))
+    return len(created)
 
 
 def notify_pipeline_result(article_or_news, pipeline_name, success, score=None, user=None):
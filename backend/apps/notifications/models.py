@@ -29,6 +29,7 @@ class Notification(TimeStampedModel):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['recipient', 'is_read', '-created_at']),
+            models.Index(fields=['recipient', '-created_at']),
         ]
 
     def __str__(self):
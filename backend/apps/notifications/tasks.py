@@ -28,3 +28,16 @@ def send_notification_email_async(user_id, notification_type, title, message, ac
     except Exception as e:
         logger.error(f"Email send failed: {e}")
         return {'sent': False, 'error': str(e)}
+
+
+@shared_task(name='apps.notifications.tasks.send_notification_emails')
+def send_notification_emails(notification_ids):
+    """Kaydedilmis bildirimlerin emaillerini toplu gonder (tercihler tek sorguda)."""
+    from apps.notifications.email_service import send_bulk_notification_emails
+    from apps.notifications.models import Notification
+
+    notifications = Notification.objects.filter(id__in=notification_ids).select_related(
+        'recipient__notification_preferences',
+    )
+    sent = send_bulk_notification_emails(notifications)
+    return {'sent': sent, 'total': len(notification_ids)}
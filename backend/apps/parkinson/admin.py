@@ -1,6 +1,6 @@
 from django.contrib import admin
 from .models import (
-    ParkinsonTrigger, ParkinsonSymptomEntry,
+    ParkinsonTrigger, ParkinsonSymptomEntry, ParkinsonDailySymptomSummary,
     ParkinsonMedication, ParkinsonMedicationSchedule, ParkinsonMedicationLog,
     HoehnYahrAssessment, SchwabEnglandAssessment, NMSQuestAssessment,
     NoseraMotorAssessment, NoseraDailyLivingAssessment,
@@ -23,6 +23,14 @@ class ParkinsonSymptomEntryAdmin(admin.ModelAdmin):
     date_hierarchy = 'recorded_at'
 
 
+@admin.register(ParkinsonDailySymptomSummary)
+class ParkinsonDailySymptomSummaryAdmin(admin.ModelAdmin):
+    list_display = ['patient', 'date', 'entry_count', 'avg_overall', 'freezing_count']
+    search_fields = ['patient__email']
+    date_hierarchy = 'date'
+    readonly_fields = ['updated_at']
+
+
 class ScheduleInline(admin.TabularInline):
     model = ParkinsonMedicationSchedule
     extra = 1
@@ -0,0 +1,172 @@
+"""
+Parkinson analitik katmani.
+
+- Semptom ozetleri (toplam, son 30 gun ortalamalari, ON/OFF suresi) tek
+  kosullu aggregate sorgusuyla hesaplanir.
+- Gunluk LED (dosage_mg * frequency_per_day * led_conversion_factor) SQL
+  ifadesi olarak annotate edilir; toplam LED ve ilac sayilari tek sorgu.
+- ParkinsonDailySymptomSummary: hasta + gun basina semptom ozeti. Kayit
+  yazildiginda/silindiginde yalnizca ilgili gun yeniden hesaplanir; uzun
+  donem grafikler ham ParkinsonSymptomEntry satirlarini okumaz.
+"""
+
+from datetime import timedelta
+
+from django.db.models import Avg, Count, DecimalField, ExpressionWrapper, F, Max, Q, Sum
+from django.utils import timezone
+
+from .models import ParkinsonDailySymptomSummary, ParkinsonMedication, ParkinsonSymptomEntry
+
+WINDOW_DAYS = 30
+# Bu kadar gunden uzun grafikler gunluk ozetten okunur
+CHART_RAW_MAX_DAYS = 31
+
+LED_EXPRESSION = ExpressionWrapper(
+    F('dosage_mg') * F('frequency_per_day') * F('led_conversion_factor'),
+    output_field=DecimalField(max_digits=14, decimal_places=4),
+)
+
+MOTOR_STATES = [choice for choice, _ in ParkinsonSymptomEntry.MotorState.choices]
+
+
+def _float(value):
+    return float(value) if value is not None else None
+
+
+def symptom_stats(user_id, now=None) -> dict:
+    """Semptom istatistikleri (tek sorgu)"""
+    now = now or timezone.now()
+    recent = Q(recorded_at__gte=now - timedelta(days=WINDOW_DAYS))
+
+    agg = ParkinsonSymptomEntry.objects.filter(patient_id=user_id).aggregate(
+        total_entries=Count('id'),
+        last_30_days=Count('id', filter=recent),
+        avg_overall_severity=Avg('overall_severity', filter=recent),
+        avg_tremor=Avg('tremor_severity', filter=recent),
+        avg_rigidity=Avg('rigidity_severity', filter=recent),
+        avg_bradykinesia=Avg('bradykinesia_severity', filter=recent),
+        avg_on_time=Avg('on_time_hours', filter=recent),
+        avg_off_time=Avg('off_time_hours', filter=recent),
+    )
+    for key in ('avg_on_time', 'avg_off_time'):
+        agg[key] = _float(agg[key])
+    return agg
+
+
+def medications_with_led(user_id):
+    """Ilaclar + SQL'de hesaplanmis gunluk LED (led_value)."""
+    return ParkinsonMedication.objects.filter(patient_id=user_id).annotate(led_value=LED_EXPRESSION)
+
+
+def medication_stats(user_id) -> dict:
+    """Ilac sayilari ve aktif ilaclarin toplam gunluk LED'i (tek sorgu)"""
+    active = Q(is_active=True)
+    agg = ParkinsonMedication.objects.filter(patient_id=user_id).aggregate(
+        total_medications=Count('id'),
+        active_medications=Count('id', filter=active),
+        total_daily_led=Sum(LED_EXPRESSION, filter=active),
+    )
+    agg['total_daily_led'] = float(agg['total_daily_led'] or 0)
+    return agg
+
+
+def led_summary(user_id) -> dict:
+    """Aktif ilaclarin LED dokumu (tek sorgu; toplam satirlardan)"""
+    meds = medications_with_led(user_id).filter(is_active=True).values(
+        'name', 'drug_class', 'dosage_mg', 'frequency_per_day', 'led_conversion_factor', 'led_value',
+    )
+    medications = [
+        {
+            'name': med['name'],
+            'drug_class': med['drug_class'],
+            'dosage_mg': float(med['dosage_mg']),
+            'frequency': med['frequency_per_day'],
+            'led_factor': float(med['led_conversion_factor']),
+            'daily_led': float(med['led_value']),
+        }
+        for med in meds
+    ]
+    return {
+        'total_daily_led': sum(med['daily_led'] for med in medications),
+        'medications': medications,
+    }
+
+
+# ------------------------------------------------------------
+# Gunluk ozet
+# ------------------------------------------------------------
+
+def refresh_daily_summary(patient_id, day):
+    """Bir gunun semptom ozetini yeniden hesapla (tek aggregate + upsert)."""
+    agg = ParkinsonSymptomEntry.objects.filter(patient_id=patient_id, recorded_at__date=day).aggregate(
+        entry_count=Count('id'),
+        avg_overall=Avg('overall_severity'),
+        max_overall=Max('overall_severity'),
+        avg_tremor=Avg('tremor_severity'),
+        avg_rigidity=Avg('rigidity_severity'),
+        avg_bradykinesia=Avg('bradykinesia_severity'),
+        avg_on_time=Avg('on_time_hours'),
+        avg_off_time=Avg('off_time_hours'),
+        freezing_count=Count('id', filter=Q(has_freezing=True)),
+        **{f'state_{state}': Count('id', filter=Q(motor_state=state)) for state in MOTOR_STATES},
+    )
+    if not agg['entry_count']:
+        ParkinsonDailySymptomSummary.objects.filter(patient_id=patient_id, date=day).delete()
+        return None
+
+    motor_states = {
+        state: agg.pop(f'state_{state}') for state in MOTOR_STATES
+    }
+    values = {
+        **agg,
+        'avg_on_time': _float(agg['avg_on_time']),
+        'avg_off_time': _float(agg['avg_off_time']),
+        'motor_states': {state: n for state, n in motor_states.items() if n},
+    }
+    summary = ParkinsonDailySymptomSummary(patient_id=patient_id, date=day, **values)
+    ParkinsonDailySymptomSummary.objects.bulk_create(
+        [summary],
+        update_conflicts=True,
+        unique_fields=['patient', 'date'],
+        update_fields=list(values) + ['updated_at'],
+    )
+    return summary
+
+
+def rebuild_daily_summaries(patient_id) -> int:
+    """Hastanin tum gunluk ozetlerini bastan olustur (ilk kurulum / onarim)."""
+    days = (
+        ParkinsonSymptomEntry.objects.filter(patient_id=patient_id)
+        .dates('recorded_at', 'day')
+    )
+    ParkinsonDailySymptomSummary.objects.filter(patient_id=patient_id).exclude(date__in=days).delete()
+    count = 0
+    for day in days:
+        refresh_daily_summary(patient_id, day)
+        count += 1
+    return count
+
+
+def _dominant_state(motor_states):
+    if not motor_states:
+        return ''
+    return max(motor_states.items(), key=lambda item: item[1])[0]
+
+
+def daily_chart(patient_id, since_date) -> list:
+    """Gunluk ozetlerden grafik noktalari (gun basina bir nokta)."""
+    rows = ParkinsonDailySymptomSummary.objects.filter(patient_id=patient_id, date__gte=since_date)
+    return [
+        {
+            'date': row.date.isoformat(),
+            'motor_state': _dominant_state(row.motor_states),
+            'tremor': row.avg_tremor,
+            'rigidity': row.avg_rigidity,
+            'bradykinesia': row.avg_bradykinesia,
+            'overall': row.avg_overall,
+            'on_time': row.avg_on_time,
+            'off_time': row.avg_off_time,
+            'entry_count': row.entry_count,
+        }
+        for row in rows
+    ]
@@ -5,3 +5,6 @@ class ParkinsonConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.parkinson'
     verbose_name = 'Parkinson'
+
+    def ready(self):
+        import apps.parkinson.signals  # noqa: F401
@@ -0,0 +1,22 @@
+"""Parkinson gunluk semptom ozetlerini mevcut kayitlardan yeniden olustur."""
+from django.core.management.base import BaseCommand
+
+from apps.parkinson.analytics import rebuild_daily_summaries
+from apps.parkinson.models import ParkinsonSymptomEntry
+
+
+class Command(BaseCommand):
+    help = 'Parkinson gunluk semptom ozetlerini (ParkinsonDailySymptomSummary) yeniden olusturur.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--patient', type=int, help='Yalnizca bu hasta id')
+
+    def handle(self, *args, **options):
+        patient_ids = ParkinsonSymptomEntry.objects.values_list('patient_id', flat=True).distinct()
+        if options['patient']:
+            patient_ids = [options['patient']]
+
+        total_days = 0
+        for patient_id in patient_ids:
+            total_days += rebuild_daily_summaries(patient_id)
+        self.stdout.write(self.style.SUCCESS(f'{total_days} gunluk ozet yeniden olusturuldu.'))
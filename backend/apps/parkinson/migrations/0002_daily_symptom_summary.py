@@ -0,0 +1,39 @@
+# Generated by Django 5.1.5 on 2026-10-19 19:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parkinson', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParkinsonDailySymptomSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('entry_count', models.PositiveSmallIntegerField(default=0)),
+                ('avg_overall', models.FloatField(blank=True, null=True)),
+                ('max_overall', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('avg_tremor', models.FloatField(blank=True, null=True)),
+                ('avg_rigidity', models.FloatField(blank=True, null=True)),
+                ('avg_bradykinesia', models.FloatField(blank=True, null=True)),
+                ('avg_on_time', models.FloatField(blank=True, null=True)),
+                ('avg_off_time', models.FloatField(blank=True, null=True)),
+                ('motor_states', models.JSONField(blank=True, default=dict)),
+                ('freezing_count', models.PositiveSmallIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('patient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='parkinson_daily_summaries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['date'],
+                'constraints': [models.UniqueConstraint(fields=('patient', 'date'), name='uniq_parkinson_daily_summary')],
+            },
+        ),
+    ]
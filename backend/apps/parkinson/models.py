@@ -146,6 +146,38 @@ class ParkinsonSymptomEntry(TimeStampedModel):
         return f"Parkinson symptoms {self.recorded_at.date()} - Severity: {self.overall_severity}"
 
 
+class ParkinsonDailySymptomSummary(models.Model):
+    """Hasta + gun basina semptom ozeti (uzun donem grafikler ham kayit okumaz)."""
+
+    patient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='parkinson_daily_summaries',
+    )
+    date = models.DateField()
+    entry_count = models.PositiveSmallIntegerField(default=0)
+    avg_overall = models.FloatField(null=True, blank=True)
+    max_overall = models.PositiveSmallIntegerField(null=True, blank=True)
+    avg_tremor = models.FloatField(null=True, blank=True)
+    avg_rigidity = models.FloatField(null=True, blank=True)
+    avg_bradykinesia = models.FloatField(null=True, blank=True)
+    avg_on_time = models.FloatField(null=True, blank=True)
+    avg_off_time = models.FloatField(null=True, blank=True)
+    # Motor durum -> kayit sayisi
+    motor_states = models.JSONField(default=dict, blank=True)
+    freezing_count = models.PositiveSmallIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['date']
+        constraints = [
+            models.UniqueConstraint(fields=['patient', 'date'], name='uniq_parkinson_daily_summary'),
+        ]
+
+    def __str__(self):
+        return f"{self.patient} - {self.date} ({self.entry_count} kayit)"
+
+
 # ============================================================
 # İLAÇ YÖNETİMİ (Parkinson'a özel)
 # ============================================================
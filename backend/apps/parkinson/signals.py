@@ -0,0 +1,35 @@
+"""
+Parkinson app signals.
+
+Semptom kaydi yazildiginda/silindiginde hastanin o gune ait
+ParkinsonDailySymptomSummary satirini yeniden hesaplar. Kaydin tarihi
+degistiyse eski gun de yenilenir.
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+
+def _day(instance):
+    return timezone.localdate(instance.recorded_at)
+
+
+@receiver(pre_save, sender='parkinson.ParkinsonSymptomEntry')
+def remember_previous_day(sender, instance, **kwargs):
+    if instance._state.adding:
+        return
+    previous = sender.objects.filter(pk=instance.pk).values_list('recorded_at', flat=True).first()
+    instance._previous_day = timezone.localdate(previous) if previous else None
+
+
+@receiver(post_save, sender='parkinson.ParkinsonSymptomEntry')
+@receiver(post_delete, sender='parkinson.ParkinsonSymptomEntry')
+def refresh_daily_summary(sender, instance, **kwargs):
+    from apps.parkinson.analytics import refresh_daily_summary
+
+    day = _day(instance)
+    refresh_daily_summary(instance.patient_id, day)
+    previous = getattr(instance, '_previous_day', None)
+    if previous and previous != day:
+        refresh_daily_summary(instance.patient_id, previous)
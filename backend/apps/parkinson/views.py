@@ -1,5 +1,4 @@
 from datetime import timedelta
-from django.db.models import Avg, Sum
 from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
@@ -7,6 +6,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from apps.accounts.permissions import IsPatient
+from apps.common.pagination import FieldProjectionMixin, KeysetPagination
+from . import analytics
 from .models import (
     ParkinsonTrigger, ParkinsonSymptomEntry,
     ParkinsonMedication, ParkinsonMedicationSchedule, ParkinsonMedicationLog,
@@ -37,10 +38,12 @@ class ParkinsonTriggerViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
 
-class ParkinsonSymptomViewSet(viewsets.ModelViewSet):
+class ParkinsonSymptomViewSet(FieldProjectionMixin, viewsets.ModelViewSet):
     """Parkinson semptom günlüğü CRUD."""
     serializer_class = ParkinsonSymptomEntrySerializer
     permission_classes = [IsPatient]
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-recorded_at', '-id')
 
     def get_queryset(self):
         return ParkinsonSymptomEntry.objects.filter(
@@ -52,10 +55,16 @@ class ParkinsonSymptomViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def chart(self, request):
-        """Son 30 günlük semptom trend verisi."""
+        """Semptom trend verisi; uzun araliklar gunluk ozetten (gun basina bir nokta)."""
         days = int(request.query_params.get('days', 30))
+        if days > analytics.CHART_RAW_MAX_DAYS:
+            since_date = timezone.localdate() - timedelta(days=days)
+            return Response(analytics.daily_chart(request.user.pk, since_date))
+
         since = timezone.now() - timedelta(days=days)
-        entries = self.get_queryset().filter(recorded_at__gte=since).order_by('recorded_at')
+        entries = ParkinsonSymptomEntry.objects.filter(
+            patient=request.user, recorded_at__gte=since,
+        ).order_by('recorded_at')
         data = []
         for e in entries:
             data.append({
@@ -72,20 +81,8 @@ class ParkinsonSymptomViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def stats(self, request):
-        """Özet istatistikler."""
-        qs = self.get_queryset()
-        last_30 = qs.filter(recorded_at__gte=timezone.now() - timedelta(days=30))
-
-        return Response({
-            'total_entries': qs.count(),
-            'last_30_days': last_30.count(),
-            'avg_overall_severity': last_30.aggregate(avg=Avg('overall_severity'))['avg'],
-            'avg_tremor': last_30.aggregate(avg=Avg('tremor_severity'))['avg'],
-            'avg_rigidity': last_30.aggregate(avg=Avg('rigidity_severity'))['avg'],
-            'avg_bradykinesia': last_30.aggregate(avg=Avg('bradykinesia_severity'))['avg'],
-            'avg_on_time': last_30.aggregate(avg=Avg('on_time_hours'))['avg'],
-            'avg_off_time': last_30.aggregate(avg=Avg('off_time_hours'))['avg'],
-        })
+        """Özet istatistikler (tek sorgu)."""
+        return Response(analytics.symptom_stats(request.user.pk))
 
 
 class ParkinsonMedicationViewSet(viewsets.ModelViewSet):
@@ -103,24 +100,8 @@ class ParkinsonMedicationViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def led_summary(self, request):
-        """Toplam günlük LED hesapla."""
-        active_meds = self.get_queryset().filter(is_active=True)
-        total_led = sum(med.daily_led for med in active_meds)
-        meds_detail = [
-            {
-                'name': med.name,
-                'drug_class': med.drug_class,
-                'dosage_mg': float(med.dosage_mg),
-                'frequency': med.frequency_per_day,
-                'led_factor': float(med.led_conversion_factor),
-                'daily_led': med.daily_led,
-            }
-            for med in active_meds
-        ]
-        return Response({
-            'total_daily_led': total_led,
-            'medications': meds_detail,
-        })
+        """Toplam günlük LED hesapla (LED SQL'de)."""
+        return Response(analytics.led_summary(request.user.pk))
 
 
 class MedicationScheduleViewSet(viewsets.ModelViewSet):
@@ -252,9 +233,9 @@ class ParkinsonDashboardView(viewsets.ViewSet):
         user = request.user
         now = timezone.now()
 
-        # İlaçlar
-        active_meds = ParkinsonMedication.objects.filter(patient=user, is_active=True)
-        total_led = sum(med.daily_led for med in active_meds)
+        # Sayilar, LED ve ON/OFF ortalamalari: tablo basina tek aggregate
+        medication_stats = analytics.medication_stats(user.pk)
+        symptom_stats = analytics.symptom_stats(user.pk, now)
 
         # Son değerlendirmeler
         latest_hy = HoehnYahrAssessment.objects.filter(patient=user).first()
@@ -266,16 +247,6 @@ class ParkinsonDashboardView(viewsets.ViewSet):
             recorded_at__gte=now - timedelta(days=7),
         ).prefetch_related('triggers_identified')[:10]
 
-        # ON/OFF ortalama (son 30 gün)
-        last_30 = ParkinsonSymptomEntry.objects.filter(
-            patient=user,
-            recorded_at__gte=now - timedelta(days=30),
-        )
-        avg_times = last_30.aggregate(
-            avg_on=Avg('on_time_hours'),
-            avg_off=Avg('off_time_hours'),
-        )
-
         # Bugünkü ilaç logları
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         upcoming_logs = ParkinsonMedicationLog.objects.filter(
@@ -291,14 +262,14 @@ class ParkinsonDashboardView(viewsets.ViewSet):
         ).order_by('visit_date').first()
 
         data = {
-            'total_symptoms': ParkinsonSymptomEntry.objects.filter(patient=user).count(),
-            'total_medications': ParkinsonMedication.objects.filter(patient=user).count(),
-            'active_medications': active_meds.count(),
-            'total_daily_led': total_led,
+            'total_symptoms': symptom_stats['total_entries'],
+            'total_medications': medication_stats['total_medications'],
+            'active_medications': medication_stats['active_medications'],
+            'total_daily_led': medication_stats['total_daily_led'],
             'latest_hoehn_yahr': HoehnYahrSerializer(latest_hy).data if latest_hy else None,
             'latest_schwab_england': SchwabEnglandSerializer(latest_se).data if latest_se else None,
-            'avg_on_time': avg_times['avg_on'],
-            'avg_off_time': avg_times['avg_off'],
+            'avg_on_time': symptom_stats['avg_on_time'],
+            'avg_off_time': symptom_stats['avg_off_time'],
             'recent_symptoms': ParkinsonSymptomEntrySerializer(recent_symptoms, many=True).data,
             'upcoming_medications': ParkinsonMedicationLogSerializer(upcoming_logs, many=True).data,
             'next_visit': ParkinsonVisitSerializer(next_visit).data if next_visit else None,
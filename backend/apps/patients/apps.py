@@ -5,3 +5,6 @@ class PatientsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.patients'
     label = 'patients'
+
+    def ready(self):
+        import apps.patients.signals  # noqa: F401
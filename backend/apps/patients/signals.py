@@ -0,0 +1,23 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import task_board
+from .models import PatientModule, TaskCompletion, TaskTemplate
+
+
+@receiver(post_save, sender=TaskCompletion)
+@receiver(post_delete, sender=TaskCompletion)
+@receiver(post_save, sender=PatientModule)
+@receiver(post_delete, sender=PatientModule)
+def invalidate_task_board(sender, instance, **kwargs):
+    patient_id = instance.patient_id
+    task_board.invalidate_patient(patient_id)
+    transaction.on_commit(lambda: task_board.invalidate_patient(patient_id))
+
+
+@receiver(post_save, sender=TaskTemplate)
+@receiver(post_delete, sender=TaskTemplate)
+def invalidate_task_boards(sender, instance, **kwargs):
+    task_board.invalidate_all()
+    transaction.on_commit(task_board.invalidate_all)
@@ -0,0 +1,104 @@
+"""
+Gunluk / haftalik gorev panosu.
+
+TaskTemplateViewSet.today ve week icin hastanin kayitli modullerindeki
+aktif gorevler, bu haftanin her gunu icin tamamlanma durumuyla birlikte
+tek sorguda okunur: gun basina bir Exists alt sorgusu (done_0..done_6,
+Pazartesi..Pazar). Her iki yanit ayni satirlardan uretilir.
+
+Pano hasta + gun basina (dil bazinda) cache'te tutulur. Tamamlama veya kayit
+(PatientModule) eklenip silinince hastanin panosu, TaskTemplate
+degisince tum panolar (surum anahtari) gecersiz olur.
+
+Kullanım:
+    board = task_board.get_board(request)
+    return Response(board['today'])
+"""
+
+import uuid
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+BOARD_CACHE_TIMEOUT = 60 * 60
+VERSION_KEY = 'task_board:version'
+TODAY_FREQUENCIES = ('daily', 'weekly')
+
+
+def _version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, uuid.uuid4().hex, None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def _cache_key(patient_id, day):
+    return f'task_board:{_version()}:{patient_id}:{day.isoformat()}'
+
+
+def _lang(request):
+    # TaskTemplateSerializer._get_lang ile ayni kural
+    return request.headers.get('Accept-Language', 'tr')[:2]
+
+
+def week_start(day):
+    return day - timedelta(days=day.weekday())
+
+
+def board_queryset(patient, day):
+    """Kayitli modullerin aktif gorevleri + haftanin gunleri icin done_N bayraklari."""
+    from .models import PatientModule, TaskCompletion, TaskTemplate
+
+    start = week_start(day)
+    enrolled = PatientModule.objects.filter(patient=patient, is_active=True).values('disease_module_id')
+    completions = TaskCompletion.objects.filter(patient=patient, task_template=OuterRef('pk'))
+    return TaskTemplate.objects.filter(disease_module_id__in=enrolled, is_active=True).annotate(**{
+        f'done_{offset}': Exists(completions.filter(completed_date=start + timedelta(days=offset)))
+        for offset in range(7)
+    })
+
+
+def build_board(request, day):
+    from .serializers import TaskTemplateSerializer
+
+    start = week_start(day)
+    templates = list(board_queryset(request.user, day))
+    data = TaskTemplateSerializer(templates, many=True, context={'request': request}).data
+
+    today, week = [], []
+    for template, item in zip(templates, data):
+        item = dict(item)
+        done = [
+            (start + timedelta(days=offset)).isoformat()
+            for offset in range(7) if getattr(template, f'done_{offset}')
+        ]
+        week.append({**item, 'completions_this_week': done})
+        if template.frequency in TODAY_FREQUENCIES:
+            today.append({**item, 'is_completed_today': day.isoformat() in done})
+    return {'today': today, 'week': week}
+
+
+def get_board(request, day=None):
+    """Hastanin gorev panosu: {'today': [...], 'week': [...]}."""
+    day = day or timezone.localdate()
+    key = _cache_key(request.user.pk, day)
+    lang = _lang(request)
+    boards = cache.get(key) or {}
+    if lang not in boards:
+        # Dil basina serilestirilmis pano; tek anahtar tek silme ile gecersiz olur
+        boards[lang] = build_board(request, day)
+        cache.set(key, boards, BOARD_CACHE_TIMEOUT)
+    return boards[lang]
+
+
+def invalidate_patient(patient_id):
+    """Hastanin bugunku panosunu sil."""
+    cache.delete(_cache_key(patient_id, timezone.localdate()))
+
+
+def invalidate_all():
+    """Tum panolari gecersiz kil (gorev sablonu degisti)."""
+    cache.set(VERSION_KEY, uuid.uuid4().hex, None)
@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
 from apps.accounts.permissions import IsPatient
+from . import task_board
 from .models import DiseaseModule, PatientModule, TaskTemplate, TaskCompletion
 from .serializers import (
     DiseaseModuleSerializer,
@@ -61,52 +62,13 @@ class TaskTemplateViewSet(viewsets.ReadOnlyModelViewSet):
 
     @action(detail=False, methods=['get'])
     def today(self, request):
-        """Get today's tasks (daily + weekly on correct day)."""
-        qs = self.get_queryset()
-        today_weekday = date.today().weekday()
-        daily = qs.filter(frequency='daily')
-        weekly = qs.filter(frequency='weekly')
-
-        completed_today = TaskCompletion.objects.filter(
-            patient=request.user,
-            completed_date=date.today(),
-        ).values_list('task_template_id', flat=True)
-
-        tasks = daily | weekly
-        serializer = self.get_serializer(tasks, many=True)
-        data = serializer.data
-        for item in data:
-            item['is_completed_today'] = item['id'] in list(map(str, completed_today))
-        return Response(data)
+        """Get today's tasks (daily + weekly) with completion status."""
+        return Response(task_board.get_board(request)['today'])
 
     @action(detail=False, methods=['get'])
     def week(self, request):
         """Get this week's tasks with completion status."""
-        today = date.today()
-        week_start = today - timedelta(days=today.weekday())
-        week_end = week_start + timedelta(days=6)
-
-        qs = self.get_queryset()
-        completions = TaskCompletion.objects.filter(
-            patient=request.user,
-            completed_date__gte=week_start,
-            completed_date__lte=week_end,
-        )
-
-        serializer = self.get_serializer(qs, many=True)
-        data = serializer.data
-
-        completion_map = {}
-        for c in completions:
-            key = str(c.task_template_id)
-            if key not in completion_map:
-                completion_map[key] = []
-            completion_map[key].append(str(c.completed_date))
-
-        for item in data:
-            item['completions_this_week'] = completion_map.get(item['id'], [])
-
-        return Response(data)
+        return Response(task_board.get_board(request)['week'])
 
 
 class TaskCompletionViewSet(viewsets.ModelViewSet):
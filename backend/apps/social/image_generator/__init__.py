@@ -3,6 +3,6 @@ Social Media Image Generator.
 Pillow tabanli gorsel sablonlari.
 """
 
-from .generator import SocialImageGenerator
+from .generator import SocialImageGenerator, render_batch
 
-__all__ = ['SocialImageGenerator']
+__all__ = ['SocialImageGenerator', 'render_batch']
@@ -6,6 +6,12 @@ SocialImageGenerator — Pillow tabanli gorsel sablon motoru.
   2. stat_card   — Istatistik gosterim (buyuk rakam + aciklama)
   3. quote_card  — Alinti / motivasyon kartlari
 
+Performans:
+  - Fontlar (face, size) anahtariyla LRU cache'te, font dosyasi bir kez aranir
+  - Arkaplan + ust accent ve brand bar platform basina bir kez cizilir
+  - Satir kirma kelime genisliklerini artimli toplar
+  - render_batch kampanya kartlarini process pool'da uretir
+
 Norosera brand:
   Primary: #1B4F72 (koyu mavi)
   Secondary: #00BCD4 (turkuaz)
@@ -18,6 +24,9 @@ import os
 import io
 import math
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -64,57 +73,111 @@ SIZES = {
 FONT_DIR = Path(__file__).parent / 'fonts'
 
 
+FALLBACK_FONT = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+
+BRAND_BAR_HEIGHT = 80
+TOP_ACCENT_HEIGHT = 8
+
+
+@lru_cache(maxsize=64)
 def _hex_to_rgb(hex_color: str) -> tuple:
     """Hex renk kodunu RGB tuple'a cevir."""
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
 
 
-def _get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
-    """Font yukle. Yoksa default kullan."""
+@lru_cache(maxsize=2)
+def _resolve_face(bold: bool) -> Optional[str]:
+    """Kullanilacak font dosyasini bir kez bul (dosya sistemi taramasi proses basina 1 kez)."""
     if bold:
         font_names = ['Inter-Bold.ttf', 'Roboto-Bold.ttf', 'NotoSans-Bold.ttf']
     else:
         font_names = ['Inter-Regular.ttf', 'Roboto-Regular.ttf', 'NotoSans-Regular.ttf']
 
-    for name in font_names:
-        font_path = FONT_DIR / name
+    candidates = [FONT_DIR / name for name in font_names] + [Path(FALLBACK_FONT)]
+    for font_path in candidates:
         if font_path.exists():
             try:
-                return ImageFont.truetype(str(font_path), size)
+                ImageFont.truetype(str(font_path), 12)
+                return str(font_path)
             except Exception:
                 continue
+    return None
+
 
-    # Fallback: Pillow default
-    try:
-        return ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', size)
-    except Exception:
+@lru_cache(maxsize=128)
+def _load_font(face: Optional[str], size: int):
+    """(face, size) anahtarli font cache'i."""
+    if face is None:
         return ImageFont.load_default()
+    return ImageFont.truetype(face, size)
+
+
+def _get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+    """Font yukle. Yoksa default kullan."""
+    return _load_font(_resolve_face(bold), size)
+
+
+@lru_cache(maxsize=8192)
+def _text_width(font, text: str) -> float:
+    """Metnin ilerleme genisligi (font nesneleri cache'li oldugundan anahtar sabittir)."""
+    return font.getlength(text)
 
 
 def _wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> list:
-    """Metni satir satir kes (word-wrap)."""
-    words = text.split()
+    """
+    Metni satir satir kes (word-wrap).
+    Kelime genislikleri bir kez olculur, satir genisligi artimli toplanir.
+    """
+    space = _text_width(font, ' ')
     lines = []
-    current = ''
-
-    for word in words:
-        test = f'{current} {word}'.strip()
-        bbox = font.getbbox(test)
-        text_width = bbox[2] - bbox[0]
-        if text_width <= max_width:
-            current = test
+    current = []
+    current_width = 0.0
+
+    for word in text.split():
+        word_width = _text_width(font, word)
+        candidate = current_width + space + word_width if current else word_width
+        if candidate <= max_width or not current:
+            current.append(word)
+            current_width = candidate
         else:
-            if current:
-                lines.append(current)
-            current = word
+            lines.append(' '.join(current))
+            current = [word]
+            current_width = word_width
 
     if current:
-        lines.append(current)
+        lines.append(' '.join(current))
 
     return lines or ['']
 
 
+@lru_cache(maxsize=32)
+def _base_canvas(size: tuple, bg_rgb: tuple, top_accent: bool) -> Image.Image:
+    """Platform boyutunda arkaplan (+ ust accent) — kopyalanarak kullanilir."""
+    img = Image.new('RGB', size, bg_rgb)
+    if top_accent:
+        ImageDraw.Draw(img).rectangle(
+            [0, 0, size[0], TOP_ACCENT_HEIGHT], fill=_hex_to_rgb(COLORS['secondary']),
+        )
+    return img
+
+
+@lru_cache(maxsize=16)
+def _brand_bar(width: int, inverted: bool) -> Image.Image:
+    """Onceden cizilmis NOROSERA bar'i (inverted: beyaz zemin, koyu yazi)."""
+    bar_bg = COLORS['bg_white'] if inverted else COLORS['primary']
+    text_color = COLORS['primary'] if inverted else COLORS['text_light']
+
+    bar = Image.new('RGB', (width, BRAND_BAR_HEIGHT), _hex_to_rgb(bar_bg))
+    draw = ImageDraw.Draw(bar)
+    font = _get_font(28, bold=True)
+    text = 'NOROSERA'
+    bbox = font.getbbox(text)
+    tw = bbox[2] - bbox[0]
+    draw.text(((width - tw) // 2, 25), text, fill=_hex_to_rgb(text_color), font=font)
+    return bar
+
+
 def _draw_rounded_rect(draw: ImageDraw.Draw, xy: tuple, radius: int, fill: str):
     """Yuvarlatilmis dikdortgen ciz."""
     x0, y0, x1, y1 = xy
@@ -145,37 +208,21 @@ class SocialImageGenerator:
         self.colors = COLORS
         self.sizes = SIZES
 
-    def _create_canvas(self, platform: str, bg_color: str = None) -> tuple:
-        """Platform'a gore bos canvas olustur."""
+    def _create_canvas(self, platform: str, bg_color: str = None, top_accent: bool = False) -> tuple:
+        """Platform'a gore canvas olustur (cache'li arkaplanin kopyasi)."""
         size_key = f'{platform}_square'
         if size_key not in self.sizes:
             size_key = 'instagram_square'
 
         width, height = self.sizes[size_key]
         bg = _hex_to_rgb(bg_color or self.colors['bg_light'])
-        img = Image.new('RGB', (width, height), bg)
+        img = _base_canvas((width, height), bg, top_accent).copy()
         draw = ImageDraw.Draw(img)
         return img, draw, width, height
 
-    def _add_brand_bar(self, draw: ImageDraw.Draw, width: int, height: int):
-        """Alt kisma Norosera brand bar ekle."""
-        bar_h = 80
-        y_start = height - bar_h
-
-        # Brand bar arkaplan
-        draw.rectangle([0, y_start, width, height], fill=_hex_to_rgb(self.colors['primary']))
-
-        # Logo text
-        font = _get_font(28, bold=True)
-        text = 'NOROSERA'
-        bbox = font.getbbox(text)
-        tw = bbox[2] - bbox[0]
-        x = (width - tw) // 2
-        draw.text((x, y_start + 25), text, fill=_hex_to_rgb(self.colors['text_light']), font=font)
-
-    def _add_top_accent(self, draw: ImageDraw.Draw, width: int):
-        """Ust kisma ince accent cizgi."""
-        draw.rectangle([0, 0, width, 8], fill=_hex_to_rgb(self.colors['secondary']))
+    def _add_brand_bar(self, img: Image.Image, width: int, height: int, inverted: bool = False):
+        """Alt kisma onceden cizilmis Norosera brand bar'ini yapistir."""
+        img.paste(_brand_bar(width, inverted), (0, height - BRAND_BAR_HEIGHT))
 
     def _to_bytes(self, img: Image.Image, format: str = 'PNG') -> bytes:
         """Image'i bytes olarak dondur."""
@@ -214,12 +261,9 @@ class SocialImageGenerator:
         Returns:
             PNG bytes
         """
-        img, draw, w, h = self._create_canvas(platform, bg_color)
+        img, draw, w, h = self._create_canvas(platform, bg_color, top_accent=True)
         accent = accent_color or self.colors['secondary']
 
-        # Ust accent
-        self._add_top_accent(draw, w)
-
         # Baslik alani arkaplan
         header_h = 220
         draw.rectangle([0, 8, w, header_h], fill=_hex_to_rgb(self.colors['primary']))
@@ -251,8 +295,7 @@ class SocialImageGenerator:
 
             # Numara
             num = str(i + 1)
-            num_bbox = number_font.getbbox(num)
-            num_w = num_bbox[2] - num_bbox[0]
+            num_w = _text_width(number_font, num)
             draw.text(
                 (circle_x - num_w // 2, y),
                 num,
@@ -269,7 +312,7 @@ class SocialImageGenerator:
             y += 20
 
         # Brand bar
-        self._add_brand_bar(draw, w, h)
+        self._add_brand_bar(img, w, h)
 
         return self._to_bytes(img)
 
@@ -303,12 +346,9 @@ class SocialImageGenerator:
         Returns:
             PNG bytes
         """
-        img, draw, w, h = self._create_canvas(platform, bg_color)
+        img, draw, w, h = self._create_canvas(platform, bg_color, top_accent=True)
         s_color = stat_color or self.colors['secondary']
 
-        # Ust accent
-        self._add_top_accent(draw, w)
-
         # Buyuk deger
         stat_font = _get_font(160, bold=True)
         stat_bbox = stat_font.getbbox(stat_value)
@@ -331,8 +371,7 @@ class SocialImageGenerator:
         label_lines = _wrap_text(stat_label, label_font, w - 160)
         y = line_y + 30
         for line in label_lines[:2]:
-            lbbox = label_font.getbbox(line)
-            lw = lbbox[2] - lbbox[0]
+            lw = _text_width(label_font, line)
             draw.text(((w - lw) // 2, y), line, fill=_hex_to_rgb(self.colors['text_dark']), font=label_font)
             y += 52
 
@@ -342,8 +381,7 @@ class SocialImageGenerator:
             desc_lines = _wrap_text(description, desc_font, w - 160)
             y += 20
             for line in desc_lines[:3]:
-                dbbox = desc_font.getbbox(line)
-                dw = dbbox[2] - dbbox[0]
+                dw = _text_width(desc_font, line)
                 draw.text(((w - dw) // 2, y), line, fill=_hex_to_rgb(self.colors['text_muted']), font=desc_font)
                 y += 36
 
@@ -353,7 +391,7 @@ class SocialImageGenerator:
             draw.text((60, h - 110), f'Kaynak: {source}', fill=_hex_to_rgb(self.colors['text_muted']), font=src_font)
 
         # Brand bar
-        self._add_brand_bar(draw, w, h)
+        self._add_brand_bar(img, w, h)
 
         return self._to_bytes(img)
 
@@ -421,16 +459,7 @@ class SocialImageGenerator:
         draw.rectangle([60, h - 120, w - 60, h - 116], fill=_hex_to_rgb(self.colors['secondary']))
 
         # Brand bar (koyu arka plan icin beyaz)
-        bar_h = 80
-        y_start = h - bar_h
-        draw.rectangle([0, y_start, w, h], fill=_hex_to_rgb(self.colors['bg_white']))
-
-        font = _get_font(28, bold=True)
-        text = 'NOROSERA'
-        bbox = font.getbbox(text)
-        tw = bbox[2] - bbox[0]
-        x = (w - tw) // 2
-        draw.text((x, y_start + 25), text, fill=_hex_to_rgb(self.colors['primary']), font=font)
+        self._add_brand_bar(img, w, h, inverted=True)
 
         return self._to_bytes(img)
 
@@ -505,3 +534,42 @@ class SocialImageGenerator:
                 'required_fields': ['quote'],
             },
         ]
+
+
+# ============================================================================
+# Toplu uretim (kampanya kartlari)
+# ============================================================================
+
+# Bu sayinin altindaki isler icin proses baslatma maliyeti kazanci asar
+MIN_PARALLEL_BATCH = 4
+
+_worker_generator = None
+
+
+def _render_brief(args: tuple) -> Optional[bytes]:
+    """Process pool isci fonksiyonu; font/arkaplan cache'i isci basina bir kez isinir."""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = SocialImageGenerator()
+    brief, platform = args
+    return _worker_generator.generate_from_brief(brief, platform=platform)
+
+
+def render_batch(briefs: list, platform: str = 'instagram', max_workers: Optional[int] = None) -> list:
+    """
+    Bir kampanyanin kartlarini toplu uret (sira korunur, hatali kart None).
+
+    Kucuk partiler ve daemon prosesler (Celery prefork iscileri alt proses
+    acamaz) ayni proseste uretilir; digerleri process pool'a dagitilir.
+    """
+    jobs = [(brief, platform) for brief in briefs]
+    if (
+        len(jobs) < MIN_PARALLEL_BATCH
+        or max_workers == 1
+        or multiprocessing.current_process().daemon
+    ):
+        return [_render_brief(job) for job in jobs]
+
+    workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_render_brief, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
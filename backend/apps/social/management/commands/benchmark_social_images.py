@@ -0,0 +1,86 @@
+"""
+Sosyal medya gorsel sablonlarinin uretim hizini olc (kart/saniye, sablon basina).
+
+Kullanım: python3 manage.py benchmark_social_images [--cards 50] [--platform instagram] [--workers 0]
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+SAMPLE_BRIEFS = {
+    'info_card': {
+        'template_type': 'info_card',
+        'title': 'Migren Tetikleyicileri ve Onleme Yollari',
+        'subtitle': 'Gunluk hayatta dikkat edilmesi gerekenler',
+        'items': [
+            'Duzensiz uyku ve uykusuzluk ataklari tetikleyebilir',
+            'Gun boyunca yeterli su icmeye ozen gosterin',
+            'Stres yonetimi icin nefes egzersizleri deneyin',
+            'Ogun atlamayin, kan sekerinizi dengede tutun',
+            'Parlak isik ve yuksek sesten korunun',
+        ],
+    },
+    'stat_card': {
+        'template_type': 'stat_card',
+        'stat_value': '%80',
+        'stat_label': 'Migren hastalarinin tetikleyicisi stres',
+        'description': 'Duzenli egzersiz ve uyku hijyeni atak sikligini belirgin sekilde azaltabilir.',
+        'source': 'American Migraine Foundation',
+    },
+    'quote_card': {
+        'template_type': 'quote_card',
+        'quote': 'Saglik her sey degildir ama saglik olmadan her sey hictir; kucuk aliskanliklar buyuk farklar yaratir.',
+        'author': 'Arthur Schopenhauer',
+    },
+}
+
+
+class Command(BaseCommand):
+    help = 'Sosyal gorsel sablon benchmark (kart/saniye)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--cards', type=int, default=50,
+            help='Sablon basina uretilecek kart sayisi (varsayılan: 50)',
+        )
+        parser.add_argument(
+            '--platform', type=str, default='instagram',
+            choices=['instagram', 'linkedin'],
+        )
+        parser.add_argument(
+            '--workers', type=int, default=0,
+            help='render_batch proses sayisi (0: sadece seri olcum)',
+        )
+
+    def handle(self, *args, **options):
+        from apps.social.image_generator import SocialImageGenerator, render_batch
+
+        cards = options['cards']
+        platform = options['platform']
+        gen = SocialImageGenerator()
+
+        # Cache'leri isit (ilk kart font yukleme ve arkaplan cizimini icerir)
+        for brief in SAMPLE_BRIEFS.values():
+            gen.generate_from_brief(brief, platform=platform)
+
+        self.stdout.write(f'\nPlatform: {platform}, sablon basina {cards} kart\n')
+        for name, brief in SAMPLE_BRIEFS.items():
+            start = time.perf_counter()
+            for _ in range(cards):
+                gen.generate_from_brief(brief, platform=platform)
+            elapsed = time.perf_counter() - start
+            self.stdout.write(
+                f'  {name:<11} seri      : {cards / elapsed:8.1f} kart/s '
+                f'({elapsed / cards * 1000:.1f} ms/kart)'
+            )
+
+            if options['workers'] > 0:
+                start = time.perf_counter()
+                render_batch([brief] * cards, platform=platform, max_workers=options['workers'])
+                elapsed = time.perf_counter() - start
+                self.stdout.write(
+                    f"  {name:<11} {options['workers']} proses: {cards / elapsed:8.1f} kart/s"
+                )
+
+        self.stdout.write(self.style.SUCCESS('\nBenchmark tamamlandi.'))
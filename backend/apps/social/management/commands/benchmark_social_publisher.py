@@ -0,0 +1,99 @@
+"""
+Sosyal post yayin hattinin hizini olc (post/saniye), FakePublisher ile.
+
+Gecici hesap ve postlar bir transaction icinde olusturulur ve olcum sonunda
+geri alinir; veritabaninda kalici kayit birakmaz.
+
+Kullanım: python3 manage.py benchmark_social_publisher [--posts 200] [--accounts 8] [--latency 0.05] [--workers 4]
+"""
+
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+User = get_user_model()
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Sosyal post yayin benchmark (post/saniye, FakePublisher)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=200, help='Toplam post sayisi (varsayılan: 200)')
+        parser.add_argument('--accounts', type=int, default=8, help='Hesap sayisi (varsayılan: 8)')
+        parser.add_argument(
+            '--latency', type=float, default=0.05,
+            help='Sahte API cagrisi gecikmesi, saniye (varsayılan: 0.05)',
+        )
+        parser.add_argument('--workers', type=int, default=4, help='Paralel hesap sayisi (varsayılan: 4)')
+
+    def handle(self, *args, **options):
+        from apps.social.models import SocialAccount, SocialPost
+        from apps.social.publishers import FakePublisher
+        from apps.social.publishing import ACCOUNT_RATE_LIMITS, publish_due_posts
+
+        user = User.objects.filter(role='doctor').first() or User.objects.filter(is_superuser=True).first()
+        if not user:
+            self.stdout.write(self.style.ERROR('No doctor or superuser found. Create one first.'))
+            return
+
+        accounts_n = max(1, options['accounts'])
+        daily_limit = ACCOUNT_RATE_LIMITS['linkedin'][0]
+        posts_n = min(options['posts'], accounts_n * daily_limit)
+        if posts_n < options['posts']:
+            self.stdout.write(self.style.WARNING(
+                f'Hesap basina gunluk limit {daily_limit}; post sayisi {posts_n} ile sinirlandi.'
+            ))
+
+        def factory(account):
+            return FakePublisher(account, latency=options['latency'])
+
+        def run(workers):
+            try:
+                with transaction.atomic():
+                    now = timezone.now()
+                    accounts = SocialAccount.objects.bulk_create([
+                        SocialAccount(
+                            platform='linkedin', account_name=f'bench-{i}',
+                            account_id=f'bench-{i}-{now.timestamp()}', access_token='x',
+                            connected_by=user,
+                        )
+                        for i in range(accounts_n)
+                    ])
+                    SocialPost.objects.bulk_create([
+                        SocialPost(
+                            platform='linkedin', post_format='text_only', caption_tr=f'Benchmark {i}',
+                            status='scheduled', scheduled_at=now - timedelta(minutes=1),
+                            social_account=accounts[i % accounts_n], created_by=user,
+                        )
+                        for i in range(posts_n)
+                    ])
+
+                    start = time.perf_counter()
+                    summary = publish_due_posts(
+                        publisher_factory=factory, limit=posts_n,
+                        max_workers=workers, min_interval=0,
+                    )
+                    elapsed = time.perf_counter() - start
+                    raise _Rollback((summary, elapsed))
+            except _Rollback as done:
+                return done.args[0]
+
+        self.stdout.write(
+            f'\n{posts_n} post, {accounts_n} hesap, API gecikmesi {options["latency"] * 1000:.0f} ms\n'
+        )
+        for workers in sorted({1, max(1, options['workers'])}):
+            summary, elapsed = run(workers)
+            self.stdout.write(
+                f'  {workers} worker: {summary.published / elapsed:8.1f} post/s '
+                f'({summary.published} yayinlandi, {elapsed:.2f} s)'
+            )
+
+        self.stdout.write(self.style.SUCCESS('\nBenchmark tamamlandi.'))
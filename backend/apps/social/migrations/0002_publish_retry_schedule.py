@@ -0,0 +1,29 @@
+# Generated by Django 5.1.5 on 2026-10-19 18:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='socialpost',
+            name='next_attempt_at',
+            field=models.DateTimeField(blank=True, help_text='Otomatik yeniden deneme zamani', null=True),
+        ),
+        migrations.AddField(
+            model_name='socialpost',
+            name='publish_attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='socialpost',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='social_soci_status_206406_idx'),
+        ),
+    ]
@@ -175,6 +175,8 @@ class SocialPost(TimeStampedModel):
     platform_post_id = models.CharField(max_length=200, blank=True, default='', help_text='Instagram/LinkedIn post ID')
     platform_url = models.URLField(blank=True, default='', help_text='Yayinlanan post URL')
     publish_error = models.TextField(blank=True, default='')
+    publish_attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(null=True, blank=True, help_text='Otomatik yeniden deneme zamani')
 
     # Duzenleme
     edited_caption = models.TextField(blank=True, default='', help_text='Admin tarafindan duzenlenmis metin')
@@ -193,6 +195,7 @@ class SocialPost(TimeStampedModel):
         indexes = [
             models.Index(fields=['status', 'scheduled_at']),
             models.Index(fields=['platform', 'status']),
+            models.Index(fields=['status', 'next_attempt_at']),
         ]
 
     def __str__(self):
@@ -4,6 +4,7 @@ Platform'a gore dogru publisher instance'i dondurur.
 """
 
 from .base import BasePublisher, PublishResult
+from .fake_publisher import FakePublisher
 from .instagram_publisher import InstagramPublisher
 from .linkedin_publisher import LinkedInPublisher
 
@@ -27,6 +28,7 @@ def get_publisher(social_account) -> BasePublisher:
 __all__ = [
     'BasePublisher',
     'PublishResult',
+    'FakePublisher',
     'InstagramPublisher',
     'LinkedInPublisher',
     'get_publisher',
@@ -0,0 +1,54 @@
+"""
+Fake Publisher — Ag erisimi olmadan yayin simulasyonu.
+
+Benchmark ve testler icin: sabit gecikme ile platform API cagrisini taklit
+eder, istenirse belirli oranda hata dondurur. Platform haritasina kayitli
+degildir; publish_due_posts(publisher_factory=FakePublisher) ile verilir.
+"""
+
+import itertools
+import threading
+import time
+
+from .base import BasePublisher, PublishResult
+
+
+class FakePublisher(BasePublisher):
+    """Gecikme ve hata orani ayarlanabilir sahte yayinci."""
+
+    platform = 'fake'
+    _ids = itertools.count(1)
+    _lock = threading.Lock()
+
+    def __init__(self, social_account, latency: float = 0.0, fail_every: int = 0):
+        super().__init__(social_account)
+        self.latency = latency
+        self.fail_every = fail_every
+        self.calls = 0
+
+    def _result(self) -> PublishResult:
+        if self.latency:
+            time.sleep(self.latency)
+        self.calls += 1
+        if self.fail_every and self.calls % self.fail_every == 0:
+            return PublishResult(success=False, error='Fake hata')
+        with self._lock:
+            post_id = f'fake_{next(self._ids)}'
+        return PublishResult(
+            success=True,
+            platform_post_id=post_id,
+            platform_url=f'https://example.com/p/{post_id}',
+            response_data={'id': post_id},
+        )
+
+    def publish_single_image(self, image_url: str, caption: str) -> PublishResult:
+        return self._result()
+
+    def publish_carousel(self, image_urls: list, caption: str) -> PublishResult:
+        return self._result()
+
+    def publish_text(self, text: str) -> PublishResult:
+        return self._result()
+
+    def validate_token(self) -> bool:
+        return True
@@ -0,0 +1,332 @@
+"""
+Zamanlanmis sosyal medya postlarinin eszamanli yayinlanmasi.
+
+Akis:
+1. claim_due_posts  — Zamani gelen postlar `SELECT ... FOR UPDATE SKIP LOCKED`
+   ile kilitlenip tek UPDATE ile 'publishing' durumuna alinir. Ayni anda
+   calisan iki worker ayni postu asla talep etmez.
+2. publish_claimed  — Talep edilen postlar hesaba gore gruplanir; hesaplar
+   paralel, bir hesabin postlari sirayla ve aralarinda minimum bekleme ile
+   yayinlanir (platform rate limit'leri hesap bazlidir).
+3. Sonuclar toplu yazilir: postlar bulk_update, PublishLog bulk_create,
+   hesap sayaclari hesap basina tek F() UPDATE.
+
+Elle "hemen yayinla" (claim_post) ayni kosullu UPDATE ile talep eder;
+worker'in talep ettigi ('publishing') veya yayinlanmis post ikinci kez
+yayinlanmaz.
+
+Basarisiz postlar 'failed' durumunda next_attempt_at ile ussel geri
+cekilmeye (60s, 120s, 240s ...) alinir ve sonraki dongude tekrar talep
+edilir; ayri bir polling task'ina gerek yoktur.
+
+Not: SQLite SKIP LOCKED desteklemez, Django orada ifadeyi atlar (testler).
+"""
+
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+CLAIM_BATCH_SIZE = 100
+PUBLISH_WINDOW = timedelta(minutes=5)
+STALE_CLAIM_AFTER = timedelta(minutes=30)
+MAX_PUBLISH_ATTEMPTS = 4
+RETRY_BASE_SECONDS = 60
+MAX_WORKERS = 4
+
+# Platform bazli hesap limitleri: (24 saatte max yayin, ardisik yayinlar arasi saniye)
+ACCOUNT_RATE_LIMITS = {
+    'instagram': (25, 2.0),
+    'linkedin': (100, 1.0),
+}
+DEFAULT_RATE_LIMIT = (25, 2.0)
+
+
+@dataclass
+class PublishOutcome:
+    """Tek bir yayin denemesinin sonucu (DB yazimi oncesi)."""
+    post: object
+    success: bool
+    platform_post_id: str = ''
+    platform_url: str = ''
+    error: str = ''
+    response_data: dict = field(default_factory=dict)
+    retryable: bool = True
+    finished_at: object = None
+
+
+@dataclass
+class PublishSummary:
+    published: int = 0
+    failed: int = 0
+    retry_scheduled: int = 0
+    claimed: int = 0
+
+    def as_dict(self):
+        return {
+            'published': self.published,
+            'failed': self.failed,
+            'retry_scheduled': self.retry_scheduled,
+            'claimed': self.claimed,
+        }
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """attempts. basarisiz denemeden sonra beklenecek sure."""
+    return timedelta(seconds=RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0))
+
+
+def _rate_limit(platform):
+    return ACCOUNT_RATE_LIMITS.get(platform, DEFAULT_RATE_LIMIT)
+
+
+def _due_filter(now):
+    return (
+        Q(status='scheduled', scheduled_at__lte=now + PUBLISH_WINDOW)
+        | Q(status='failed', next_attempt_at__lte=now)
+        # Worker cokmusse takili kalan talepleri geri al
+        | Q(status='publishing', updated_at__lt=now - STALE_CLAIM_AFTER)
+    )
+
+
+def _remaining_quota(account_ids, now):
+    """Hesap basina son 24 saatte kalan yayin hakki (tek aggregate sorgu)."""
+    from apps.social.models import SocialAccount, SocialPost
+
+    used = dict(
+        SocialPost.objects.filter(
+            social_account_id__in=account_ids,
+            status='published',
+            published_at__gte=now - timedelta(hours=24),
+        ).values_list('social_account_id').annotate(n=Count('id'))
+    )
+    platforms = dict(
+        SocialAccount.objects.filter(id__in=account_ids).values_list('id', 'platform')
+    )
+    return {
+        account_id: _rate_limit(platforms.get(account_id))[0] - used.get(account_id, 0)
+        for account_id in account_ids
+    }
+
+
+def claim_due_posts(now=None, limit=CLAIM_BATCH_SIZE, post_ids=None) -> list:
+    """
+    Zamani gelen postlari kilitleyip 'publishing' olarak isaretle, ID listesini dondur.
+
+    Kilitli satirlar (baska worker'in talebi) atlanir. Gunluk kotasi dolan
+    hesaplarin postlari talep edilmez, durumlari degismeden sonraki donguye kalir.
+    """
+    from apps.social.models import SocialPost
+
+    now = now or timezone.now()
+    qs = SocialPost.objects.filter(_due_filter(now), social_account__isnull=False)
+    if post_ids is not None:
+        qs = qs.filter(id__in=post_ids)
+
+    with transaction.atomic():
+        candidates = list(
+            qs.select_for_update(skip_locked=True)
+            .order_by(F('scheduled_at').asc(nulls_last=True), 'created_at')
+            .values_list('id', 'social_account_id')[:limit]
+        )
+        if not candidates:
+            return []
+
+        quota = _remaining_quota({account_id for _, account_id in candidates}, now)
+        claimed = []
+        for post_id, account_id in candidates:
+            if quota[account_id] > 0:
+                quota[account_id] -= 1
+                claimed.append(post_id)
+
+        if claimed:
+            SocialPost.objects.filter(id__in=claimed).update(
+                status='publishing', next_attempt_at=None, updated_at=now,
+            )
+    return claimed
+
+
+def claim_post(post_id, account, now=None) -> bool:
+    """
+    Tek postu elle yayin icin talep et (kosullu UPDATE). Post zaten
+    talep edilmis ya da yayinlanmissa False; basarida otomatik tekrar
+    deneme (next_attempt_at) iptal edilir.
+    """
+    from apps.social.models import SocialPost
+
+    return bool(
+        SocialPost.objects.filter(id=post_id)
+        .exclude(status__in=('publishing', 'published'))
+        .update(
+            status='publishing', social_account=account,
+            next_attempt_at=None, updated_at=now or timezone.now(),
+        )
+    )
+
+
+def _publish_account_posts(account, posts, publisher_factory, min_interval):
+    """Tek hesabin postlarini sirayla yayinla (worker thread'de, DB erisimi yok)."""
+    outcomes = []
+
+    if not account.is_token_valid:
+        for post in posts:
+            outcomes.append(PublishOutcome(
+                post=post, success=False, retryable=False,
+                error=f'Token suresi dolmus: {account.account_name}',
+                finished_at=timezone.now(),
+            ))
+        return outcomes
+
+    try:
+        publisher = publisher_factory(account)
+    except Exception as e:
+        logger.exception(f"Publisher olusturulamadi: account={account.id}")
+        return [
+            PublishOutcome(post=post, success=False, retryable=False, error=str(e),
+                           finished_at=timezone.now())
+            for post in posts
+        ]
+
+    last_call = None
+    for post in posts:
+        if last_call is not None and min_interval:
+            wait = min_interval - (time.monotonic() - last_call)
+            if wait > 0:
+                time.sleep(wait)
+        last_call = time.monotonic()
+
+        try:
+            result = publisher.publish(post)
+            outcomes.append(PublishOutcome(
+                post=post,
+                success=result.success,
+                platform_post_id=result.platform_post_id,
+                platform_url=result.platform_url,
+                error=result.error,
+                response_data=result.response_data or {},
+                finished_at=timezone.now(),
+            ))
+        except Exception as e:
+            logger.exception(f"Post publish hatasi: post={post.id}")
+            outcomes.append(PublishOutcome(
+                post=post, success=False, error=str(e), finished_at=timezone.now(),
+            ))
+    return outcomes
+
+
+def _apply_outcomes(outcomes, summary):
+    """Yayin sonuclarini toplu yaz: post durumlari, loglar, hesap sayaclari."""
+    from apps.social.models import PublishLog, SocialAccount, SocialPost
+
+    posts, logs = [], []
+    account_stats = defaultdict(lambda: [0, None])  # account_id -> [yayin sayisi, son zaman]
+
+    for outcome in outcomes:
+        post = outcome.post
+        action = 'retry' if post.publish_attempts else 'publish'
+        post.publish_attempts += 1
+
+        if outcome.success:
+            post.status = 'published'
+            post.published_at = outcome.finished_at
+            post.platform_post_id = outcome.platform_post_id
+            post.platform_url = outcome.platform_url
+            post.publish_error = ''
+            post.next_attempt_at = None
+            stats = account_stats[post.social_account_id]
+            stats[0] += 1
+            if stats[1] is None or outcome.finished_at > stats[1]:
+                stats[1] = outcome.finished_at
+            summary.published += 1
+        elif outcome.retryable and post.publish_attempts < MAX_PUBLISH_ATTEMPTS:
+            post.status = 'failed'
+            post.publish_error = outcome.error
+            post.next_attempt_at = outcome.finished_at + retry_delay(post.publish_attempts)
+            summary.retry_scheduled += 1
+        else:
+            post.status = 'failed'
+            post.publish_error = outcome.error
+            if outcome.retryable:
+                post.publish_error = f"Max retry ({MAX_PUBLISH_ATTEMPTS}) asildi: {outcome.error}"
+            post.next_attempt_at = None
+            summary.failed += 1
+
+        post.updated_at = outcome.finished_at
+        posts.append(post)
+        logs.append(PublishLog(
+            post=post,
+            action=action,
+            success=outcome.success,
+            response_data=outcome.response_data,
+            error_message=outcome.error,
+        ))
+
+    with transaction.atomic():
+        SocialPost.objects.bulk_update(posts, [
+            'status', 'published_at', 'platform_post_id', 'platform_url',
+            'publish_error', 'publish_attempts', 'next_attempt_at', 'updated_at',
+        ])
+        PublishLog.objects.bulk_create(logs)
+        for account_id, (count, last_used) in account_stats.items():
+            SocialAccount.objects.filter(id=account_id).update(
+                total_posts_published=F('total_posts_published') + count,
+                last_used_at=last_used,
+            )
+
+
+def publish_claimed(post_ids, publisher_factory=None, max_workers=MAX_WORKERS,
+                    min_interval=None) -> PublishSummary:
+    """
+    Talep edilmis postlari hesaplar arasi paralel yayinla ve sonuclari toplu yaz.
+
+    publisher_factory: account -> BasePublisher (varsayilan get_publisher).
+    min_interval: hesap ici ardisik yayin araligi; None ise platform limiti.
+    """
+    from apps.social.models import SocialPost
+
+    if publisher_factory is None:
+        from apps.social.publishers import get_publisher
+        publisher_factory = get_publisher
+
+    summary = PublishSummary(claimed=len(post_ids))
+    if not post_ids:
+        return summary
+
+    by_account = defaultdict(list)
+    accounts = {}
+    for post in SocialPost.objects.filter(id__in=post_ids).select_related('social_account'):
+        accounts[post.social_account_id] = post.social_account
+        by_account[post.social_account_id].append(post)
+
+    def run(account_id):
+        account = accounts[account_id]
+        interval = _rate_limit(account.platform)[1] if min_interval is None else min_interval
+        return _publish_account_posts(account, by_account[account_id], publisher_factory, interval)
+
+    workers = max(1, min(max_workers, len(by_account)))
+    if workers == 1:
+        batches = [run(account_id) for account_id in by_account]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            batches = list(pool.map(run, by_account))
+
+    _apply_outcomes([outcome for batch in batches for outcome in batch], summary)
+    return summary
+
+
+def publish_due_posts(now=None, publisher_factory=None, limit=CLAIM_BATCH_SIZE,
+                      max_workers=MAX_WORKERS, min_interval=None, post_ids=None) -> PublishSummary:
+    """Zamani gelen postlari talep et ve yayinla (tek dongu)."""
+    claimed = claim_due_posts(now=now, limit=limit, post_ids=post_ids)
+    return publish_claimed(
+        claimed, publisher_factory=publisher_factory,
+        max_workers=max_workers, min_interval=min_interval,
+    )
@@ -204,98 +204,20 @@ def publish_scheduled_posts(self):
     """
     Zamanlanmis ve onaylanmis postlari yayinla.
     Her 5 dakikada calisan periodic task.
-    """
-    from apps.social.models import SocialPost, SocialAccount, PublishLog
-    from apps.social.publishers import get_publisher
 
-    now = timezone.now()
-    window = now + timedelta(minutes=5)
-
-    # Zamani gelen scheduled postlari bul
-    posts = SocialPost.objects.filter(
-        status='scheduled',
-        scheduled_at__lte=window,
-        social_account__isnull=False,
-    ).select_related('social_account')
-
-    published_count = 0
-    failed_count = 0
-
-    for post in posts:
-        account = post.social_account
-
-        # Token gecerliligi kontrol
-        if not account.is_token_valid:
-            PublishLog.objects.create(
-                post=post,
-                action='publish',
-                success=False,
-                error_message=f'Token suresi dolmus: {account.account_name}',
-            )
-            post.status = 'failed'
-            post.publish_error = 'Token suresi dolmus'
-            post.save(update_fields=['status', 'publish_error'])
-            failed_count += 1
-            continue
-
-        # Yayinla
-        post.status = 'publishing'
-        post.save(update_fields=['status'])
+    Postlar SKIP LOCKED ile talep edilir (paralel worker'lar cakismaz),
+    hesaplar arasi eszamanli yayinlanir; basarisiz olanlar ussel geri
+    cekilmeyle sonraki dongude tekrar denenir (bkz. apps.social.publishing).
+    """
+    from apps.social.publishing import publish_due_posts
 
-        try:
-            publisher = get_publisher(account)
-            result = publisher.publish(post)
-
-            PublishLog.objects.create(
-                post=post,
-                action='publish',
-                success=result.success,
-                response_data=result.response_data,
-                error_message=result.error,
-            )
-
-            if result.success:
-                post.status = 'published'
-                post.published_at = timezone.now()
-                post.platform_post_id = result.platform_post_id
-                post.platform_url = result.platform_url
-                post.publish_error = ''
-                post.save(update_fields=[
-                    'status', 'published_at', 'platform_post_id',
-                    'platform_url', 'publish_error',
-                ])
-
-                # Hesap istatistiklerini guncelle
-                account.total_posts_published += 1
-                account.last_used_at = timezone.now()
-                account.save(update_fields=['total_posts_published', 'last_used_at'])
-
-                published_count += 1
-            else:
-                post.status = 'failed'
-                post.publish_error = result.error
-                post.save(update_fields=['status', 'publish_error'])
-                failed_count += 1
+    summary = publish_due_posts()
 
-        except Exception as e:
-            logger.exception(f"Post publish hatasi: post={post.id}")
-            post.status = 'failed'
-            post.publish_error = str(e)
-            post.save(update_fields=['status', 'publish_error'])
-
-            PublishLog.objects.create(
-                post=post,
-                action='publish',
-                success=False,
-                error_message=str(e),
-            )
-            failed_count += 1
-
-    logger.info(f"Scheduled publish: {published_count} basarili, {failed_count} basarisiz")
-    return {
-        'published': published_count,
-        'failed': failed_count,
-    }
+    logger.info(
+        f"Scheduled publish: {summary.published} basarili, {summary.failed} basarisiz, "
+        f"{summary.retry_scheduled} tekrar denenecek"
+    )
+    return summary.as_dict()
 
 
 # =============================================================================
@@ -360,14 +282,15 @@ def refresh_social_tokens(self):
 # 4) RETRY FAILED POST
 # =============================================================================
 
-@shared_task(bind=True, max_retries=3)
-def retry_failed_post(self, post_id: str):
+@shared_task
+def retry_failed_post(post_id: str):
     """
-    Basarisiz olan bir postu tekrar yayinlamayi dene.
-    Max 3 deneme, artan bekleme suresiyle.
+    Basarisiz olan bir postu hemen tekrar yayinlamayi dene.
+    Deneme sayaci sifirlanir; yine basarisiz olursa publish_scheduled_posts
+    dongusu artan bekleme suresiyle tekrar dener.
     """
-    from apps.social.models import SocialPost, PublishLog
-    from apps.social.publishers import get_publisher
+    from apps.social.models import SocialPost
+    from apps.social.publishing import publish_due_posts
 
     try:
         post = SocialPost.objects.select_related('social_account').get(id=post_id)
@@ -390,67 +313,10 @@ def retry_failed_post(self, post_id: str):
         post.save(update_fields=['publish_error'])
         return
 
-    post.status = 'publishing'
-    post.save(update_fields=['status'])
-
-    try:
-        publisher = get_publisher(account)
-        result = publisher.publish(post)
-
-        PublishLog.objects.create(
-            post=post,
-            action='retry',
-            success=result.success,
-            response_data=result.response_data,
-            error_message=result.error,
-        )
-
-        if result.success:
-            post.status = 'published'
-            post.published_at = timezone.now()
-            post.platform_post_id = result.platform_post_id
-            post.platform_url = result.platform_url
-            post.publish_error = ''
-            post.save(update_fields=[
-                'status', 'published_at', 'platform_post_id',
-                'platform_url', 'publish_error',
-            ])
-
-            account.total_posts_published += 1
-            account.last_used_at = timezone.now()
-            account.save(update_fields=['total_posts_published', 'last_used_at'])
-
-            logger.info(f"Post retry basarili: {post_id}")
-        else:
-            post.status = 'failed'
-            post.publish_error = result.error
-            post.save(update_fields=['status', 'publish_error'])
-            logger.warning(f"Post retry basarisiz: {post_id}, error={result.error}")
-
-            # Retry with exponential backoff
-            raise self.retry(countdown=60 * (2 ** self.request.retries))
-
-    except self.MaxRetriesExceededError:
-        post.status = 'failed'
-        post.publish_error = f"Max retry ({self.max_retries}) asildi"
-        post.save(update_fields=['status', 'publish_error'])
-        logger.error(f"Post max retry asildi: {post_id}")
-
-    except Exception as e:
-        logger.exception(f"Post retry hatasi: {post_id}")
-        post.status = 'failed'
-        post.publish_error = str(e)
-        post.save(update_fields=['status', 'publish_error'])
-
-        PublishLog.objects.create(
-            post=post,
-            action='retry',
-            success=False,
-            error_message=str(e),
-        )
-
-        try:
-            raise self.retry(countdown=60 * (2 ** self.request.retries))
-        except self.MaxRetriesExceededError:
-            post.publish_error = f"Max retry asildi: {str(e)}"
-            post.save(update_fields=['publish_error'])
+    now = timezone.now()
+    SocialPost.objects.filter(id=post.id, status='failed').update(
+        publish_attempts=0, next_attempt_at=now,
+    )
+    summary = publish_due_posts(now=now, post_ids=[post.id])
+    logger.info(f"Post retry: {post_id} -> {summary.as_dict()}")
+    return summary.as_dict()
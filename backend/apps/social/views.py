@@ -453,9 +453,15 @@ class SocialPostPublishNowView(APIView):
         if not account.is_token_valid:
             return Response({'error': 'Token suresi dolmus'}, status=status.HTTP_400_BAD_REQUEST)
 
+        from .publishing import claim_post
+        if not claim_post(post.id, account):
+            return Response(
+                {'error': 'Post su anda yayinlaniyor veya zaten yayinlanmis'},
+                status=status.HTTP_409_CONFLICT,
+            )
         post.social_account = account
         post.status = 'publishing'
-        post.save(update_fields=['social_account', 'status'])
+        post.next_attempt_at = None
 
         from .publishers import get_publisher
         try:
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.5 on 2026-10-19 19:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracking', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='medicationlog',
+            index=models.Index(fields=['patient', '-taken_at'], name='tracking_me_patient_7da12d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='symptomentry',
+            index=models.Index(fields=['patient', '-created_at'], name='tracking_sy_patient_84f72e_idx'),
+        ),
+    ]
@@ -51,6 +51,7 @@ class SymptomEntry(TimeStampedModel):
         indexes = [
             models.Index(fields=['patient', '-recorded_date']),
             models.Index(fields=['symptom_definition', 'patient']),
+            models.Index(fields=['patient', '-created_at']),
         ]
         unique_together = ['patient', 'symptom_definition', 'recorded_date']
 
@@ -96,6 +97,9 @@ class MedicationLog(TimeStampedModel):
 
     class Meta:
         ordering = ['-taken_at']
+        indexes = [
+            models.Index(fields=['patient', '-taken_at']),
+        ]
 
     def __str__(self):
         status = 'taken' if self.was_taken else 'missed'
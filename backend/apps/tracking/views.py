@@ -7,6 +7,7 @@ from django.db.models import Avg
 from django_filters.rest_framework import DjangoFilterBackend
 
 from apps.accounts.permissions import IsPatient
+from apps.common.pagination import FieldProjectionMixin, KeysetPagination
 from .models import SymptomDefinition, SymptomEntry, Medication, MedicationLog, ReminderConfig
 from .serializers import (
     SymptomDefinitionSerializer,
@@ -34,10 +35,11 @@ class SymptomDefinitionViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
 
-class SymptomEntryViewSet(viewsets.ModelViewSet):
+class SymptomEntryViewSet(FieldProjectionMixin, viewsets.ModelViewSet):
     """Patient symptom entries."""
     serializer_class = SymptomEntrySerializer
     permission_classes = [permissions.IsAuthenticated, IsPatient]
+    pagination_class = KeysetPagination
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['symptom_definition', 'recorded_date']
 
@@ -91,10 +93,12 @@ class MedicationViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class MedicationLogViewSet(viewsets.ModelViewSet):
+class MedicationLogViewSet(FieldProjectionMixin, viewsets.ModelViewSet):
     """Medication intake logs."""
     serializer_class = MedicationLogSerializer
     permission_classes = [permissions.IsAuthenticated, IsPatient]
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-taken_at', '-id')
     http_method_names = ['get', 'post', 'delete']
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['medication', 'was_taken']
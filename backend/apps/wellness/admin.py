@@ -1,7 +1,8 @@
 from django.contrib import admin
 from .models import (
     BreathingExercise, RelaxationExercise, ExerciseSession,
-    SleepLog, MenstrualLog, WaterIntakeLog, WeatherData, UserWeatherAlert
+    SleepLog, MenstrualLog, WaterIntakeLog, WeatherData, UserWeatherAlert,
+    WeatherSensitivityProfile, WellnessSummary,
 )
 
 
@@ -73,3 +74,21 @@ class UserWeatherAlertAdmin(admin.ModelAdmin):
     list_display = ['user', 'city', 'alert_on_pressure_drop', 'is_active']
     list_filter = ['is_active', 'city']
     search_fields = ['user__email']
+
+
+@admin.register(WeatherSensitivityProfile)
+class WeatherSensitivityProfileAdmin(admin.ModelAdmin):
+    list_display = [
+        'user', 'city', 'attacks_analyzed', 'pressure_sensitivity',
+        'pressure_drop_threshold', 'pressure_drop_relative_risk', 'computed_at',
+    ]
+    list_filter = ['city']
+    search_fields = ['user__email']
+    readonly_fields = ['computed_at']
+
+
+@admin.register(WellnessSummary)
+class WellnessSummaryAdmin(admin.ModelAdmin):
+    list_display = ['user', 'window_date', 'updated_at']
+    search_fields = ['user__email']
+    readonly_fields = ['exercise', 'sleep', 'cycle', 'window_date', 'updated_at']
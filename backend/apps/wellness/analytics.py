@@ -0,0 +1,192 @@
+"""
+Wellness analitik katmani.
+
+Her bolum (egzersiz, uyku, dongu) tek bir kosullu aggregate sorgusuyla
+veritabaninda hesaplanir; adet dongusu baslangiclari LAG() pencere
+fonksiyonuyla bulunur. Sonuclar kullanici basina tek WellnessSummary
+satirinda tutulur: kayit yazildiginda ilgili bolum yeniden hesaplanir,
+dashboard'lar gecmisin uzunlugundan bagimsiz olarak tek satir okur.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.db.models import Avg, Count, F, Q, Sum, Window
+from django.db.models.functions import Lag
+from django.utils import timezone
+
+from .models import ExerciseSession, MenstrualLog, SleepLog, WellnessSummary
+
+WINDOW_DAYS = 30
+# Iki adet gunu arasinda bundan uzun bosluk varsa yeni dongu baslar
+CYCLE_GAP_DAYS = 7
+
+SYMPTOM_FIELDS = {
+    'cramps': 'has_cramps',
+    'headache': 'has_headache',
+    'mood_changes': 'has_mood_changes',
+    'bloating': 'has_bloating',
+    'fatigue': 'has_fatigue',
+}
+
+
+def _window_start(today):
+    """Pencere baslangic gunu ve o gunun yerel gece yarisi."""
+    start_date = today - timedelta(days=WINDOW_DAYS)
+    return start_date, timezone.make_aware(datetime.combine(start_date, time.min))
+
+
+def exercise_stats(user_id, today=None) -> dict:
+    """Egzersiz istatistikleri (tek sorgu)"""
+    today = today or timezone.localdate()
+    _, since = _window_start(today)
+    recent = Q(completed_at__gte=since)
+
+    agg = ExerciseSession.objects.filter(user_id=user_id).aggregate(
+        total_sessions=Count('id'),
+        sessions_this_month=Count('id', filter=recent),
+        total_seconds=Sum('duration_seconds'),
+        total_points=Sum('points_earned'),
+        avg_reduction=Avg(
+            F('stress_before') - F('stress_after'),
+            filter=recent & Q(stress_before__isnull=False, stress_after__isnull=False),
+        ),
+    )
+    return {
+        'total_sessions': agg['total_sessions'],
+        'sessions_this_month': agg['sessions_this_month'],
+        'total_minutes': (agg['total_seconds'] or 0) // 60,
+        'avg_stress_reduction': agg['avg_reduction'] or 0,
+        'total_points_earned': agg['total_points'] or 0,
+    }
+
+
+def sleep_stats(user_id, today=None) -> dict:
+    """Uyku istatistikleri (tek sorgu)"""
+    today = today or timezone.localdate()
+    start_date, _ = _window_start(today)
+    recent = Q(date__gte=start_date)
+
+    agg = SleepLog.objects.filter(user_id=user_id).aggregate(
+        total_logs=Count('id'),
+        logs_this_month=Count('id', filter=recent),
+        avg_minutes=Avg('sleep_duration_minutes', filter=recent),
+        avg_quality=Avg('sleep_quality', filter=recent),
+        nightmare_count=Count('id', filter=recent & Q(had_nightmare=True)),
+    )
+    return {
+        'avg_duration_hours': round((agg['avg_minutes'] or 0) / 60, 1),
+        'avg_quality': round(agg['avg_quality'] or 0, 1),
+        'total_logs': agg['total_logs'],
+        'logs_this_month': agg['logs_this_month'],
+        'nightmare_count': agg['nightmare_count'],
+    }
+
+
+def period_starts(user_id) -> list:
+    """Dongu baslangic gunleri: onceki adet gunune bosluk > CYCLE_GAP_DAYS (LAG penceresi)"""
+    return list(
+        MenstrualLog.objects.filter(user_id=user_id, is_period_day=True)
+        .annotate(prev_date=Window(Lag('date'), order_by=F('date').asc()))
+        .filter(
+            Q(prev_date__isnull=True)
+            | Q(prev_date__lt=F('date') - timedelta(days=CYCLE_GAP_DAYS))
+        )
+        .order_by('date')
+        .values_list('date', flat=True)
+    )
+
+
+def cycle_stats(user_id) -> dict:
+    """Dongu istatistikleri: semptom sayimlari tek sorgu, baslangiclar tek pencere sorgusu"""
+    agg = MenstrualLog.objects.filter(user_id=user_id, is_period_day=True).aggregate(
+        total_period_days=Count('id'),
+        **{
+            name: Count('id', filter=Q(**{field: True}))
+            for name, field in SYMPTOM_FIELDS.items()
+        },
+    )
+    total = agg.pop('total_period_days')
+
+    if total < 2:
+        return {
+            'avg_cycle_length': None,
+            'avg_period_length': None,
+            'headache_correlation': None,
+            'message': 'Yeterli veri yok',
+        }
+
+    starts = period_starts(user_id)
+    # Ardisik dongu uzunluklarinin ortalamasi = (son - ilk) / (dongu sayisi - 1)
+    avg_cycle = round((starts[-1] - starts[0]).days / (len(starts) - 1)) if len(starts) > 1 else None
+
+    return {
+        'avg_cycle_length': avg_cycle,
+        'total_cycles_tracked': len(starts),
+        'headache_correlation': round(agg['headache'] / total * 100),
+        'common_symptoms': agg,
+    }
+
+
+SECTIONS = {
+    'exercise': lambda user_id, today: exercise_stats(user_id, today),
+    'sleep': lambda user_id, today: sleep_stats(user_id, today),
+    'cycle': lambda user_id, today: cycle_stats(user_id),
+}
+# Son 30 gune bagli bolumler: gun degisince yeniden hesaplanir
+WINDOWED_SECTIONS = ('exercise', 'sleep')
+
+
+def refresh_summary(user_id, sections=tuple(SECTIONS), today=None, create=True) -> WellnessSummary:
+    """
+    Verilen bolumleri yeniden hesapla ve ozet satirina tek sorguyla yaz.
+
+    create=False: satir yoksa olusturma (silme sinyalleri; kullanici
+    cascade ile silinirken ozet satiri yeniden yaratilmasin).
+    """
+    today = today or timezone.localdate()
+    values = {name: SECTIONS[name](user_id, today) for name in sections}
+    if set(WINDOWED_SECTIONS) <= set(values):
+        values['window_date'] = today
+
+    summary = WellnessSummary(user_id=user_id, **values)
+    if not create:
+        WellnessSummary.objects.filter(user_id=user_id).update(updated_at=timezone.now(), **values)
+        return summary
+
+    WellnessSummary.objects.bulk_create(
+        [summary],
+        update_conflicts=True,
+        unique_fields=['user'],
+        update_fields=list(values) + ['updated_at'],
+    )
+    return summary
+
+
+def get_summary(user_id, today=None) -> WellnessSummary:
+    """
+    Kullanicinin ozet satirini oku; eksik veya gunu gecmis bolumler
+    varsa sadece onlari yeniden hesapla.
+    """
+    today = today or timezone.localdate()
+    summary = WellnessSummary.objects.filter(user_id=user_id).first()
+
+    stale = [
+        name for name in SECTIONS
+        if summary is None or not getattr(summary, name)
+        or (name in WINDOWED_SECTIONS and summary.window_date != today)
+    ]
+    if not stale:
+        return summary
+
+    if any(name in WINDOWED_SECTIONS for name in stale):
+        # Pencere tarihi tutarli kalsin diye iki pencereli bolum birlikte hesaplanir
+        stale = sorted(set(stale) | set(WINDOWED_SECTIONS))
+    refreshed = refresh_summary(user_id, stale, today)
+
+    if summary is None:
+        return refreshed
+    for name in stale:
+        setattr(summary, name, getattr(refreshed, name))
+    if refreshed.window_date:
+        summary.window_date = refreshed.window_date
+    return summary
@@ -5,3 +5,6 @@ class WellnessConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.wellness'
     verbose_name = 'Wellness & Relaxation'
+
+    def ready(self):
+        import apps.wellness.signals  # noqa: F401
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.5 on 2026-10-19 18:14
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wellness', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WeatherSensitivityProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('city', models.CharField(default='Istanbul', max_length=100)),
+                ('attacks_analyzed', models.PositiveIntegerField(default=0)),
+                ('pressure_sensitivity', models.FloatField(blank=True, null=True)),
+                ('humidity_sensitivity', models.FloatField(blank=True, null=True)),
+                ('temperature_sensitivity', models.FloatField(blank=True, null=True)),
+                ('best_lag_hours', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('pressure_drop_threshold', models.FloatField(blank=True, null=True)),
+                ('pressure_drop_relative_risk', models.FloatField(blank=True, null=True)),
+                ('computed_at', models.DateTimeField()),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='weather_sensitivity', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['city', 'pressure_drop_threshold'], name='wellness_we_city_ca793c_idx')],
+            },
+        ),
+    ]
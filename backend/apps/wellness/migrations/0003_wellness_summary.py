@@ -0,0 +1,28 @@
+# Generated by Django 5.1.5 on 2026-10-19 18:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wellness', '0002_weather_sensitivity_profile'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WellnessSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('exercise', models.JSONField(default=dict)),
+                ('sleep', models.JSONField(default=dict)),
+                ('cycle', models.JSONField(default=dict)),
+                ('window_date', models.DateField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='wellness_summary', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
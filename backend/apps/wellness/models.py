@@ -230,3 +230,56 @@ class UserWeatherAlert(models.Model):
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+
+class WeatherSensitivityProfile(models.Model):
+    """Hasta bazli hava-atak korelasyon profili (gece batch ile hesaplanir)"""
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='weather_sensitivity',
+    )
+    city = models.CharField(max_length=100, default='Istanbul')
+
+    attacks_analyzed = models.PositiveIntegerField(default=0)
+    # Atak oncesi degerin tum saatlere gore standart sapma cinsinden farki
+    pressure_sensitivity = models.FloatField(null=True, blank=True)
+    humidity_sensitivity = models.FloatField(null=True, blank=True)
+    temperature_sensitivity = models.FloatField(null=True, blank=True)
+    best_lag_hours = models.PositiveSmallIntegerField(null=True, blank=True)
+
+    # 24 saatlik basinc dususu bu esigi gecince risk artar (hPa, pozitif)
+    pressure_drop_threshold = models.FloatField(null=True, blank=True)
+    # Dusus sonrasi 24 saatte atak olasiligi / genel olasilik
+    pressure_drop_relative_risk = models.FloatField(null=True, blank=True)
+
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['city', 'pressure_drop_threshold']),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.city} ({self.attacks_analyzed} attacks)"
+
+
+class WellnessSummary(models.Model):
+    """Kullanici bazli ozet istatistikler (kayit yazildikca guncellenir)"""
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='wellness_summary',
+    )
+
+    # Bolum bazli hazir yanitlar (bos dict: henuz hesaplanmadi)
+    exercise = models.JSONField(default=dict)
+    sleep = models.JSONField(default=dict)
+    cycle = models.JSONField(default=dict)
+
+    # Son 30 gun pencerelerinin hesaplandigi gun
+    window_date = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user} - wellness ozeti"
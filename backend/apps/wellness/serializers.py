@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from .models import (
     BreathingExercise, RelaxationExercise, ExerciseSession,
-    SleepLog, MenstrualLog, WaterIntakeLog, WeatherData, UserWeatherAlert
+    SleepLog, MenstrualLog, WaterIntakeLog, WeatherData, UserWeatherAlert,
+    WeatherSensitivityProfile,
 )
 
 
@@ -207,3 +208,14 @@ class UserWeatherAlertSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
+
+
+class WeatherSensitivityProfileSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = WeatherSensitivityProfile
+        fields = [
+            'city', 'attacks_analyzed',
+            'pressure_sensitivity', 'humidity_sensitivity', 'temperature_sensitivity',
+            'best_lag_hours', 'pressure_drop_threshold', 'pressure_drop_relative_risk',
+            'computed_at',
+        ]
@@ -0,0 +1,38 @@
+"""
+Wellness app signals.
+
+Egzersiz, uyku ve adet kayitlari yazildiginda/silindiginde kullanicinin
+WellnessSummary satirindaki ilgili bolumu yeniden hesaplar.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+SECTION_BY_MODEL = {
+    'ExerciseSession': 'exercise',
+    'SleepLog': 'sleep',
+    'MenstrualLog': 'cycle',
+}
+
+
+def _refresh(instance, create):
+    from apps.wellness.analytics import WINDOWED_SECTIONS, refresh_summary
+
+    section = SECTION_BY_MODEL[type(instance).__name__]
+    # Pencereli bolumler ayni window_date ile birlikte yazilir
+    sections = WINDOWED_SECTIONS if section in WINDOWED_SECTIONS else (section,)
+    refresh_summary(instance.user_id, sections, create=create)
+
+
+@receiver(post_save, sender='wellness.ExerciseSession')
+@receiver(post_save, sender='wellness.SleepLog')
+@receiver(post_save, sender='wellness.MenstrualLog')
+def refresh_summary_on_save(sender, instance, **kwargs):
+    _refresh(instance, create=True)
+
+
+@receiver(post_delete, sender='wellness.ExerciseSession')
+@receiver(post_delete, sender='wellness.SleepLog')
+@receiver(post_delete, sender='wellness.MenstrualLog')
+def refresh_summary_on_delete(sender, instance, **kwargs):
+    _refresh(instance, create=False)
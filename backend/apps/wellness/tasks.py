@@ -3,45 +3,42 @@ from celery import shared_task
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_WEATHER_CITIES = ['Istanbul', 'Ankara', 'Izmir']
+
 
 @shared_task(name='apps.wellness.tasks.update_weather_cache')
 def update_weather_cache():
     """Varsayilan sehirler icin hava durumu cache guncelle."""
-    from apps.wellness.models import WeatherData
-    from django.conf import settings
-    from django.utils import timezone
-    import requests
-
-    cities = ['Istanbul', 'Ankara', 'Izmir']
-    api_key = getattr(settings, 'OPENWEATHERMAP_API_KEY', None)
-    if not api_key:
-        logger.warning("No OpenWeatherMap API key configured")
-        return {'updated': 0}
+    from apps.wellness import weather
 
     updated = 0
-    for city in cities:
+    for city in DEFAULT_WEATHER_CITIES:
         try:
-            resp = requests.get(
-                'https://api.openweathermap.org/data/2.5/weather',
-                params={'q': f'{city},TR', 'appid': api_key, 'units': 'metric', 'lang': 'tr'},
-                timeout=10,
-            )
-            if resp.status_code == 200:
-                d = resp.json()
-                WeatherData.objects.update_or_create(
-                    city=city,
-                    defaults={
-                        'temperature': d['main']['temp'],
-                        'humidity': d['main']['humidity'],
-                        'pressure': d['main']['pressure'],
-                        'weather_condition': d['weather'][0]['main'],
-                        'weather_description': d['weather'][0]['description'],
-                        'recorded_at': timezone.now(),
-                    },
-                )
-                updated += 1
-        except Exception as e:
+            weather.refresh(city)
+            updated += 1
+        except weather.WeatherUnavailable as e:
             logger.error(f"Weather update failed for {city}: {e}")
 
     logger.info(f"Updated weather for {updated} cities")
     return {'updated': updated}
+
+
+@shared_task(name='apps.wellness.tasks.refresh_city_weather')
+def refresh_city_weather(city):
+    """Tek sehir icin arka plan yenilemesi (kilit get_current tarafindan alinmistir)."""
+    from apps.wellness import weather
+
+    try:
+        weather.refresh_locked(city)
+        return {'city': city, 'refreshed': True}
+    except weather.WeatherUnavailable as e:
+        logger.warning(f"Weather refresh failed for {city}: {e}")
+        return {'city': city, 'refreshed': False}
+
+
+@shared_task(name='apps.wellness.tasks.compute_weather_sensitivity')
+def compute_weather_sensitivity():
+    """Gece: hasta bazli hava-atak korelasyon profillerini yeniden hesapla."""
+    from apps.wellness.weather_correlation import compute_all_profiles
+
+    return compute_all_profiles()
@@ -3,7 +3,7 @@ from rest_framework.routers import DefaultRouter
 from .views import (
     BreathingExerciseViewSet, RelaxationExerciseViewSet, ExerciseSessionViewSet,
     SleepLogViewSet, MenstrualLogViewSet, WaterIntakeLogViewSet,
-    WeatherViewSet, UserWeatherAlertViewSet
+    WeatherViewSet, UserWeatherAlertViewSet, WellnessSummaryViewSet
 )
 
 router = DefaultRouter()
@@ -15,6 +15,7 @@ router.register(r'menstrual', MenstrualLogViewSet, basename='menstrual')
 router.register(r'water', WaterIntakeLogViewSet, basename='water')
 router.register(r'weather', WeatherViewSet, basename='weather')
 router.register(r'weather-alerts', UserWeatherAlertViewSet, basename='weather-alert')
+router.register(r'summary', WellnessSummaryViewSet, basename='wellness-summary')
 
 urlpatterns = [
     path('', include(router.urls)),
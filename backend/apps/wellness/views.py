@@ -3,21 +3,24 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Avg, Count
 from django.utils import timezone
 from datetime import timedelta
-import requests
-from django.conf import settings
 
+from apps.common.counters import DailyCounterMixin
+from apps.gamification.engine import emit_event
+from . import analytics, weather as weather_service
 from .models import (
     BreathingExercise, RelaxationExercise, ExerciseSession,
-    SleepLog, MenstrualLog, WaterIntakeLog, WeatherData, UserWeatherAlert
+    SleepLog, MenstrualLog, WaterIntakeLog, UserWeatherAlert,
+    WeatherSensitivityProfile,
 )
 from .serializers import (
     BreathingExerciseSerializer, RelaxationExerciseSerializer,
     ExerciseSessionSerializer, SleepLogSerializer, MenstrualLogSerializer,
-    WaterIntakeLogSerializer, WeatherDataSerializer, UserWeatherAlertSerializer
+    WaterIntakeLogSerializer, UserWeatherAlertSerializer,
+    WeatherSensitivityProfileSerializer,
 )
+from .weather_correlation import pressure_drop_risk
 
 
 class BreathingExerciseViewSet(viewsets.ReadOnlyModelViewSet):
@@ -71,27 +74,19 @@ class ExerciseSessionViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         return ExerciseSession.objects.filter(user=self.request.user)
 
+    def perform_create(self, serializer):
+        session = serializer.save(user=self.request.user)
+        emit_event(
+            self.request.user, 'exercise_done',
+            points=session.points_earned,
+            reason='Egzersiz tamamlandi',
+            session_id=session.id,
+        )
+
     @action(detail=False, methods=['get'])
     def stats(self, request):
-        """Egzersiz istatistikleri"""
-        sessions = self.get_queryset()
-        thirty_days_ago = timezone.now() - timedelta(days=30)
-        recent = sessions.filter(completed_at__gte=thirty_days_ago)
-
-        stats = {
-            'total_sessions': sessions.count(),
-            'sessions_this_month': recent.count(),
-            'total_minutes': sum(s.duration_seconds for s in sessions) // 60,
-            'avg_stress_reduction': recent.exclude(
-                stress_before__isnull=True
-            ).exclude(
-                stress_after__isnull=True
-            ).annotate(
-                reduction=models.F('stress_before') - models.F('stress_after')
-            ).aggregate(avg=Avg('reduction'))['avg'] or 0,
-            'total_points_earned': sum(s.points_earned for s in sessions),
-        }
-        return Response(stats)
+        """Egzersiz istatistikleri (ozet satirindan)"""
+        return Response(analytics.get_summary(request.user.id).exercise)
 
 
 class SleepLogViewSet(viewsets.ModelViewSet):
@@ -104,24 +99,8 @@ class SleepLogViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def stats(self, request):
-        """Uyku istatistikleri"""
-        logs = self.get_queryset()
-        thirty_days = logs.filter(
-            date__gte=timezone.now().date() - timedelta(days=30)
-        )
-
-        stats = {
-            'avg_duration_hours': round(
-                (thirty_days.aggregate(avg=Avg('sleep_duration_minutes'))['avg'] or 0) / 60, 1
-            ),
-            'avg_quality': round(
-                thirty_days.aggregate(avg=Avg('sleep_quality'))['avg'] or 0, 1
-            ),
-            'total_logs': logs.count(),
-            'logs_this_month': thirty_days.count(),
-            'nightmare_count': thirty_days.filter(had_nightmare=True).count(),
-        }
-        return Response(stats)
+        """Uyku istatistikleri (ozet satirindan)"""
+        return Response(analytics.get_summary(request.user.id).sleep)
 
     @action(detail=False, methods=['get'])
     def weekly_chart(self, request):
@@ -149,85 +128,28 @@ class MenstrualLogViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def cycle_stats(self, request):
-        """Döngü istatistikleri"""
-        logs = self.get_queryset().filter(is_period_day=True).order_by('date')
-
-        if logs.count() < 2:
-            return Response({
-                'avg_cycle_length': None,
-                'avg_period_length': None,
-                'headache_correlation': None,
-                'message': 'Yeterli veri yok'
-            })
+        """Döngü istatistikleri (ozet satirindan)"""
+        return Response(analytics.get_summary(request.user.id).cycle)
 
-        # Döngü uzunluğunu hesapla
-        period_starts = []
-        current_period_start = None
 
-        for log in logs:
-            if current_period_start is None:
-                current_period_start = log.date
-            elif (log.date - current_period_start).days > 7:
-                period_starts.append(current_period_start)
-                current_period_start = log.date
-
-        if current_period_start:
-            period_starts.append(current_period_start)
-
-        cycle_lengths = []
-        for i in range(1, len(period_starts)):
-            cycle_lengths.append((period_starts[i] - period_starts[i-1]).days)
-
-        # Baş ağrısı korelasyonu
-        total_period_days = logs.count()
-        headache_days = logs.filter(has_headache=True).count()
-
-        stats = {
-            'avg_cycle_length': round(sum(cycle_lengths) / len(cycle_lengths)) if cycle_lengths else None,
-            'total_cycles_tracked': len(period_starts),
-            'headache_correlation': round((headache_days / total_period_days) * 100) if total_period_days > 0 else 0,
-            'common_symptoms': {
-                'cramps': logs.filter(has_cramps=True).count(),
-                'headache': headache_days,
-                'mood_changes': logs.filter(has_mood_changes=True).count(),
-                'bloating': logs.filter(has_bloating=True).count(),
-                'fatigue': logs.filter(has_fatigue=True).count(),
-            }
-        }
-        return Response(stats)
-
-
-class WaterIntakeLogViewSet(viewsets.ModelViewSet):
+class WaterIntakeLogViewSet(DailyCounterMixin, viewsets.ModelViewSet):
     """Su tüketimi takibi"""
     serializer_class = WaterIntakeLogSerializer
     permission_classes = [IsAuthenticated]
+    counter_field = 'glasses'
 
     def get_queryset(self):
         return WaterIntakeLog.objects.filter(user=self.request.user)
 
     @action(detail=False, methods=['post'])
     def add_glass(self, request):
-        """Bir bardak su ekle"""
-        from datetime import date
-        today = date.today()
-
-        log, created = WaterIntakeLog.objects.get_or_create(
-            user=request.user,
-            date=today,
-            defaults={'glasses': 1}
-        )
-
-        if not created:
-            log.glasses += 1
-            log.save()
-
-        return Response(WaterIntakeLogSerializer(log).data)
+        """Bardak ekle: {"amount": n} (varsayilan 1), Idempotency-Key header'i ile tekrar guvenli"""
+        return self.increment_counter(request)
 
     @action(detail=False, methods=['get'])
     def today(self, request):
         """Bugünkü su tüketimi"""
-        from datetime import date
-        today = date.today()
+        today = timezone.localdate()
 
         log, created = WaterIntakeLog.objects.get_or_create(
             user=request.user,
@@ -259,54 +181,19 @@ class WeatherViewSet(viewsets.ViewSet):
     """Hava durumu servisi"""
     permission_classes = [IsAuthenticated]
 
+    @staticmethod
+    def _invalid_city():
+        return Response({'error': 'Gecersiz sehir adi'}, status=status.HTTP_400_BAD_REQUEST)
+
     @action(detail=False, methods=['get'])
     def current(self, request):
-        """Mevcut hava durumu"""
+        """Mevcut hava durumu (stale-while-revalidate cache)"""
         city = request.query_params.get('city', 'Istanbul')
-
-        # Cache kontrol (son 30 dakika)
-        thirty_mins_ago = timezone.now() - timedelta(minutes=30)
-        cached = WeatherData.objects.filter(
-            city__iexact=city,
-            recorded_at__gte=thirty_mins_ago
-        ).first()
-
-        if cached:
-            return Response(WeatherDataSerializer(cached).data)
-
-        # OpenWeatherMap API çağrısı
-        api_key = getattr(settings, 'OPENWEATHERMAP_API_KEY', None)
-        if not api_key:
-            return Response(
-                {'error': 'Weather API not configured'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-
+        if not weather_service.is_valid_city(city):
+            return self._invalid_city()
         try:
-            url = f'https://api.openweathermap.org/data/2.5/weather'
-            params = {
-                'q': f'{city},TR',
-                'appid': api_key,
-                'units': 'metric',
-                'lang': 'tr'
-            }
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            weather = WeatherData.objects.create(
-                city=city,
-                temperature=data['main']['temp'],
-                humidity=data['main']['humidity'],
-                pressure=data['main']['pressure'],
-                weather_condition=data['weather'][0]['main'],
-                weather_description=data['weather'][0]['description'],
-                recorded_at=timezone.now()
-            )
-
-            return Response(WeatherDataSerializer(weather).data)
-
-        except requests.RequestException as e:
+            return Response(weather_service.get_current(city))
+        except weather_service.WeatherUnavailable as e:
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_503_SERVICE_UNAVAILABLE
@@ -316,31 +203,36 @@ class WeatherViewSet(viewsets.ViewSet):
     def pressure_history(self, request):
         """Son 24 saatlik basınç değişimi"""
         city = request.query_params.get('city', 'Istanbul')
-        twenty_four_hours_ago = timezone.now() - timedelta(hours=24)
-
-        history = WeatherData.objects.filter(
-            city__iexact=city,
-            recorded_at__gte=twenty_four_hours_ago
-        ).order_by('recorded_at')
-
-        data = []
-        for record in history:
-            data.append({
-                'time': record.recorded_at.isoformat(),
-                'pressure': record.pressure,
-                'temperature': record.temperature,
-                'humidity': record.humidity
-            })
+        if not weather_service.is_valid_city(city):
+            return self._invalid_city()
+        return Response(weather_service.pressure_history(city))
 
-        # Basınç değişimi hesapla
-        pressure_change = 0
-        if len(data) >= 2:
-            pressure_change = data[-1]['pressure'] - data[0]['pressure']
+    @action(detail=False, methods=['get'])
+    def my_risk(self, request):
+        """Kisisel basinc dususu riski (gece hesaplanan profil + guncel degisim)"""
+        profile = WeatherSensitivityProfile.objects.filter(user=request.user).first()
+        city = request.query_params.get('city') or (profile.city if profile else 'Istanbul')
+        if not weather_service.is_valid_city(city):
+            return self._invalid_city()
+        history = weather_service.pressure_history(city)
+
+        data = pressure_drop_risk(profile, history['pressure_change_24h'])
+        data['city'] = city
+        data['profile'] = WeatherSensitivityProfileSerializer(profile).data if profile else None
+        return Response(data)
+
+
+class WellnessSummaryViewSet(viewsets.ViewSet):
+    """Dashboard icin tum wellness ozetleri (tek satir okuma)"""
+    permission_classes = [IsAuthenticated]
 
+    def list(self, request):
+        summary = analytics.get_summary(request.user.id)
         return Response({
-            'history': data,
-            'pressure_change_24h': round(pressure_change, 1),
-            'risk_level': 'high' if abs(pressure_change) > 5 else 'normal'
+            'exercise': summary.exercise,
+            'sleep': summary.sleep,
+            'cycle': summary.cycle,
+            'updated_at': summary.updated_at,
         })
 
 
@@ -0,0 +1,254 @@
+"""
+Hava durumu cache servisi.
+
+- Guncel hava durumu sehir bazinda Django cache'inde (Redis) tutulur.
+- Deger bayatladiginda (FRESH_SECONDS) istek bayat degeri hemen alir, sehir
+  basina tek bir arka plan yenilemesi calisir (single-flight, cache.add kilidi).
+- Hic deger yoksa sadece kilidi alan istek OpenWeatherMap'i cagirir, digerleri
+  kisa bir sure sonucu bekler.
+- WeatherData sehir basina saatte tek satira indirgenir (downsampled seri).
+- pressure_history bu saatlik satirlardan okunur (tum worker'lar ayni seriyi
+  gorur); sonuc paylasilan cache'te tutulur, her yeni gozlemde silinir.
+- Proses ici sehir kilitleri sabit sayida serittir; istemcinin gonderdigi
+  ?city= degerleri bellekte biriken bir sozluk buyutmez.
+"""
+
+import logging
+import re
+import threading
+import time
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+FRESH_SECONDS = 30 * 60
+SNAPSHOT_TIMEOUT = 24 * 60 * 60
+LOCK_TIMEOUT = 30
+WAIT_FOR_FIRST_FETCH_SECONDS = 5
+HISTORY_HOURS = 24
+HISTORY_CACHE_TIMEOUT = 10 * 60
+REQUEST_TIMEOUT = 10
+LOCK_STRIPES = 64
+CITY_RE = re.compile(r"^[^\W\d_]+(?:[ .'-]+[^\W\d_]+)*\.?$")
+CITY_MAX_LENGTH = 60
+
+
+class WeatherUnavailable(Exception):
+    """Hava durumu alinamadi (API anahtari yok veya saglayici hatasi)."""
+
+
+def _city_key(city):
+    return city.strip().lower()
+
+
+def _snapshot_key(city):
+    return f'weather:current:{_city_key(city)}'
+
+
+def _lock_key(city):
+    return f'weather:refresh-lock:{_city_key(city)}'
+
+
+def _history_key(city):
+    return f'weather:history:{_city_key(city)}'
+
+
+def is_valid_city(city):
+    """Sehir adi yalnizca harf, bosluk, nokta, kesme ve tireden olusabilir."""
+    city = (city or '').strip()
+    return 0 < len(city) <= CITY_MAX_LENGTH and bool(CITY_RE.match(city))
+
+
+def _hour_bucket(dt):
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+# ─── OpenWeatherMap ───
+
+def fetch_from_provider(city):
+    """OpenWeatherMap'ten tek sehir icin guncel hava durumunu cek."""
+    api_key = getattr(settings, 'OPENWEATHERMAP_API_KEY', None)
+    if not api_key:
+        raise WeatherUnavailable('Weather API not configured')
+
+    try:
+        response = requests.get(
+            f'{settings.OPENWEATHERMAP_BASE_URL}/weather',
+            params={'q': f'{city},TR', 'appid': api_key, 'units': 'metric', 'lang': 'tr'},
+            timeout=REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return {
+            'temperature': data['main']['temp'],
+            'humidity': data['main']['humidity'],
+            'pressure': data['main']['pressure'],
+            'weather_condition': data['weather'][0]['main'],
+            'weather_description': data['weather'][0]['description'],
+        }
+    except (requests.RequestException, KeyError, IndexError, ValueError) as e:
+        raise WeatherUnavailable(str(e))
+
+
+# ─── Downsampled seri ───
+
+def store_observation(city, values, recorded_at):
+    """Gozlemi sehir basina saatlik tek satira yaz (ayni saat icinde gunceller)."""
+    from .models import WeatherData
+
+    bucket = _hour_bucket(recorded_at)
+    latest = WeatherData.objects.filter(
+        city__iexact=city, recorded_at__gte=bucket,
+    ).order_by('-recorded_at').first()
+
+    if latest:
+        for field, value in values.items():
+            setattr(latest, field, value)
+        latest.recorded_at = recorded_at
+        latest.save(update_fields=[*values.keys(), 'recorded_at'])
+    else:
+        latest = WeatherData.objects.create(city=city, recorded_at=recorded_at, **values)
+
+    # Yazan proses (Celery) hangisi olursa olsun tum worker'lar yeni seriyi okusun
+    cache.delete(_history_key(city))
+    return latest
+
+
+def _serialize(weather):
+    from .serializers import WeatherDataSerializer
+    return dict(WeatherDataSerializer(weather).data)
+
+
+# ─── Servis ───
+
+_LOCKS = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+
+def _local_lock(city):
+    """Sehir icin proses ici kilit (sabit sayida serit; sehir basina kayit tutulmaz)."""
+    return _LOCKS[hash(_city_key(city)) % LOCK_STRIPES]
+
+
+def refresh(city):
+    """Saglayicidan cek, seriye yaz ve cache'i guncelle."""
+    values = fetch_from_provider(city)
+    recorded_at = timezone.now()
+    weather = store_observation(city, values, recorded_at)
+
+    snapshot = {
+        'data': _serialize(weather),
+        'recorded_at_dt': recorded_at,
+        'fetched_at': time.time(),
+    }
+    cache.set(_snapshot_key(city), snapshot, SNAPSHOT_TIMEOUT)
+    return snapshot
+
+
+def refresh_locked(city):
+    """Kilit zaten alinmis olarak yenile ve kilidi birak (Celery gorevi icin)."""
+    try:
+        return refresh(city)
+    finally:
+        cache.delete(_lock_key(city))
+
+
+def _schedule_background_refresh(city):
+    """Sehir icin tek bir arka plan yenilemesi baslat (kilit alinamazsa zaten calisiyor)."""
+    if not cache.add(_lock_key(city), 1, LOCK_TIMEOUT):
+        return False
+    try:
+        from .tasks import refresh_city_weather
+        refresh_city_weather.delay(city)
+    except Exception as e:
+        logger.warning(f'Weather refresh could not be queued for {city}: {e}')
+        cache.delete(_lock_key(city))
+        return False
+    return True
+
+
+def _seed_from_database(city):
+    """Cache bos ise (ornegin Redis yeniden basladi) son satiri bayat deger olarak kullan."""
+    from .models import WeatherData
+
+    latest = WeatherData.objects.filter(city__iexact=city).order_by('-recorded_at').first()
+    if latest is None:
+        return None
+    snapshot = {
+        'data': _serialize(latest),
+        'recorded_at_dt': latest.recorded_at,
+        'fetched_at': latest.recorded_at.timestamp(),
+    }
+    cache.set(_snapshot_key(city), snapshot, SNAPSHOT_TIMEOUT)
+    return snapshot
+
+
+def get_current(city):
+    """
+    Sehrin guncel hava durumunu dondur.
+
+    Taze deger varsa direkt; bayatsa bayat deger + tek arka plan yenilemesi;
+    hic yoksa tek istek senkron ceker, digerleri sonucu bekler.
+    """
+    snapshot = cache.get(_snapshot_key(city)) or _seed_from_database(city)
+    if snapshot is not None:
+        if time.time() - snapshot['fetched_at'] > FRESH_SECONDS:
+            _schedule_background_refresh(city)
+        return snapshot['data']
+
+    with _local_lock(city):
+        snapshot = cache.get(_snapshot_key(city))
+        if snapshot is not None:
+            return snapshot['data']
+
+        if cache.add(_lock_key(city), 1, LOCK_TIMEOUT):
+            return refresh_locked(city)['data']
+
+        # Baska bir proses cekiyor: kisa sure sonucu bekle
+        deadline = time.monotonic() + WAIT_FOR_FIRST_FETCH_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(0.1)
+            snapshot = cache.get(_snapshot_key(city))
+            if snapshot is not None:
+                return snapshot['data']
+
+    raise WeatherUnavailable('Weather refresh in progress')
+
+
+def _load_history(city):
+    """Son 24 saatin saatlik gozlemleri (DB'deki downsampled seri)."""
+    from .models import WeatherData
+
+    since = timezone.now() - timedelta(hours=HISTORY_HOURS)
+    rows = WeatherData.objects.filter(
+        city__iexact=city, recorded_at__gte=since,
+    ).order_by('recorded_at').values_list('recorded_at', 'pressure', 'temperature', 'humidity')
+    return [
+        {
+            'time': recorded_at.isoformat(),
+            'pressure': pressure,
+            'temperature': temperature,
+            'humidity': humidity,
+        }
+        for recorded_at, pressure, temperature, humidity in rows
+    ]
+
+
+def pressure_history(city):
+    """Son 24 saatlik basinc serisi ve degisim (saatlik gozlemlerden)."""
+    data = cache.get(_history_key(city))
+    if data is None:
+        data = _load_history(city)
+        cache.set(_history_key(city), data, HISTORY_CACHE_TIMEOUT)
+    pressure_change = 0
+    if len(data) >= 2:
+        pressure_change = data[-1]['pressure'] - data[0]['pressure']
+    return {
+        'history': data,
+        'pressure_change_24h': round(pressure_change, 1),
+        'risk_level': 'high' if abs(pressure_change) > 5 else 'normal',
+    }
@@ -0,0 +1,281 @@
+"""
+Hava durumu - migren atagi korelasyon motoru.
+
+Gece batch'i:
+- Sehir basina saatlik basinc/nem/sicaklik serisi tek sorguyla okunur,
+  kucuk bosluklar ileri doldurulur (forward fill).
+- 24 saatlik basinc ve sicaklik degisimi serileri bir kez hesaplanir;
+  tum saatlerin ortalama/standart sapmasi sehir basina tek seferlik taban olur.
+- Her hastanin ataklari saat kovasina hizalanir ve gecikmeli (lag) degerler
+  sozluk erisimiyle okunur; hassasiyet skoru = (atak oncesi ortalama - taban
+  ortalama) / taban standart sapma.
+- Sonuc WeatherSensitivityProfile satirina yazilir; uyari kontrolu kullanici
+  basina tek satir okumasidir.
+
+Not: numpy/pandas bagimliliklari bu proje icin eklenmedi; seriler en fazla
+birkac bin saat oldugundan saf Python tek gecis yeterince hizli.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from statistics import fmean, median, pstdev
+
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_DAYS = 180
+MIN_ATTACKS = 3
+MAX_FILL_HOURS = 6
+CHANGE_WINDOW_HOURS = 24
+RISK_HORIZON_HOURS = 24
+LAGS_HOURS = (0, 6, 12, 24)
+DEFAULT_CITY = 'Istanbul'
+DEFAULT_DROP_THRESHOLD = 5.0
+# Uyari, tipik atak oncesi dususun bu kadari gerceklestiginde verilir
+DROP_THRESHOLD_FRACTION = 0.5
+MIN_DROP_THRESHOLD = 1.0
+
+HOUR = timedelta(hours=1)
+
+
+def _hour_bucket(dt):
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+# ─── Seriler ───
+
+def load_city_series(city, since, until):
+    """Sehrin saatlik serisini {saat: (basinc, nem, sicaklik)} olarak dondur."""
+    from .models import WeatherData
+
+    rows = WeatherData.objects.filter(
+        city__iexact=city, recorded_at__gte=since, recorded_at__lte=until,
+    ).order_by('recorded_at').values_list('recorded_at', 'pressure', 'humidity', 'temperature')
+
+    series = {}
+    for recorded_at, pressure, humidity, temperature in rows:
+        series[_hour_bucket(recorded_at)] = (pressure, humidity, temperature)
+    return forward_fill(series)
+
+
+def forward_fill(series):
+    """Ardisik olcumler arasindaki en fazla MAX_FILL_HOURS saatlik bosluklari doldur."""
+    if not series:
+        return {}
+    hours = sorted(series)
+    filled = {}
+    for prev, nxt in zip(hours, hours[1:] + [None]):
+        filled[prev] = series[prev]
+        if nxt is None:
+            break
+        gap = int((nxt - prev) / HOUR)
+        if gap <= MAX_FILL_HOURS:
+            for step in range(1, gap):
+                filled[prev + step * HOUR] = series[prev]
+    return filled
+
+
+class CityFeatures:
+    """Bir sehrin ozellik serileri ve taban istatistikleri (hastalar arasi paylasilir)."""
+
+    def __init__(self, series):
+        self.hours = sorted(series)
+        window = CHANGE_WINDOW_HOURS * HOUR
+        self.pressure_change = {}
+        self.temperature_change = {}
+        self.humidity = {}
+        for hour in self.hours:
+            pressure, humidity, temperature = series[hour]
+            self.humidity[hour] = humidity
+            previous = series.get(hour - window)
+            if previous is not None:
+                self.pressure_change[hour] = pressure - previous[0]
+                self.temperature_change[hour] = temperature - previous[2]
+
+        self.baseline = {
+            name: _mean_std(values.values())
+            for name, values in self.features().items()
+        }
+
+    def features(self):
+        return {
+            'pressure': self.pressure_change,
+            'humidity': self.humidity,
+            'temperature': self.temperature_change,
+        }
+
+
+def _mean_std(values):
+    values = list(values)
+    if len(values) < 2:
+        return None
+    return fmean(values), pstdev(values)
+
+
+def _score(values, baseline):
+    if not values or baseline is None:
+        return None
+    mean, std = baseline
+    if std == 0:
+        return None
+    return round((fmean(values) - mean) / std, 3)
+
+
+# ─── Hasta profili ───
+
+def compute_profile(attack_times, features):
+    """
+    Tek hastanin atak zamanlarini sehir serisiyle hizala ve profil alanlarini dondur.
+
+    attack_times: atak baslangic datetime listesi
+    features: CityFeatures
+    """
+    attack_hours = sorted({_hour_bucket(t) for t in attack_times})
+    result = {
+        'attacks_analyzed': len(attack_hours),
+        'pressure_sensitivity': None,
+        'humidity_sensitivity': None,
+        'temperature_sensitivity': None,
+        'best_lag_hours': None,
+        'pressure_drop_threshold': None,
+        'pressure_drop_relative_risk': None,
+    }
+    if len(attack_hours) < MIN_ATTACKS or not features.pressure_change:
+        return result
+
+    # Basinc dususu en belirgin olan gecikmeyi sec
+    best = None
+    for lag in LAGS_HOURS:
+        offset = lag * HOUR
+        drops = [
+            features.pressure_change[h - offset]
+            for h in attack_hours if h - offset in features.pressure_change
+        ]
+        score = _score(drops, features.baseline['pressure'])
+        if score is not None and (best is None or score < best[1]):
+            best = (lag, score, drops)
+
+    if best is None:
+        return result
+
+    lag, pressure_score, drops = best
+    offset = lag * HOUR
+    result['best_lag_hours'] = lag
+    result['pressure_sensitivity'] = pressure_score
+
+    for name in ('humidity', 'temperature'):
+        values = features.features()[name]
+        aligned = [values[h - offset] for h in attack_hours if h - offset in values]
+        result[f'{name}_sensitivity'] = _score(aligned, features.baseline[name])
+
+    typical_drop = median(drops)
+    if typical_drop < 0:
+        threshold = max(MIN_DROP_THRESHOLD, -typical_drop * DROP_THRESHOLD_FRACTION)
+    else:
+        threshold = DEFAULT_DROP_THRESHOLD
+    result['pressure_drop_threshold'] = round(threshold, 1)
+    result['pressure_drop_relative_risk'] = _relative_risk(
+        attack_hours, features.pressure_change, threshold,
+    )
+    return result
+
+
+def _relative_risk(attack_hours, pressure_change, threshold):
+    """P(ufukta atak | dusus >= esik) / P(ufukta atak)."""
+    followed = set()
+    for hour in attack_hours:
+        for step in range(1, RISK_HORIZON_HOURS + 1):
+            followed.add(hour - step * HOUR)
+
+    total = len(pressure_change)
+    base_hits = sum(1 for h in pressure_change if h in followed)
+    drop_hours = [h for h, change in pressure_change.items() if change <= -threshold]
+    if not total or not base_hits or not drop_hours:
+        return None
+
+    drop_hits = sum(1 for h in drop_hours if h in followed)
+    base_rate = base_hits / total
+    return round((drop_hits / len(drop_hours)) / base_rate, 2)
+
+
+# ─── Batch ───
+
+def compute_all_profiles(now=None):
+    """Son ANALYSIS_DAYS gunde atagi olan tum hastalarin profilini yeniden hesapla."""
+    from apps.migraine.models import MigraineAttack
+
+    from .models import UserWeatherAlert, WeatherSensitivityProfile
+
+    now = now or timezone.now()
+    since = now - timedelta(days=ANALYSIS_DAYS)
+
+    attacks_by_user = defaultdict(list)
+    for patient_id, start in MigraineAttack.objects.filter(
+        start_datetime__gte=since, start_datetime__lte=now,
+    ).values_list('patient_id', 'start_datetime'):
+        attacks_by_user[patient_id].append(start)
+
+    if not attacks_by_user:
+        return {'profiles': 0, 'cities': 0}
+
+    cities = dict(
+        UserWeatherAlert.objects.filter(
+            user_id__in=attacks_by_user.keys(),
+        ).values_list('user_id', 'city')
+    )
+    users_by_city = defaultdict(list)
+    for user_id in attacks_by_user:
+        users_by_city[cities.get(user_id) or DEFAULT_CITY].append(user_id)
+
+    profiles = []
+    for city, user_ids in users_by_city.items():
+        # Sehir serisi bir kez okunur; deger degisimi icin 24 saat oncesi de gerekli
+        series = load_city_series(city, since - CHANGE_WINDOW_HOURS * HOUR, now)
+        features = CityFeatures(series)
+        for user_id in user_ids:
+            fields = compute_profile(attacks_by_user[user_id], features)
+            profiles.append(WeatherSensitivityProfile(
+                user_id=user_id, city=city, computed_at=now, **fields,
+            ))
+
+    WeatherSensitivityProfile.objects.bulk_create(
+        profiles,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=['user'],
+        update_fields=[
+            'city', 'attacks_analyzed', 'pressure_sensitivity', 'humidity_sensitivity',
+            'temperature_sensitivity', 'best_lag_hours', 'pressure_drop_threshold',
+            'pressure_drop_relative_risk', 'computed_at',
+        ],
+    )
+    logger.info(f"Weather sensitivity computed for {len(profiles)} patients in {len(users_by_city)} cities")
+    return {'profiles': len(profiles), 'cities': len(users_by_city)}
+
+
+# ─── Uyari kontrolu ───
+
+def pressure_drop_risk(profile, pressure_change_24h):
+    """Hazir profil ve guncel 24 saatlik degisimle risk seviyesini dondur (sorgu yok)."""
+    threshold = DEFAULT_DROP_THRESHOLD
+    relative_risk = None
+    if profile is not None and profile.pressure_drop_threshold is not None:
+        threshold = profile.pressure_drop_threshold
+        relative_risk = profile.pressure_drop_relative_risk
+
+    dropping = pressure_change_24h <= -threshold
+    if dropping and relative_risk is not None and relative_risk >= 1.5:
+        level = 'high'
+    elif dropping:
+        level = 'elevated'
+    else:
+        level = 'normal'
+
+    return {
+        'risk_level': level,
+        'pressure_change_24h': pressure_change_24h,
+        'personal_threshold': threshold,
+        'relative_risk': relative_risk,
+    }
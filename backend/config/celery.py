@@ -27,10 +27,18 @@ app.conf.beat_schedule = {
         'task': 'apps.wellness.tasks.update_weather_cache',
         'schedule': crontab(minute=0, hour='*/3'),  # Her 3 saat
     },
+    'compute-weather-sensitivity': {
+        'task': 'apps.wellness.tasks.compute_weather_sensitivity',
+        'schedule': crontab(hour=2, minute=30),  # Her gun 02:30
+    },
     'daily-streak-check': {
         'task': 'apps.gamification.tasks.daily_streak_check',
         'schedule': crontab(hour=0, minute=30),  # Her gun 00:30
     },
+    'process-gamification-events': {
+        'task': 'apps.gamification.tasks.process_gamification_events',
+        'schedule': crontab(minute='*'),  # Her dakika (on_commit kuyrugu icin yedek)
+    },
     'auto-generate-weekly-content': {
         'task': 'apps.content.tasks.auto_generate_weekly_content',
         'schedule': crontab(hour=9, minute=0, day_of_week=1),  # Pazartesi 09:00
@@ -67,9 +75,40 @@ app.conf.beat_schedule = {
         'task': 'apps.common.tasks.scan_broken_links',
         'schedule': crontab(hour=4, minute=0, day_of_week=3),  # Carsamba 04:00
     },
+    'scan-broken-links-incremental': {
+        'task': 'apps.common.tasks.scan_broken_links',
+        'schedule': crontab(hour=4, minute=30),  # Her gun 04:30 (degisen icerik)
+        'kwargs': {'incremental': True},
+    },
+    'purge-idempotency-keys': {
+        'task': 'apps.common.tasks.purge_idempotency_keys',
+        'schedule': crontab(hour=3, minute=45),  # Her gun 03:45
+    },
+    'purge-generated-reports': {
+        'task': 'apps.common.tasks.purge_generated_reports',
+        'schedule': crontab(hour=3, minute=50),  # Her gun 03:50
+    },
+    'purge-data-exports': {
+        'task': 'apps.common.tasks.purge_data_exports',
+        'schedule': crontab(hour=3, minute=55),  # Her gun 03:55
+    },
+    'purge-health-audits': {
+        'task': 'apps.common.tasks.purge_health_audits',
+        'schedule': crontab(hour=4, minute=0),  # Her gun 04:00
+    },
+    'reconcile-seizure-summaries': {
+        'task': 'apps.epilepsy.tasks.reconcile_seizure_summaries',
+        'schedule': crontab(hour=3, minute=15),  # Her gun 03:15
+    },
     # Backend-Frontend Uyum Kontrolü
     'backend-frontend-health-check': {
         'task': 'apps.common.tasks.backend_frontend_health_check',
-        'schedule': crontab(hour=6, minute=0),  # Her gün 06:00
+        'schedule': crontab(minute='*/15'),  # Her 15 dakika (yalnizca degisen kapsamlar)
+    },
+    'backend-frontend-health-check-full': {
+        'task': 'apps.common.tasks.backend_frontend_health_check',
+        # */15 artimli calismayla cakismasin diye 06:07
+        'schedule': crontab(hour=6, minute=7),  # Her gün 06:07 (tam denetim + endpoint'ler)
+        'kwargs': {'full': True},
     },
 }
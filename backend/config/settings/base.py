@@ -176,7 +176,7 @@ ADMIN_URL = os.environ.get('ADMIN_URL', 'admin/')
 # ---------- Django REST Framework ----------
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.accounts.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -231,6 +231,9 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'Europe/Istanbul'
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 
+# Gunluk egitim drip'i: >1 ise hastalar patient_id % N ile paralel gorevlere bolunur
+EDUCATION_DRIP_SHARDS = int(os.environ.get('EDUCATION_DRIP_SHARDS', '1'))
+
 # ---------- iyzico ----------
 IYZICO_API_KEY = os.environ.get('IYZICO_API_KEY', '')
 IYZICO_SECRET_KEY = os.environ.get('IYZICO_SECRET_KEY', '')
@@ -250,6 +253,9 @@ RECAPTCHA_SCORE_THRESHOLD = float(os.environ.get('RECAPTCHA_SCORE_THRESHOLD', '0
 
 # ---------- OpenWeatherMap ----------
 OPENWEATHERMAP_API_KEY = os.environ.get('OPENWEATHERMAP_API_KEY', '')
+OPENWEATHERMAP_BASE_URL = os.environ.get(
+    'OPENWEATHERMAP_BASE_URL', 'https://api.openweathermap.org/data/2.5'
+)
 
 # ---------- LLM API ----------
 GROQ_API_KEY = os.environ.get('GROQ_API_KEY', '')
@@ -258,6 +264,8 @@ LLM_PRIMARY_PROVIDER = 'groq'
 LLM_FALLBACK_PROVIDER = 'gemini'
 LLM_MAX_RETRIES = 2
 LLM_TIMEOUT_SECONDS = 30
+# Saglayici dakikalik istek siniri (paralel ceviri parcalari bunu paylasir)
+LLM_REQUESTS_PER_MINUTE = int(os.environ.get('LLM_REQUESTS_PER_MINUTE', '30'))
 
 # ---------- Social Media API ----------
 META_APP_ID = os.environ.get('META_APP_ID', '')
@@ -7,7 +7,7 @@ from django.conf.urls.static import static
 
 from services.admin_views import pipeline_run_view
 
-from apps.common.views_health import HealthCheckView
+from apps.common.views_health import ConsistencyAuditView, HealthCheckView, LivenessView, ReadinessView
 from apps.common.views_contact import ContactFormView
 
 # Admin branding
@@ -27,6 +27,9 @@ if not settings.DEBUG:
 
 urlpatterns = [
     path('api/v1/health/', HealthCheckView.as_view(), name='health-check'),
+    path('api/v1/health/live/', LivenessView.as_view(), name='health-live'),
+    path('api/v1/health/ready/', ReadinessView.as_view(), name='health-ready'),
+    path('api/v1/health/consistency/', ConsistencyAuditView.as_view(), name='health-consistency'),
     path('api/v1/contact/', ContactFormView.as_view(), name='contact-form'),
     path(f"{settings.ADMIN_URL}pipeline/", pipeline_run_view, name="pipeline_run"),
     path(settings.ADMIN_URL, admin.site.urls),
@@ -47,6 +50,7 @@ urlpatterns = [
     path('api/v1/doctor/', include('apps.doctor_panel.urls')),
     path('api/v1/kvkk/', include('apps.common.urls')),
     path('api/v1/site/', include('apps.common.urls_site')),
+    path('api/v1/reports/', include('apps.common.urls_reports')),
     path('api/v1/wellness/', include('apps.wellness.urls')),
     path('api/v1/gamification/', include('apps.gamification.urls')),
     path('api/v1/social/', include('apps.social.urls')),
@@ -149,3 +149,28 @@ def disease_module(db):
         }
     )
     return module
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """Uploaded/generated files go to a per-test temporary directory."""
+    settings.MEDIA_ROOT = tmp_path / 'media'
+    return settings.MEDIA_ROOT
+
+
+@pytest.fixture(autouse=True)
+def site_snapshot_reset():
+    """Proses ici site goruntusu testler arasinda tasinmasin (rollback sinyal tetiklemez)."""
+    from apps.common import site_snapshot
+    site_snapshot.reset()
+    yield
+    site_snapshot.reset()
+
+
+@pytest.fixture(autouse=True)
+def auth_cache_reset():
+    """Proses ici kullanici onbellegi testler arasinda tasinmasin."""
+    from apps.accounts import authentication
+    authentication.reset()
+    yield
+    authentication.reset()
@@ -0,0 +1,94 @@
+"""
+Ajan calistirma baglami (contextvars).
+
+agent_registry her ajandan tek ornek tutar; ayni ajan farkli thread'lerde
+es zamanli calisabilir. Bu yuzden calistirmaya ait durum (token kullanimi,
+provider/model, sure, flag_overrides) ajan orneginde degil, her run()
+cagrisinin actigi ExecutionContext'te tutulur.
+
+- BaseAgent.run baglami acar; llm_call her yaniti current() baglamina yazar.
+- Ic ice run() cagrilari kendi baglamini acar; flag_overrides verilmediyse
+  dis baglamdakini devralir.
+- ThreadPoolExecutor contextvars'i aktarmaz: ajan icinden thread'e is
+  gonderirken bind() ile sarin (ayni baglama yazilir).
+
+Kullanım:
+    with execution_context('translation_agent', flag_overrides) as ctx:
+        ...
+        ctx.tokens_used, ctx.provider, ctx.elapsed_ms()
+
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(bind(self._translate_chunk), chunks))
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class ExecutionContext:
+    """Tek bir ajan calistirmasinin durumu."""
+    agent_name: str
+    flag_overrides: Optional[dict] = None
+    provider: str = ''
+    model: str = ''
+    tokens_used: int = 0
+    llm_calls: int = 0
+    llm_ms: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, provider: str = '', model: str = '', tokens: int = 0, duration_ms: int = 0):
+        """Bir LLM cagrisinin kullanimini ekle (bind() ile thread'lerden de cagrilir)."""
+        with self._lock:
+            self.llm_calls += 1
+            self.tokens_used += tokens
+            self.llm_ms += duration_ms
+            if provider:
+                self.provider = provider
+            if model:
+                self.model = model
+
+    def record_response(self, response):
+        self.record(response.provider, response.model, response.tokens_used, response.duration_ms)
+
+    def elapsed_ms(self) -> int:
+        return int((time.monotonic() - self.started_at) * 1000)
+
+
+_current: contextvars.ContextVar = contextvars.ContextVar('agent_execution_context', default=None)
+
+
+def current() -> Optional[ExecutionContext]:
+    """Aktif calistirma baglami (run() disinda None)."""
+    return _current.get()
+
+
+@contextmanager
+def execution_context(agent_name: str, flag_overrides: Optional[dict] = None):
+    """Yeni baglam ac; flag_overrides None ise dis baglamdakini devral."""
+    parent = _current.get()
+    if flag_overrides is None and parent is not None:
+        flag_overrides = parent.flag_overrides
+    context = ExecutionContext(agent_name=agent_name, flag_overrides=flag_overrides)
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+
+
+def bind(fn):
+    """
+    Cagiran thread'in baglamini yakala; fn her cagrildiginda bu baglamin
+    bir kopyasinda calissin (ayni Context ayni anda iki thread'de acilamaz).
+    """
+    captured = contextvars.copy_context()
+
+    def wrapper(*args, **kwargs):
+        return captured.copy().run(fn, *args, **kwargs)
+    return wrapper
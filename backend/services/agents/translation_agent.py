@@ -2,7 +2,9 @@
 Cevirmen Ajan - TR -> EN tibbi icerik cevirisi.
 
 Pipeline'da Legal Agent'tan sonra calisir.
-Content Agent'in urettigi Turkce icerigi Ingilizce'ye cevirir.
+Content Agent'in urettigi Turkce icerigi Ingilizce'ye cevirir. Uzun
+govdeler kesilmez; paragraf segmentleri halinde cevrilir ve ceviri
+belleginde tutulur.
 """
 
 import json
@@ -12,6 +14,7 @@ from typing import Optional
 
 from services.base_agent import BaseAgent
 from services.prompts.translation_prompts import TRANSLATION_SYSTEM_PROMPT
+from services.translation_engine import TranslationEngine
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +33,10 @@ class TranslationAgent(BaseAgent):
         """
         Turkce icerigi Ingilizce'ye cevir.
 
+        Govde paragraf segmentlerine bolunur; ceviri bellegindeki segmentler
+        LLM'e gitmez, kalanlar parcalar halinde paralel cevrilir
+        (services.translation_engine).
+
         Input: title_tr, body_tr, excerpt_tr, module
         Output: title_en, body_en, excerpt_en + SEO EN alanlari
         """
@@ -41,32 +48,48 @@ class TranslationAgent(BaseAgent):
         if not body_tr:
             return {**input_data, 'translation_error': 'Cevirilecek icerik (body_tr) bos'}
 
-        # Icerik cok uzunsa parcala: sadece baslik + ozet + body'nin ilk 2000 karakteri
-        body_short = body_tr[:2000] if len(body_tr) > 2000 else body_tr
-
-        prompt = self._build_prompt(title_tr, body_short, excerpt_tr, module)
-        response = self.llm_call(prompt)
-        translation_data = self._parse_response(response.content)
+        engine = TranslationEngine(self.llm_call, context=self._module_context(module))
+        translation = engine.translate({
+            'title_en': title_tr,
+            'body_en': body_tr,
+            'excerpt_en': excerpt_tr,
+        })
 
         result = {**input_data}
-
-        if translation_data.get('title_en'):
-            result['title_en'] = translation_data['title_en']
-        if translation_data.get('body_en'):
-            result['body_en'] = translation_data['body_en']
-        if translation_data.get('excerpt_en'):
-            result['excerpt_en'] = translation_data['excerpt_en']
-        if not result.get('seo_title_en') and translation_data.get('seo_title_en'):
-            result['seo_title_en'] = translation_data['seo_title_en']
-        if not result.get('seo_description_en') and translation_data.get('seo_description_en'):
-            result['seo_description_en'] = translation_data['seo_description_en']
-
-        result['translation_provider'] = response.provider
-        result['translation_tokens'] = response.tokens_used
+        provider = translation.provider
+        tokens = translation.tokens_used
+
+        # Tek bir segment bile cevrilemediyse kismi (TR/EN karisik) metin yayinlanmaz
+        if translation.stats['failed']:
+            result['translation_error'] = (
+                f"{translation.stats['failed']} segment cevrilemedi "
+                f"({', '.join(translation.incomplete)})"
+            )
+            result['translation_provider'] = provider
+            result['translation_tokens'] = tokens
+            result['translation_stats'] = translation.stats
+            return result
+
+        result.update({key: value for key, value in translation.texts.items() if value})
+
+        # SEO alanlari yalnizca eksikse uretilir (kisa, govdesiz istek)
+        if not result.get('seo_title_en') or not result.get('seo_description_en'):
+            response = self.llm_call(self._build_seo_prompt(
+                result.get('title_en', ''), result.get('excerpt_en', ''), module,
+            ))
+            seo_data = self._parse_response(response.content)
+            for key in ('seo_title_en', 'seo_description_en'):
+                if not result.get(key) and seo_data.get(key):
+                    result[key] = seo_data[key]
+            provider = provider or response.provider
+            tokens += response.tokens_used
+
+        result['translation_provider'] = provider or 'memory'
+        result['translation_tokens'] = tokens
+        result['translation_stats'] = translation.stats
         return result
 
-    def _build_prompt(self, title_tr, body_tr, excerpt_tr, module):
-        """Ceviri prompt'u."""
+    def _module_context(self, module):
         module_context = {
             'migraine': 'migraine / headache neurology',
             'epilepsy': 'epilepsy / seizure disorders',
@@ -74,31 +97,20 @@ class TranslationAgent(BaseAgent):
             'wellness': 'wellness / healthy living',
             'general': 'general neurology',
         }
-        context = module_context.get(module, 'neurology')
-
-        return f"""Translate the following Turkish medical content to English.
-
-MEDICAL FIELD: {context}
+        return module_context.get(module, 'neurology')
 
-TURKISH TITLE: {title_tr}
+    def _build_seo_prompt(self, title_en, excerpt_en, module):
+        """Cevrilmis baslik ve ozetten SEO alanlari prompt'u."""
+        return f"""Write English SEO fields for the following medical article.
 
-TURKISH SUMMARY: {excerpt_tr}
+MEDICAL FIELD: {self._module_context(module)}
 
-TURKISH CONTENT:
-{body_tr}
+TITLE: {title_en}
 
-RULES:
-1. Translate medical terms correctly
-2. Keep the informational tone
-3. Translate the disclaimer too
-4. Keep Markdown formatting
-5. Write natural English
+SUMMARY: {excerpt_en}
 
 OUTPUT FORMAT (JSON):
 {{
-    "title_en": "English title",
-    "body_en": "Full English content in Markdown",
-    "excerpt_en": "2-3 sentence English summary",
     "seo_title_en": "SEO title max 60 chars",
     "seo_description_en": "Meta description max 160 chars"
 }}
@@ -9,6 +9,10 @@ Her ajan su ozelliklere sahiptir:
 - execute(): Ana calistirma metodu
 - validate_output(): Teknik cikti dogrulama
 - check_gatekeeper_decision(): Is mantigi red karari (pipeline kontrolu)
+
+Calistirmaya ait durum (token, provider, sure, flag_overrides) ajan
+orneginde degil, run()'in actigi ExecutionContext'te tutulur
+(services.agent_context); ayni ornek es zamanli calistirilabilir.
 """
 
 import logging
@@ -16,12 +20,14 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
-from django.utils import timezone
-
+from services import agent_context
 from services.llm_client import llm_client, LLMResponse, LLMError
 
 logger = logging.getLogger(__name__)
 
+# flag_overrides icinde tum flag'leri temsil eden anahtar
+ALL_FLAGS = '*'
+
 
 class _NullTask:
     """
@@ -75,24 +81,33 @@ class BaseAgent(ABC):
     temperature: float = 0.7
     max_tokens: int = 2000
 
-    # Son LLM cagrisi bilgileri (AgentTask icin)
-    _last_provider: str = ''
-    _last_model: str = ''
-    _last_tokens: int = 0
-
     def is_enabled(self) -> bool:
-        """FeatureFlag kontrolu. Flag yoksa veya aktifse True."""
+        """FeatureFlag kontrolu (proses ici site goruntusu). Flag anahtari yoksa True."""
         if not self.feature_flag_key:
             return True
         try:
-            from apps.common.models import FeatureFlag
-            flag = FeatureFlag.objects.filter(key=self.feature_flag_key).first()
-            if flag is None:
-                return False  # Flag tanimlanmamissa kapali kabul et
-            return flag.is_enabled
+            from apps.common import site_snapshot
+            # Flag tanimlanmamissa kapali kabul et
+            return site_snapshot.is_feature_enabled(self.feature_flag_key, default=False)
         except Exception:
             return False
 
+    def is_enabled_with(self, flag_overrides: Optional[dict] = None) -> bool:
+        """
+        Calistirmaya ozel flag degerleri ({key: bool}, '*' hepsi) varsa onlari,
+        yoksa is_enabled() sonucunu kullan. BaseAgent.is_enabled'i sinif
+        seviyesinde degistirmenin aksine es zamanli calistirmalari etkilemez.
+        Arguman verilmezse aktif calistirma baglamindaki degerler kullanilir.
+        """
+        if flag_overrides is None:
+            context = agent_context.current()
+            flag_overrides = context.flag_overrides if context else None
+        if flag_overrides:
+            forced = flag_overrides.get(self.feature_flag_key, flag_overrides.get(ALL_FLAGS))
+            if forced is not None:
+                return bool(forced)
+        return self.is_enabled()
+
     def llm_call(
         self,
         message: str,
@@ -118,10 +133,10 @@ class BaseAgent(ABC):
             temperature=temperature or self.temperature,
             max_tokens=max_tokens or self.max_tokens,
         )
-        # Son LLM cagrisi bilgisini sakla (AgentTask icin)
-        self._last_provider = response.provider
-        self._last_model = response.model
-        self._last_tokens = response.tokens_used
+        # Kullanimi bu calistirmanin baglamina yaz (AgentTask icin)
+        context = agent_context.current()
+        if context is not None:
+            context.record_response(response)
         return response
 
     def run(
@@ -130,6 +145,7 @@ class BaseAgent(ABC):
         triggered_by=None,
         parent_task=None,
         is_gatekeeper: bool = False,
+        flag_overrides: Optional[dict] = None,
     ) -> AgentResult:
         """
         Ajan calistirma wrapper. FeatureFlag, AgentTask lifecycle,
@@ -142,9 +158,16 @@ class BaseAgent(ABC):
             triggered_by: Tetikleyen kullanici (AuditLog + AgentTask icin)
             parent_task: Ust pipeline AgentTask (subtask iliskisi icin)
             is_gatekeeper: Bu ajan pipeline'da gatekeeper mi?
+            flag_overrides: Calistirmaya ozel flag degerleri (is_enabled_with);
+                None ise dis calistirma baglamindakiler devralinir
         """
+        with agent_context.execution_context(self.name, flag_overrides) as context:
+            return self._run(context, input_data, triggered_by, parent_task, is_gatekeeper)
+
+    def _run(self, context, input_data, triggered_by, parent_task, is_gatekeeper) -> AgentResult:
+        """run() govdesi; kullanim ve sure `context`'ten okunur."""
         # 1. Feature flag kontrolu
-        if not self.is_enabled():
+        if not self.is_enabled_with(context.flag_overrides):
             logger.info(f"Agent {self.name} is disabled via FeatureFlag")
             task = self._create_task(input_data, triggered_by, parent_task)
             task.status = 'skipped'
@@ -162,14 +185,13 @@ class BaseAgent(ABC):
         task.mark_running()
 
         # 3. Calistir
-        start = timezone.now()
         try:
             result = self.execute(input_data)
 
             # 4. Teknik dogrulama
             validation_error = self.validate_output(result)
             if validation_error:
-                duration = int((timezone.now() - start).total_seconds() * 1000)
+                duration = context.elapsed_ms()
                 logger.warning(
                     f"Agent {self.name} output validation failed: {validation_error}"
                 )
@@ -194,16 +216,16 @@ class BaseAgent(ABC):
             if is_gatekeeper:
                 gatekeeper_error = self.check_gatekeeper_decision(result)
                 if gatekeeper_error:
-                    duration = int((timezone.now() - start).total_seconds() * 1000)
+                    duration = context.elapsed_ms()
                     logger.warning(
                         f"Agent {self.name} gatekeeper red: {gatekeeper_error}"
                     )
                     task.mark_failed(f"Gatekeeper red: {gatekeeper_error}")
                     task.duration_ms = duration
                     task.output_data = result if isinstance(result, dict) else {}
-                    task.tokens_used = self._last_tokens
-                    task.llm_provider = self._last_provider
-                    task.llm_model = self._last_model
+                    task.tokens_used = context.tokens_used
+                    task.llm_provider = context.provider
+                    task.llm_model = context.model
                     task.save(update_fields=[
                         'duration_ms', 'output_data', 'tokens_used',
                         'llm_provider', 'llm_model',
@@ -217,20 +239,20 @@ class BaseAgent(ABC):
                         data=result,  # Partial data'yi yine dondur
                         error=f"Gatekeeper red: {gatekeeper_error}",
                         agent_name=self.name,
-                        provider=self._last_provider,
-                        tokens_used=self._last_tokens,
+                        provider=context.provider,
+                        tokens_used=context.tokens_used,
                         duration_ms=duration,
                         task_id=str(task.id) if task.id else None,
                     )
 
             # 6. Basarili - logla ve AgentTask guncelle
-            duration = int((timezone.now() - start).total_seconds() * 1000)
+            duration = context.elapsed_ms()
             task.mark_completed(
                 output_data=result if isinstance(result, dict) else {},
-                tokens=self._last_tokens,
+                tokens=context.tokens_used,
                 duration=duration,
-                provider=self._last_provider,
-                model_name=self._last_model,
+                provider=context.provider,
+                model_name=context.model,
             )
             self._log_execution(
                 input_data, result, triggered_by, duration, success=True
@@ -240,14 +262,14 @@ class BaseAgent(ABC):
                 success=True,
                 data=result,
                 agent_name=self.name,
-                provider=self._last_provider,
-                tokens_used=self._last_tokens,
+                provider=context.provider,
+                tokens_used=context.tokens_used,
                 duration_ms=duration,
                 task_id=str(task.id) if task.id else None,
             )
 
         except LLMError as e:
-            duration = int((timezone.now() - start).total_seconds() * 1000)
+            duration = context.elapsed_ms()
             task.mark_failed(str(e))
             task.duration_ms = duration
             task.save(update_fields=['duration_ms'])
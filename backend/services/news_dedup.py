@@ -0,0 +1,110 @@
+"""
+Haber tekrar tespiti (near-duplicate).
+
+Basliklar ve ozetler normalize edilip kelime + kelime ikilisi (shingle)
+ozelliklerine ayrilir, 64 bit SimHash parmak izi uretilir. Indeks parmak
+izini 4 x 16 bitlik bantlara boler: Hamming mesafesi <= 3 olan iki parmak
+izi en az bir bantta birebir ayni olacagindan (guvercin yuvasi), aday
+arama sozluk erisimiyle yapilir, tum kayitlarla karsilastirma gerekmez.
+
+Kullanım:
+    index = NearDuplicateIndex()
+    index.add('FDA approves new migraine drug')
+    index.contains('FDA Approves New Migraine Drug!')  # True
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections import defaultdict
+
+FINGERPRINT_BITS = 64
+BANDS = 4
+BAND_BITS = FINGERPRINT_BITS // BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+MAX_DISTANCE = 3
+
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'by', 'for', 'from', 'in', 'into',
+    'is', 'of', 'on', 'or', 'the', 'to', 'with', 've', 'ile', 'bir', 'bu',
+})
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def normalize_tokens(text: str) -> list[str]:
+    """Kucuk harf, aksan temizligi, noktalama ve stopword atma."""
+    text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode()
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def shingles(tokens: list[str]) -> set[str]:
+    features = set(tokens)
+    features.update(f'{a} {b}' for a, b in zip(tokens, tokens[1:]))
+    return features
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), 'big')
+
+
+def simhash(text: str) -> int | None:
+    """Metnin 64 bit SimHash parmak izi (ozellik yoksa None)."""
+    features = shingles(normalize_tokens(text))
+    if not features:
+        return None
+
+    weights = [0] * FINGERPRINT_BITS
+    for feature in features:
+        h = _feature_hash(feature)
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class NearDuplicateIndex:
+    """Bantli SimHash indeksi."""
+
+    def __init__(self, max_distance: int = MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._bands = [defaultdict(set) for _ in range(BANDS)]
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @staticmethod
+    def _band_keys(fingerprint: int):
+        for band in range(BANDS):
+            yield band, fingerprint >> (band * BAND_BITS) & BAND_MASK
+
+    def add_fingerprint(self, fingerprint: int | None):
+        if fingerprint is None:
+            return
+        for band, key in self._band_keys(fingerprint):
+            self._bands[band][key].add(fingerprint)
+        self._size += 1
+
+    def add(self, text: str):
+        self.add_fingerprint(simhash(text))
+
+    def contains_fingerprint(self, fingerprint: int | None) -> bool:
+        if fingerprint is None:
+            return False
+        for band, key in self._band_keys(fingerprint):
+            for candidate in self._bands[band].get(key, ()):
+                if hamming(candidate, fingerprint) <= self.max_distance:
+                    return True
+        return False
+
+    def contains(self, text: str) -> bool:
+        return self.contains_fingerprint(simhash(text))
@@ -11,25 +11,46 @@ Kaynaklar:
 - Neurology Today RSS
 - WHO Newsroom RSS
 
+Kaynaklar paralel çekilir (ortak session + ETag/If-Modified-Since cache),
+tekrarlar SimHash indeksiyle elenir, sadece yeni haberler news_agent'a
+paralel gönderilir.
+
 Kullanım:
     from services.news_fetcher import NewsFetcher
     fetcher = NewsFetcher()
     items = fetcher.fetch_all(max_per_source=3)
 """
 
+import hashlib
+import json
 import logging
 import re
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import reduce
+from operator import or_
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
 from django.utils import timezone
 
+from services.base_agent import ALL_FLAGS
+from services.news_dedup import NearDuplicateIndex, simhash
+
 logger = logging.getLogger(__name__)
 
 FETCH_TIMEOUT = 15  # saniye
+FETCH_WORKERS = 8
+AGENT_WORKERS = 3
+CONDITIONAL_CACHE_TIMEOUT = 7 * 24 * 3600
+DEDUP_LOOKBACK_DAYS = 365
+USER_AGENT = 'Norosera/1.0 (Neurology Platform; +https://norosera.com)'
 
 
 @dataclass
@@ -48,6 +69,66 @@ class NewsItem:
     disease_tags: list = field(default_factory=list)
 
 
+# ═══════════════════════════════════════════════════════
+# HTTP istemcisi (ortak session + koşullu istek cache'i)
+# ═══════════════════════════════════════════════════════
+
+class FeedClient:
+    """
+    Thread'ler arası paylaşılan bağlantı havuzlu HTTP istemcisi.
+
+    Sunucu ETag / Last-Modified döndürürse gövde cache'e yazılır, sonraki
+    çağrı koşullu istek atar; 304 gelirse cache'teki gövde kullanılır.
+    """
+
+    def __init__(self, pool_size: int = FETCH_WORKERS):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['User-Agent'] = USER_AGENT
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[dict]) -> str:
+        raw = url + '?' + json.dumps(params or {}, sort_keys=True)
+        return 'news_fetch:' + hashlib.sha256(raw.encode()).hexdigest()
+
+    def get_text(self, url: str, params: Optional[dict] = None) -> str:
+        key = self._cache_key(url, params)
+        cached = cache.get(key)
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        resp = self.session.get(url, params=params, headers=headers, timeout=FETCH_TIMEOUT)
+        if resp.status_code == 304 and cached:
+            return cached['body']
+        resp.raise_for_status()
+
+        etag = resp.headers.get('ETag', '')
+        last_modified = resp.headers.get('Last-Modified', '')
+        if etag or last_modified:
+            cache.set(key, {
+                'etag': etag,
+                'last_modified': last_modified,
+                'body': resp.text,
+            }, CONDITIONAL_CACHE_TIMEOUT)
+        return resp.text
+
+
+_default_client = None
+
+
+def get_client() -> FeedClient:
+    global _default_client
+    if _default_client is None:
+        _default_client = FeedClient()
+    return _default_client
+
+
 # ═══════════════════════════════════════════════════════
 # PubMed E-utilities (ücretsiz, API key opsiyonel)
 # ═══════════════════════════════════════════════════════
@@ -79,33 +160,33 @@ PUBMED_QUERIES = [
 ]
 
 
-def fetch_pubmed(query: str, max_results: int = 3, disease: str = '', category: str = 'clinical_trial') -> list[NewsItem]:
+def fetch_pubmed(query: str, max_results: int = 3, disease: str = '', category: str = 'clinical_trial',
+                 client: Optional[FeedClient] = None) -> list[NewsItem]:
     """PubMed'den araştırma makaleleri çeker."""
+    client = client or get_client()
     items = []
     try:
         # 1. Arama — PMID listesi al
-        search_resp = requests.get(PUBMED_SEARCH_URL, params={
+        search_body = client.get_text(PUBMED_SEARCH_URL, params={
             'db': 'pubmed',
             'term': query,
             'retmax': max_results,
             'sort': 'date',
             'retmode': 'json',
-        }, timeout=FETCH_TIMEOUT)
-        search_resp.raise_for_status()
-        id_list = search_resp.json().get('esearchresult', {}).get('idlist', [])
+        })
+        id_list = json.loads(search_body).get('esearchresult', {}).get('idlist', [])
 
         if not id_list:
             return items
 
         # 2. Detay çek — XML
-        fetch_resp = requests.get(PUBMED_FETCH_URL, params={
+        fetch_body = client.get_text(PUBMED_FETCH_URL, params={
             'db': 'pubmed',
             'id': ','.join(id_list),
             'retmode': 'xml',
-        }, timeout=FETCH_TIMEOUT)
-        fetch_resp.raise_for_status()
+        })
 
-        root = ET.fromstring(fetch_resp.text)
+        root = ET.fromstring(fetch_body)
         for article_el in root.findall('.//PubmedArticle'):
             try:
                 title_el = article_el.find('.//ArticleTitle')
@@ -202,19 +283,15 @@ RSS_FEEDS = [
 ]
 
 
-def fetch_rss_feed(feed_config: dict, max_items: int = 3) -> list[NewsItem]:
+def fetch_rss_feed(feed_config: dict, max_items: int = 3, client: Optional[FeedClient] = None) -> list[NewsItem]:
     """Tek bir RSS feed'den haber çeker (stdlib XML parser)."""
+    client = client or get_client()
     items = []
     name = feed_config['name']
     url = feed_config['url']
 
     try:
-        resp = requests.get(url, timeout=FETCH_TIMEOUT, headers={
-            'User-Agent': 'Norosera/1.0 (Neurology Platform; +https://norosera.com)',
-        })
-        resp.raise_for_status()
-
-        root = ET.fromstring(resp.text)
+        root = ET.fromstring(client.get_text(url))
 
         # RSS 2.0 items
         entries = root.findall('.//item')
@@ -300,43 +377,153 @@ def fetch_rss_feed(feed_config: dict, max_items: int = 3) -> list[NewsItem]:
 # Ana Fetcher sınıfı
 # ═══════════════════════════════════════════════════════
 
+def _existing_news_index(items: list[NewsItem]) -> tuple[NearDuplicateIndex, set, set]:
+    """
+    Mevcut haberlerden tekrar indeksi kur.
+    Son DEDUP_LOOKBACK_DAYS gunun basliklari SimHash indeksine, kaynak URL'leri
+    kumeye alinir; daha eskiler icin sadece gelen basliklarla birebir eslesme sorgulanir.
+    """
+    from apps.content.models import NewsArticle
+
+    title_index = NearDuplicateIndex()
+    source_urls = set()
+    since = timezone.now() - timedelta(days=DEDUP_LOOKBACK_DAYS)
+    for title_en, urls in NewsArticle.objects.filter(created_at__gte=since).values_list(
+        'title_en', 'source_urls',
+    ):
+        title_index.add(title_en)
+        for entry in urls or []:
+            url = entry.get('url') if isinstance(entry, dict) else entry
+            if isinstance(url, str) and url:
+                source_urls.add(url)
+
+    exact_titles = set(
+        NewsArticle.objects.filter(
+            title_en__in=[item.title for item in items],
+        ).values_list('title_en', flat=True)
+    )
+    return title_index, source_urls, exact_titles
+
+
+def select_new_items(items: list[NewsItem]) -> list[NewsItem]:
+    """Daha once yayinlanmis veya bu partide tekrar eden haberleri ele."""
+    title_index, source_urls, exact_titles = _existing_news_index(items)
+    abstract_index = NearDuplicateIndex()
+
+    fresh = []
+    for item in items:
+        if item.url and item.url in source_urls:
+            continue
+        if item.title in exact_titles:
+            continue
+        title_fp = simhash(item.title)
+        if title_index.contains_fingerprint(title_fp):
+            continue
+        abstract_fp = simhash(item.summary) if item.summary else None
+        if abstract_index.contains_fingerprint(abstract_fp):
+            continue
+
+        title_index.add_fingerprint(title_fp)
+        abstract_index.add_fingerprint(abstract_fp)
+        if item.url:
+            source_urls.add(item.url)
+        fresh.append(item)
+    return fresh
+
+
+def reserve_slugs(bases: list[str]) -> list[str]:
+    """Slug tabanlari icin tek sorguyla cakismayan slug'lar ayir (sira korunur)."""
+    from apps.content.models import NewsArticle
+
+    if not bases:
+        return []
+    taken = set(
+        NewsArticle.objects.filter(
+            reduce(or_, (Q(slug__startswith=base) for base in set(bases))),
+        ).values_list('slug', flat=True)
+    )
+
+    slugs = []
+    for base in bases:
+        slug = base
+        counter = 1
+        while slug in taken:
+            slug = f'{base}-{counter}'
+            counter += 1
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
 class NewsFetcher:
     """Tüm kaynaklardan haber toplar ve news_agent'a besler."""
 
-    def fetch_all(self, max_per_source: int = 3) -> list[NewsItem]:
-        """Tüm kaynaklardan haber çeker."""
-        all_items: list[NewsItem] = []
+    def __init__(self, client: Optional[FeedClient] = None):
+        self.client = client or get_client()
 
-        # PubMed
-        for pq in PUBMED_QUERIES:
-            items = fetch_pubmed(
-                query=pq['query'],
-                max_results=max_per_source,
-                disease=pq['disease'],
-                category=pq['category'],
+    def fetch_all(self, max_per_source: int = 3) -> list[NewsItem]:
+        """Tüm kaynaklardan haberleri paralel çeker (sonuç sırası kaynak sırasıdır)."""
+        jobs = [
+            (
+                f"PubMed [{pq['disease'] or 'general'}]",
+                lambda pq=pq: fetch_pubmed(
+                    query=pq['query'],
+                    max_results=max_per_source,
+                    disease=pq['disease'],
+                    category=pq['category'],
+                    client=self.client,
+                ),
             )
-            all_items.extend(items)
-            logger.info(f"PubMed [{pq['disease'] or 'general'}]: {len(items)} makale")
+            for pq in PUBMED_QUERIES
+        ] + [
+            (
+                f"RSS [{feed['name']}]",
+                lambda feed=feed: fetch_rss_feed(feed, max_items=max_per_source, client=self.client),
+            )
+            for feed in RSS_FEEDS
+        ]
 
-        # RSS Feeds
-        for feed in RSS_FEEDS:
-            items = fetch_rss_feed(feed, max_items=max_per_source)
-            all_items.extend(items)
-            logger.info(f"RSS [{feed['name']}]: {len(items)} haber")
+        all_items: list[NewsItem] = []
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+            for (label, _), items in zip(jobs, pool.map(lambda job: job[1](), jobs)):
+                all_items.extend(items)
+                logger.info(f"{label}: {len(items)} kayıt")
 
         logger.info(f"Toplam {len(all_items)} haber kaynağı toplandı")
         return all_items
 
+    @staticmethod
+    def _run_agent(news_agent, item: NewsItem):
+        """
+        news_agent'i tek haber icin calistir (thread icinde). FeatureFlag
+        yalnizca bu calistirma icin atlanir; sinif durumu degismez.
+        """
+        try:
+            return news_agent.run({
+                'topic': item.title,
+                'source': item.url,
+                'type': _detect_news_type(item),
+                'study': item.title,
+                'journal': item.journal,
+                'summary': item.summary[:500],
+                'source_name': item.source_name,
+            }, flag_overrides={ALL_FLAGS: True}), None
+        except Exception as e:
+            return None, e
+        finally:
+            # Thread'in actigi DB baglantisini birak
+            connection.close()
+
     def fetch_and_generate(self, max_per_source: int = 2, max_news: int = 5) -> list[dict]:
         """
-        Kaynakları çek → news_agent ile Türkçe haber üret → NewsArticle kaydet.
+        Kaynakları çek → tekrarları ele → news_agent ile paralel Türkçe haber üret
+        → NewsArticle kaydet.
         Dönen liste: [{news_id, title, source, success}, ...]
         """
         from apps.content.models import NewsArticle
         from apps.patients.models import DiseaseModule
         from django.utils.text import slugify
         from services.registry import agent_registry
-        from services.base_agent import BaseAgent
         import uuid
 
         raw_items = self.fetch_all(max_per_source=max_per_source)
@@ -349,47 +536,39 @@ class NewsFetcher:
         source_priority = {'pubmed': 0, 'fda': 1, 'rss': 2}
         raw_items.sort(key=lambda x: source_priority.get(x.source_type, 9))
 
-        # Tekrar kontrol: aynı başlıkla daha önce haber var mı
-        existing_titles = set(
-            NewsArticle.objects.values_list('title_en', flat=True)
-        )
-
-        # FeatureFlag bypass
-        original_is_enabled = BaseAgent.is_enabled
-        BaseAgent.is_enabled = lambda self: True
+        # Tekrar kontrol: URL, birebir başlık ve SimHash benzerliği
+        candidates = select_new_items(raw_items)
+        logger.info(f"{len(raw_items)} kaynaktan {len(candidates)} yeni haber adayı")
 
         results = []
         generated = 0
 
-        try:
-            news_agent = agent_registry.get('news_agent')
-            if not news_agent:
-                logger.error("news_agent bulunamadı")
-                return []
-
-            disease_map = {dm.slug: dm for dm in DiseaseModule.objects.all()}
-
-            for item in raw_items:
-                if generated >= max_news:
-                    break
+        news_agent = agent_registry.get('news_agent')
+        if not news_agent:
+            logger.error("news_agent bulunamadı")
+            return []
 
-                # Başlık benzerliği kontrolü (basit)
-                if item.title in existing_titles:
-                    continue
+        disease_map = {dm.slug: dm for dm in DiseaseModule.objects.all()}
+        valid_cats = [c[0] for c in NewsArticle.CATEGORY_CHOICES]
 
-                try:
-                    # news_agent'a kaynak bilgisini besle
-                    agent_input = {
-                        'topic': item.title,
-                        'source': item.url,
-                        'type': _detect_news_type(item),
-                        'study': item.title,
-                        'journal': item.journal,
-                        'summary': item.summary[:500],
-                        'source_name': item.source_name,
-                    }
+        with ThreadPoolExecutor(max_workers=AGENT_WORKERS) as pool:
+            # Eksik kalan kadar adayi dalga dalga paralel calistir
+            while candidates and generated < max_news:
+                wave = candidates[:max_news - generated]
+                candidates = candidates[len(wave):]
+                outcomes = list(pool.map(lambda item: self._run_agent(news_agent, item), wave))
 
-                    agent_result = news_agent.run(agent_input)
+                ready = []
+                for item, (agent_result, error) in zip(wave, outcomes):
+                    if error is not None:
+                        logger.error(f"Haber üretim hatası [{item.title[:40]}]: {error}")
+                        results.append({
+                            'title': item.title[:80],
+                            'source': item.source_name,
+                            'success': False,
+                            'error': str(error),
+                        })
+                        continue
 
                     if not agent_result.success:
                         logger.warning(f"news_agent başarısız: {item.title[:60]}")
@@ -402,75 +581,66 @@ class NewsFetcher:
                         continue
 
                     data = agent_result.data or {}
-                    title_tr = data.get('title_tr', '') or item.title
-                    body_tr = data.get('body_tr', '')
+                    if data.get('body_tr'):
+                        ready.append((item, data))
 
-                    if not body_tr:
-                        continue
+                slugs = reserve_slugs([
+                    slugify((data.get('title_tr', '') or item.title)[:80]) or f'haber-{uuid.uuid4().hex[:8]}'
+                    for item, data in ready
+                ])
 
-                    # Slug oluştur
-                    slug_base = slugify(title_tr[:80]) or f'haber-{uuid.uuid4().hex[:8]}'
-                    slug = slug_base
-                    counter = 1
-                    while NewsArticle.objects.filter(slug=slug).exists():
-                        slug = f'{slug_base}-{counter}'
-                        counter += 1
-
-                    # Kategori
-                    category = data.get('category', item.category)
-                    valid_cats = [c[0] for c in NewsArticle.CATEGORY_CHOICES]
-                    if category not in valid_cats:
-                        category = 'popular_science'
-
-                    # Kaydet
-                    news = NewsArticle.objects.create(
-                        slug=slug,
-                        title_tr=title_tr,
-                        title_en=data.get('title_en', item.title),
-                        excerpt_tr=data.get('excerpt_tr', item.summary[:200]),
-                        excerpt_en=data.get('excerpt_en', item.summary[:200]),
-                        body_tr=body_tr,
-                        body_en=data.get('body_en', ''),
-                        category=category,
-                        priority='medium',
-                        status='published',
-                        published_at=timezone.now(),
-                        is_auto_generated=True,
-                        source_urls=[{'url': item.url, 'title': item.source_name}] if item.url else [],
-                        meta_title=title_tr[:200],
-                        meta_description=data.get('excerpt_tr', '')[:300],
-                    )
-
-                    # Hastalık ilişkilendir
-                    for dtag in item.disease_tags:
-                        dm = disease_map.get(dtag)
-                        if dm:
-                            news.related_diseases.add(dm)
-
-                    existing_titles.add(item.title)
-                    generated += 1
-
-                    results.append({
-                        'news_id': str(news.id),
-                        'title': title_tr[:80],
-                        'source': item.source_name,
-                        'source_url': item.url,
-                        'category': category,
-                        'success': True,
-                    })
-                    logger.info(f"Haber üretildi: {title_tr[:60]} [{item.source_name}]")
-
-                except Exception as e:
-                    logger.error(f"Haber üretim hatası [{item.title[:40]}]: {e}")
-                    results.append({
-                        'title': item.title[:80],
-                        'source': item.source_name,
-                        'success': False,
-                        'error': str(e),
-                    })
+                for (item, data), slug in zip(ready, slugs):
+                    title_tr = data.get('title_tr', '') or item.title
+                    try:
+                        # Kategori
+                        category = data.get('category', item.category)
+                        if category not in valid_cats:
+                            category = 'popular_science'
+
+                        # Kaydet
+                        news = NewsArticle.objects.create(
+                            slug=slug,
+                            title_tr=title_tr,
+                            title_en=data.get('title_en', item.title),
+                            excerpt_tr=data.get('excerpt_tr', item.summary[:200]),
+                            excerpt_en=data.get('excerpt_en', item.summary[:200]),
+                            body_tr=data['body_tr'],
+                            body_en=data.get('body_en', ''),
+                            category=category,
+                            priority='medium',
+                            status='published',
+                            published_at=timezone.now(),
+                            is_auto_generated=True,
+                            source_urls=[{'url': item.url, 'title': item.source_name}] if item.url else [],
+                            meta_title=title_tr[:200],
+                            meta_description=data.get('excerpt_tr', '')[:300],
+                        )
+
+                        # Hastalık ilişkilendir
+                        diseases = [disease_map[d] for d in item.disease_tags if d in disease_map]
+                        if diseases:
+                            news.related_diseases.add(*diseases)
+
+                        generated += 1
 
-        finally:
-            BaseAgent.is_enabled = original_is_enabled
+                        results.append({
+                            'news_id': str(news.id),
+                            'title': title_tr[:80],
+                            'source': item.source_name,
+                            'source_url': item.url,
+                            'category': category,
+                            'success': True,
+                        })
+                        logger.info(f"Haber üretildi: {title_tr[:60]} [{item.source_name}]")
+
+                    except Exception as e:
+                        logger.error(f"Haber üretim hatası [{item.title[:40]}]: {e}")
+                        results.append({
+                            'title': item.title[:80],
+                            'source': item.source_name,
+                            'success': False,
+                            'error': str(e),
+                        })
 
         logger.info(f"Haber üretimi tamamlandı: {generated}/{len(raw_items)} başarılı")
         return results
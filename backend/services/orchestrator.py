@@ -161,6 +161,8 @@ class Orchestrator:
         steps: Optional[List[str]] = None,
         triggered_by=None,
         stop_on_failure: bool = True,
+        parent_task=None,
+        flag_overrides: Optional[dict] = None,
     ) -> PipelineResult:
         """
         Senkron ajan zinciri calistir.
@@ -171,6 +173,10 @@ class Orchestrator:
             steps: Ajan isimleri listesi (None ise PIPELINES'dan alinir)
             triggered_by: Tetikleyen kullanici (AuditLog icin)
             stop_on_failure: Bir ajan basarisiz olursa dur mu?
+            parent_task: Onceden olusturulmus pipeline AgentTask'i (is kaydi);
+                None ise yenisi olusturulur
+            flag_overrides: Bu calistirmaya ozel FeatureFlag degerleri
+                ({flag_key: bool}, '*' tum flag'ler). Sinif durumu degismez.
 
         Returns:
             PipelineResult
@@ -197,8 +203,11 @@ class Orchestrator:
             f"steps={steps}, input_keys={list(input_data.keys())}"
         )
 
-        # Pipeline-level parent AgentTask olustur
-        parent_task = self._create_pipeline_task(pipeline_name, input_data, triggered_by)
+        # Pipeline-level parent AgentTask olustur (is kaydi verildiyse onu kullan)
+        if parent_task is None:
+            parent_task = self._create_pipeline_task(pipeline_name, input_data, triggered_by)
+        elif parent_task.status != 'running':
+            parent_task.mark_running()
 
         completed = []
         failed = []
@@ -223,6 +232,7 @@ class Orchestrator:
                 triggered_by=triggered_by,
                 parent_task=parent_task,
                 is_gatekeeper=is_gatekeeper,
+                flag_overrides=flag_overrides,
             )
             step_results.append(result)
 
@@ -0,0 +1,404 @@
+"""
+Parcali, paralel ceviri motoru ve segment bazli ceviri bellegi.
+
+- split_segments: HTML/Markdown govdeyi paragraf segmentlerine boler.
+  Kod bloklari, bos satirlar, blok etiketleri ve satir basi Markdown
+  isaretleri (#, -, 1., >) LLM'e gitmez, oldugu gibi korunur.
+- Her segmentin (dil cifti + normalize metin) SHA-256 ozeti ile
+  TranslationMemory'ye bakilir; degismeyen paragraflar LLM'siz doner.
+- Bellekte olmayan segmentler CHUNK_CHARS'lik parcalara toplanir ve
+  parcalar es zamanli cevrilir. Proses genelindeki RateLimiter, saglayicinin
+  dakikalik istek sinirini (LLM_REQUESTS_PER_MINUTE) asmaz.
+- Segmentler sirasiyla yeniden birlestirilir. Markup'i bozulmadan cevrilen
+  yeni ciftler bellege yazilir.
+
+Kullanım:
+    engine = TranslationEngine(agent.llm_call, context='epilepsy / seizure disorders')
+    result = engine.translate({'title_en': title_tr, 'body_en': body_tr})
+    result.texts['body_en'], result.stats
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from django.conf import settings
+
+from services.agent_context import bind
+
+logger = logging.getLogger(__name__)
+
+CHUNK_CHARS = 1500
+MAX_WORKERS = 3
+DEFAULT_REQUESTS_PER_MINUTE = 30
+
+BLOCK_TAGS = 'p|h[1-6]|li|blockquote|figcaption|caption|td|th|dt|dd'
+BLOCK_RE = re.compile(
+    r'(?P<code>```.*?(?:```|\Z))'
+    r'|(?P<open><(?P<tag>' + BLOCK_TAGS + r')\b[^>]*>)(?P<inner>.*?)(?P<close></(?P=tag)\s*>)'
+    r'|(?P<gap>\n[ \t]*\n\s*)',
+    re.DOTALL | re.IGNORECASE,
+)
+MARKER_RE = re.compile(r'^[ \t]*(?:#{1,6}[ \t]+|[-*+][ \t]+(?:\[[ xX]\][ \t]+)?|\d+[.)][ \t]+|>[ \t]?)+')
+TAG_RE = re.compile(r'</?([a-zA-Z][a-zA-Z0-9]*)\b[^>]*>')
+URL_RE = re.compile(r'https?://\S+')
+LETTER_RE = re.compile(r'[^\W\d_]')
+
+
+@dataclass
+class Segment:
+    """Cevrilecek tek paragraf (satir ici markup dahil)."""
+    text: str
+    key: str
+    translation: str = ''
+
+
+@dataclass
+class TranslationResult:
+    """
+    translate() sonucu. texts yalnizca tum segmentleri cevrilen alanlari
+    icerir; eksik kalan alanlar `incomplete`'te listelenir (karisik TR/EN
+    metin dondurulmez).
+    """
+    texts: dict = field(default_factory=dict)
+    incomplete: list = field(default_factory=list)
+    provider: str = ''
+    tokens_used: int = 0
+    stats: dict = field(default_factory=dict)
+
+
+class RateLimiter:
+    """Dakikalik istek sinirina gore cagrilari esit araliklarla baslatir (thread-safe)."""
+
+    def __init__(self, per_minute: int):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def shared_limiter() -> RateLimiter:
+    """Proses genelinde tek limiter (ayni anda calisan ajanlar ortak kullanir)."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter(
+                getattr(settings, 'LLM_REQUESTS_PER_MINUTE', DEFAULT_REQUESTS_PER_MINUTE)
+            )
+        return _limiter
+
+
+# ------------------------------------------------------------
+# Segmentleme
+# ------------------------------------------------------------
+
+def normalize(text: str) -> str:
+    return ' '.join(text.split())
+
+
+def segment_key(text: str, source_lang: str = 'tr', target_lang: str = 'en') -> str:
+    return hashlib.sha256(f'{source_lang}:{target_lang}:{normalize(text)}'.encode()).hexdigest()
+
+
+def is_translatable(text: str) -> bool:
+    """Etiket ve URL'ler cikarildiginda harf kaliyor mu?"""
+    return bool(LETTER_RE.search(URL_RE.sub('', TAG_RE.sub('', text))))
+
+
+def markup_signature(text: str) -> tuple:
+    """Cevirinin korumasi gereken markup: etiket sirasi ve Markdown isaret sayilari."""
+    return (
+        tuple(name.lower() for name in TAG_RE.findall(text)),
+        text.count('**'), text.count('`'), text.count(']('), text.count('|'),
+    )
+
+
+def _markdown_lines(block: str) -> list:
+    """Markdown blogunu satir basi isaretlerine gore gruplara ayir."""
+    groups = []
+    for line in block.split('\n'):
+        starts_block = bool(MARKER_RE.match(line)) or line.lstrip().startswith('|')
+        if groups and not starts_block and not groups[-1]['closed']:
+            groups[-1]['lines'].append(line)
+            continue
+        heading = line.lstrip().startswith('#') or line.lstrip().startswith('|')
+        groups.append({'lines': [line], 'closed': heading})
+    return ['\n'.join(group['lines']) for group in groups]
+
+
+def split_segments(text: str, source_lang: str = 'tr', target_lang: str = 'en') -> list:
+    """
+    Metni parcalara ayir: str (oldugu gibi korunur) veya Segment (cevrilir).
+    ''.join(parcalar) orijinal metni birebir verir.
+    """
+    parts = []
+
+    def add_text(chunk, allow_markers=True):
+        if not chunk:
+            return
+        stripped = chunk.strip()
+        if not stripped or not is_translatable(stripped):
+            parts.append(chunk)
+            return
+        lead = chunk[:len(chunk) - len(chunk.lstrip())]
+        tail = chunk[len(chunk.rstrip()):]
+        if lead:
+            parts.append(lead)
+        marker = MARKER_RE.match(stripped) if allow_markers else None
+        if marker:
+            parts.append(marker.group(0))
+            stripped = stripped[marker.end():]
+        parts.append(Segment(stripped, segment_key(stripped, source_lang, target_lang)))
+        if tail:
+            parts.append(tail)
+
+    def add_markdown(block):
+        lines = _markdown_lines(block)
+        for i, line in enumerate(lines):
+            add_text(line)
+            if i < len(lines) - 1:
+                parts.append('\n')
+
+    pos = 0
+    for match in BLOCK_RE.finditer(text):
+        add_markdown(text[pos:match.start()])
+        if match.group('open'):
+            parts.append(match.group('open'))
+            add_text(match.group('inner'), allow_markers=False)
+            parts.append(match.group('close'))
+        else:
+            parts.append(match.group(0))
+        pos = match.end()
+    add_markdown(text[pos:])
+    return parts
+
+
+def assemble(parts: list) -> str:
+    """Parcalari birlestir; cevirisi olmayan segment kaynak metinle kalir (round-trip)."""
+    return ''.join(
+        part if isinstance(part, str) else (part.translation or part.text)
+        for part in parts
+    )
+
+
+def is_complete(parts: list) -> bool:
+    return all(part.translation for part in parts if isinstance(part, Segment))
+
+
+def chunk_segments(segments: list, max_chars: int = CHUNK_CHARS) -> list:
+    """Segmentleri sirayi koruyarak en fazla max_chars'lik parcalara topla."""
+    chunks, current, size = [], [], 0
+    for segment in segments:
+        if current and size + len(segment.text) > max_chars:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(segment)
+        size += len(segment.text)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+# ------------------------------------------------------------
+# Ceviri bellegi
+# ------------------------------------------------------------
+
+def memory_lookup(keys) -> dict:
+    """{hash: ceviri}; bulunanlarin kullanim sayaci tek UPDATE ile artar."""
+    from django.db.models import F
+    from django.utils import timezone
+    from apps.common.models import TranslationMemory
+
+    if not keys:
+        return {}
+    found = dict(
+        TranslationMemory.objects.filter(source_hash__in=keys).values_list('source_hash', 'target_text')
+    )
+    if found:
+        TranslationMemory.objects.filter(source_hash__in=list(found)).update(
+            hit_count=F('hit_count') + 1, last_used_at=timezone.now(),
+        )
+    return found
+
+
+def memory_store(segments, source_lang, target_lang, provider=''):
+    from apps.common.models import TranslationMemory
+
+    TranslationMemory.objects.bulk_create(
+        [
+            TranslationMemory(
+                source_hash=segment.key, source_lang=source_lang, target_lang=target_lang,
+                source_text=segment.text, target_text=segment.translation, provider=provider,
+            )
+            for segment in segments
+        ],
+        ignore_conflicts=True,
+    )
+
+
+# ------------------------------------------------------------
+# Motor
+# ------------------------------------------------------------
+
+def parse_translations(content: str, expected: int) -> Optional[list]:
+    """LLM yanitindan {"translations": [...]} listesini cikar; sayi tutmazsa None."""
+    cleaned = re.sub(r'^```(?:json)?\s*|\s*```$', '', content.strip())
+    candidates = [cleaned]
+    match = re.search(r'\{.*\}', cleaned, re.DOTALL)
+    if match:
+        candidates.append(match.group(0))
+    for candidate in candidates:
+        try:
+            data = json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        translations = data.get('translations') if isinstance(data, dict) else data
+        if (
+            isinstance(translations, list) and len(translations) == expected
+            and all(isinstance(item, str) for item in translations)
+        ):
+            return translations
+    return None
+
+
+class TranslationEngine:
+    """Segmentleri bellek + paralel LLM parcalariyla ceviren motor."""
+
+    def __init__(
+        self,
+        llm_call: Callable,
+        context: str = 'neurology',
+        source_lang: str = 'tr',
+        target_lang: str = 'en',
+        chunk_chars: int = CHUNK_CHARS,
+        max_workers: int = MAX_WORKERS,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self.llm_call = llm_call
+        self.context = context
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.chunk_chars = chunk_chars
+        self.max_workers = max_workers
+        self.limiter = limiter or shared_limiter()
+
+    def build_prompt(self, texts: list) -> str:
+        payload = json.dumps({'segments': texts}, ensure_ascii=False, indent=1)
+        return f"""Translate each Turkish segment below to English.
+
+MEDICAL FIELD: {self.context}
+
+INPUT (JSON):
+{payload}
+
+RULES:
+1. Translate medical terms correctly, write natural English
+2. Return exactly {len(texts)} translations in the same order
+3. Keep every HTML tag, Markdown mark (**, `, [text](url), |) and URL unchanged
+4. Do not merge, split, add or drop segments
+
+OUTPUT FORMAT (JSON):
+{{"translations": ["...", "..."]}}
+
+Return ONLY JSON, nothing else."""
+
+    def _call(self, segments: list):
+        self.limiter.wait()
+        response = self.llm_call(self.build_prompt([s.text for s in segments]))
+        return parse_translations(response.content, len(segments)), response
+
+    def _translate_chunk(self, segments: list) -> dict:
+        """Parcayi cevir; yanit segment sayisini tutmazsa segmentleri tek tek dene."""
+        outcome = {'calls': 0, 'tokens': 0, 'provider': ''}
+
+        def call(batch):
+            translations, response = self._call(batch)
+            outcome['calls'] += 1
+            outcome['tokens'] += response.tokens_used
+            outcome['provider'] = outcome['provider'] or response.provider
+            return translations
+
+        translations = call(segments)
+        if translations is None and len(segments) > 1:
+            logger.warning(f"Ceviri parcasi ayrisamadi ({len(segments)} segment), tek tek deneniyor")
+            translations = [(call([segment]) or [''])[0] for segment in segments]
+        for segment, translation in zip(segments, translations or []):
+            segment.translation = translation.strip()
+        return outcome
+
+    def translate(self, texts: dict) -> TranslationResult:
+        """{alan: kaynak metin} -> TranslationResult(texts={alan: ceviri})."""
+        documents = {
+            name: split_segments(text, self.source_lang, self.target_lang)
+            for name, text in texts.items() if text
+        }
+        unique = {}
+        for parts in documents.values():
+            for part in parts:
+                if isinstance(part, Segment):
+                    unique.setdefault(part.key, []).append(part)
+
+        remembered = memory_lookup(list(unique))
+        pending = [group[0] for key, group in unique.items() if key not in remembered]
+
+        chunks = chunk_segments(pending, self.chunk_chars)
+        workers = max(1, min(self.max_workers, len(chunks)))
+        if workers == 1:
+            outcomes = [self._translate_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # bind: parca cagrilari ajanin calistirma baglamina token yazar
+                outcomes = list(pool.map(bind(self._translate_chunk), chunks))
+
+        provider = next((o['provider'] for o in outcomes if o['provider']), '')
+        failed = [s for s in pending if not s.translation]
+        broken = {
+            s.key for s in pending
+            if s.translation and markup_signature(s.translation) != markup_signature(s.text)
+        }
+        if broken:
+            logger.warning(f"Ceviri: {len(broken)} segmentte markup degisti, bellege yazilmadi")
+        memory_store(
+            [s for s in pending if s.translation and s.key not in broken],
+            self.source_lang, self.target_lang, provider,
+        )
+
+        for key, group in unique.items():
+            translation = remembered.get(key) or group[0].translation
+            for segment in group:
+                segment.translation = translation
+
+        return TranslationResult(
+            texts={name: assemble(parts) for name, parts in documents.items() if is_complete(parts)},
+            incomplete=[name for name, parts in documents.items() if not is_complete(parts)],
+            provider=provider,
+            tokens_used=sum(o['tokens'] for o in outcomes),
+            stats={
+                'segments': len(unique),
+                'memory_hits': len(remembered),
+                'translated': len(pending) - len(failed),
+                'failed': len(failed),
+                'markup_changed': len(broken),
+                'chunks': len(chunks),
+                'llm_calls': sum(o['calls'] for o in outcomes),
+            },
+        )
@@ -0,0 +1,109 @@
+"""
+Tests for cached JWT user resolution.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.accounts import authentication
+from apps.accounts.authentication import StampedRefreshToken
+
+DASHBOARD_URL = '/api/v1/gamification/summary/'
+
+
+def _client(token_class, user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {token_class.for_user(user).access_token}')
+    return client
+
+
+def _queries(client, url):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    return len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+class TestCachedUserResolution:
+    """Tests for stamp-checked user caching."""
+
+    def test_saves_user_query_per_request(self, patient_user):
+        legacy = _client(RefreshToken, patient_user)
+        stamped = _client(StampedRefreshToken, patient_user)
+        legacy.get(DASHBOARD_URL)
+        stamped.get(DASHBOARD_URL)
+
+        # Yerel kopya dustukten sonra da paylasilan cache'ten cozulur
+        authentication.reset()
+        assert _queries(stamped, DASHBOARD_URL) == _queries(legacy, DASHBOARD_URL) - 1
+
+    def test_password_change_revokes_token(self, patient_user):
+        client = _client(StampedRefreshToken, patient_user)
+        assert client.get('/api/v1/users/me/').status_code == status.HTTP_200_OK
+
+        patient_user.set_password('yeni-sifre-123')
+        patient_user.save()
+
+        assert client.get('/api/v1/users/me/').status_code == status.HTTP_401_UNAUTHORIZED
+        assert _client(StampedRefreshToken, patient_user).get('/api/v1/users/me/').status_code == 200
+
+    @pytest.mark.parametrize('field, value', [('role', 'caregiver'), ('is_active', False)])
+    def test_role_change_and_deactivation_revoke_token(self, patient_user, field, value):
+        client = _client(StampedRefreshToken, patient_user)
+        client.get('/api/v1/users/me/')
+
+        setattr(patient_user, field, value)
+        patient_user.save()
+
+        assert client.get('/api/v1/users/me/').status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_logout_drops_cached_user(self, patient_user):
+        client = _client(StampedRefreshToken, patient_user)
+        client.get('/api/v1/users/me/')
+        assert cache.get(f'auth_user:{patient_user.pk}') is not None
+
+        client.post('/api/v1/auth/logout/', {}, format='json')
+
+        assert cache.get(f'auth_user:{patient_user.pk}') is None
+
+    def test_password_hash_not_cached(self, patient_user):
+        client = _client(StampedRefreshToken, patient_user)
+        client.get('/api/v1/users/me/')
+
+        entry = cache.get(f'auth_user:{patient_user.pk}')
+        assert 'password' not in entry['fields']
+        assert patient_user.password not in entry['values']
+
+        token = StampedRefreshToken.for_user(patient_user).access_token
+        user = authentication.CachedJWTAuthentication().get_user(token)
+        assert 'password' in user.get_deferred_fields()
+        assert user.password == patient_user.password
+
+    def test_change_password_returns_fresh_tokens(self, patient_user):
+        client = _client(StampedRefreshToken, patient_user)
+        response = client.post('/api/v1/auth/password/change/', {
+            'old_password': 'testpass123', 'new_password': 'yeni-sifre-456',
+        }, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert client.get('/api/v1/users/me/').status_code == status.HTTP_401_UNAUTHORIZED
+
+        fresh = APIClient()
+        fresh.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['tokens']['access']}")
+        assert fresh.get('/api/v1/users/me/').status_code == status.HTTP_200_OK
+
+    def test_each_request_gets_own_instance(self, patient_user, rf):
+        token = StampedRefreshToken.for_user(patient_user).access_token
+        auth = authentication.CachedJWTAuthentication()
+
+        first, second = auth.get_user(token), auth.get_user(token)
+
+        assert first == second == patient_user
+        assert first is not second
+        assert first.role == 'patient' and not first._state.adding
@@ -0,0 +1,113 @@
+"""
+Tests for the doctor-patient inbox: denormalized last message, unread counters
+and keyset-paginated listing.
+"""
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.chat.inbox import mark_conversation_read, record_chat_message, record_direct_message
+from apps.chat.models import ChatSession, Conversation
+
+
+def _client_for(user):
+    client = APIClient()
+    refresh = RefreshToken.for_user(user)
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+    return client
+
+
+@pytest.fixture
+def conversation(patient_user, doctor_user):
+    return Conversation.objects.create(
+        patient=patient_user, doctor=doctor_user, subject='Bas agrisi',
+    )
+
+
+@pytest.mark.django_db
+class TestInboxHelpers:
+    """Tests for atomic inbox updates."""
+
+    def test_message_updates_snapshot_and_recipient_counter(
+        self, conversation, patient_user, doctor_user
+    ):
+        record_direct_message(conversation, patient_user, 'Merhaba doktor')
+        record_direct_message(conversation, patient_user, 'Ikinci mesaj')
+        record_direct_message(conversation, doctor_user, 'Merhaba')
+
+        conversation.refresh_from_db()
+        assert conversation.doctor_unread_count == 2
+        assert conversation.patient_unread_count == 1
+        assert conversation.last_message_preview == 'Merhaba'
+        assert conversation.last_message_sender_name == doctor_user.get_full_name()
+
+    def test_mark_read_resets_only_reader_counter(self, conversation, patient_user, doctor_user):
+        record_direct_message(conversation, patient_user, 'Soru')
+        record_direct_message(conversation, doctor_user, 'Cevap')
+
+        mark_conversation_read(conversation, doctor_user, 'doctor')
+
+        conversation.refresh_from_db()
+        assert conversation.doctor_unread_count == 0
+        assert conversation.patient_unread_count == 1
+        assert conversation.messages.filter(sender=patient_user, is_read=True).count() == 1
+
+    def test_chat_message_increments_session(self, patient_user):
+        session = ChatSession.objects.create(patient=patient_user)
+        record_chat_message(session, 'user', 'Migren nedir?')
+        record_chat_message(session, 'assistant', 'Migren bir bas agrisi turudur.')
+
+        session.refresh_from_db()
+        assert session.message_count == 2
+        assert session.last_message_role == 'assistant'
+        assert session.last_message_preview.startswith('Migren bir')
+
+
+@pytest.mark.django_db
+class TestDoctorInboxViews:
+    """Tests for doctor inbox listing and stats."""
+
+    def test_list_query_count_is_constant(
+        self, doctor_user, user_factory, django_assert_max_num_queries
+    ):
+        for i in range(10):
+            patient = user_factory(email=f'p{i}@example.com', role='patient')
+            conv = Conversation.objects.create(patient=patient, doctor=doctor_user)
+            record_direct_message(conv, patient, f'Mesaj {i}')
+
+        client = _client_for(doctor_user)
+        # auth user + doctor profile + conversation page (+ middleware writes)
+        with django_assert_max_num_queries(6):
+            response = client.get('/api/v1/chat/doctor/conversations/')
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data['results']
+        assert len(results) == 10
+        assert results[0]['last_message']['content'] == 'Mesaj 9'
+        assert 'count' not in response.data
+
+    def test_keyset_pagination(self, doctor_user, user_factory):
+        for i in range(3):
+            patient = user_factory(email=f'k{i}@example.com', role='patient')
+            conv = Conversation.objects.create(patient=patient, doctor=doctor_user)
+            record_direct_message(conv, patient, f'Mesaj {i}')
+
+        client = _client_for(doctor_user)
+        first = client.get('/api/v1/chat/doctor/conversations/?page_size=2')
+        assert len(first.data['results']) == 2
+        second = client.get(first.data['next'])
+        assert [c['last_message']['content'] for c in second.data['results']] == ['Mesaj 0']
+
+    def test_stats_aggregate(self, conversation, patient_user, doctor_user):
+        record_direct_message(conversation, patient_user, 'Bir')
+        record_direct_message(conversation, patient_user, 'Iki')
+
+        response = _client_for(doctor_user).get('/api/v1/chat/doctor/stats/')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            'active_conversations': 1,
+            'total_unread': 2,
+            'total_conversations': 1,
+        }
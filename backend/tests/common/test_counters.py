@@ -0,0 +1,77 @@
+"""
+Tests for atomic, idempotent daily counter increments.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.common.counters import increment_daily_counter
+from apps.common.models import IdempotencyKey
+from apps.common.tasks import purge_idempotency_keys
+from apps.wellness.models import WaterIntakeLog
+
+URL = '/api/v1/wellness/water/add_glass/'
+
+
+@pytest.mark.django_db
+class TestIncrementDailyCounter:
+    """Tests for the single-statement upsert."""
+
+    def test_creates_then_increments_in_one_query(self, patient_user, django_assert_num_queries):
+        today = timezone.localdate()
+        with django_assert_num_queries(1):
+            log = increment_daily_counter(WaterIntakeLog, 'glasses', patient_user, today)
+        assert log.glasses == 1
+        assert log.date == today
+        assert log.target_glasses == 8
+
+        created_at = log.created_at
+        with django_assert_num_queries(1):
+            log = increment_daily_counter(WaterIntakeLog, 'glasses', patient_user, today, amount=3)
+        assert log.glasses == 4
+        assert log.created_at == created_at
+        assert WaterIntakeLog.objects.get().glasses == 4
+
+    def test_days_are_separate_rows(self, patient_user):
+        today = timezone.localdate()
+        increment_daily_counter(WaterIntakeLog, 'glasses', patient_user, today)
+        increment_daily_counter(WaterIntakeLog, 'glasses', patient_user, today - timedelta(days=1))
+        assert WaterIntakeLog.objects.count() == 2
+
+
+@pytest.mark.django_db
+class TestAddGlassEndpoint:
+    """Tests for the idempotent add_glass endpoint."""
+
+    def test_rapid_taps_are_all_counted(self, authenticated_client):
+        for _ in range(5):
+            assert authenticated_client.post(URL).status_code == 200
+        response = authenticated_client.post(URL, {'amount': 2}, format='json')
+        assert response.data['glasses'] == 7
+
+    def test_replayed_key_is_applied_once(self, authenticated_client):
+        first = authenticated_client.post(URL, {'amount': 2}, format='json', HTTP_IDEMPOTENCY_KEY='tap-1')
+        replay = authenticated_client.post(URL, {'amount': 2}, format='json', HTTP_IDEMPOTENCY_KEY='tap-1')
+
+        assert first.data['glasses'] == 2
+        assert replay.data == first.data
+        assert replay['Idempotent-Replayed'] == 'true'
+        assert WaterIntakeLog.objects.get().glasses == 2
+
+        authenticated_client.post(URL, format='json', HTTP_IDEMPOTENCY_KEY='tap-2')
+        assert WaterIntakeLog.objects.get().glasses == 3
+
+    def test_invalid_amount_rejected(self, authenticated_client):
+        assert authenticated_client.post(URL, {'amount': 0}, format='json').status_code == 400
+        assert authenticated_client.post(URL, {'amount': 'x'}, format='json').status_code == 400
+        assert not WaterIntakeLog.objects.exists()
+
+    def test_old_keys_are_purged(self, authenticated_client, patient_user):
+        authenticated_client.post(URL, HTTP_IDEMPOTENCY_KEY='old')
+        IdempotencyKey.objects.update(created_at=timezone.now() - timedelta(days=3))
+        authenticated_client.post(URL, HTTP_IDEMPOTENCY_KEY='new')
+
+        assert purge_idempotency_keys() == {'deleted': 1}
+        assert list(IdempotencyKey.objects.values_list('key', flat=True)) == ['new']
@@ -0,0 +1,197 @@
+"""
+Tests for the streaming cross-module patient data export.
+"""
+
+import csv
+import io
+import json
+import zipfile
+from datetime import date, timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from apps.chat.models import ChatMessage, ChatSession, Conversation, DirectMessage
+from apps.common import data_export
+from apps.common.models import DataExport
+from apps.migraine.models import MigraineAttack
+from apps.notifications.models import Notification
+from apps.wellness.models import WaterIntakeLog
+
+URL = '/api/v1/kvkk/export/'
+
+
+def _archive(response):
+    return zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+
+
+@pytest.fixture
+def history(patient_user):
+    now = timezone.now()
+    MigraineAttack.objects.bulk_create([
+        MigraineAttack(patient=patient_user, start_datetime=now - timedelta(days=i), intensity=5 + i % 3)
+        for i in range(25)
+    ])
+    WaterIntakeLog.objects.create(user=patient_user, date=date(2026, 1, 1), glasses=6)
+
+
+@pytest.mark.django_db
+class TestStreamingExport:
+    """Tests for the synchronous zip stream."""
+
+    def test_ndjson_archive(self, authenticated_client, patient_user, history, user_factory):
+        other = user_factory(email='other@example.com')
+        MigraineAttack.objects.create(patient=other, start_datetime=timezone.now(), intensity=9)
+
+        response = authenticated_client.get(URL)
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response['Content-Type'] == 'application/zip'
+        archive = _archive(response)
+        attacks = [json.loads(line) for line in archive.read('migraine/MigraineAttack.ndjson').splitlines()]
+        assert len(attacks) == 25
+        assert {row['patient_id'] for row in attacks} == {patient_user.id}
+
+        manifest = json.loads(archive.read('manifest.json'))
+        rows = {member['model']: member['rows'] for member in manifest['members']}
+        assert rows['migraine.MigraineAttack'] == 25
+        assert rows['wellness.WaterIntakeLog'] == 1
+        assert manifest['total_rows'] == 26
+
+    def test_rows_are_streamed_in_chunks(self, patient_user, history, monkeypatch):
+        monkeypatch.setattr(data_export, 'EXPORT_CHUNK_SIZE', 5)
+        # Sikistirilmis veri kucuk kalsin diye yalnizca tek kaynak
+        sources = [data_export.ExportSource('migraine.MigraineAttack')]
+
+        chunks = [c for c in data_export.iter_archive(patient_user, sources=sources) if c]
+
+        assert len(chunks) > 2
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(chunks)))
+        assert len(archive.read('migraine/MigraineAttack.ndjson').splitlines()) == 25
+
+    def test_csv_format(self, authenticated_client, history):
+        response = authenticated_client.get(URL, {'export_format': 'csv'})
+
+        archive = _archive(response)
+        reader = csv.DictReader(io.StringIO(archive.read('wellness/WaterIntakeLog.csv').decode()))
+        rows = list(reader)
+        assert rows[0]['glasses'] == '6'
+        assert rows[0]['date'] == '2026-01-01'
+
+    def test_invalid_format(self, authenticated_client):
+        response = authenticated_client.get(URL, {'export_format': 'xml'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestAsyncExport:
+    """Tests for the Celery-backed export."""
+
+    def test_async_export_ready_and_downloadable(
+        self, authenticated_client, patient_user, history, django_capture_on_commit_callbacks,
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            response = authenticated_client.get(URL, {'async': '1'})
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        export = DataExport.objects.get(id=response.data['id'])
+        assert export.status == 'ready'
+        assert export.row_count == 26
+        assert Notification.objects.filter(recipient=patient_user, metadata__export_id=str(export.id)).exists()
+
+        status_data = authenticated_client.get(response.data['status_url']).data
+        assert status_data['status'] == 'ready'
+        download = authenticated_client.get(response.data['download_url'])
+        assert download.status_code == 200
+        body = b''.join(download.streaming_content)
+        assert len(body) == export.size_bytes
+        assert 'manifest.json' in zipfile.ZipFile(io.BytesIO(body)).namelist()
+
+    def test_large_export_goes_async(self, authenticated_client, history, monkeypatch):
+        monkeypatch.setattr(data_export, 'ASYNC_EXPORT_MIN_ROWS', 10)
+
+        response = authenticated_client.get(URL)
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data['status'] == 'pending'
+
+    def test_pending_export_is_reused(self, authenticated_client, history):
+        first = authenticated_client.get(URL, {'async': '1'})
+        second = authenticated_client.get(URL, {'async': '1'})
+
+        assert second.status_code == status.HTTP_202_ACCEPTED
+        assert second.data['id'] == first.data['id']
+        assert DataExport.objects.count() == 1
+        assert authenticated_client.get(URL, {'async': '1', 'export_format': 'csv'}).data['id'] != first.data['id']
+
+    def test_ready_export_reused_until_expiry_then_purged(
+        self, authenticated_client, history, django_capture_on_commit_callbacks,
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            first = authenticated_client.get(URL, {'async': '1'})
+        export = DataExport.objects.get(id=first.data['id'])
+        assert export.expires_at > timezone.now()
+
+        again = authenticated_client.get(URL, {'async': '1'})
+        assert again.status_code == status.HTTP_200_OK
+        assert again.data['id'] == first.data['id']
+
+        DataExport.objects.filter(id=export.id).update(expires_at=timezone.now() - timedelta(minutes=1))
+        assert authenticated_client.get(first.data['download_url']).status_code == status.HTTP_410_GONE
+
+        storage, name = export.file.storage, export.file.name
+        assert storage.exists(name)
+        from apps.common.tasks import purge_data_exports
+        assert purge_data_exports() == {'deleted': 1}
+        assert not storage.exists(name)
+        assert not DataExport.objects.exists()
+
+    def test_other_user_cannot_see_export(self, api_client, patient_user, user_factory):
+        export = DataExport.objects.create(patient=patient_user, requested_by=patient_user)
+        api_client.force_authenticate(user_factory(email='other@example.com'))
+
+        response = api_client.get(f'/api/v1/kvkk/exports/{export.id}/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestDoctorExport:
+    """Tests for the doctor panel export action."""
+
+    def test_assigned_patient(self, doctor_client, doctor_user, patient_profile, history):
+        patient_profile.assigned_doctor = doctor_user
+        patient_profile.save()
+
+        response = doctor_client.get(f'/api/v1/doctor/patients/{patient_profile.user_id}/export/')
+
+        assert response.status_code == 200
+        assert 'migraine/MigraineAttack.ndjson' in _archive(response).namelist()
+
+    def test_unassigned_patient(self, doctor_client, patient_profile, history):
+        response = doctor_client.get(f'/api/v1/doctor/patients/{patient_profile.user_id}/export/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_doctor_export_excludes_other_threads_and_chatbot(
+        self, doctor_client, doctor_user, patient_user, patient_profile, user_factory,
+    ):
+        patient_profile.assigned_doctor = doctor_user
+        patient_profile.save()
+        other_doctor = user_factory(email='diger-hekim@example.com', role='doctor')
+        own = Conversation.objects.create(patient=patient_user, doctor=doctor_user)
+        other = Conversation.objects.create(patient=patient_user, doctor=other_doctor)
+        DirectMessage.objects.create(conversation=own, sender=patient_user, content='Bana')
+        DirectMessage.objects.create(conversation=other, sender=patient_user, content='Diger hekime')
+        session = ChatSession.objects.create(patient=patient_user)
+        ChatMessage.objects.create(session=session, role='user', content='Chatbot')
+
+        archive = _archive(doctor_client.get(f'/api/v1/doctor/patients/{patient_user.id}/export/'))
+
+        messages = [json.loads(line) for line in archive.read('chat/DirectMessage.ndjson').splitlines()]
+        assert [row['content'] for row in messages] == ['Bana']
+        assert not {'chat/ChatSession.ndjson', 'chat/ChatMessage.ndjson'} & set(archive.namelist())
+
+        own_archive = data_export.iter_archive(patient_user, requested_by=patient_user)
+        own_names = zipfile.ZipFile(io.BytesIO(b''.join(own_archive))).namelist()
+        assert 'chat/ChatSession.ndjson' in own_names
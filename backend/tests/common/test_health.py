@@ -0,0 +1,160 @@
+"""
+Tests for health probes and the incremental content consistency audit.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from django_celery_beat.models import IntervalSchedule, PeriodicTask
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.common import health
+from apps.common.models import HealthAuditResult
+from apps.common.tasks import backend_frontend_health_check, purge_health_audits
+from apps.content.models import NewsArticle
+from apps.notifications.models import Notification
+
+
+@pytest.fixture(autouse=True)
+def no_cached_readiness():
+    from django.core.cache import cache
+    cache.delete(health.READINESS_CACHE_KEY)
+
+
+@pytest.fixture
+def fresh_versions():
+    from django.core.cache import cache
+    cache.delete_many([health.VERSION_KEY.format(scope=scope) for scope in health.SCOPE_MODELS])
+
+
+def _news(slug):
+    category = NewsArticle._meta.get_field('category').choices[0][0]
+    return NewsArticle.objects.create(
+        slug=slug, title_tr='Haber', body_tr='Govde', category=category, status='published',
+    )
+
+
+@pytest.mark.django_db
+class TestProbes:
+    """Tests for the liveness and readiness endpoints."""
+
+    def test_liveness(self, api_client, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            response = api_client.get('/api/v1/health/live/')
+        assert response.data == {'status': 'ok'}
+
+    def test_readiness_reports_overdue_beat_task(self, admin_client):
+        every_day = IntervalSchedule.objects.create(every=1, period=IntervalSchedule.DAYS)
+        PeriodicTask.objects.create(
+            name='purge-idempotency-keys', task='apps.common.tasks.purge_idempotency_keys',
+            interval=every_day, last_run_at=timezone.now() - timedelta(days=3),
+        )
+        PeriodicTask.objects.create(
+            name='send-medication-reminders', task='apps.tracking.tasks.send_medication_reminders',
+            interval=every_day, last_run_at=timezone.now() - timedelta(minutes=5),
+        )
+
+        response = admin_client.get('/api/v1/health/ready/')
+
+        assert response.status_code == status.HTTP_200_OK
+        checks = response.data['checks']
+        assert checks['database']['ok'] and checks['cache']['ok']
+        assert checks['queue']['skipped'] == 'eager'
+        assert checks['beat']['overdue'] == ['purge-idempotency-keys']
+        assert checks['beat']['tasks']['send-medication-reminders']['overdue'] is False
+        assert response.data['status'] == 'degraded'
+
+    def test_readiness_down_without_cache(self, api_client, monkeypatch):
+        monkeypatch.setattr(health, 'check_cache', lambda: {'ok': False, 'error': 'baglanti yok'})
+
+        response = api_client.get('/api/v1/health/ready/')
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.data == {'status': 'down'}
+
+    def test_readiness_hides_detail_and_reuses_result(self, api_client, authenticated_client, monkeypatch):
+        calls = []
+        real = health.readiness
+        monkeypatch.setattr(health, 'readiness', lambda: calls.append(1) or real())
+
+        for client in (api_client, authenticated_client, api_client):
+            response = client.get('/api/v1/health/ready/')
+            assert response.status_code == status.HTTP_200_OK
+            assert set(response.data) == {'status'}
+        assert len(calls) == 1
+
+
+@pytest.mark.django_db
+class TestConsistencyAudit:
+    """Tests for change-tracked, incremental audit runs."""
+
+    def test_only_changed_scopes_are_rechecked(self, fresh_versions, django_capture_on_commit_callbacks):
+        first = health.run_consistency_audit()
+        assert first.scopes_checked == ['modules', 'news', 'articles']
+        assert first.status == 'fail'
+
+        # Degisen kapsam yok: yeni satir yazilmaz
+        assert health.run_consistency_audit() == first
+        assert HealthAuditResult.objects.count() == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            _news('yeni-haber')
+        third = health.run_consistency_audit()
+
+        assert third.scopes_checked == ['news']
+        assert third.results['news']['stats']['news_total'] == 1
+        assert third.results['modules'] == first.results['modules']
+
+    def test_full_run_checks_everything(self, fresh_versions, monkeypatch):
+        monkeypatch.setattr(health, 'check_endpoints', lambda: {'issues': [], 'warnings': [], 'stats': {'api': 'OK'}})
+        health.run_consistency_audit()
+
+        result = health.run_consistency_audit(full=True)
+        assert result.scopes_checked == ['modules', 'news', 'articles', 'endpoints']
+        assert result.is_full
+
+    def test_task_notifies_only_on_new_findings(self, fresh_versions, admin_user):
+        report = backend_frontend_health_check()
+        assert report['issues'] > 0
+        assert Notification.objects.filter(recipient=admin_user).count() == 1
+
+        assert backend_frontend_health_check()['checked'] == []
+        assert Notification.objects.filter(recipient=admin_user).count() == 1
+        assert HealthAuditResult.objects.count() == 1
+
+    def test_purge_drops_expired_but_keeps_latest(self, fresh_versions, monkeypatch):
+        monkeypatch.setattr(health, 'check_endpoints', lambda: {'issues': [], 'warnings': [], 'stats': {}})
+        expired = health.run_consistency_audit()
+        latest = health.run_consistency_audit(full=True)
+        cutoff = timezone.now() - timedelta(days=health.RESULT_RETENTION_DAYS)
+        HealthAuditResult.objects.filter(pk=expired.pk).update(created_at=cutoff - timedelta(days=2))
+        HealthAuditResult.objects.filter(pk=latest.pk).update(created_at=cutoff - timedelta(days=1))
+
+        assert purge_health_audits() == {'deleted': 1}
+        assert not HealthAuditResult.objects.filter(pk=expired.pk).exists()
+        assert list(HealthAuditResult.objects.values_list('pk', flat=True)) == [latest.pk]
+
+    def test_full_run_does_not_collide_with_incremental(self):
+        from config.celery import app
+        schedule = app.conf.beat_schedule
+        full = schedule['backend-frontend-health-check-full']['schedule']
+        incremental = schedule['backend-frontend-health-check']['schedule']
+        assert not full.minute & incremental.minute
+
+    def test_series_endpoint_allows_role_admin(self, user_factory, fresh_versions):
+        client = APIClient()
+        client.force_authenticate(user_factory(email='rol-admin@example.com', role='admin'))
+
+        assert client.get('/api/v1/health/consistency/').status_code == status.HTTP_200_OK
+
+    def test_series_endpoint_is_admin_only(self, api_client, admin_client, fresh_versions):
+        health.run_consistency_audit()
+        response = admin_client.get('/api/v1/health/consistency/')
+
+        assert response.data['latest']['status'] == 'fail'
+        assert len(response.data['series']) == 1
+        api_client.force_authenticate(None)
+        assert api_client.get('/api/v1/health/consistency/').status_code in (
+            status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN,
+        )
@@ -0,0 +1,177 @@
+"""
+Tests for the concurrent broken link scanner, run against a local HTTP server.
+"""
+
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from django.utils import timezone
+
+from apps.common import tasks as link_tasks
+from apps.common.link_scanner import LinkScanner
+from apps.common.models import BrokenLink, BrokenLinkScan, LinkCheckCache
+from apps.content.models import Article
+
+ETAG = '"v1"'
+
+
+class LinkServer:
+    """/ok (ETag + 304), /missing (404), /no-head (HEAD 405, GET 200), /slow/N."""
+
+    def __init__(self):
+        self.hits = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self):
+                with server._lock:
+                    server.hits.append((self.command, self.path))
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                try:
+                    if self.path.startswith('/slow'):
+                        time.sleep(0.1)
+                        status, headers = 200, {}
+                    elif self.path == '/ok':
+                        if self.headers.get('If-None-Match') == ETAG:
+                            status, headers = 304, {}
+                        else:
+                            status, headers = 200, {'ETag': ETAG}
+                    elif self.path == '/no-head':
+                        status, headers = (405 if self.command == 'HEAD' else 200), {}
+                    else:
+                        status, headers = 404, {}
+                    self.send_response(status)
+                    for key, value in headers.items():
+                        self.send_header(key, value)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+            do_HEAD = _respond
+            do_GET = _respond
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, path):
+        host, port = self.httpd.server_address
+        return f'http://{host}:{port}{path}'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def link_server():
+    with LinkServer() as server:
+        yield server
+
+
+@pytest.fixture
+def allow_local(monkeypatch):
+    monkeypatch.setattr(link_tasks, 'SKIP_DOMAINS', ())
+
+
+def _article(slug, body):
+    return Article.objects.create(
+        slug=slug, title_tr=slug, title_en=slug,
+        body_tr=body, body_en='', status='published',
+    )
+
+
+@pytest.mark.django_db
+class TestLinkScanner:
+    """Tests for pooled checks, host limits and the status cache."""
+
+    def test_classifies_responses(self, link_server):
+        urls = [link_server.url(p) for p in ('/ok', '/missing', '/no-head')]
+        results = LinkScanner(host_delay=0).check_many(urls)
+
+        assert not results[urls[0]].is_broken
+        assert results[urls[1]].is_broken
+        assert results[urls[1]].http_status == 404
+        assert not results[urls[2]].is_broken
+        assert LinkCheckCache.objects.count() == 3
+
+    def test_per_host_concurrency_limit(self, link_server):
+        urls = [link_server.url(f'/slow/{i}') for i in range(8)]
+        LinkScanner(max_workers=8, per_host=2, host_delay=0).check_many(urls)
+
+        assert len(link_server.hits) == 8
+        assert link_server.max_active <= 2
+
+    def test_fresh_cache_skips_network_and_expired_is_conditional(self, link_server):
+        url = link_server.url('/ok')
+        scanner = LinkScanner(host_delay=0)
+        scanner.check_many([url])
+        assert scanner.check_many([url])[url].from_cache
+        assert len(link_server.hits) == 1
+
+        LinkCheckCache.objects.update(checked_at=timezone.now() - timedelta(days=30))
+        result = scanner.check_many([url])[url]
+        assert not result.from_cache
+        assert not result.is_broken
+        assert result.http_status == 200
+        assert len(link_server.hits) == 2
+
+
+@pytest.mark.django_db
+class TestScanBrokenLinks:
+    """Tests for the scan task with bulk result writes."""
+
+    def test_full_scan_records_broken_links(self, link_server, allow_local):
+        missing = link_server.url('/missing')
+        _article('a', f'<a href="{missing}">x</a> <a href="{link_server.url("/ok")}">y</a>')
+        _article('b', f'<img src="{missing}">')
+
+        result = link_tasks.scan_broken_links()
+
+        assert result['total_checked'] == 2
+        assert result['broken_found'] == 2
+        assert BrokenLink.objects.filter(broken_url=missing, http_status=404).count() == 2
+
+        # Kirik link cache'te: ikinci taramada ag kullanilmaz, sayac artar
+        hits = len(link_server.hits)
+        link_tasks.scan_broken_links()
+        assert len(link_server.hits) == hits
+        assert set(BrokenLink.objects.values_list('check_count', flat=True)) == {2}
+
+    def test_incremental_scan_only_changed_content(self, link_server, allow_local):
+        _article('old', f'<a href="{link_server.url("/missing")}">x</a>')
+        link_tasks.scan_broken_links()
+        Article.objects.update(updated_at=timezone.now() - timedelta(days=1))
+        BrokenLinkScan.objects.update(created_at=timezone.now() - timedelta(hours=1))
+
+        _article('new', f'<a href="{link_server.url("/no-head")}">x</a>')
+        link_tasks.scan_broken_links(incremental=True)
+
+        scan = BrokenLinkScan.objects.order_by('-created_at').first()
+        assert scan.details['incremental'] is True
+        assert scan.details['unique_urls'] == 1
+        assert scan.total_links_checked == 1
+
+    def test_recovered_link_is_auto_fixed(self, link_server, allow_local):
+        ok = link_server.url('/ok')
+        article = _article('a', f'<a href="{ok}">x</a>')
+        BrokenLink.objects.create(
+            broken_url=ok, source_type='article', source_id=article.id, source_field='body_tr',
+        )
+        link_tasks.scan_broken_links()
+        assert BrokenLink.objects.get().status == 'auto_fixed'
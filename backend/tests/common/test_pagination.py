@@ -0,0 +1,101 @@
+"""
+Tests for keyset pagination and ?fields= projection on patient list endpoints.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from apps.content.models import Article
+from apps.epilepsy.models import SeizureEvent
+from apps.notifications.models import Notification
+
+SEIZURES = '/api/v1/epilepsy/seizures/'
+NOTIFICATIONS = '/api/v1/notifications/'
+
+
+@pytest.fixture
+def seizures(patient_user):
+    now = timezone.now()
+    return SeizureEvent.objects.bulk_create([
+        SeizureEvent(
+            patient=patient_user, seizure_datetime=now - timedelta(hours=i),
+            seizure_type='focal_aware', intensity=3,
+        )
+        for i in range(7)
+    ])
+
+
+def _walk(client, url, **params):
+    ids, pages = [], 0
+    response = client.get(url, params)
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        assert 'count' not in response.data
+        ids += [row['id'] for row in response.data['results']]
+        pages += 1
+        if not response.data['next']:
+            return ids, pages
+        response = client.get(response.data['next'])
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    """Tests for cursor pages on (timestamp, id)."""
+
+    def test_walks_all_pages_in_order(self, authenticated_client, seizures):
+        ids, pages = _walk(authenticated_client, SEIZURES, page_size=3)
+
+        expected = [str(s.id) for s in sorted(seizures, key=lambda s: s.seizure_datetime, reverse=True)]
+        assert ids == expected
+        assert pages == 3
+
+    def test_ties_on_timestamp_are_not_skipped(self, authenticated_client, patient_user):
+        created_at = timezone.now()
+        notifications = Notification.objects.bulk_create([
+            Notification(recipient=patient_user, notification_type='info', title_tr='T', title_en='T',
+                         message_tr='M', message_en='M')
+            for _ in range(5)
+        ])
+        Notification.objects.update(created_at=created_at)
+
+        ids, _ = _walk(authenticated_client, NOTIFICATIONS, page_size=2)
+        assert sorted(ids) == sorted(str(n.id) for n in notifications)
+
+    def test_page_size_is_capped(self, authenticated_client, seizures, monkeypatch):
+        from apps.common.pagination import KeysetPagination
+        monkeypatch.setattr(KeysetPagination, 'max_page_size', 4)
+
+        response = authenticated_client.get(SEIZURES, {'page_size': 50})
+        assert len(response.data['results']) == 4
+
+    def test_article_list_stays_unpaginated_by_default(self, api_client, doctor_user):
+        Article.objects.create(
+            slug='a', title_tr='A', title_en='A', body_tr='B', body_en='B',
+            author=doctor_user, status='published', published_at=timezone.now(),
+        )
+
+        assert isinstance(api_client.get('/api/v1/content/articles/').data, list)
+        paged = api_client.get('/api/v1/content/articles/', {'page_size': 1}).data
+        assert len(paged['results']) == 1
+
+
+@pytest.mark.django_db
+class TestFieldProjection:
+    """Tests for sparse fieldsets."""
+
+    def test_only_requested_fields(self, authenticated_client, seizures):
+        response = authenticated_client.get(SEIZURES, {'fields': 'id,intensity'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data['results'][0]) == {'id', 'intensity'}
+
+    def test_detail_projection(self, authenticated_client, seizures):
+        response = authenticated_client.get(f'{SEIZURES}{seizures[0].id}/', {'fields': 'id'})
+        assert response.data == {'id': str(seizures[0].id)}
+
+    def test_unknown_field_rejected(self, authenticated_client, seizures):
+        response = authenticated_client.get(SEIZURES, {'fields': 'id,password'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
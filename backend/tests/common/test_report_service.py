@@ -0,0 +1,130 @@
+"""
+Tests for cached, asynchronous PDF report generation and ranged downloads.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.common import report_service
+from apps.common.models import GeneratedReport
+from apps.migraine.models import MigraineAttack
+from apps.migraine.reports import MigraineReportGenerator
+from apps.notifications.models import Notification
+
+URL = '/api/v1/migraine/attacks/report/'
+
+
+def _content(response):
+    return b''.join(response.streaming_content)
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    calls = []
+    original = MigraineReportGenerator.generate
+
+    def counting(self):
+        calls.append((self.start_date, self.end_date))
+        return original(self)
+
+    monkeypatch.setattr(MigraineReportGenerator, 'generate', counting)
+    return calls
+
+
+@pytest.fixture
+def attack(patient_user):
+    return MigraineAttack.objects.create(
+        patient=patient_user, start_datetime=timezone.now() - timedelta(days=2),
+        intensity=6, duration_minutes=90,
+    )
+
+
+@pytest.mark.django_db
+class TestReportCache:
+    """Tests for data-version keyed report artifacts."""
+
+    def test_repeat_download_is_served_from_cache(self, authenticated_client, attack, render_calls):
+        first = authenticated_client.get(URL)
+        second = authenticated_client.get(URL)
+
+        assert first.status_code == second.status_code == 200
+        assert first['Content-Type'] == 'application/pdf'
+        body = _content(first)
+        assert body.startswith(b'%PDF')
+        assert _content(second) == body
+        assert len(render_calls) == 1
+        assert GeneratedReport.objects.get().status == 'ready'
+
+    def test_data_change_creates_new_version_and_drops_old_file(
+        self, authenticated_client, patient_user, attack, render_calls, media_root,
+    ):
+        authenticated_client.get(URL)
+        old = GeneratedReport.objects.get()
+        old_path = media_root / old.file.name
+
+        attack.intensity = 9
+        attack.save()
+        authenticated_client.get(URL)
+
+        assert len(render_calls) == 2
+        new = GeneratedReport.objects.get()
+        assert new.data_version != old.data_version
+        assert not old_path.exists()
+
+    def test_report_bytes_reuses_artifact(self, patient_user, attack, render_calls):
+        end = timezone.localdate()
+        start = end - timedelta(days=30)
+        first = report_service.report_bytes(patient_user, 'migraine', start, end)
+        assert report_service.report_bytes(patient_user, 'migraine', start, end) == first
+        assert len(render_calls) == 1
+
+
+@pytest.mark.django_db
+class TestReportDownload:
+    """Tests for range, conditional and asynchronous downloads."""
+
+    def test_range_and_conditional_requests(self, authenticated_client, attack):
+        full = _content(authenticated_client.get(URL))
+        etag = GeneratedReport.objects.get().data_version
+
+        partial = authenticated_client.get(URL, HTTP_RANGE='bytes=0-99')
+        assert partial.status_code == 206
+        assert partial['Content-Range'] == f'bytes 0-99/{len(full)}'
+        assert _content(partial) == full[:100]
+
+        tail = authenticated_client.get(URL, HTTP_RANGE='bytes=-10')
+        assert _content(tail) == full[-10:]
+
+        assert authenticated_client.get(URL, HTTP_RANGE=f'bytes={len(full)}-').status_code == 416
+        assert authenticated_client.get(URL, HTTP_IF_NONE_MATCH=f'"{etag}"').status_code == 304
+
+    def test_long_range_is_generated_in_background(self, authenticated_client, patient_user, attack):
+        end = timezone.localdate()
+        start = end - timedelta(days=365)
+
+        response = authenticated_client.get(f'{URL}?start_date={start}&end_date={end}')
+
+        assert response.status_code == 202
+        status_url = response.data['status_url']
+        # Testlerde Celery eager: rapor uretilmis ve bildirim gonderilmis olmali
+        assert authenticated_client.get(status_url).data['status'] == 'ready'
+        download = authenticated_client.get(response.data['download_url'])
+        assert download.status_code == 200
+        assert _content(download).startswith(b'%PDF')
+        assert Notification.objects.filter(recipient=patient_user, metadata__report_type='migraine').exists()
+
+    def test_other_users_cannot_access_report(self, authenticated_client, doctor_user, attack):
+        authenticated_client.get(URL)
+        report = GeneratedReport.objects.get()
+
+        other = APIClient()
+        other.force_authenticate(doctor_user)
+        assert other.get(f'/api/v1/reports/{report.id}/download/').status_code == 404
+        assert authenticated_client.get(f'/api/v1/reports/{report.id}/').data['status'] == 'ready'
+
+    def test_invalid_range_rejected(self, authenticated_client):
+        assert authenticated_client.get(f'{URL}?start_date=2026-02-01&end_date=2026-01-01').status_code == 400
+        assert authenticated_client.get(f'{URL}?start_date=bad').status_code == 400
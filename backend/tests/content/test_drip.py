@@ -0,0 +1,84 @@
+"""
+Tests for the set-based daily education drip.
+"""
+
+import pytest
+from django.utils import timezone
+
+from apps.content.drip import run_module_drip
+from apps.content.models import EducationItem, EducationProgress
+from apps.content.tasks import send_daily_education_drip
+from apps.notifications.models import Notification, NotificationPreference
+from apps.patients.models import DiseaseModule, PatientModule
+
+
+@pytest.fixture
+def migraine(db):
+    return DiseaseModule.objects.create(
+        slug='migraine', disease_type='migraine', name_tr='Migren', name_en='Migraine',
+    )
+
+
+@pytest.fixture
+def cards(migraine):
+    return [
+        EducationItem.objects.create(
+            slug=f'kart-{i}', title_tr=f'Kart {i}', title_en=f'Card {i}',
+            content_type='text', disease_module=migraine, order=i, is_published=True,
+        )
+        for i in range(1, 4)
+    ]
+
+
+@pytest.fixture
+def patients(user_factory, migraine):
+    users = [
+        user_factory(email=f'p{i}@example.com', role='patient') for i in range(6)
+    ]
+    for user in users:
+        PatientModule.objects.create(patient=user, disease_module=migraine)
+    return users
+
+
+@pytest.mark.django_db
+class TestEducationDrip:
+    """Tests for next-card selection, dedupe and opt-out."""
+
+    def test_next_card_per_patient(self, cards, patients):
+        EducationProgress.objects.create(
+            patient=patients[0], education_item=cards[0], completed_at=timezone.now(),
+        )
+        for card in cards:
+            EducationProgress.objects.create(
+                patient=patients[1], education_item=card, completed_at=timezone.now(),
+            )
+        NotificationPreference.objects.create(user=patients[2], email_education=False)
+
+        result = send_daily_education_drip()
+        assert result == {'sent': 4, 'skipped': 2}
+
+        note = Notification.objects.get(recipient=patients[0])
+        assert note.metadata['drip_education_item'] == str(cards[1].id)
+        assert note.title_en == "Today's Migraine Tip: Card 2"
+        assert note.message_tr.endswith('(2/3)')
+        assert note.action_url == '/patient/migraine/education'
+
+        assert Notification.objects.get(recipient=patients[3]).metadata['card_number'] == 1
+
+    def test_second_run_same_day_is_deduped(self, cards, patients):
+        send_daily_education_drip()
+        assert send_daily_education_drip() == {'sent': 0, 'skipped': 6}
+        assert Notification.objects.count() == 6
+
+    def test_query_count_is_constant(self, cards, patients, django_assert_num_queries, migraine):
+        # Kartlar + kayit satirlari + bugunku gonderimler + bulk insert
+        with django_assert_num_queries(4):
+            run_module_drip(migraine)
+
+    def test_shards_partition_patients(self, cards, patients, migraine):
+        sent = sum(
+            run_module_drip(migraine, shard=shard, shard_count=3)['sent']
+            for shard in range(3)
+        )
+        assert sent == len(patients)
+        assert Notification.objects.values('recipient').distinct().count() == len(patients)
@@ -0,0 +1,154 @@
+"""
+Tests for compiled quiz answer keys, single-pass grading and quiz attempt endpoints.
+"""
+
+import pytest
+from django.core.cache import cache
+from rest_framework import status
+
+from apps.content.models import EducationQuiz, QuizAttempt, QuizQuestion
+from apps.content.quiz_grading import get_answer_key, grade_answers
+from apps.gamification.models import GamificationEvent
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def quiz(db):
+    quiz = EducationQuiz.objects.create(
+        slug='migren-temel', title_tr='Migren Temel', title_en='Migraine Basics',
+        passing_score_percent=50, points_reward=10, is_published=True,
+    )
+    for order in range(2):
+        QuizQuestion.objects.create(
+            quiz=quiz, order=order,
+            question_tr=f'Soru {order}', question_en=f'Question {order}',
+            options=[
+                {'text_tr': 'A', 'text_en': 'A', 'is_correct': order == 0},
+                {'text_tr': 'B', 'text_en': 'B', 'is_correct': order == 1},
+            ],
+        )
+    quiz.refresh_from_db()
+    return quiz
+
+
+def _answers(quiz, indexes):
+    questions = quiz.questions.order_by('order')
+    return [
+        {'question_id': str(q.id), 'selected_option_index': idx}
+        for q, idx in zip(questions, indexes)
+    ]
+
+
+@pytest.mark.django_db
+class TestAnswerKey:
+    """Tests for answer key compilation and version invalidation."""
+
+    def test_cached_grading_makes_no_queries(self, quiz, django_assert_num_queries):
+        answers = _answers(quiz, [0, 1])
+        get_answer_key(quiz)
+        with django_assert_num_queries(0):
+            result = grade_answers(get_answer_key(quiz), answers)
+        assert result.score == 2
+        assert result.passed
+        assert result.is_perfect
+
+    def test_question_edit_bumps_version(self, quiz):
+        old_key = get_answer_key(quiz)
+        question = quiz.questions.order_by('order').first()
+        question.options = [
+            {'text_tr': 'A', 'text_en': 'A', 'is_correct': False},
+            {'text_tr': 'B', 'text_en': 'B', 'is_correct': True},
+        ]
+        question.save()
+        quiz.refresh_from_db()
+
+        new_key = get_answer_key(quiz)
+        assert new_key.version > old_key.version
+        assert grade_answers(new_key, _answers(quiz, [1, 1])).score == 2
+
+    def test_stale_quiz_save_does_not_roll_back_version(self, quiz):
+        stale = EducationQuiz.objects.get(pk=quiz.pk)
+        question = quiz.questions.order_by('order').first()
+        question.question_tr = 'Guncel soru'
+        question.save()
+        quiz.refresh_from_db()
+
+        stale.passing_score_percent = 60
+        stale.save()
+
+        assert stale.content_version == quiz.content_version + 1
+        stale.refresh_from_db()
+        assert stale.content_version == quiz.content_version + 1
+
+    def test_duplicate_answers_count_once(self, quiz):
+        question = quiz.questions.order_by('order').first()
+        answers = [{'question_id': str(question.id), 'selected_option_index': 0}] * 2
+        result = grade_answers(get_answer_key(quiz), answers)
+        assert result.score == 1
+
+    def test_out_of_range_option_is_wrong(self, quiz):
+        result = grade_answers(get_answer_key(quiz), _answers(quiz, [5, -1]))
+        assert result.score == 0
+        assert not result.passed
+
+
+@pytest.mark.django_db
+class TestQuizAttemptEndpoints:
+    """Tests for single and bulk quiz attempt submission."""
+
+    url = '/api/v1/content/quiz-attempts/'
+
+    def test_create_attempt_grades_and_queues_event(self, authenticated_client, quiz):
+        response = authenticated_client.post(
+            self.url, {'quiz': str(quiz.id), 'answers': _answers(quiz, [0, 0])}, format='json',
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['score'] == 1
+        assert response.data['total_questions'] == 2
+        assert response.data['passed'] is True
+        event = GamificationEvent.objects.get(event_type='quiz_passed')
+        assert event.points == 10
+
+    def test_bulk_attempts(self, authenticated_client, patient_user, quiz):
+        payload = {'attempts': [
+            {'quiz': str(quiz.id), 'answers': _answers(quiz, [0, 1]), 'duration_seconds': 30},
+            {'quiz': str(quiz.id), 'answers': _answers(quiz, [1, 0])},
+        ]}
+        response = authenticated_client.post(f'{self.url}bulk/', payload, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [a['score'] for a in response.data] == [2, 0]
+        assert QuizAttempt.objects.filter(patient=patient_user).count() == 2
+        # Sadece gecen deneme icin olay; tam puan bonusu dahil
+        event = GamificationEvent.objects.get(event_type='quiz_passed')
+        assert event.points == 15
+
+    def test_bulk_rejects_unknown_quiz(self, authenticated_client, quiz):
+        payload = {'attempts': [
+            {'quiz': str(quiz.id), 'answers': _answers(quiz, [0, 1])},
+            {'quiz': 'not-a-uuid', 'answers': []},
+        ]}
+        response = authenticated_client.post(f'{self.url}bulk/', payload, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['errors'][0]['index'] == 1
+        assert not QuizAttempt.objects.exists()
+
+    def test_quiz_detail_cached_per_version(self, authenticated_client, quiz):
+        url = f'/api/v1/content/quizzes/{quiz.slug}/'
+        first = authenticated_client.get(url)
+        assert first.status_code == status.HTTP_200_OK
+        assert first.data['question_count'] == 2
+
+        QuizQuestion.objects.create(
+            quiz=quiz, order=2, question_tr='Soru 2', question_en='Question 2',
+            options=[{'text_tr': 'A', 'text_en': 'A', 'is_correct': True}],
+        )
+        second = authenticated_client.get(url)
+        assert second.data['question_count'] == 3
@@ -0,0 +1,155 @@
+"""
+Tests for set-based editor bulk transitions.
+"""
+
+import pytest
+from rest_framework import status
+
+from apps.accounts.models import DoctorAuthor, DoctorProfile
+from apps.content.models import Article, NewsArticle
+from apps.notifications.models import Notification
+
+ARTICLE_URL = '/api/v1/doctor/editor/articles/bulk-transition/'
+NEWS_URL = '/api/v1/doctor/editor/news/bulk-transition/'
+
+
+@pytest.fixture
+def author(doctor_user):
+    profile, _ = DoctorProfile.objects.get_or_create(user=doctor_user)
+    return DoctorAuthor.objects.create(doctor=profile, primary_specialty='neurology')
+
+
+def _articles(user, count, status='draft'):
+    return [
+        Article.objects.create(
+            slug=f'bulk-{status}-{i}', title_tr=f'Makale {i}', title_en='A',
+            body_tr='Govde', body_en='Body', author=user, status=status,
+        )
+        for i in range(count)
+    ]
+
+
+def _news(author, count, status='review'):
+    category = NewsArticle._meta.get_field('category').choices[0][0]
+    return [
+        NewsArticle.objects.create(
+            slug=f'haber-{status}-{i}', title_tr=f'Haber {i}', body_tr='Govde',
+            category=category, author=author, status=status,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.django_db
+class TestBulkArticleTransition:
+    """Tests for the bulk article transition endpoint."""
+
+    def test_publish_updates_stats_and_notifies(self, admin_client, doctor_user, author):
+        articles = _articles(doctor_user, 5)
+
+        response = admin_client.post(
+            ARTICLE_URL, {'ids': [str(a.id) for a in articles], 'action': 'publish'}, format='json',
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']['success']) == 5
+        assert set(Article.objects.values_list('status', flat=True)) == {'published'}
+        assert not Article.objects.filter(published_at__isnull=True).exists()
+        assert Notification.objects.filter(recipient=doctor_user).count() == 5
+
+        author.refresh_from_db()
+        assert author.total_articles == 5
+        assert author.author_level == DoctorAuthor.level_for(5) == 1
+
+    def test_stats_match_single_item_transition(self, admin_client, doctor_user, author, user_factory):
+        from apps.doctor_panel.bulk_transitions import ARTICLE_TRANSITIONS, NEWS_TRANSITIONS
+        from apps.doctor_panel.views_editor import EditorArticleTransitionView, EditorNewsTransitionView
+
+        assert EditorArticleTransitionView.TRANSITIONS is ARTICLE_TRANSITIONS
+        assert EditorNewsTransitionView.TRANSITIONS is NEWS_TRANSITIONS
+
+        # Yalnizca doctor_author olarak baglanan makale sayima girmez
+        Article.objects.create(
+            slug='baska-yazar', title_tr='Baska', title_en='Other', body_tr='G', body_en='B',
+            author=user_factory(email='diger@example.com'), doctor_author=author, status='published',
+        )
+        bulk, single = _articles(doctor_user, 2)
+
+        admin_client.post(ARTICLE_URL, {'ids': [str(bulk.id)], 'action': 'publish'}, format='json')
+        author.refresh_from_db()
+        assert author.total_articles == 1
+
+        admin_client.post(
+            f'/api/v1/doctor/editor/articles/{single.id}/transition/', {'action': 'publish'}, format='json',
+        )
+        author.refresh_from_db()
+        assert author.total_articles == 2
+
+    def test_query_count_does_not_grow_with_selection(self, admin_client, doctor_user, author,
+                                                      django_assert_max_num_queries):
+        small = _articles(doctor_user, 2)
+        admin_client.post(ARTICLE_URL, {'ids': [str(a.id) for a in small], 'action': 'publish'}, format='json')
+
+        large = [a.id for a in Article.objects.bulk_create([
+            Article(slug=f'toplu-{i}', title_tr='T', title_en='T', body_tr='B', body_en='B', author=doctor_user)
+            for i in range(40)
+        ])]
+        with django_assert_max_num_queries(20):
+            response = admin_client.post(
+                ARTICLE_URL, {'ids': [str(pk) for pk in large], 'action': 'publish'}, format='json',
+            )
+        assert len(response.data['results']['success']) == 40
+
+    def test_invalid_state_and_missing_rows_fail(self, admin_client, doctor_user):
+        draft = _articles(doctor_user, 1)[0]
+        archived = _articles(doctor_user, 1, status='archived')[0]
+        missing = '00000000-0000-0000-0000-000000000000'
+
+        response = admin_client.post(
+            ARTICLE_URL, {'ids': [str(draft.id), str(archived.id), missing], 'action': 'archive'}, format='json',
+        )
+
+        results = response.data['results']
+        assert [r['id'] for r in results['success']] == [str(draft.id)]
+        assert {r['id'] for r in results['failed']} == {str(archived.id), missing}
+        draft.refresh_from_db()
+        assert draft.status == 'archived'
+
+    def test_malformed_id_fails_alone(self, admin_client, doctor_user):
+        draft = _articles(doctor_user, 1)[0]
+
+        response = admin_client.post(
+            ARTICLE_URL, {'ids': ['not-a-uuid', str(draft.id)], 'action': 'archive'}, format='json',
+        )
+
+        results = response.data['results']
+        assert [r['id'] for r in results['success']] == [str(draft.id)]
+        assert results['failed'] == [{'id': 'not-a-uuid', 'error': 'Gecersiz id.'}]
+
+    def test_unsupported_article_action_changes_nothing(self, admin_client, doctor_user):
+        draft = _articles(doctor_user, 1)[0]
+
+        response = admin_client.post(ARTICLE_URL, {'ids': [str(draft.id)], 'action': 'approve'}, format='json')
+
+        assert response.data['results']['success'] == []
+        draft.refresh_from_db()
+        assert draft.status == 'draft'
+
+
+@pytest.mark.django_db
+class TestBulkNewsTransition:
+    """Tests for the bulk news transition endpoint."""
+
+    def test_approve_sets_reviewer_and_notifies_author(self, admin_client, admin_user, doctor_user, author,
+                                                       django_capture_on_commit_callbacks):
+        news = _news(author, 3)
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            response = admin_client.post(
+                NEWS_URL, {'ids': [str(n.id) for n in news], 'action': 'approve'}, format='json',
+            )
+
+        assert len(response.data['results']['success']) == 3
+        assert set(NewsArticle.objects.values_list('status', 'reviewed_by')) == {('approved', admin_user.id)}
+        assert Notification.objects.filter(recipient=doctor_user).count() == 3
+        assert len(callbacks) == 1
@@ -0,0 +1,168 @@
+"""
+Tests for asynchronous author pipeline jobs.
+"""
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+import services.agents  # noqa: F401
+from apps.content.models import Article, ArticleReview
+from apps.doctor_panel import pipeline_jobs
+from services import agent_context
+from services.base_agent import ALL_FLAGS, BaseAgent
+from services.registry import agent_registry
+
+
+class FakeAgent(BaseAgent):
+    """FeatureFlag'i tanimsiz (kapali) ajan: yalnizca flag_overrides ile calisir."""
+
+    def __init__(self, name, data, tokens=10):
+        self.name = name
+        self.feature_flag_key = f'agent_{name}'
+        self.data = data
+        self.tokens = tokens
+        self.calls = 0
+
+    def execute(self, input_data):
+        self.calls += 1
+        agent_context.current().record(tokens=self.tokens)
+        return dict(self.data)
+
+
+@pytest.fixture
+def review_agents(monkeypatch):
+    agents = {
+        'publishing_agent': FakeAgent('publishing_agent', {'overall_score': 82, 'feedback': 'Iyi'}),
+        'seo_agent': FakeAgent('seo_agent', {'seo_title_tr': 'SEO Baslik'}),
+        'internal_link_agent': FakeAgent('internal_link_agent', {}),
+    }
+    for name, agent in agents.items():
+        monkeypatch.setitem(agent_registry._agents, name, agent)
+    return agents
+
+
+@pytest.fixture
+def article(doctor_user):
+    return Article.objects.create(
+        slug='migren-yazisi', title_tr='Migren', title_en='Migraine',
+        body_tr='Govde', body_en='Body', author=doctor_user,
+    )
+
+
+def _submit_review(client, article):
+    return client.post(
+        f'/api/v1/doctor/author/articles/{article.id}/transition/',
+        {'action': 'submit_for_review'}, format='json',
+    )
+
+
+@pytest.mark.django_db
+class TestReviewJob:
+    """Tests for submit_for_review running as a background job."""
+
+    def test_submit_returns_job_and_publishes_after_run(
+        self, doctor_client, article, review_agents, django_capture_on_commit_callbacks,
+    ):
+        original_is_enabled = BaseAgent.is_enabled
+        with django_capture_on_commit_callbacks(execute=True):
+            response = _submit_review(doctor_client, article)
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data['status'] == 'draft'
+        job_id = response.data['job']['id']
+
+        article.refresh_from_db()
+        assert article.status == 'published'
+        assert article.seo_title_tr == 'SEO Baslik'
+        assert ArticleReview.objects.get(article=article).overall_score == 82
+        # Flag bypass sinif durumunu degistirmez
+        assert BaseAgent.is_enabled is original_is_enabled
+
+        data = doctor_client.get(f'/api/v1/doctor/author/pipeline-jobs/{job_id}/').data
+        assert data['status'] == 'completed'
+        assert [step['name'] for step in data['steps']] == list(review_agents)
+        assert {step['status'] for step in data['steps']} == {'completed'}
+        assert data['steps_finished'] == 3
+        assert data['tokens_used'] == 30
+        assert data['result']['published'] is True
+
+    def test_low_score_keeps_draft(self, doctor_client, article, review_agents,
+                                   django_capture_on_commit_callbacks):
+        review_agents['publishing_agent'].data = {'overall_score': '40'}
+        with django_capture_on_commit_callbacks(execute=True):
+            _submit_review(doctor_client, article)
+
+        article.refresh_from_db()
+        assert article.status == 'draft'
+        assert ArticleReview.objects.get(article=article).decision == 'revise'
+
+    def test_job_runs_once(self, doctor_user, article, review_agents):
+        job = pipeline_jobs.submit_job(doctor_user, pipeline_jobs.JOB_REVIEW, 'doctor_article_review', article)
+
+        assert pipeline_jobs.run_job(job.id) is not None
+        assert pipeline_jobs.run_job(job.id) is None
+        assert review_agents['publishing_agent'].calls == 1
+
+
+@pytest.mark.django_db
+class TestJobLimits:
+    """Tests for per-author concurrency and ownership."""
+
+    def test_duplicate_job_for_article_conflicts(self, doctor_client, article):
+        assert _submit_review(doctor_client, article).status_code == status.HTTP_202_ACCEPTED
+
+        response = doctor_client.post(
+            f'/api/v1/doctor/author/articles/{article.id}/run-pipeline/',
+            {'pipeline': 'seo_optimize'}, format='json',
+        )
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    def test_submit_job_rejects_second_job_for_article(self, doctor_user, article):
+        job = pipeline_jobs.submit_job(doctor_user, pipeline_jobs.JOB_RUN, 'seo_optimize', article)
+
+        with pytest.raises(pipeline_jobs.JobAlreadyRunning) as exc:
+            pipeline_jobs.submit_job(doctor_user, pipeline_jobs.JOB_REVIEW, 'doctor_article_review', article)
+        assert exc.value.job == job
+
+    def test_author_limit(self, doctor_client, doctor_user):
+        articles = [
+            Article.objects.create(
+                slug=f'yazi-{i}', title_tr='T', title_en='T', body_tr='B', body_en='B',
+                author=doctor_user,
+            )
+            for i in range(pipeline_jobs.MAX_ACTIVE_JOBS_PER_AUTHOR + 1)
+        ]
+        responses = [
+            doctor_client.post(
+                f'/api/v1/doctor/author/articles/{a.id}/run-pipeline/',
+                {'pipeline': 'seo_optimize'}, format='json',
+            )
+            for a in articles
+        ]
+
+        assert [r.status_code for r in responses] == (
+            [status.HTTP_202_ACCEPTED] * pipeline_jobs.MAX_ACTIVE_JOBS_PER_AUTHOR
+            + [status.HTTP_429_TOO_MANY_REQUESTS]
+        )
+        assert doctor_client.get('/api/v1/doctor/author/pipeline-jobs/').data[0]['status'] == 'pending'
+
+    def test_other_author_cannot_see_job(self, doctor_user, user_factory, article):
+        job = pipeline_jobs.submit_job(doctor_user, pipeline_jobs.JOB_RUN, 'seo_optimize', article)
+        other = APIClient()
+        other.force_authenticate(user_factory(email='other@example.com', role='doctor'))
+
+        response = other.get(f'/api/v1/doctor/author/pipeline-jobs/{job.id}/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestFlagOverrides:
+    """Tests for per-run feature flag overrides."""
+
+    def test_override_takes_precedence(self):
+        agent = FakeAgent('x', {})
+        agent.is_enabled = lambda: False
+
+        assert agent.is_enabled_with() is False
+        assert agent.is_enabled_with({ALL_FLAGS: True}) is True
+        assert agent.is_enabled_with({ALL_FLAGS: True, 'agent_x': False}) is False
@@ -0,0 +1,124 @@
+"""
+Tests for the monthly epilepsy seizure rollup.
+"""
+
+import pytest
+from datetime import date, datetime, timedelta
+from django.utils import timezone
+
+from apps.epilepsy import rollups
+from apps.epilepsy.models import EpilepsyTrigger, SeizureEvent, SeizureMonthlySummary
+
+STATS = '/api/v1/epilepsy/seizures/stats/'
+
+
+def _at(year, month, day):
+    return timezone.make_aware(datetime(year, month, day, 12, 0))
+
+
+def _seizure(patient, when, **kwargs):
+    kwargs.setdefault('intensity', 5)
+    return SeizureEvent.objects.create(patient=patient, seizure_datetime=when, **kwargs)
+
+
+@pytest.fixture
+def triggers():
+    return [
+        EpilepsyTrigger.objects.create(name_tr='Uykusuzluk', name_en='Sleep deprivation', category='sleep'),
+        EpilepsyTrigger.objects.create(name_tr='Stres', name_en='Stress', category='stress'),
+    ]
+
+
+def _summary(patient, year, month):
+    return SeizureMonthlySummary.objects.get(patient=patient, month=date(year, month, 1))
+
+
+@pytest.mark.django_db
+class TestMonthlySummaryMaintenance:
+    """Tests for keeping the buckets in step with SeizureEvent writes."""
+
+    def test_create_update_delete(self, patient_user):
+        first = _seizure(patient_user, _at(2026, 3, 5), intensity=4, duration_seconds=60, loss_of_consciousness=True)
+        _seizure(patient_user, _at(2026, 3, 20), intensity=8, seizure_type='focal_aware')
+
+        summary = _summary(patient_user, 2026, 3)
+        assert summary.seizure_count == 2
+        assert summary.intensity_sum == 12
+        assert (summary.duration_sum, summary.duration_count) == (60, 1)
+        assert summary.consciousness_loss_count == 1
+        assert summary.type_counts == {'unknown': 1, 'focal_aware': 1}
+
+        first.seizure_datetime = _at(2026, 4, 1)
+        first.save()
+        assert _summary(patient_user, 2026, 3).seizure_count == 1
+        assert _summary(patient_user, 2026, 4).seizure_count == 1
+
+        first.delete()
+        assert not SeizureMonthlySummary.objects.filter(month=date(2026, 4, 1)).exists()
+
+    def test_trigger_counters(self, patient_user, triggers):
+        seizure = _seizure(patient_user, _at(2026, 3, 5))
+        seizure.triggers_identified.set(triggers)
+        assert _summary(patient_user, 2026, 3).trigger_counts == {str(t.id): 1 for t in triggers}
+
+        seizure.triggers_identified.remove(triggers[0])
+        assert _summary(patient_user, 2026, 3).trigger_counts == {str(triggers[1].id): 1}
+
+        triggers[1].delete()
+        assert _summary(patient_user, 2026, 3).trigger_counts == {}
+
+    def test_reconcile_repairs_drift(self, patient_user, user_factory):
+        _seizure(patient_user, _at(2026, 3, 5), intensity=4)
+        _seizure(patient_user, _at(2026, 5, 5), intensity=6)
+        SeizureEvent.objects.filter(seizure_datetime__month=3).update(intensity=9)
+        SeizureMonthlySummary.objects.filter(month=date(2026, 5, 1)).delete()
+        other = user_factory(email='other@example.com')
+        SeizureMonthlySummary.objects.create(patient=other, month=date(2026, 1, 1), seizure_count=3)
+
+        assert rollups.reconcile_summaries() == {'updated': 2, 'deleted': 1}
+        assert _summary(patient_user, 2026, 3).intensity_sum == 9
+        assert _summary(patient_user, 2026, 5).seizure_count == 1
+        assert rollups.reconcile_summaries() == {'updated': 0, 'deleted': 0}
+
+
+@pytest.mark.django_db
+class TestSummaryEndpoints:
+    """Tests for stats, chart and trigger analysis served from buckets."""
+
+    def test_stats(self, authenticated_client, patient_user, triggers, django_assert_num_queries):
+        today = date.today()
+        now = timezone.now()
+        a = _seizure(patient_user, now, intensity=4, duration_seconds=30, seizure_type='focal_aware')
+        b = _seizure(patient_user, now - timedelta(days=1), intensity=6, loss_of_consciousness=True,
+                     seizure_type='focal_aware')
+        _seizure(patient_user, now - timedelta(days=400), intensity=8)
+        a.triggers_identified.set(triggers)
+        b.triggers_identified.add(triggers[1])
+
+        authenticated_client.get(STATS)
+        # kullanici + denetim kaydi + ozetler + tetikleyici adlari
+        with django_assert_num_queries(4):
+            response = authenticated_client.get(STATS)
+
+        this_month = sum(1 for s in (a, b) if timezone.localdate(s.seizure_datetime).replace(day=1) == today.replace(day=1))
+        assert response.data['total_seizures'] == 3
+        assert response.data['avg_intensity'] == 6.0
+        assert response.data['avg_duration'] == 30
+        assert response.data['seizures_this_month'] == this_month
+        assert response.data['most_common_type'] == 'focal_aware'
+        assert response.data['consciousness_loss_percentage'] == 33.3
+        assert response.data['most_common_triggers'] == [
+            {'name': 'Stres', 'count': 2}, {'name': 'Uykusuzluk', 'count': 1},
+        ]
+
+    def test_chart_and_analysis(self, authenticated_client, patient_user, triggers):
+        today = date.today()
+        seizure = _seizure(patient_user, timezone.now(), intensity=7)
+        seizure.triggers_identified.add(triggers[0])
+
+        chart = authenticated_client.get('/api/v1/epilepsy/seizures/chart/', {'months': 3}).data
+        assert chart[-1] == {'month': today.strftime('%Y-%m'), 'count': 1, 'avg_intensity': 7.0}
+        assert sum(row['count'] for row in chart) == 1
+
+        analysis = authenticated_client.get('/api/v1/epilepsy/triggers/analysis/').data
+        assert [(row['name_tr'], row['seizure_count']) for row in analysis] == [('Uykusuzluk', 1)]
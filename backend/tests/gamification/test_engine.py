@@ -0,0 +1,166 @@
+"""
+Tests for the gamification rules engine and the denormalized summary endpoint.
+"""
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from apps.gamification.engine import emit_event, process_pending_events
+from apps.gamification.models import (
+    Achievement,
+    Badge,
+    GamificationEvent,
+    PointHistory,
+    UserAchievement,
+    UserBadge,
+    UserGamificationSummary,
+    UserPoints,
+    UserStreak,
+)
+
+
+@pytest.fixture
+def level_badge(db):
+    return Badge.objects.create(
+        name_tr='Seviye 2', name_en='Level 2',
+        description_tr='Test', description_en='Test',
+        icon='star', category='milestone',
+        points_reward=0,
+        requirement_type='level', requirement_value=2,
+    )
+
+
+@pytest.fixture
+def daily_any_log(db):
+    return Achievement.objects.create(
+        name_tr='Gunluk Kayit', name_en='Daily Log',
+        description_tr='Test', description_en='Test',
+        icon='check', period='daily',
+        target_type='any_log', target_value=2, points_reward=3,
+    )
+
+
+@pytest.mark.django_db
+class TestEmitEvent:
+    """Tests for queueing domain events."""
+
+    def test_emit_only_queues_event(self, patient_user):
+        event = emit_event(patient_user, 'education_completed', reason='Egitim')
+        assert event.points == 5
+        assert event.processed_at is None
+        assert not UserPoints.objects.filter(user=patient_user).exists()
+
+    def test_unknown_event_type_rejected(self, patient_user):
+        with pytest.raises(ValueError):
+            emit_event(patient_user, 'unknown_event')
+
+
+@pytest.mark.django_db
+class TestProcessPendingEvents:
+    """Tests for batch evaluation of queued events."""
+
+    def test_batch_applies_points_streak_and_history(self, patient_user):
+        emit_event(patient_user, 'quiz_passed', points=60, reason='Quiz 1')
+        emit_event(patient_user, 'education_completed', reason='Egitim')
+
+        result = process_pending_events()
+
+        assert result == {'processed': 2, 'users': 1, 'failed': 0}
+        points = UserPoints.objects.get(user=patient_user)
+        assert points.total_points == 65
+        assert PointHistory.objects.filter(user=patient_user).count() == 2
+        streak = UserStreak.objects.get(user=patient_user, streak_type='education')
+        assert streak.current_streak == 1
+        assert not GamificationEvent.objects.filter(processed_at__isnull=True).exists()
+
+    def test_processed_events_not_reapplied(self, patient_user):
+        emit_event(patient_user, 'quiz_passed', points=10, reason='Quiz')
+        process_pending_events()
+        assert process_pending_events() == {'processed': 0, 'users': 0, 'failed': 0}
+        assert UserPoints.objects.get(user=patient_user).total_points == 10
+
+    def test_failed_user_events_stay_pending(self, patient_user, user_factory, monkeypatch):
+        from apps.gamification import engine
+
+        other = user_factory(email='diger@example.com')
+        emit_event(patient_user, 'quiz_passed', points=10, reason='Quiz')
+        emit_event(other, 'quiz_passed', points=20, reason='Quiz')
+        apply = engine._apply_user_events
+
+        def flaky(user_id, events):
+            if user_id == patient_user.id:
+                raise RuntimeError('gecici hata')
+            return apply(user_id, events)
+
+        monkeypatch.setattr(engine, '_apply_user_events', flaky)
+        assert process_pending_events() == {'processed': 1, 'users': 2, 'failed': 1}
+
+        failed = GamificationEvent.objects.get(user=patient_user)
+        assert failed.processed_at is None
+        assert failed.attempts == 1 and 'gecici hata' in failed.last_error
+        assert GamificationEvent.objects.get(user=other).processed_at is not None
+
+        monkeypatch.setattr(engine, '_apply_user_events', apply)
+        assert process_pending_events()['processed'] == 1
+        assert UserPoints.objects.get(user=patient_user).total_points == 10
+
+    def test_events_past_attempt_cap_are_not_retried(self, patient_user):
+        from apps.gamification.engine import MAX_EVENT_ATTEMPTS
+
+        emit_event(patient_user, 'quiz_passed', points=10, reason='Quiz')
+        GamificationEvent.objects.update(attempts=MAX_EVENT_ATTEMPTS)
+
+        assert process_pending_events() == {'processed': 0, 'users': 0, 'failed': 0}
+        assert not UserPoints.objects.filter(user=patient_user, total_points__gt=0).exists()
+
+    def test_achievement_progress_and_reward(self, patient_user, daily_any_log):
+        emit_event(patient_user, 'education_completed', reason='Egitim 1')
+        emit_event(patient_user, 'education_completed', reason='Egitim 2')
+        process_pending_events()
+
+        ua = UserAchievement.objects.get(user=patient_user, achievement=daily_any_log)
+        assert ua.is_completed
+        assert ua.period_start == timezone.localdate()
+        assert UserPoints.objects.get(user=patient_user).total_points == 13
+
+    def test_level_badge_awarded(self, patient_user, level_badge):
+        emit_event(patient_user, 'quiz_passed', points=100, reason='Quiz')
+        process_pending_events()
+        assert UserBadge.objects.filter(user=patient_user, badge=level_badge).exists()
+
+    def test_summary_row_rebuilt(self, patient_user, level_badge):
+        emit_event(patient_user, 'quiz_passed', points=100, reason='Quiz')
+        process_pending_events()
+
+        summary = UserGamificationSummary.objects.get(user=patient_user)
+        assert summary.points['total_points'] == 100
+        assert summary.total_badges == 1
+        assert summary.recent_badges[0]['badge']['id'] == level_badge.id
+
+
+@pytest.mark.django_db
+class TestGamificationSummaryEndpoint:
+    """Tests for the summary endpoint served from the denormalized row."""
+
+    url = '/api/v1/gamification/summary/'
+
+    def test_summary_single_read(self, authenticated_client, patient_user,
+                                 django_assert_max_num_queries):
+        emit_event(patient_user, 'education_completed', reason='Egitim')
+        process_pending_events()
+
+        # auth user + summary row (+ LastActive / AuditLog middleware writes)
+        with django_assert_max_num_queries(4):
+            response = authenticated_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['points']['total_points'] == 5
+        assert response.data['stats']['active_streaks'] == 1
+        assert response.data['streaks'][0]['is_active_today'] is True
+
+    def test_summary_built_on_first_access(self, authenticated_client, patient_user):
+        response = authenticated_client.get(self.url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['points']['total_points'] == 0
+        assert UserGamificationSummary.objects.filter(user=patient_user).exists()
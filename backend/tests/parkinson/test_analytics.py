@@ -0,0 +1,112 @@
+"""
+Tests for Parkinson analytics and the daily symptom rollup.
+"""
+
+import pytest
+from datetime import date, timedelta
+from django.utils import timezone
+from rest_framework import status
+
+from apps.parkinson import analytics
+from apps.parkinson.models import ParkinsonDailySymptomSummary, ParkinsonMedication, ParkinsonSymptomEntry
+
+
+def _entry(patient, when, **kwargs):
+    return ParkinsonSymptomEntry.objects.create(patient=patient, recorded_at=when, **kwargs)
+
+
+@pytest.fixture
+def medications(patient_user):
+    ParkinsonMedication.objects.create(
+        patient=patient_user, name='Madopar', drug_class='levodopa',
+        dosage_mg='100', frequency_per_day=3, led_conversion_factor='1.0', start_date=date(2026, 1, 1),
+    )
+    ParkinsonMedication.objects.create(
+        patient=patient_user, name='Pramipeksol', drug_class='dopamine_agonist',
+        dosage_mg='0.5', frequency_per_day=2, led_conversion_factor='100', start_date=date(2026, 1, 1),
+    )
+    ParkinsonMedication.objects.create(
+        patient=patient_user, name='Eski', drug_class='other',
+        dosage_mg='50', frequency_per_day=1, start_date=date(2025, 1, 1), is_active=False,
+    )
+
+
+@pytest.mark.django_db
+class TestParkinsonAnalytics:
+    """Tests for the aggregate analytics endpoints."""
+
+    def test_led_summary_computed_in_sql(self, authenticated_client, medications, django_assert_num_queries):
+        authenticated_client.get('/api/v1/parkinson/medications/led_summary/')
+        with django_assert_num_queries(2):
+            response = authenticated_client.get('/api/v1/parkinson/medications/led_summary/')
+
+        assert response.data['total_daily_led'] == 400.0
+        assert sorted(m['daily_led'] for m in response.data['medications']) == [100.0, 300.0]
+
+    def test_stats_single_query(self, authenticated_client, patient_user, django_assert_num_queries):
+        now = timezone.now()
+        _entry(patient_user, now - timedelta(days=1), tremor_severity=2, overall_severity=4, on_time_hours='6.0')
+        _entry(patient_user, now - timedelta(days=2), tremor_severity=4, overall_severity=6, on_time_hours='8.0')
+        _entry(patient_user, now - timedelta(days=40), tremor_severity=0, overall_severity=1)
+
+        authenticated_client.get('/api/v1/parkinson/symptoms/stats/')
+        with django_assert_num_queries(2):
+            response = authenticated_client.get('/api/v1/parkinson/symptoms/stats/')
+
+        assert response.data['total_entries'] == 3
+        assert response.data['last_30_days'] == 2
+        assert response.data['avg_tremor'] == 3
+        assert response.data['avg_on_time'] == 7.0
+
+    def test_dashboard_totals(self, authenticated_client, patient_user, medications):
+        _entry(patient_user, timezone.now(), off_time_hours='2.0')
+
+        response = authenticated_client.get('/api/v1/parkinson/dashboard/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['total_daily_led'] == 400.0
+        assert response.data['total_medications'] == 3
+        assert response.data['active_medications'] == 2
+        assert response.data['total_symptoms'] == 1
+        assert response.data['avg_off_time'] == 2.0
+
+
+@pytest.mark.django_db
+class TestDailySymptomSummary:
+    """Tests for the per-day rollup kept in sync by signals."""
+
+    def test_rollup_follows_entry_changes(self, patient_user):
+        day = timezone.now() - timedelta(days=3)
+        first = _entry(patient_user, day, overall_severity=4, motor_state='off', has_freezing=True)
+        _entry(patient_user, day, overall_severity=8, motor_state='off')
+
+        summary = ParkinsonDailySymptomSummary.objects.get(patient=patient_user)
+        assert summary.entry_count == 2
+        assert summary.avg_overall == 6
+        assert summary.max_overall == 8
+        assert summary.motor_states == {'off': 2}
+        assert summary.freezing_count == 1
+
+        first.recorded_at = day - timedelta(days=1)
+        first.save()
+        assert ParkinsonDailySymptomSummary.objects.filter(patient=patient_user).count() == 2
+
+        first.delete()
+        summary = ParkinsonDailySymptomSummary.objects.get(patient=patient_user)
+        assert summary.entry_count == 1 and summary.freezing_count == 0
+
+    def test_long_range_chart_reads_rollup(self, authenticated_client, patient_user):
+        now = timezone.now()
+        for offset in (5, 5, 60):
+            _entry(patient_user, now - timedelta(days=offset), tremor_severity=2)
+
+        response = authenticated_client.get('/api/v1/parkinson/symptoms/chart/?days=90')
+
+        assert [point['entry_count'] for point in response.data] == [1, 2]
+
+    def test_rebuild(self, patient_user):
+        _entry(patient_user, timezone.now(), overall_severity=3)
+        ParkinsonDailySymptomSummary.objects.all().delete()
+
+        assert analytics.rebuild_daily_summaries(patient_user.pk) == 1
+        assert ParkinsonDailySymptomSummary.objects.get(patient=patient_user).avg_overall == 3
@@ -0,0 +1,82 @@
+"""
+Tests for the daily/weekly task board.
+"""
+
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework import status
+
+from apps.patients import task_board
+from apps.patients.models import PatientModule, TaskCompletion, TaskTemplate
+
+TODAY_URL = '/api/v1/tasks/templates/today/'
+WEEK_URL = '/api/v1/tasks/templates/week/'
+
+
+@pytest.fixture
+def templates(patient_user, disease_module):
+    PatientModule.objects.create(patient=patient_user, disease_module=disease_module)
+    return [
+        TaskTemplate.objects.create(
+            disease_module=disease_module, title_tr=f'Gorev {i}', title_en=f'Task {i}',
+            task_type='checklist', frequency=frequency, order=i,
+        )
+        for i, frequency in enumerate(['daily', 'daily', 'weekly', 'one_time'])
+    ]
+
+
+@pytest.mark.django_db
+class TestTaskBoard:
+    """Tests for the task board endpoints."""
+
+    def test_today_marks_completions(self, authenticated_client, patient_user, templates):
+        TaskCompletion.objects.create(
+            patient=patient_user, task_template=templates[0], completed_date=timezone.localdate(),
+        )
+
+        response = authenticated_client.get(TODAY_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item['is_completed_today'] for item in response.data] == [True, False, False]
+
+    def test_week_lists_completion_dates(self, authenticated_client, patient_user, templates):
+        today = timezone.localdate()
+        week_start = today - timedelta(days=today.weekday())
+        TaskCompletion.objects.create(patient=patient_user, task_template=templates[1], completed_date=week_start)
+        TaskCompletion.objects.create(
+            patient=patient_user, task_template=templates[1], completed_date=week_start - timedelta(days=1),
+        )
+
+        response = authenticated_client.get(WEEK_URL)
+
+        completions = {item['title_en']: item['completions_this_week'] for item in response.data}
+        assert completions['Task 1'] == [week_start.isoformat()]
+        assert completions['Task 0'] == []
+        assert len(response.data) == 4
+
+    def test_board_is_single_query_then_cached(self, authenticated_client, patient_user, templates,
+                                               django_assert_num_queries):
+        authenticated_client.get(TODAY_URL)
+        task_board.invalidate_patient(patient_user.pk)
+
+        # auth user + pano + AuditLog yazimi
+        with django_assert_num_queries(3):
+            authenticated_client.get(TODAY_URL)
+        # week ayni panodan (cache)
+        with django_assert_num_queries(2):
+            authenticated_client.get(WEEK_URL)
+
+    def test_completion_invalidates_board(self, authenticated_client, templates):
+        assert not any(item['is_completed_today'] for item in authenticated_client.get(TODAY_URL).data)
+
+        authenticated_client.post(
+            '/api/v1/tasks/completions/',
+            {'task_template': templates[0].id, 'completed_date': timezone.localdate().isoformat()},
+            format='json',
+        )
+        assert authenticated_client.get(TODAY_URL).data[0]['is_completed_today'] is True
+
+        completion_id = authenticated_client.get('/api/v1/tasks/completions/').data['results'][0]['id']
+        authenticated_client.delete(f'/api/v1/tasks/completions/{completion_id}/')
+        assert authenticated_client.get(TODAY_URL).data[0]['is_completed_today'] is False
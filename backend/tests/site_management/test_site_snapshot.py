@@ -0,0 +1,126 @@
+"""
+Tests for the in-process site configuration snapshot.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from datetime import timedelta
+from rest_framework import status
+
+from apps.common import site_snapshot
+from apps.common.models import Announcement, FeatureFlag, HomepageHero, SiteConfig, SocialLink
+from services.base_agent import BaseAgent
+
+
+class _FlaggedAgent(BaseAgent):
+    name = 'flagged'
+    feature_flag_key = 'agent_flagged'
+
+    def execute(self, input_data):
+        return {}
+
+
+@pytest.fixture
+def site_data(db):
+    now = timezone.now()
+    FeatureFlag.objects.create(key='agent_flagged', label='Agent', is_enabled=True)
+    FeatureFlag.objects.create(key='store_module', label='Store', is_enabled=True, is_public=True)
+    FeatureFlag.objects.create(key='doctor_only', label='Doktor', is_enabled=True, enabled_for_roles=['doctor'])
+    SiteConfig.objects.create(key='topics', label='Topics', value='["a", "b"]', value_type='json')
+    SiteConfig.objects.create(key='max_items', label='Max', value='12', value_type='integer', is_public=True)
+    Announcement.objects.create(title_tr='Aktif', message_tr='m', is_active=True, priority=2)
+    Announcement.objects.create(
+        title_tr='Ileride', message_tr='m', is_active=True, priority=5,
+        starts_at=now + timedelta(days=1),
+    )
+    HomepageHero.objects.create(title_tr='Hero', subtitle_tr='Alt', is_active=True)
+    SocialLink.objects.create(platform='twitter', url='https://twitter.com/x', is_active=True)
+
+
+@pytest.mark.django_db
+class TestSnapshotLookups:
+    """Tests for typed lookups served from the snapshot."""
+
+    def test_lookups_do_not_query_after_load(self, site_data, patient_user, doctor_user,
+                                             django_assert_num_queries):
+        site_snapshot.get_snapshot()
+
+        with django_assert_num_queries(0):
+            assert site_snapshot.is_feature_enabled('agent_flagged') is True
+            assert site_snapshot.is_feature_enabled('missing') is False
+            assert site_snapshot.is_feature_enabled_for('doctor_only', doctor_user) is True
+            assert site_snapshot.is_feature_enabled_for('doctor_only', patient_user) is False
+            assert site_snapshot.get_config('max_items') == 12
+            assert _FlaggedAgent().is_enabled() is True
+
+    def test_json_values_are_copied(self, site_data):
+        topics = site_snapshot.get_config('topics')
+        topics.append('c')
+        assert site_snapshot.get_config('topics') == ['a', 'b']
+
+    def test_unparseable_value_falls_back_to_raw(self, db):
+        SiteConfig.objects.create(key='broken', label='B', value='{bad', value_type='json')
+        assert site_snapshot.get_config('broken') == '{bad'
+
+
+@pytest.mark.django_db
+class TestSnapshotInvalidation:
+    """Tests for local and cross-process invalidation."""
+
+    def test_save_invalidates_local_snapshot(self, site_data):
+        assert _FlaggedAgent().is_enabled() is True
+
+        flag = FeatureFlag.objects.get(key='agent_flagged')
+        flag.is_enabled = False
+        flag.save()
+
+        assert _FlaggedAgent().is_enabled() is False
+
+    def test_admin_viewset_update_is_visible_publicly(self, admin_client, site_data):
+        flag = FeatureFlag.objects.get(key='store_module')
+        admin_client.get('/api/v1/site/feature-flags/')
+
+        admin_client.patch(
+            f'/api/v1/site/admin/feature-flags/{flag.id}/', {'is_enabled': False}, format='json',
+        )
+        response = admin_client.get('/api/v1/site/feature-flags/')
+
+        flags = {item['key']: item['is_enabled'] for item in response.data}
+        assert flags == {'store_module': False}
+
+    def test_reloads_when_shared_version_changes(self, site_data):
+        snapshot = site_snapshot.get_snapshot()
+        # Baska bir prosesin yazimi: sinyal bu proseste calismaz
+        FeatureFlag.objects.filter(key='agent_flagged').update(is_enabled=False)
+        assert site_snapshot.is_feature_enabled('agent_flagged') is True
+
+        cache.set(site_snapshot.VERSION_KEY, 'other-process', None)
+        site_snapshot._state.checked_at = 0.0
+
+        assert site_snapshot.is_feature_enabled('agent_flagged') is False
+        assert site_snapshot.get_snapshot().version == 'other-process'
+        assert site_snapshot.get_snapshot() is not snapshot
+
+
+@pytest.mark.django_db
+class TestSiteBootstrap:
+    """Tests for the combined public bootstrap endpoint."""
+
+    def test_bootstrap_payload(self, api_client, site_data):
+        response = api_client.get('/api/v1/site/bootstrap/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['config'] == [
+            {'key': 'max_items', 'value': '12', 'value_type': 'integer', 'typed_value': 12},
+        ]
+        assert [f['key'] for f in response.data['feature_flags']] == ['store_module']
+        assert [a['title_tr'] for a in response.data['announcements']] == ['Aktif']
+        assert response.data['hero']['title_tr'] == 'Hero'
+        assert [link['platform'] for link in response.data['social_links']] == ['twitter']
+
+    def test_bootstrap_served_without_queries(self, api_client, site_data, django_assert_num_queries):
+        api_client.get('/api/v1/site/bootstrap/')
+        with django_assert_num_queries(0):
+            response = api_client.get('/api/v1/site/bootstrap/')
+        assert response.status_code == status.HTTP_200_OK
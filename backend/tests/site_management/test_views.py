@@ -27,8 +27,8 @@ def site_configs(db):
 def feature_flags(db):
     """Create test feature flags."""
     return [
-        FeatureFlag.objects.create(key='migraine_module', label='Migraine', is_enabled=True),
-        FeatureFlag.objects.create(key='store_module', label='Store', is_enabled=False),
+        FeatureFlag.objects.create(key='migraine_module', label='Migraine', is_enabled=True, is_public=True),
+        FeatureFlag.objects.create(key='store_module', label='Store', is_enabled=False, is_public=True),
     ]
 
 
@@ -170,6 +170,16 @@ class TestPublicFeatureFlags:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 2
 
+    def test_internal_flags_are_not_listed(self, api_client, feature_flags):
+        FeatureFlag.objects.create(key='agent_translation', label='Ceviri Agent', is_enabled=True)
+
+        response = api_client.get('/api/v1/site/feature-flags/')
+        keys = {flag['key'] for flag in response.data}
+        assert keys == {'migraine_module', 'store_module'}
+
+        bootstrap = api_client.get('/api/v1/site/bootstrap/')
+        assert 'agent_translation' not in {flag['key'] for flag in bootstrap.data['feature_flags']}
+
     def test_returns_public_fields_only(self, api_client, feature_flags):
         response = api_client.get('/api/v1/site/feature-flags/')
         assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,70 @@
+"""
+Tests for the cached social image rendering engine.
+"""
+
+import io
+
+from PIL import Image
+
+from apps.social.image_generator import SocialImageGenerator, render_batch
+from apps.social.image_generator.generator import (
+    BRAND_BAR_HEIGHT, _get_font, _text_width, _wrap_text,
+)
+
+
+def _open(png_bytes):
+    return Image.open(io.BytesIO(png_bytes))
+
+
+class TestFontCache:
+    """Tests for font lookup caching and incremental layout."""
+
+    def test_same_font_object_is_reused(self):
+        assert _get_font(36) is _get_font(36)
+        assert _get_font(36) is not _get_font(40)
+
+    def test_wrap_respects_width(self):
+        font = _get_font(36)
+        text = 'Migren ataklari duzensiz uyku stres ve dehidrasyon ile tetiklenebilir ' * 3
+        lines = _wrap_text(text, font, 400)
+
+        assert len(lines) > 1
+        assert ' '.join(lines) == ' '.join(text.split())
+        for line in lines:
+            assert _text_width(font, line) <= 400 or ' ' not in line
+
+    def test_long_word_gets_own_line(self):
+        font = _get_font(36)
+        assert _wrap_text('a ' + 'x' * 200 + ' b', font, 100) == ['a', 'x' * 200, 'b']
+        assert _wrap_text('', font, 100) == ['']
+
+
+class TestCards:
+    """Tests for prerendered backgrounds and batch rendering."""
+
+    def test_brand_bar_and_canvas_are_not_shared_state(self):
+        gen = SocialImageGenerator()
+        first = _open(gen.info_card(title='Baslik', items=['Bir', 'Iki']))
+        gen.info_card(title='Baska baslik', items=['Uc'] * 7)
+        again = _open(gen.info_card(title='Baslik', items=['Bir', 'Iki']))
+
+        assert first.size == (1080, 1080)
+        assert list(first.getdata()) == list(again.getdata())
+        # Alt bar primary renginde
+        assert first.getpixel((5, 1080 - BRAND_BAR_HEIGHT // 2)) == (0x1B, 0x4F, 0x72)
+
+    def test_quote_card_uses_inverted_bar(self):
+        img = _open(SocialImageGenerator().quote_card(quote='Kisa bir alinti', platform='linkedin'))
+        assert img.getpixel((5, img.height - 10)) == (255, 255, 255)
+
+    def test_render_batch_preserves_order(self):
+        briefs = [
+            {'template_type': 'stat_card', 'stat_value': str(i), 'stat_label': 'etiket'}
+            for i in range(4)
+        ]
+        serial = render_batch(briefs, max_workers=1)
+        parallel = render_batch(briefs, max_workers=2)
+
+        assert len(serial) == 4
+        assert serial == parallel
+        assert len(set(serial)) == 4
@@ -0,0 +1,185 @@
+"""
+Tests for the lock-safe concurrent social post publisher.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.social import publishing
+from apps.social.models import PublishLog, SocialAccount, SocialPost
+from apps.social.publishers import FakePublisher, PublishResult
+from apps.social.tasks import publish_scheduled_posts, retry_failed_post
+
+
+def _account(user, name, platform='linkedin', **kwargs):
+    return SocialAccount.objects.create(
+        platform=platform, account_name=name, account_id=name,
+        access_token='token', connected_by=user, **kwargs,
+    )
+
+
+def _posts(account, count, **kwargs):
+    return [
+        SocialPost.objects.create(
+            platform=account.platform, post_format='text_only', caption_tr=f'Post {i}',
+            status='scheduled', scheduled_at=timezone.now() - timedelta(minutes=1),
+            social_account=account, **kwargs,
+        )
+        for i in range(count)
+    ]
+
+
+class FailingPublisher(FakePublisher):
+    def publish_text(self, text):
+        return PublishResult(success=False, error='API hatasi')
+
+
+@pytest.fixture
+def fake_publishers(monkeypatch):
+    monkeypatch.setattr('apps.social.publishers.get_publisher', FakePublisher)
+
+
+@pytest.mark.django_db
+class TestClaimDuePosts:
+    """Tests for claiming due posts."""
+
+    def test_claimed_posts_are_not_claimed_again(self, doctor_user):
+        account = _account(doctor_user, 'a')
+        _posts(account, 3)
+        SocialPost.objects.create(
+            platform='linkedin', caption_tr='Gelecek', status='scheduled',
+            scheduled_at=timezone.now() + timedelta(days=1), social_account=account,
+        )
+
+        first = publishing.claim_due_posts()
+        assert len(first) == 3
+        assert publishing.claim_due_posts() == []
+        assert SocialPost.objects.filter(status='publishing').count() == 3
+
+    def test_daily_account_quota_is_respected(self, doctor_user, monkeypatch):
+        monkeypatch.setitem(publishing.ACCOUNT_RATE_LIMITS, 'linkedin', (2, 0))
+        account = _account(doctor_user, 'a')
+        _posts(account, 1, published_at=timezone.now())
+        SocialPost.objects.update(status='published')
+        _posts(account, 3)
+
+        assert len(publishing.claim_due_posts()) == 1
+        assert SocialPost.objects.filter(status='scheduled').count() == 2
+
+    def test_stale_claim_is_reclaimed(self, doctor_user):
+        account = _account(doctor_user, 'a')
+        _posts(account, 1)
+        publishing.claim_due_posts()
+        SocialPost.objects.update(updated_at=timezone.now() - timedelta(hours=1))
+
+        assert len(publishing.claim_due_posts()) == 1
+
+
+@pytest.mark.django_db
+class TestPublishDuePosts:
+    """Tests for concurrent publishing and bulk result writes."""
+
+    def test_publishes_across_accounts(self, doctor_user, fake_publishers):
+        accounts = [_account(doctor_user, f'acc{i}') for i in range(3)]
+        for account in accounts:
+            _posts(account, 2)
+
+        result = publish_scheduled_posts()
+
+        assert result['published'] == 6
+        assert result['failed'] == 0
+        assert SocialPost.objects.filter(status='published').exclude(platform_post_id='').count() == 6
+        assert PublishLog.objects.filter(action='publish', success=True).count() == 6
+        assert set(SocialAccount.objects.values_list('total_posts_published', flat=True)) == {2}
+        assert publish_scheduled_posts()['claimed'] == 0
+
+    def test_bulk_writes_use_constant_queries(self, doctor_user, django_assert_max_num_queries):
+        account = _account(doctor_user, 'a')
+        _posts(account, 10)
+
+        with django_assert_max_num_queries(12):
+            summary = publishing.publish_due_posts(publisher_factory=FakePublisher, min_interval=0)
+        assert summary.published == 10
+
+    def test_failure_schedules_backoff_then_gives_up(self, doctor_user):
+        account = _account(doctor_user, 'a')
+        post = _posts(account, 1)[0]
+        now = timezone.now()
+
+        for attempt in range(1, publishing.MAX_PUBLISH_ATTEMPTS + 1):
+            summary = publishing.publish_due_posts(now=now, publisher_factory=FailingPublisher)
+            assert summary.claimed == 1
+            post.refresh_from_db()
+            assert post.status == 'failed'
+            assert post.publish_attempts == attempt
+            if attempt < publishing.MAX_PUBLISH_ATTEMPTS:
+                assert post.next_attempt_at == post.updated_at + publishing.retry_delay(attempt)
+                # Bekleme suresi dolmadan tekrar denenmez
+                assert publishing.claim_due_posts(now=now) == []
+                now = post.next_attempt_at
+
+        assert post.next_attempt_at is None
+        assert 'Max retry' in post.publish_error
+        assert list(post.publish_logs.order_by('created_at').values_list('action', flat=True)) == (
+            ['publish'] + ['retry'] * (publishing.MAX_PUBLISH_ATTEMPTS - 1)
+        )
+
+    def test_expired_token_fails_without_retry(self, doctor_user):
+        account = _account(doctor_user, 'a', token_expires_at=timezone.now() - timedelta(days=1))
+        post = _posts(account, 1)[0]
+
+        summary = publishing.publish_due_posts(publisher_factory=FakePublisher)
+
+        post.refresh_from_db()
+        assert summary.failed == 1
+        assert post.status == 'failed'
+        assert post.next_attempt_at is None
+        assert 'Token' in post.publish_error
+
+    def test_manual_retry_publishes_immediately(self, doctor_user, fake_publishers):
+        account = _account(doctor_user, 'a')
+        post = _posts(account, 1)[0]
+        SocialPost.objects.filter(id=post.id).update(status='failed', publish_attempts=4)
+
+        retry_failed_post(str(post.id))
+
+        post.refresh_from_db()
+        assert post.status == 'published'
+
+
+@pytest.mark.django_db
+class TestPublishNow:
+    """Tests for the manual publish-now endpoint's claim."""
+
+    def _url(self, post):
+        return f'/api/v1/social/posts/{post.id}/publish-now/'
+
+    def test_post_claimed_by_worker_conflicts(self, doctor_client, doctor_user, fake_publishers):
+        account = _account(doctor_user, 'a')
+        post = _posts(account, 1)[0]
+        assert publishing.claim_due_posts() == [post.id]
+
+        response = doctor_client.post(self._url(post), {}, format='json')
+
+        assert response.status_code == 409
+        post.refresh_from_db()
+        assert post.status == 'publishing'
+        assert not PublishLog.objects.filter(post=post).exists()
+
+    def test_failed_post_with_pending_retry_is_claimed_once(self, doctor_client, doctor_user, fake_publishers):
+        account = _account(doctor_user, 'a')
+        post = _posts(account, 1)[0]
+        SocialPost.objects.filter(id=post.id).update(
+            status='failed', next_attempt_at=timezone.now() - timedelta(seconds=1),
+        )
+
+        response = doctor_client.post(self._url(post), {}, format='json')
+
+        assert response.status_code == 200
+        post.refresh_from_db()
+        assert post.status == 'published'
+        assert post.next_attempt_at is None
+        assert publishing.claim_due_posts() == []
+        assert doctor_client.post(self._url(post), {}, format='json').status_code == 400
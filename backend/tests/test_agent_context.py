@@ -0,0 +1,97 @@
+"""
+Tests for the per-run agent execution context: many concurrent runs of one
+shared agent instance must keep their token usage and flag overrides apart.
+LLM, AgentTask and AuditLog are mocked; no DB access.
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from services import agent_context
+from services.agent_context import bind, execution_context
+from services.base_agent import ALL_FLAGS, BaseAgent, _NullTask
+from services.llm_client import LLMResponse
+
+RUNS = 64
+WORKERS = 16
+
+
+def fake_chat(user_message, **kwargs):
+    """'<run>:<i>' mesajina run+1 token ve run'in tekligine gore provider dondur."""
+    run = int(user_message.split(':')[0])
+    time.sleep(random.uniform(0, 0.003))
+    return LLMResponse(
+        content='{}', provider='groq' if run % 2 == 0 else 'gemini',
+        model=f'model-{run}', tokens_used=run + 1, duration_ms=1, raw={},
+    )
+
+
+class StressAgent(BaseAgent):
+    """Her calistirmada `calls` kez LLM cagiran ajan (yarisi thread'lerden)."""
+
+    name = 'stress_agent'
+    feature_flag_key = 'agent_stress'
+
+    def execute(self, input_data):
+        run, calls = input_data['run'], input_data['calls']
+        messages = [f'{run}:{i}' for i in range(calls)]
+        half = len(messages) // 2
+        for message in messages[:half]:
+            self.llm_call(message)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(bind(self.llm_call), messages[half:]))
+        return {'run': run}
+
+
+@pytest.fixture
+def agent():
+    with patch('services.base_agent.llm_client.chat', side_effect=fake_chat), \
+         patch.object(BaseAgent, '_create_task', lambda self, *args: _NullTask()), \
+         patch.object(BaseAgent, '_log_execution', lambda self, *args, **kwargs: None), \
+         patch.object(BaseAgent, 'is_enabled', lambda self: False):
+        yield StressAgent()
+
+
+class TestExecutionContext:
+    """Tests for context isolation under concurrency."""
+
+    def test_parallel_runs_keep_usage_and_flags_apart(self, agent):
+        def run(i):
+            overrides = {ALL_FLAGS: True} if i % 4 else {'agent_stress': False}
+            return i, agent.run({'run': i, 'calls': 1 + i % 5}, flag_overrides=overrides)
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+            outcomes = list(pool.map(run, range(RUNS)))
+
+        for i, result in outcomes:
+            if i % 4 == 0:
+                assert not result.success and 'devre disi' in result.error
+                continue
+            assert result.success, result.error
+            assert result.data == {'run': i}
+            assert result.tokens_used == (1 + i % 5) * (i + 1)
+            assert result.provider == ('groq' if i % 2 == 0 else 'gemini')
+        assert agent_context.current() is None
+        assert not hasattr(agent, '_last_tokens')
+
+    def test_nested_run_inherits_flag_overrides(self, agent):
+        with execution_context('pipeline', {ALL_FLAGS: True}):
+            assert agent.run({'run': 1, 'calls': 2}).success
+        assert not agent.run({'run': 1, 'calls': 2}).success
+
+    def test_bind_records_into_callers_context(self):
+        with execution_context('outer') as context:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(bind(lambda n: agent_context.current().record(tokens=n)), range(10)))
+
+        assert context.tokens_used == 45
+        assert context.llm_calls == 10
+
+    def test_llm_call_outside_run_is_not_recorded(self, agent):
+        response = agent.llm_call('3:0')
+        assert response.tokens_used == 4
+        assert agent_context.current() is None
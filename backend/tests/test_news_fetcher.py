@@ -0,0 +1,166 @@
+"""
+Tests for parallel news ingestion: conditional fetches, near-duplicate
+detection and bulk slug reservation. Feeds are served by a local HTTP server.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from django.core.cache import cache
+
+from apps.content.models import NewsArticle
+from services import news_fetcher
+from services.base_agent import ALL_FLAGS, AgentResult
+from services.news_dedup import NearDuplicateIndex, hamming, simhash
+
+RSS_BODY = """<?xml version="1.0"?>
+<rss><channel>
+<item><title>New migraine drug shows benefit in phase 3 trial</title>
+<description>A CGRP antagonist reduced monthly migraine days.</description>
+<link>https://example.org/a</link></item>
+<item><title>New Migraine Drug Shows Benefit in Phase 3 Trial!</title>
+<description>Reprint of the same brain study.</description>
+<link>https://example.org/a-copy</link></item>
+<item><title>Epilepsy surgery outcomes improve with early referral</title>
+<description>Seizure freedom rates rose.</description>
+<link>https://example.org/b</link></item>
+<item><title>Stroke units cut brain injury mortality</title>
+<description>Neurology wards report gains.</description>
+<link>https://example.org/c</link></item>
+</channel></rss>"""
+
+
+class FeedServer:
+    def __init__(self):
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append(dict(self.headers))
+                if self.headers.get('If-None-Match') == '"feed-v1"':
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = RSS_BODY.encode()
+                self.send_response(200)
+                self.send_header('ETag', '"feed-v1"')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f'http://{host}:{port}/feed.xml'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FakeNewsAgent:
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def run(self, input_data, flag_overrides=None):
+        assert flag_overrides == {ALL_FLAGS: True}
+        with self._lock:
+            self.calls.append(input_data['topic'])
+        return AgentResult(success=True, data={
+            'title_tr': 'Noroloji Haberi',
+            'title_en': input_data['topic'],
+            'body_tr': 'Govde',
+            'category': 'clinical_trial',
+        })
+
+
+@pytest.fixture
+def feed_server(monkeypatch):
+    cache.clear()
+    with FeedServer() as server:
+        monkeypatch.setattr(news_fetcher, 'PUBMED_QUERIES', [])
+        monkeypatch.setattr(news_fetcher, 'RSS_FEEDS', [{
+            'name': 'Local Feed', 'url': server.url,
+            'category': 'clinical_trial', 'diseases': [],
+        }])
+        yield server
+    cache.clear()
+
+
+@pytest.fixture
+def fake_agent(monkeypatch):
+    agent = FakeNewsAgent()
+    monkeypatch.setattr('services.registry.agent_registry.get', lambda name: agent)
+    return agent
+
+
+class TestNearDuplicateIndex:
+    """Tests for SimHash fingerprints and the banded index."""
+
+    def test_near_identical_titles_match(self):
+        a = simhash('FDA approves new migraine drug')
+        b = simhash('FDA Approves New Migraine Drug!')
+        assert hamming(a, b) == 0
+
+        index = NearDuplicateIndex()
+        index.add('FDA approves new migraine drug')
+        assert index.contains('fda approves the new migraine drug')
+        assert not index.contains('Deep brain stimulation for Parkinson tremor')
+
+    def test_empty_text_is_never_duplicate(self):
+        index = NearDuplicateIndex()
+        index.add('')
+        assert len(index) == 0
+        assert not index.contains('')
+
+
+@pytest.mark.django_db
+class TestNewsIngestion:
+    """Tests for conditional fetches and the generation pipeline."""
+
+    def test_second_fetch_is_conditional(self, feed_server):
+        fetcher = news_fetcher.NewsFetcher(client=news_fetcher.FeedClient())
+        first = fetcher.fetch_all(max_per_source=10)
+        second = fetcher.fetch_all(max_per_source=10)
+
+        assert [i.title for i in first] == [i.title for i in second]
+        assert len(first) == 4
+        assert feed_server.requests[1].get('If-None-Match') == '"feed-v1"'
+
+    def test_only_new_items_reach_agent(self, feed_server, fake_agent):
+        NewsArticle.objects.create(
+            slug='noroloji-haberi', title_tr='Eski', title_en='Stroke units cut brain injury mortality',
+            body_tr='x', category='clinical_trial', status='published',
+        )
+
+        fetcher = news_fetcher.NewsFetcher(client=news_fetcher.FeedClient())
+        results = fetcher.fetch_and_generate(max_per_source=10, max_news=5)
+
+        assert sorted(fake_agent.calls) == [
+            'Epilepsy surgery outcomes improve with early referral',
+            'New migraine drug shows benefit in phase 3 trial',
+        ]
+        assert all(r['success'] for r in results)
+        # Ayni title_tr -> tek sorguyla ayrilan benzersiz slug'lar
+        assert set(NewsArticle.objects.values_list('slug', flat=True)) == {
+            'noroloji-haberi', 'noroloji-haberi-1', 'noroloji-haberi-2',
+        }
+
+    def test_max_news_limits_agent_calls(self, feed_server, fake_agent):
+        fetcher = news_fetcher.NewsFetcher(client=news_fetcher.FeedClient())
+        fetcher.fetch_and_generate(max_per_source=10, max_news=1)
+        assert len(fake_agent.calls) == 1
+        assert NewsArticle.objects.count() == 1
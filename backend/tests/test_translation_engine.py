@@ -0,0 +1,215 @@
+"""
+Tests for chunked, parallel translation with the segment translation memory.
+LLM calls are served by a fake that echoes each segment with an EN: prefix.
+"""
+
+import json
+import re
+import threading
+import time
+
+import pytest
+
+from apps.common.models import TranslationMemory
+from services import translation_engine
+from services.agents.translation_agent import TranslationAgent
+from services.llm_client import LLMResponse
+from services.translation_engine import (
+    RateLimiter, Segment, TranslationEngine, assemble, split_segments,
+)
+
+BODY = """# Migren nedir?
+
+Migren **tekrarlayan** bir bas agrisidir.
+
+- Isik hassasiyeti
+- Bulanti [kaynak](https://example.org)
+
+```
+kod blogu
+```
+
+<p>HTML <b>paragraf</b></p>"""
+
+
+class FakeLLM:
+    """Prompt'taki segmentleri 'EN:' onekiyle geri dondurur."""
+
+    def __init__(self, mangle=None, drop_one=False):
+        self.prompts = []
+        self.mangle = mangle or (lambda text: f'EN:{text}')
+        self.drop_one = drop_one
+        self.lock = threading.Lock()
+
+    def __call__(self, prompt, **kwargs):
+        with self.lock:
+            self.prompts.append(prompt)
+        match = re.search(r'INPUT \(JSON\):\n(\{.*?\n\})', prompt, re.DOTALL)
+        if not match:
+            content = json.dumps({'seo_title_en': 'SEO', 'seo_description_en': 'Desc'})
+        else:
+            segments = json.loads(match.group(1))['segments']
+            if self.drop_one and len(segments) > 1:
+                segments = segments[1:]
+            content = json.dumps({'translations': [self.mangle(s) for s in segments]})
+        return LLMResponse(content=content, provider='groq', model='m', tokens_used=10, duration_ms=1, raw={})
+
+    @property
+    def segments_sent(self):
+        sent = []
+        for prompt in self.prompts:
+            match = re.search(r'INPUT \(JSON\):\n(\{.*?\n\})', prompt, re.DOTALL)
+            if match:
+                sent += json.loads(match.group(1))['segments']
+        return sent
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    monkeypatch.setattr(translation_engine, '_limiter', RateLimiter(0))
+
+
+def _engine(llm, **kwargs):
+    return TranslationEngine(llm, **kwargs)
+
+
+class TestSegmentation:
+    """Tests for markup-preserving paragraph segmentation."""
+
+    def test_round_trip_and_markup_kept_out_of_segments(self):
+        parts = split_segments(BODY)
+        texts = [part.text for part in parts if isinstance(part, Segment)]
+
+        assert assemble(parts) == BODY
+        assert texts == [
+            'Migren nedir?',
+            'Migren **tekrarlayan** bir bas agrisidir.',
+            'Isik hassasiyeti',
+            'Bulanti [kaynak](https://example.org)',
+            'HTML <b>paragraf</b>',
+        ]
+
+    def test_same_text_same_key_regardless_of_whitespace(self):
+        a = split_segments('Bir  paragraf\nburada.')[0]
+        b = split_segments('Bir paragraf burada.')[0]
+        assert a.key == b.key
+
+
+@pytest.mark.django_db
+class TestTranslationEngine:
+    """Tests for chunking, concurrency and the translation memory."""
+
+    def test_long_body_translated_in_order_across_chunks(self):
+        paragraphs = [f'Paragraf {i}: ' + ' '.join(['uzun metin'] * 30) for i in range(12)]
+        body = '\n\n'.join(paragraphs)
+        llm = FakeLLM()
+
+        result = _engine(llm, chunk_chars=1000).translate({'body_en': body})
+
+        assert result.texts['body_en'] == '\n\n'.join(f'EN:{p}' for p in paragraphs)
+        assert result.stats['chunks'] > 1
+        assert result.stats['llm_calls'] == result.stats['chunks']
+        assert result.tokens_used == 10 * result.stats['chunks']
+        assert TranslationMemory.objects.count() == 12
+
+    def test_unchanged_paragraphs_come_from_memory(self):
+        _engine(FakeLLM()).translate({'body_en': BODY})
+
+        edited = BODY.replace('Isik hassasiyeti', 'Ses hassasiyeti')
+        llm = FakeLLM()
+        result = _engine(llm).translate({'body_en': edited})
+
+        assert llm.segments_sent == ['Ses hassasiyeti']
+        assert result.stats['memory_hits'] == 4
+        assert '- EN:Ses hassasiyeti' in result.texts['body_en']
+        assert TranslationMemory.objects.get(source_text='Migren nedir?').hit_count == 1
+
+        repeat = FakeLLM()
+        _engine(repeat).translate({'body_en': edited})
+        assert repeat.prompts == []
+
+    def test_count_mismatch_falls_back_to_single_segments(self):
+        llm = FakeLLM(drop_one=True)
+        result = _engine(llm).translate({'body_en': 'Bir.\n\nIki.\n\nUc.'})
+
+        assert result.texts['body_en'] == 'EN:Bir.\n\nEN:Iki.\n\nEN:Uc.'
+        assert result.stats['llm_calls'] == 4
+
+    def test_untranslated_segment_leaves_field_out(self):
+        llm = FakeLLM(mangle=lambda text: '' if text == 'Iki.' else f'EN:{text}')
+        result = _engine(llm).translate({'title_en': 'Bir.', 'body_en': 'Bir.\n\nIki.'})
+
+        assert result.stats['failed'] == 1
+        assert result.texts == {'title_en': 'EN:Bir.'}
+        assert result.incomplete == ['body_en']
+
+    def test_changed_markup_is_not_memorised(self):
+        llm = FakeLLM(mangle=lambda text: 'EN:' + text.replace('**', ''))
+        result = _engine(llm).translate({'body_en': 'Migren **tekrarlayan** bir agridir.\n\nDuz metin.'})
+
+        assert result.stats['markup_changed'] == 1
+        assert list(TranslationMemory.objects.values_list('source_text', flat=True)) == ['Duz metin.']
+
+
+class TestRateLimiter:
+    def test_spaces_concurrent_calls(self):
+        limiter = RateLimiter(600)  # 100 ms aralik
+        starts = []
+
+        def call():
+            limiter.wait()
+            starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        starts.sort()
+        assert starts[2] - starts[0] >= 0.19
+
+
+@pytest.mark.django_db
+class TestTranslationAgent:
+    """Tests for TranslationAgent on top of the engine."""
+
+    def test_full_body_translated_without_truncation(self, monkeypatch):
+        llm = FakeLLM()
+        agent = TranslationAgent()
+        monkeypatch.setattr(agent, 'llm_call', llm)
+        body = '\n\n'.join(f'Paragraf {i} ' + 'metin ' * 60 for i in range(10))
+
+        result = agent.execute({'title_tr': 'Baslik', 'excerpt_tr': 'Ozet', 'body_tr': body})
+
+        assert len(body) > 2000
+        assert result['body_en'].count('EN:Paragraf') == 10
+        assert result['title_en'] == 'EN:Baslik'
+        assert result['seo_title_en'] == 'SEO'
+        assert agent.validate_output(result) is None
+
+    def test_existing_seo_fields_skip_extra_call(self, monkeypatch):
+        llm = FakeLLM()
+        agent = TranslationAgent()
+        monkeypatch.setattr(agent, 'llm_call', llm)
+
+        result = agent.execute({
+            'title_tr': 'Baslik', 'body_tr': 'Govde.',
+            'seo_title_en': 'Given', 'seo_description_en': 'Given desc',
+        })
+
+        assert len(llm.prompts) == 1
+        assert result['seo_title_en'] == 'Given'
+        assert result['translation_stats']['translated'] == 2
+
+    def test_failed_segment_is_a_validation_error(self, monkeypatch):
+        llm = FakeLLM(mangle=lambda text: '' if text == 'Iki.' else f'EN:{text}')
+        agent = TranslationAgent()
+        monkeypatch.setattr(agent, 'llm_call', llm)
+
+        result = agent.execute({'title_tr': 'Baslik', 'body_tr': 'Bir.\n\nIki.'})
+
+        assert 'body_en' not in result
+        assert 'title_en' not in result
+        assert result['translation_stats']['failed'] == 1
+        assert '1 segment' in agent.validate_output(result)
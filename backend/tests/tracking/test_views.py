@@ -109,7 +109,7 @@ class TestSymptomEntryViewSet:
         )
         response = authenticated_client.get('/api/v1/tracking/symptoms/entries/')
         assert response.status_code == status.HTTP_200_OK
-        assert response.data['count'] == 1
+        assert len(response.data['results']) == 1
 
     def test_create_symptom_entry(self, authenticated_client, enrolled_patient, symptom_definition):
         """Test creating a symptom entry."""
@@ -251,7 +251,7 @@ class TestMedicationLogViewSet:
         )
         response = authenticated_client.get('/api/v1/tracking/medications/logs/')
         assert response.status_code == status.HTTP_200_OK
-        assert response.data['count'] == 1
+        assert len(response.data['results']) == 1
 
     def test_create_medication_log(self, authenticated_client, medication):
         """Test creating a medication log."""
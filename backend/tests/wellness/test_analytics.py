@@ -0,0 +1,119 @@
+"""
+Tests for database-side wellness analytics and the per-user summary row.
+"""
+
+from datetime import date, time, timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.wellness import analytics
+from apps.wellness.models import ExerciseSession, MenstrualLog, SleepLog, WellnessSummary
+
+
+def _sleep(user, day, minutes=420, quality=4, nightmare=False):
+    return SleepLog.objects.create(
+        user=user, date=day, bedtime=time(23), wake_time=time(7),
+        sleep_duration_minutes=minutes, sleep_quality=quality, had_nightmare=nightmare,
+    )
+
+
+def _period(user, start, days, **symptoms):
+    for i in range(days):
+        MenstrualLog.objects.create(user=user, date=start + timedelta(days=i), **symptoms)
+
+
+@pytest.mark.django_db
+class TestAnalytics:
+    """Tests for single-query section stats."""
+
+    def test_exercise_stats(self, patient_user):
+        ExerciseSession.objects.create(
+            user=patient_user, duration_seconds=600, points_earned=10, stress_before=8, stress_after=4,
+        )
+        old = ExerciseSession.objects.create(user=patient_user, duration_seconds=300, points_earned=5)
+        ExerciseSession.objects.filter(id=old.id).update(completed_at=timezone.now() - timedelta(days=60))
+
+        assert analytics.exercise_stats(patient_user.id) == {
+            'total_sessions': 2,
+            'sessions_this_month': 1,
+            'total_minutes': 15,
+            'avg_stress_reduction': 4,
+            'total_points_earned': 15,
+        }
+
+    def test_sleep_stats_in_one_query(self, patient_user, django_assert_num_queries):
+        today = timezone.localdate()
+        _sleep(patient_user, today, minutes=480, quality=5, nightmare=True)
+        _sleep(patient_user, today - timedelta(days=1), minutes=360, quality=3)
+        _sleep(patient_user, today - timedelta(days=90), minutes=60, quality=1)
+
+        with django_assert_num_queries(1):
+            stats = analytics.sleep_stats(patient_user.id)
+        assert stats == {
+            'avg_duration_hours': 7.0, 'avg_quality': 4.0,
+            'total_logs': 3, 'logs_this_month': 2, 'nightmare_count': 1,
+        }
+
+    def test_cycle_detection_uses_gaps_between_period_days(self, patient_user):
+        _period(patient_user, date(2026, 1, 1), 9, has_headache=True)  # 9 gunluk tek adet
+        _period(patient_user, date(2026, 1, 29), 5, has_cramps=True)
+        _period(patient_user, date(2026, 2, 28), 4)
+        MenstrualLog.objects.create(user=patient_user, date=date(2026, 2, 10), is_period_day=False)
+
+        assert analytics.period_starts(patient_user.id) == [
+            date(2026, 1, 1), date(2026, 1, 29), date(2026, 2, 28),
+        ]
+        stats = analytics.cycle_stats(patient_user.id)
+        assert stats['avg_cycle_length'] == 29
+        assert stats['total_cycles_tracked'] == 3
+        assert stats['headache_correlation'] == 50
+        assert stats['common_symptoms']['cramps'] == 5
+
+    def test_cycle_stats_without_data(self, patient_user):
+        assert analytics.cycle_stats(patient_user.id)['message'] == 'Yeterli veri yok'
+
+
+@pytest.mark.django_db
+class TestWellnessSummary:
+    """Tests for the summary row maintained on write."""
+
+    def test_write_updates_summary_and_read_is_single_query(self, patient_user, django_assert_num_queries):
+        _sleep(patient_user, timezone.localdate())
+        summary = WellnessSummary.objects.get(user=patient_user)
+        assert summary.sleep['total_logs'] == 1
+        assert summary.window_date == timezone.localdate()
+
+        analytics.get_summary(patient_user.id)  # dongu bolumunu doldur
+        with django_assert_num_queries(1):
+            assert analytics.get_summary(patient_user.id).sleep['total_logs'] == 1
+
+    def test_delete_refreshes_summary(self, patient_user):
+        log = _sleep(patient_user, timezone.localdate())
+        log.delete()
+        assert WellnessSummary.objects.get(user=patient_user).sleep['total_logs'] == 0
+
+    def test_stale_window_is_recomputed_on_read(self, patient_user):
+        _sleep(patient_user, timezone.localdate() - timedelta(days=29))
+        WellnessSummary.objects.update(window_date=timezone.localdate() - timedelta(days=5))
+
+        summary = analytics.get_summary(patient_user.id, today=timezone.localdate() + timedelta(days=2))
+        assert summary.sleep['logs_this_month'] == 0
+        assert summary.sleep['total_logs'] == 1
+
+    def test_user_delete_does_not_recreate_summary(self, patient_user):
+        _sleep(patient_user, timezone.localdate())
+        patient_user.delete()
+        assert not WellnessSummary.objects.exists()
+
+    def test_endpoints(self, authenticated_client, patient_user):
+        ExerciseSession.objects.create(user=patient_user, duration_seconds=120, points_earned=3)
+
+        response = authenticated_client.get('/api/v1/wellness/sessions/stats/')
+        assert response.status_code == 200
+        assert response.data['total_minutes'] == 2
+
+        response = authenticated_client.get('/api/v1/wellness/summary/')
+        assert response.status_code == 200
+        assert response.data['exercise']['total_points_earned'] == 3
+        assert response.data['cycle']['message'] == 'Yeterli veri yok'
@@ -0,0 +1,214 @@
+"""
+Tests for the weather cache service, run against a local fake OpenWeatherMap server.
+"""
+
+import json
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import status
+
+from apps.wellness import weather
+from apps.wellness.models import WeatherData
+
+
+class FakeWeatherServer:
+    """OpenWeatherMap /weather endpoint'ini taklit eden yerel HTTP sunucusu."""
+
+    def __init__(self, delay=0.0):
+        self.hits = 0
+        self.pressure = 1013.0
+        self.delay = delay
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.hits += 1
+                    pressure = server.pressure
+                if server.delay:
+                    time.sleep(server.delay)
+                body = json.dumps({
+                    'main': {'temp': 18.5, 'humidity': 65, 'pressure': pressure},
+                    'weather': [{'main': 'Clouds', 'description': 'parcali bulutlu'}],
+                }).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f'http://{host}:{port}'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def clean_weather_state():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def fake_weather(settings):
+    with FakeWeatherServer() as server:
+        settings.OPENWEATHERMAP_API_KEY = 'test-key'
+        settings.OPENWEATHERMAP_BASE_URL = server.url
+        yield server
+
+
+@pytest.mark.django_db
+class TestWeatherCache:
+    """Tests for cache hits, downsampling and stale-while-revalidate."""
+
+    def test_cold_then_cached(self, fake_weather):
+        first = weather.get_current('Istanbul')
+        second = weather.get_current('istanbul')
+
+        assert first['pressure'] == 1013.0
+        assert second == first
+        assert fake_weather.hits == 1
+
+    def test_refreshes_in_same_hour_share_one_row(self, fake_weather):
+        weather.refresh('Istanbul')
+        fake_weather.pressure = 1008.0
+        weather.refresh('Istanbul')
+
+        rows = WeatherData.objects.filter(city='Istanbul')
+        assert rows.count() == 1
+        assert rows.get().pressure == 1008.0
+
+    def test_stale_value_served_with_single_background_refresh(self, fake_weather, monkeypatch):
+        weather.refresh('Istanbul')
+        snapshot = cache.get('weather:current:istanbul')
+        snapshot['fetched_at'] -= weather.FRESH_SECONDS + 1
+        cache.set('weather:current:istanbul', snapshot)
+
+        scheduled = []
+        monkeypatch.setattr(
+            'apps.wellness.tasks.refresh_city_weather.delay', scheduled.append,
+        )
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(weather.get_current('Istanbul')))
+            for _ in range(20)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 20
+        assert all(r['pressure'] == 1013.0 for r in results)
+        assert scheduled == ['Istanbul']
+        assert fake_weather.hits == 1
+
+    def test_cold_cache_single_flight(self, settings, monkeypatch):
+        # Sadece cagri tekillestirmesini olc: DB yazimini bellekte tut
+        monkeypatch.setattr(weather, '_seed_from_database', lambda city: None)
+        monkeypatch.setattr(
+            weather, 'store_observation',
+            lambda city, values, recorded_at: WeatherData(
+                city=city, recorded_at=recorded_at, **values
+            ),
+        )
+        with FakeWeatherServer(delay=0.2) as server:
+            settings.OPENWEATHERMAP_API_KEY = 'test-key'
+            settings.OPENWEATHERMAP_BASE_URL = server.url
+
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(weather.get_current('Ankara')))
+                for _ in range(10)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert len(results) == 10
+            assert server.hits == 1
+
+    def test_missing_api_key(self, settings):
+        settings.OPENWEATHERMAP_API_KEY = ''
+        with pytest.raises(weather.WeatherUnavailable):
+            weather.get_current('Izmir')
+
+
+@pytest.mark.django_db
+class TestPressureHistory:
+    """Tests for pressure history read from stored hourly observations."""
+
+    def test_history_from_hourly_rows(self, fake_weather, authenticated_client):
+        now = timezone.now()
+        for hours_ago, pressure in [(5, 1015.0), (3, 1012.0)]:
+            WeatherData.objects.create(
+                city='Istanbul', temperature=20, humidity=50, pressure=pressure,
+                weather_condition='Clear', weather_description='acik',
+                recorded_at=now - timedelta(hours=hours_ago),
+            )
+        WeatherData.objects.create(
+            city='Istanbul', temperature=20, humidity=50, pressure=1030.0,
+            weather_condition='Clear', weather_description='acik',
+            recorded_at=now - timedelta(hours=30),
+        )
+
+        response = authenticated_client.get('/api/v1/wellness/weather/pressure_history/')
+        assert response.status_code == status.HTTP_200_OK
+        assert [p['pressure'] for p in response.data['history']] == [1015.0, 1012.0]
+
+        fake_weather.pressure = 1008.0
+        weather.refresh('Istanbul')
+
+        data = weather.pressure_history('Istanbul')
+        assert [p['pressure'] for p in data['history']] == [1015.0, 1012.0, 1008.0]
+        assert data['pressure_change_24h'] == -7.0
+        assert data['risk_level'] == 'high'
+
+    def test_observation_stored_elsewhere_invalidates_cached_history(self):
+        assert weather.pressure_history('Ankara')['history'] == []
+
+        # Celery worker'in yazdigi gozlem (bu prosesin yenilemesi degil)
+        weather.store_observation('Ankara', {
+            'temperature': 18, 'humidity': 40, 'pressure': 1011.0,
+            'weather_condition': 'Clear', 'weather_description': 'acik',
+        }, timezone.now())
+
+        assert [p['pressure'] for p in weather.pressure_history('ankara')['history']] == [1011.0]
+
+    def test_invalid_city_rejected(self, authenticated_client):
+        for city in ['x' * 200, 'Istanbul<script>', '../etc']:
+            response = authenticated_client.get('/api/v1/wellness/weather/pressure_history/', {'city': city})
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_city_locks_are_bounded(self):
+        locks = {id(weather._local_lock(f'Sehir{chr(97 + i % 26)}{i}')) for i in range(1000)}
+        assert len(locks) <= weather.LOCK_STRIPES
+
+    def test_current_endpoint(self, fake_weather, authenticated_client):
+        response = authenticated_client.get('/api/v1/wellness/weather/current/?city=Izmir')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['city'] == 'Izmir'
@@ -0,0 +1,116 @@
+"""
+Tests for the weather - migraine correlation engine.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import status
+
+from apps.migraine.models import MigraineAttack
+from apps.wellness.models import WeatherData, WeatherSensitivityProfile
+from apps.wellness.weather_correlation import (
+    HOUR, compute_all_profiles, forward_fill, pressure_drop_risk,
+)
+
+
+def _pressure_at(hours_from_start):
+    # 4 gunluk dongu: 2 gun sabit, 1 gun 12 hPa dusus, 1 gun geri yukselis
+    day, hour = divmod(hours_from_start, 24)
+    phase = day % 4
+    if phase == 2:
+        return 1018.0 - hour * 0.5
+    if phase == 3:
+        return 1006.0 + hour * 0.5
+    return 1018.0
+
+
+@pytest.fixture(autouse=True)
+def clean_weather_state():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def weather_series(db):
+    now = timezone.now().replace(minute=0, second=0, microsecond=0)
+    start = now - timedelta(days=40)
+    WeatherData.objects.bulk_create([
+        WeatherData(
+            city='Istanbul', temperature=15.0, humidity=60 + (h % 7),
+            pressure=_pressure_at(h), weather_condition='Clouds',
+            weather_description='bulutlu', recorded_at=start + h * HOUR,
+        )
+        # Her 2 saatte bir olcum: bosluklar ileri doldurulur
+        for h in range(0, 40 * 24, 2)
+    ])
+    return start, now
+
+
+@pytest.mark.django_db
+class TestCorrelationEngine:
+    """Tests for the nightly sensitivity batch."""
+
+    def test_pressure_sensitive_patient(self, weather_series, patient_user):
+        start, now = weather_series
+        # Ataklar her dusus gununun sonunda (dip noktasi)
+        for cycle in range(1, 9):
+            MigraineAttack.objects.create(
+                patient=patient_user, intensity=7,
+                start_datetime=start + timedelta(days=cycle * 4 + 2, hours=22),
+            )
+
+        result = compute_all_profiles(now=now)
+        assert result == {'profiles': 1, 'cities': 1}
+
+        profile = WeatherSensitivityProfile.objects.get(user=patient_user)
+        assert profile.attacks_analyzed == 8
+        assert profile.pressure_sensitivity < -1
+        assert profile.pressure_drop_threshold >= 5
+        assert profile.pressure_drop_relative_risk > 1.5
+
+        # Tekrar calistirma ayni satiri gunceller
+        compute_all_profiles(now=now)
+        assert WeatherSensitivityProfile.objects.count() == 1
+
+    def test_too_few_attacks_has_no_scores(self, weather_series, patient_user):
+        start, now = weather_series
+        MigraineAttack.objects.create(
+            patient=patient_user, intensity=5, start_datetime=now - timedelta(days=3),
+        )
+        compute_all_profiles(now=now)
+
+        profile = WeatherSensitivityProfile.objects.get(user=patient_user)
+        assert profile.attacks_analyzed == 1
+        assert profile.pressure_sensitivity is None
+
+    def test_forward_fill_respects_gap_limit(self):
+        base = timezone.now().replace(minute=0, second=0, microsecond=0)
+        series = {base: (1, 2, 3), base + 3 * HOUR: (4, 5, 6), base + 20 * HOUR: (7, 8, 9)}
+        filled = forward_fill(series)
+        assert filled[base + 2 * HOUR] == (1, 2, 3)
+        assert base + 10 * HOUR not in filled
+
+    def test_risk_lookup_uses_personal_threshold(self):
+        profile = WeatherSensitivityProfile(
+            pressure_drop_threshold=3.0, pressure_drop_relative_risk=2.4,
+            computed_at=timezone.now(),
+        )
+        assert pressure_drop_risk(profile, -3.5)['risk_level'] == 'high'
+        assert pressure_drop_risk(None, -3.5)['risk_level'] == 'normal'
+        assert pressure_drop_risk(None, -6)['risk_level'] == 'elevated'
+
+    def test_my_risk_endpoint(self, authenticated_client, patient_user):
+        WeatherSensitivityProfile.objects.create(
+            user=patient_user, city='Istanbul', attacks_analyzed=10,
+            pressure_drop_threshold=4.0, pressure_drop_relative_risk=2.0,
+            computed_at=timezone.now(),
+        )
+        response = authenticated_client.get('/api/v1/wellness/weather/my_risk/')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['risk_level'] == 'normal'
+        assert response.data['personal_threshold'] == 4.0
+        assert response.data['profile']['attacks_analyzed'] == 10